@@ -7,11 +7,15 @@ Usage:
     /optimize suggest <targets>  - Get suggestions for targets
     /optimize report             - Get optimization report
     /optimize phase <A|B|C>      - Run specific cascade phase
+
+Evaluation runs serially by default; pass backend="thread"/"process" (CLI:
+--backend, --workers) to evaluate suggestion batches on a worker pool.
 """
 
 import os
 import sys
 import json
+import argparse
 from typing import Optional, Dict, Any, List
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,6 +26,7 @@ from optimization.globalmoo_client import (
     ParetoPoint,
 )
 from optimization.cascade import ThreeMOOCascade, CascadePhase, CascadeResult
+from optimization.evaluation_executor import BACKENDS, create_executor
 from optimization.distill_modes import ModeDistiller
 from core.config import FullConfig, VectorCodec
 
@@ -108,6 +113,8 @@ def optimize_command(
     action: Optional[str] = None,
     targets: Optional[Dict[str, float]] = None,
     phase: Optional[str] = None,
+    backend: str = "serial",
+    max_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Execute /optimize command.
@@ -116,10 +123,26 @@ def optimize_command(
         action: Command action (start, suggest, report, phase)
         targets: Target outcomes for inverse suggestion
         phase: Specific phase to run (A, B, C)
+        backend: Evaluation executor backend ("serial", "thread", "process")
+        max_workers: Pool size for thread/process backends (default: CPU count)
 
     Returns:
         Command result with optimization data
     """
+    # The executor's pool is shut down when the command finishes
+    with create_executor(backend, max_workers=max_workers) as executor:
+        # Initialize cascade (uses mock mode by default)
+        cascade = ThreeMOOCascade(executor=executor)
+        return _run_optimize(cascade, action, targets, phase)
+
+
+def _run_optimize(
+    cascade: ThreeMOOCascade,
+    action: Optional[str],
+    targets: Optional[Dict[str, float]],
+    phase: Optional[str],
+) -> Dict[str, Any]:
+    """Dispatch an /optimize action on a ready cascade."""
     result = {
         "command": "/optimize",
         "success": True,
@@ -127,9 +150,6 @@ def optimize_command(
         "data": None,
     }
 
-    # Initialize cascade (uses mock mode by default)
-    cascade = ThreeMOOCascade()
-
     # Helper to get pareto points
     def get_pareto_points():
         try:
@@ -287,19 +307,20 @@ Usage:
 
 
 if __name__ == "__main__":
-    # Demo
-    print("=== /optimize ===")
-    r = optimize_command()
-    print(r["output"])
+    parser = argparse.ArgumentParser(description="Run GlobalMOO optimization")
+    parser.add_argument("action", nargs="?", help="start, suggest, report or phase (default: demo of each)")
+    parser.add_argument("phase", nargs="?", help="Phase for 'phase' (A, B or C)")
+    parser.add_argument("--backend", choices=BACKENDS, default="serial", help="Evaluation executor backend")
+    parser.add_argument("--workers", type=int, default=None, help="Pool size for thread/process backends")
+    args = parser.parse_args()
+
+    if args.action:
+        r = optimize_command(args.action, phase=args.phase, backend=args.backend, max_workers=args.workers)
+        print(r["output"])
+        sys.exit(0 if r["success"] else 1)
 
-    print("\n=== /optimize start ===")
-    r = optimize_command("start")
-    print(r["output"])
-
-    print("\n=== /optimize suggest ===")
-    r = optimize_command("suggest")
-    print(r["output"])
-
-    print("\n=== /optimize report ===")
-    r = optimize_command("report")
-    print(r["output"])
+    # Demo
+    for action in (None, "start", "suggest", "report"):
+        print(f"\n=== /optimize{' ' + action if action else ''} ===")
+        r = optimize_command(action, backend=args.backend, max_workers=args.workers)
+        print(r["output"])
@@ -7,10 +7,12 @@ Contains:
 - verilingua: 7 cognitive frames from natural language distinctions
 - prompt_builder: THIN WAIST contract for prompt construction
 - runtime: Claude client wrapper
+- response_cache: Content-addressed SQLite cache for LLM responses
 """
 
 from .config import FullConfig, FrameworkConfig, PromptConfig, VectorCodec
-from .verix import VerixClaim, VerixParser, VerixValidator
+from .response_cache import ResponseCache
+from .verix import ClaimTable, VerixClaim, VerixParser, VerixTokenizer, VerixValidator
 from .verilingua import CognitiveFrame, FrameRegistry
 
 __all__ = [
@@ -18,8 +20,11 @@ __all__ = [
     "FrameworkConfig",
     "PromptConfig",
     "VectorCodec",
+    "ResponseCache",
+    "ClaimTable",
     "VerixClaim",
     "VerixParser",
+    "VerixTokenizer",
     "VerixValidator",
     "CognitiveFrame",
     "FrameRegistry",
@@ -21,18 +21,31 @@ The bridge:
 
 This creates a self-improving system where frame configurations
 evolve based on actual output quality.
+
+Feedback is persisted write-behind by FeedbackJournal: validations append
+to an in-memory queue that a background thread writes to an append-only
+journal, periodically compacted into an atomically replaced snapshot.
 """
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from collections import deque
+from contextlib import contextmanager
 from enum import Enum
+import atexit
 import logging
+import os
+import queue
 import time
 import json
 import threading
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process journal locking
+    fcntl = None
+
 from .verix import VerixClaim, VerixValidator, VerixParser
 from .verilingua import FRAME_WEIGHTS, EVIDENTIAL_MINIMUM, FrameWeightViolation
 from .config import FrameworkConfig, PromptConfig, FullConfig
@@ -112,6 +125,423 @@ class FrameCorrelation:
         self.avg_compliance = self.total_compliance / self.activation_count
 
 
+# Feedback entries kept in memory and in snapshots
+HISTORY_LIMIT = 1000
+
+
+def _record_feedback(
+    correlations: Dict[str, FrameCorrelation],
+    baseline: Optional[float],
+    feedback: ValidationFeedback,
+) -> Optional[float]:
+    """Update frame correlations with one feedback; return the new baseline."""
+    # Update correlations for active frames
+    for frame_name in feedback.active_frames:
+        if frame_name in correlations:
+            correlations[frame_name].update(feedback.compliance_score)
+
+    # Track baseline (when minimal frames active)
+    if len(feedback.active_frames) <= 1:
+        if baseline is None:
+            return feedback.compliance_score
+        # Exponential moving average
+        return 0.9 * baseline + 0.1 * feedback.compliance_score
+    return baseline
+
+
+class FeedbackJournal:
+    """
+    Write-behind persistence for one feedback directory.
+
+    Files:
+    - feedback_history.json: compacted snapshot (history, correlations,
+      baseline and the last journal sequence number it includes)
+    - feedback_journal.jsonl: one line per event since the snapshot
+    - feedback_journal.lock: flock target; holds the last sequence number
+
+    append() updates the in-memory state and enqueues the event; a daemon
+    thread writes queued events every flush_interval seconds and compacts
+    once snapshot_every events have accumulated. Snapshots are written to a
+    temp file, fsynced and swapped in with os.replace(), and journal lines
+    at or below the snapshot's sequence number are skipped on replay, so a
+    crash at any point loses at most the events not yet flushed.
+
+    Bridges sharing a directory share one journal per process (see
+    for_directory()). Several processes (e.g. process-backend workers) may
+    open the same directory: appends, replay and compaction run under an
+    exclusive flock, sequence numbers come from the shared counter in the
+    lock file, and compaction snapshots the directory's state as replayed
+    from disk, so it covers every process's flushed events before the
+    journal is truncated.
+    """
+
+    SNAPSHOT_FILE = "feedback_history.json"
+    JOURNAL_FILE = "feedback_journal.jsonl"
+    LOCK_FILE = "feedback_journal.lock"
+
+    DEFAULT_FLUSH_INTERVAL = 1.0  # seconds
+    DEFAULT_SNAPSHOT_EVERY = 1000  # journal events between compactions
+    MAX_PENDING = 10000  # queued events before append() blocks
+
+    _registry: Dict[Path, "FeedbackJournal"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        directory: Path,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+        max_pending: int = MAX_PENDING,
+    ):
+        """
+        Open a journal and replay snapshot + journal tail.
+
+        Args:
+            directory: Feedback directory
+            flush_interval: Seconds between background writes
+            snapshot_every: Journal events between compacted snapshots
+            max_pending: Queue bound; append() blocks while it is full
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.snapshot_every = snapshot_every
+        self._init_state(self.directory)
+
+        self._state_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._pending: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        with self._locked() as lock:
+            self._replay()
+            seq = self._read_seq(lock)
+            if seq is None or seq < self._seq:
+                self._write_seq(lock, self._seq)
+
+    def _init_state(self, directory: Path) -> None:
+        """Set file paths and empty replayed state."""
+        self.directory = directory
+        self.snapshot_file = directory / self.SNAPSHOT_FILE
+        self.journal_file = directory / self.JOURNAL_FILE
+        self.lock_file = directory / self.LOCK_FILE
+
+        # Replayed state, kept current by append()
+        self.history: deque = deque(maxlen=HISTORY_LIMIT)
+        self.correlations: Dict[str, FrameCorrelation] = {
+            frame: FrameCorrelation(frame_name=frame)
+            for frame in FRAME_WEIGHTS.keys()
+        }
+        self.baseline_compliance: Optional[float] = None
+        self._seq = 0  # Last sequence number written or replayed
+        self._snapshot_seq = 0
+
+    @classmethod
+    def for_directory(
+        cls,
+        directory: Path,
+        flush_interval: Optional[float] = None,
+    ) -> "FeedbackJournal":
+        """Return the process-wide journal for a directory, opening it once."""
+        key = Path(directory).resolve()
+        with cls._registry_lock:
+            journal = cls._registry.get(key)
+            if journal is None:
+                journal = cls(key, flush_interval=flush_interval or cls.DEFAULT_FLUSH_INTERVAL)
+                cls._registry[key] = journal
+            return journal
+
+    def append(
+        self,
+        feedback: ValidationFeedback,
+        weight_deltas: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Record a feedback entry; file I/O happens on the flusher thread.
+
+        Args:
+            feedback: Validation feedback
+            weight_deltas: Per-frame weight deltas computed after this
+                feedback (journaled with it only if they changed)
+        """
+        with self._state_lock:
+            event = {"feedback": feedback.to_dict()}
+            self.history.append(feedback)
+            self.baseline_compliance = _record_feedback(
+                self.correlations, self.baseline_compliance, feedback,
+            )
+            if weight_deltas and self._apply_weight_deltas(weight_deltas):
+                event["weight_deltas"] = weight_deltas
+        self._enqueue(event)
+
+    def record_weight_deltas(self, weight_deltas: Dict[str, float]) -> None:
+        """Record per-frame weight deltas (no event if none changed)."""
+        with self._state_lock:
+            if not self._apply_weight_deltas(weight_deltas):
+                return
+            event = {"weight_deltas": weight_deltas}
+        self._enqueue(event)
+
+    def reset_correlations(self) -> None:
+        """Record a correlation reset (see FrameValidationBridge.reset_correlations)."""
+        with self._state_lock:
+            event = {"reset": True}
+            self._reset_state()
+        self._enqueue(event)
+
+    def snapshot(self) -> Dict:
+        """Current in-memory state in snapshot format."""
+        with self._state_lock:
+            return self._snapshot_data()
+
+    def flush(self) -> None:
+        """Write every queued event now."""
+        with self._io_lock:
+            self._write_pending()
+
+    def compact(self) -> None:
+        """Flush, then replace the snapshot and truncate the journal."""
+        with self._io_lock:
+            self._write_pending()
+            self._write_snapshot()
+
+    def close(self) -> None:
+        """Stop the flusher, write pending events and unregister."""
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+        with FeedbackJournal._registry_lock:
+            if FeedbackJournal._registry.get(self.directory.resolve()) is self:
+                del FeedbackJournal._registry[self.directory.resolve()]
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every open journal (registered with atexit)."""
+        for journal in list(cls._registry.values()):
+            journal.close()
+
+    def _enqueue(self, event: Dict) -> None:
+        if self._thread is None and not self._closed:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="feedback-journal", daemon=True,
+                    )
+                    self._thread.start()
+        try:
+            self._pending.put_nowait(event)
+        except queue.Full:
+            # Backpressure: wake the flusher and wait for room
+            self._wake.set()
+            self._pending.put(event)
+        if self._closed:
+            self.flush()
+
+    def _run(self) -> None:
+        """Flusher loop: write queued events every flush_interval."""
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                with self._io_lock:
+                    self._write_pending()
+                    if self._seq - self._snapshot_seq >= self.snapshot_every:
+                        self._write_snapshot()
+            except Exception as e:  # Keep flushing after transient errors
+                logger.warning(f"Feedback journal flush failed: {e}")
+
+    def _write_pending(self) -> None:
+        """Append queued events to the journal in one write (holds _io_lock)."""
+        events = []
+        while True:
+            try:
+                events.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        if not events:
+            return
+
+        try:
+            with self._locked() as lock:
+                seq = self._read_seq(lock)
+                if seq is None:
+                    seq = self._disk_seq()
+                # Reserve the numbers first: a crash leaves a gap, never a reuse
+                self._write_seq(lock, seq + len(events))
+                lines = [
+                    json.dumps({"seq": seq + i, **event}, separators=(",", ":")) + "\n"
+                    for i, event in enumerate(events, 1)
+                ]
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+            self._seq = seq + len(events)
+        except (IOError, OSError) as e:
+            logger.warning(f"Could not append feedback journal: {e}")
+
+    def _write_snapshot(self) -> None:
+        """Atomically replace the snapshot and truncate the journal (holds _io_lock)."""
+        tmp_file = self.snapshot_file.with_name(self.snapshot_file.name + ".tmp")
+        try:
+            with self._locked():
+                # Snapshot what is on disk, not this process's view: other
+                # processes' journal lines must survive the truncate
+                data = self._read_disk()._snapshot_data()
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.snapshot_file)
+                # Every journal line is now covered by the snapshot's journal_seq
+                open(self.journal_file, "w").close()
+            self._snapshot_seq = data["journal_seq"]
+        except (IOError, OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save feedback snapshot: {e}")
+
+    @contextmanager
+    def _locked(self):
+        """Hold the directory's exclusive flock; yields the open lock file."""
+        with open(self.lock_file, "a+", encoding="utf-8") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            yield lock
+
+    @staticmethod
+    def _read_seq(lock) -> Optional[int]:
+        """Last sequence number recorded in the lock file (None if unset)."""
+        lock.seek(0)
+        text = lock.read().strip()
+        return int(text) if text.isdigit() else None
+
+    @staticmethod
+    def _write_seq(lock, seq: int) -> None:
+        lock.seek(0)
+        lock.truncate()
+        lock.write(str(seq))
+        lock.flush()
+
+    def _disk_seq(self) -> int:
+        """Highest sequence number in the snapshot or journal (holds the flock)."""
+        return self._read_disk()._seq
+
+    def _read_disk(self) -> "FeedbackJournal":
+        """Replay the directory into a fresh, unregistered journal (holds the flock)."""
+        disk = object.__new__(FeedbackJournal)
+        disk._init_state(self.directory)
+        disk._replay()
+        return disk
+
+    def _snapshot_data(self) -> Dict:
+        return {
+            "history": [fb.to_dict() for fb in self.history],
+            "correlations": {
+                name: {
+                    "activation_count": corr.activation_count,
+                    "total_compliance": corr.total_compliance,
+                    "avg_compliance": corr.avg_compliance,
+                    "weight_delta": corr.weight_delta,
+                }
+                for name, corr in self.correlations.items()
+            },
+            "baseline_compliance": self.baseline_compliance,
+            "journal_seq": self._seq,
+            "saved_at": time.time(),
+        }
+
+    def _apply_weight_deltas(self, weight_deltas: Dict[str, float]) -> bool:
+        """Set weight_delta on known frames; True if any value changed."""
+        changed = False
+        for name, delta in weight_deltas.items():
+            corr = self.correlations.get(name)
+            if corr is not None and corr.weight_delta != delta:
+                corr.weight_delta = delta
+                changed = True
+        return changed
+
+    def _reset_state(self) -> None:
+        for frame_name in self.correlations:
+            self.correlations[frame_name] = FrameCorrelation(frame_name=frame_name)
+        self.baseline_compliance = None
+
+    def _replay(self) -> None:
+        """Load the snapshot, then apply journal events newer than it (holds the flock)."""
+        if self.snapshot_file.exists():
+            try:
+                with open(self.snapshot_file) as f:
+                    data = json.load(f)
+                self.history.extend(
+                    ValidationFeedback.from_dict(fb) for fb in data.get("history", [])
+                )
+                for name, corr_data in data.get("correlations", {}).items():
+                    if name in self.correlations:
+                        corr = self.correlations[name]
+                        corr.activation_count = corr_data.get("activation_count", 0)
+                        corr.total_compliance = corr_data.get("total_compliance", 0.0)
+                        corr.avg_compliance = corr_data.get("avg_compliance", 0.0)
+                        corr.weight_delta = corr_data.get("weight_delta", 0.0)
+                self.baseline_compliance = data.get("baseline_compliance")
+                self._seq = self._snapshot_seq = data.get("journal_seq", 0)
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                logger.warning(f"Could not load feedback snapshot: {e}")
+
+        if not self.journal_file.exists():
+            return
+
+        with open(self.journal_file, "rb") as f:
+            data = f.read()
+        complete = self._repair_tail(data)
+
+        for line in data[:complete].decode("utf-8", errors="replace").splitlines():
+            try:
+                event = json.loads(line)
+                if event["seq"] <= self._snapshot_seq:
+                    continue  # Already in the snapshot
+                if event.get("reset"):
+                    self._reset_state()
+                if "feedback" in event:
+                    feedback = ValidationFeedback.from_dict(event["feedback"])
+                    self.history.append(feedback)
+                    self.baseline_compliance = _record_feedback(
+                        self.correlations, self.baseline_compliance, feedback,
+                    )
+                if "weight_deltas" in event:
+                    self._apply_weight_deltas(event["weight_deltas"])
+                self._seq = max(self._seq, event["seq"])
+            except (json.JSONDecodeError, KeyError, ValueError):
+                logger.warning("Skipping unreadable feedback journal line")
+
+    def _repair_tail(self, data: bytes) -> int:
+        """
+        Make the journal end on a line boundary so appends start a new line.
+
+        A crash mid-write leaves a final line without its newline. If that
+        line is a complete event only the newline is missing and it is
+        added; otherwise the torn line is truncated away. Returns how many
+        leading bytes of data hold whole events.
+        """
+        complete = data.rfind(b"\n") + 1
+        tail = data[complete:]
+        if not tail:
+            return complete
+        try:
+            json.loads(tail)
+        except ValueError:
+            logger.warning("Dropping torn final feedback journal line")
+            with open(self.journal_file, "r+b") as f:
+                f.truncate(complete)
+            return complete
+        with open(self.journal_file, "ab") as f:
+            f.write(b"\n")
+        return len(data)
+
+
+atexit.register(FeedbackJournal.close_all)
+
+
 class FrameValidationBridge:
     """
     Bidirectional bridge between VERIX validation and VERILINGUA frames.
@@ -140,6 +570,7 @@ class FrameValidationBridge:
         config: FullConfig,
         feedback_dir: Optional[Path] = None,
         auto_adjust: bool = True,
+        flush_interval: Optional[float] = None,
     ):
         """
         Initialize the bridge.
@@ -148,6 +579,9 @@ class FrameValidationBridge:
             config: Current FullConfig
             feedback_dir: Directory to persist feedback history
             auto_adjust: If True, automatically apply weight adjustments
+            flush_interval: Seconds between background journal writes
+                (default: FeedbackJournal.DEFAULT_FLUSH_INTERVAL; the first
+                bridge to open a directory sets it)
         """
         self.config = config
         self.auto_adjust = auto_adjust
@@ -156,6 +590,7 @@ class FrameValidationBridge:
             feedback_dir = Path(__file__).parent.parent / "storage" / "frame-feedback"
         self.feedback_dir = Path(feedback_dir)
         self.feedback_dir.mkdir(parents=True, exist_ok=True)
+        self._journal = FeedbackJournal.for_directory(self.feedback_dir, flush_interval)
 
         # Validation components
         self.verix_validator = VerixValidator(config.prompt)
@@ -166,7 +601,7 @@ class FrameValidationBridge:
 
         # FIX: Bounded feedback history to prevent memory leak (FVB-MEM)
         # Using deque with maxlen=1000 to match persistence policy
-        self.feedback_history: deque = deque(maxlen=1000)
+        self.feedback_history: deque = deque(maxlen=HISTORY_LIMIT)
 
         # Frame correlations
         self.correlations: Dict[str, FrameCorrelation] = {
@@ -245,9 +680,10 @@ class FrameValidationBridge:
             if self.auto_adjust and len(self.feedback_history) >= self.MIN_SAMPLES_FOR_ADJUSTMENT:
                 self._apply_adjustments()
 
-            # Persist feedback periodically
-            if len(self.feedback_history) % 10 == 0:
-                self._save_history()
+            weight_deltas = {name: corr.weight_delta for name, corr in self.correlations.items()}
+
+        # Persist write-behind: no file I/O on the validation path
+        self._journal.append(feedback, weight_deltas)
 
         logger.info(
             f"Validation feedback: score={compliance_score:.2f}, "
@@ -258,20 +694,9 @@ class FrameValidationBridge:
 
     def _update_correlations(self, feedback: ValidationFeedback):
         """Update frame-compliance correlations with new feedback."""
-        # Update correlations for active frames
-        for frame_name in feedback.active_frames:
-            if frame_name in self.correlations:
-                self.correlations[frame_name].update(feedback.compliance_score)
-
-        # Track baseline (when minimal frames active)
-        if len(feedback.active_frames) <= 1:
-            if self.baseline_compliance is None:
-                self.baseline_compliance = feedback.compliance_score
-            else:
-                # Exponential moving average
-                self.baseline_compliance = (
-                    0.9 * self.baseline_compliance + 0.1 * feedback.compliance_score
-                )
+        self.baseline_compliance = _record_feedback(
+            self.correlations, self.baseline_compliance, feedback,
+        )
 
     def _calculate_weight_deltas(self) -> Dict[str, float]:
         """
@@ -343,6 +768,9 @@ class FrameValidationBridge:
             Dict mapping frame names to adjustment info
         """
         deltas = self._calculate_weight_deltas()
+        self._journal.record_weight_deltas(
+            {name: corr.weight_delta for name, corr in self.correlations.items()}
+        )
         suggestions = {}
 
         for frame_name, delta in deltas.items():
@@ -403,71 +831,32 @@ class FrameValidationBridge:
         for frame_name in self.correlations:
             self.correlations[frame_name] = FrameCorrelation(frame_name=frame_name)
         self.baseline_compliance = None
+        self._journal.reset_correlations()
         logger.info("Frame correlations reset")
 
     def _save_history(self):
-        """Save feedback history to disk."""
-        history_file = self.feedback_dir / "feedback_history.json"
-
-        # FIX: Create immutable snapshot for thread-safe persistence (FVB-RACE)
-        # deque already bounds to 1000, just copy for thread safety
-        recent_history = list(self.feedback_history)
-
-        data = {
-            "history": [fb.to_dict() for fb in recent_history],
-            "correlations": {
-                name: {
-                    "activation_count": corr.activation_count,
-                    "total_compliance": corr.total_compliance,
-                    "avg_compliance": corr.avg_compliance,
-                    "weight_delta": corr.weight_delta,
-                }
-                for name, corr in self.correlations.items()
-            },
-            "baseline_compliance": self.baseline_compliance,
-            "saved_at": time.time(),
-        }
-
-        # FIX: Wrap I/O in try/except for defensive programming (FVB-IO)
-        try:
-            with open(history_file, "w") as f:
-                json.dump(data, f, indent=2)
-        except (IOError, OSError, json.JSONEncodeError) as e:
-            logger.warning(f"Could not save feedback history: {e}")
+        """Write a compacted feedback snapshot now (normally done in the background)."""
+        self._journal.compact()
 
     def _load_history(self):
-        """Load feedback history from disk."""
-        history_file = self.feedback_dir / "feedback_history.json"
-
-        if not history_file.exists():
-            return
-
-        try:
-            with open(history_file) as f:
-                data = json.load(f)
-
-            # FIX: Populate deque properly (FVB-MEM)
-            loaded_entries = [
-                ValidationFeedback.from_dict(fb)
-                for fb in data.get("history", [])
-            ]
+        """Load feedback history (snapshot + journal tail) from the journal."""
+        journal = self._journal
+        with journal._state_lock:
             self.feedback_history.clear()
-            self.feedback_history.extend(loaded_entries)
+            self.feedback_history.extend(journal.history)
 
-            for name, corr_data in data.get("correlations", {}).items():
+            for name, corr in journal.correlations.items():
                 if name in self.correlations:
-                    self.correlations[name].activation_count = corr_data.get("activation_count", 0)
-                    self.correlations[name].total_compliance = corr_data.get("total_compliance", 0.0)
-                    self.correlations[name].avg_compliance = corr_data.get("avg_compliance", 0.0)
-                    self.correlations[name].weight_delta = corr_data.get("weight_delta", 0.0)
+                    self.correlations[name].activation_count = corr.activation_count
+                    self.correlations[name].total_compliance = corr.total_compliance
+                    self.correlations[name].avg_compliance = corr.avg_compliance
+                    self.correlations[name].weight_delta = corr.weight_delta
 
-            self.baseline_compliance = data.get("baseline_compliance")
+            self.baseline_compliance = journal.baseline_compliance
 
+        if self.feedback_history:
             logger.info(f"Loaded {len(self.feedback_history)} feedback entries from history")
 
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Could not load feedback history: {e}")
-
 
 def create_bridge(config: Optional[FullConfig] = None) -> FrameValidationBridge:
     """
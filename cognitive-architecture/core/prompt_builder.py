@@ -17,14 +17,23 @@ THE CONTRACT:
 FIX-4 from REMEDIATION-PLAN.md:
 - ModeSelector now integrated for runtime mode selection
 - Modes are selected based on task context and applied before frame activation
+
+Compiled templates:
+- The system prompt depends only on the (mode-adjusted) config and task type,
+  so it is compiled once per key and shared by every builder
+- Key: cluster_key fields plus require_ground / require_confidence /
+  max_frame_depth, the active frames, the task type and the selected mode
+- The cache is dropped when FRAME_WEIGHTS or the feature flags change
 """
 
-from typing import Tuple, List, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, Tuple, List, Optional
+from dataclasses import dataclass, replace
 import logging
 
 from .config import FullConfig, VectorCodec, CompressionLevel
+from .feature_flags import HofstadterFeatureFlags
 from .verix import VerixValidator, VerixStrictness
+from . import verilingua
 from .verilingua import FrameRegistry, CognitiveFrame, get_combined_activation_instruction
 from .frame_validation_bridge import FrameValidationBridge, ValidationFeedback
 from .vcl_validator import VCLValidator, VCLConfig, ValidationResult as VCLValidationResult
@@ -126,8 +135,19 @@ class PromptBuilder:
 
     FIX-5: Now includes FrameValidationBridge for bidirectional VERIX-VERILINGUA integration.
     Validation feedback is used to dynamically adjust frame weights.
+
+    Compiled system prompts are memoized at class level (see template_key()),
+    so only mode selection and the user prompt run per task.
     """
 
+    # Max compiled system prompts kept across all builders
+    TEMPLATE_CACHE_SIZE = 4096
+
+    _template_cache: Dict[Tuple, Tuple[PromptComponents, str]] = {}
+    _template_state: Optional[Tuple[Dict[str, float], Dict[str, bool]]] = None
+    _template_hits: int = 0
+    _template_misses: int = 0
+
     def __init__(
         self,
         config: FullConfig,
@@ -193,17 +213,9 @@ class PromptBuilder:
         if self.auto_select_mode and not self._mode_applied:
             self._select_and_apply_mode(task, task_type)
 
-        # Gather components
-        components = PromptComponents(
-            base_instruction=self._base_instruction(task_type),
-            frame_activations=self._frame_activations(),
-            verix_requirements=self._verix_requirements(),
-            output_format=self._output_format(),
-            task_content=task,
-        )
-
-        # Assemble prompts
-        system_prompt = self._assemble_system_prompt(components)
+        # Static components come from the compiled template; only the task varies
+        template, system_prompt = self._compiled_template(task_type)
+        components = replace(template, task_content=task)
         user_prompt = self._assemble_user_prompt(components)
 
         # FIX: Reset mode selection for next build to prevent stale mode reuse (PB-STICKY-MODE)
@@ -211,6 +223,101 @@ class PromptBuilder:
 
         return system_prompt, user_prompt
 
+    def template_key(self, task_type: str) -> Tuple:
+        """
+        Key of the compiled system prompt for the current config.
+
+        Covers everything the system prompt reads: the fields behind
+        cluster_key() (frame toggles, strictness, compression), the prompt
+        flags that cluster_key() leaves out, the active frames, the resolved
+        task type and the selected mode. Raw fields are used instead of the
+        cluster_key() string so that a cache hit stays cheap.
+
+        Args:
+            task_type: Category of task
+
+        Returns:
+            Hashable template cache key
+        """
+        normalized_type = task_type.lower().strip()
+        if normalized_type not in TASK_TYPE_INSTRUCTIONS:
+            normalized_type = "default"
+        framework = self.config.framework
+        prompt = self.config.prompt
+        return (
+            framework.evidential, framework.aspectual, framework.morphological,
+            framework.compositional, framework.honorific, framework.classifier,
+            framework.spatial, framework.max_frame_depth,
+            prompt.verix_strictness, prompt.compression_level,
+            prompt.require_ground, prompt.require_confidence,
+            tuple(f.name for f in self.active_frames),
+            normalized_type,
+            self._selected_mode.name if self._selected_mode else None,
+        )
+
+    def _compiled_template(self, task_type: str) -> Tuple[PromptComponents, str]:
+        """
+        Get (or compile) the static components and system prompt.
+
+        Args:
+            task_type: Category of task
+
+        Returns:
+            (components without task content, system prompt)
+        """
+        cache = PromptBuilder._template_cache
+        self._check_template_state()
+        key = self.template_key(task_type)
+        compiled = cache.get(key)
+        if compiled is not None:
+            PromptBuilder._template_hits += 1
+            return compiled
+
+        PromptBuilder._template_misses += 1
+        compiled = self._compile_template(task_type)
+        if len(cache) >= self.TEMPLATE_CACHE_SIZE:
+            cache.clear()
+        cache[key] = compiled
+        return compiled
+
+    def _compile_template(self, task_type: str) -> Tuple[PromptComponents, str]:
+        """Build the static components and system prompt from scratch."""
+        components = PromptComponents(
+            base_instruction=self._base_instruction(task_type),
+            frame_activations=self._frame_activations(),
+            verix_requirements=self._verix_requirements(),
+            output_format=self._output_format(),
+            task_content="",
+        )
+        return components, self._assemble_system_prompt(components)
+
+    @classmethod
+    def _check_template_state(cls) -> None:
+        """Drop compiled templates if frame weights or feature flags changed."""
+        weights = verilingua.FRAME_WEIGHTS
+        flags = vars(HofstadterFeatureFlags.get_instance())
+        state = PromptBuilder._template_state
+        if state is None or state[0] != weights or state[1] != flags:
+            PromptBuilder._template_cache.clear()
+            PromptBuilder._template_state = (dict(weights), dict(flags))
+
+    @classmethod
+    def clear_template_cache(cls) -> None:
+        """Drop all compiled templates and reset the hit/miss counters."""
+        PromptBuilder._template_cache.clear()
+        PromptBuilder._template_state = None
+        PromptBuilder._template_hits = 0
+        PromptBuilder._template_misses = 0
+
+    @classmethod
+    def template_cache_info(cls) -> Dict[str, Any]:
+        """Return template cache hits, misses and size."""
+        return {
+            "hits": PromptBuilder._template_hits,
+            "misses": PromptBuilder._template_misses,
+            "size": len(PromptBuilder._template_cache),
+        }
+
     def _select_and_apply_mode(self, task: str, task_type: str) -> None:
         """
         FIX-4: Select optimal mode based on task context and apply configuration.
@@ -0,0 +1,254 @@
+"""
+Response Cache - content-addressed on-disk cache for LLM responses.
+
+Optimization runs re-send identical requests: configs that decode to the
+same prompts, repeated holdout validation, reruns of a corpus. The cache
+keys each response by a SHA-256 of the fully built request (prompts,
+model, max_tokens, provider) so those requests are paid for once.
+
+Storage is a single SQLite file (WAL mode, safe to share between threads
+and processes) with:
+- TTL expiry on read and on write
+- LRU eviction to an entry cap and a byte cap
+- hit/miss/eviction counters per cache instance
+
+Entry count and byte total live in a one-row meta table kept current by
+triggers, so puts never scan the table; expiry and eviction walk the
+`created` and `(accessed, size)` indexes and stop at the first row they
+keep.
+
+Runtimes take an optional `cache` plus a `bypass_cache` flag; bypassing
+skips lookups but still stores the fresh response, refreshing the entry.
+Messages API callers store {"response", "input_tokens", "output_tokens"}
+under an "anthropic-messages" provider key, so entries are interchangeable.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache with LRU/TTL eviction.
+
+    Values are JSON-serializable dicts (response text plus whatever usage
+    data the caller needs to rebuild its result).
+    """
+
+    DEFAULT_PATH = Path(__file__).parent.parent / "storage" / "response-cache" / "responses.sqlite3"
+    DEFAULT_MAX_ENTRIES = 10_000
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Open (or create) a cache.
+
+        Args:
+            path: SQLite file (defaults to storage/response-cache/responses.sqlite3);
+                ":memory:" for a process-local cache
+            max_entries: LRU entry cap
+            max_bytes: LRU cap on the summed size of stored values
+            ttl_seconds: Entry lifetime (None = no expiry)
+        """
+        self.path = str(path) if path is not None else str(self.DEFAULT_PATH)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._create_meta()
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """
+        Content address of a request.
+
+        Args:
+            request: Everything that determines the response (prompts,
+                model, max_tokens, provider, ...); must be JSON-serializable
+
+        Returns:
+            Hex SHA-256 of the canonical JSON encoding
+        """
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached value, refreshing its LRU position.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Stored dict, or None on a miss or an expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._expired(row[1], now):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.expirations += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a value and evict expired / least recently used entries.
+
+        Args:
+            key: Key from make_key()
+            value: JSON-serializable dict
+        """
+        data = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            # An upsert (not INSERT OR REPLACE) so the meta triggers see an update
+            self._conn.execute(
+                "INSERT INTO responses (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "created = excluded.created, accessed = excluded.accessed",
+                (key, data, size, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created > self.ttl_seconds
+
+    def _create_meta(self) -> None:
+        """Create indexes and the trigger-maintained entry/byte totals."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses(created)")
+            # Covers the LRU walk (rowid, accessed, size) without touching values
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses(accessed, size)")
+            self._conn.execute("DROP INDEX IF EXISTS responses_accessed")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses_meta ("
+                "id INTEGER PRIMARY KEY CHECK (id = 1), entries INTEGER NOT NULL, bytes INTEGER NOT NULL)"
+            )
+            # Seeds the totals once, for a store created before the meta table
+            self._conn.execute(
+                "INSERT OR IGNORE INTO responses_meta (id, entries, bytes) "
+                "SELECT 1, COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_meta_insert AFTER INSERT ON responses BEGIN "
+                "UPDATE responses_meta SET entries = entries + 1, bytes = bytes + new.size WHERE id = 1; END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_meta_delete AFTER DELETE ON responses BEGIN "
+                "UPDATE responses_meta SET entries = entries - 1, bytes = bytes - old.size WHERE id = 1; END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_meta_update AFTER UPDATE OF size ON responses BEGIN "
+                "UPDATE responses_meta SET bytes = bytes - old.size + new.size WHERE id = 1; END"
+            )
+            self._conn.commit()
+        except BaseException:
+            self._conn.rollback()
+            raise
+
+    def _totals(self) -> tuple:
+        """(entries, bytes) from the meta row."""
+        return self._conn.execute("SELECT entries, bytes FROM responses_meta WHERE id = 1").fetchone()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then LRU entries until within both caps."""
+        if self.ttl_seconds is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,)
+            )
+            self.expirations += max(0, cursor.rowcount)
+
+        count, total = self._totals()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        # Least recently used first, until both caps hold; the cursor is lazy
+        # and reads only the index, so this stops at the first kept entry
+        victims = 0
+        walk = self._conn.execute("SELECT size FROM responses ORDER BY accessed ASC")
+        try:
+            for (size,) in walk:
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                victims += 1
+                count -= 1
+                total -= size
+        finally:
+            walk.close()
+        cursor = self._conn.execute(
+            "DELETE FROM responses WHERE rowid IN "
+            "(SELECT rowid FROM responses ORDER BY accessed ASC LIMIT ?)",
+            (victims,),
+        )
+        self.evictions += max(0, cursor.rowcount)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this instance plus current size of the store."""
+        with self._lock:
+            entries, size = self._totals()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._totals()[0]
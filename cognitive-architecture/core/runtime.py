@@ -11,9 +11,13 @@ The runtime wraps the Anthropic SDK but could be swapped
 for other providers without changing the rest of the system.
 """
 
+import asyncio
 import os
+import random
+import threading
 import time
-from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -27,6 +31,7 @@ from .config import FullConfig
 from .prompt_builder import PromptBuilder
 from .verix import VerixParser, VerixClaim, VerixValidator
 from .frame_validation_bridge import ValidationFeedback
+from .response_cache import ResponseCache
 
 import logging
 
@@ -47,6 +52,12 @@ class ExecutionMetrics:
     latency_ms: float = 0.0
     model: str = ""
     timestamp: str = ""
+    retries: int = 0
+    cache_hits: int = 0  # 1 when served from the ResponseCache
+
+    # Batch aggregates (see aggregate())
+    request_count: int = 1
+    wall_time_ms: float = 0.0
 
     # Estimated cost in USD (approximate)
     input_cost_per_1k: float = 0.003  # Claude 3 Sonnet default
@@ -59,6 +70,46 @@ class ExecutionMetrics:
         output_cost = (self.output_tokens / 1000) * self.output_cost_per_1k
         return input_cost + output_cost
 
+    @property
+    def requests_per_second(self) -> float:
+        """Batch throughput (0.0 when no wall time was recorded)."""
+        if self.wall_time_ms <= 0:
+            return 0.0
+        return self.request_count / (self.wall_time_ms / 1000)
+
+    @classmethod
+    def aggregate(
+        cls,
+        metrics: List["ExecutionMetrics"],
+        wall_time_ms: float = 0.0,
+    ) -> "ExecutionMetrics":
+        """
+        Combine per-request metrics from a batch.
+
+        Tokens, latency and retries are summed, so latency_ms is the total
+        time spent in requests; wall_time_ms is the elapsed batch time.
+
+        Args:
+            metrics: Per-request metrics
+            wall_time_ms: Elapsed wall-clock time of the batch
+
+        Returns:
+            Aggregated ExecutionMetrics
+        """
+        timestamps = [m.timestamp for m in metrics if m.timestamp]
+        return cls(
+            input_tokens=sum(m.input_tokens for m in metrics),
+            output_tokens=sum(m.output_tokens for m in metrics),
+            total_tokens=sum(m.total_tokens for m in metrics),
+            latency_ms=sum(m.latency_ms for m in metrics),
+            model=next((m.model for m in metrics if m.model), ""),
+            timestamp=min(timestamps) if timestamps else "",
+            retries=sum(m.retries for m in metrics),
+            cache_hits=sum(m.cache_hits for m in metrics),
+            request_count=len(metrics),
+            wall_time_ms=wall_time_ms,
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging."""
         return {
@@ -68,6 +119,10 @@ class ExecutionMetrics:
             "latency_ms": self.latency_ms,
             "model": self.model,
             "timestamp": self.timestamp,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "request_count": self.request_count,
+            "wall_time_ms": self.wall_time_ms,
             "estimated_cost_usd": self.estimated_cost,
         }
 
@@ -109,6 +164,87 @@ class ExecutionResult:
         }
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill at `rate` per second up to `capacity`. reserve() always
+    takes the token (the balance may go negative, queueing later callers
+    behind earlier ones) and returns how long the caller must wait, so the
+    same bucket serves threads (acquire) and coroutines (acquire_async).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens and return the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until tokens are available."""
+        delay = self.reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Wait (without blocking the event loop) until tokens are available."""
+        delay = self.reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry schedule for transient API errors.
+
+    Uses exponential backoff with full jitter: attempt n sleeps a uniform
+    random time in [0, min(max_delay, base_delay * 2**n)], which keeps
+    concurrent requests from retrying in lockstep.
+    """
+    max_retries: int = 2
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def delay(self, attempt: int) -> float:
+        """Backoff before retry number `attempt` (0-based)."""
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    # Same status codes the SDK's built-in retry treats as transient
+    RETRYABLE_STATUS_CODES = (408, 409, 429)
+
+    @classmethod
+    def is_retryable(cls, error: Exception) -> bool:
+        """Timeouts, conflicts, rate limits, 5xx/overloaded and connection errors."""
+        if not HAS_ANTHROPIC:
+            return False
+        if isinstance(error, anthropic.APIStatusError):
+            return error.status_code in cls.RETRYABLE_STATUS_CODES or error.status_code >= 500
+        return isinstance(error, anthropic.APIConnectionError)
+
+
+TaskSpec = Union[str, Tuple[str, str]]
+
+
 class ClaudeRuntime:
     """
     Claude API client wrapper for executing cognitive prompts.
@@ -122,6 +258,7 @@ class ClaudeRuntime:
 
     DEFAULT_MODEL = "claude-sonnet-4-20250514"
     DEFAULT_MAX_TOKENS = 4096
+    DEFAULT_MAX_CONCURRENCY = 4
 
     def __init__(
         self,
@@ -129,6 +266,12 @@ class ClaudeRuntime:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_second: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        base_url: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False,
     ):
         """
         Initialize runtime with configuration.
@@ -138,10 +281,24 @@ class ClaudeRuntime:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
             model: Model to use (defaults to claude-sonnet-4-20250514)
             max_tokens: Max output tokens (defaults to 4096)
+            max_concurrency: Max API calls in flight in execute_many()
+            requests_per_second: Token-bucket rate limit shared by all calls
+                (None = unlimited)
+            retry_policy: Retry schedule for transient errors (defaults to
+                RetryPolicy())
+            base_url: API base URL override (e.g. a local stub server)
+            cache: ResponseCache for identical requests (None = no caching)
+            bypass_cache: Skip cache lookups but still store fresh responses
         """
         self.config = config
         self.model = model or self.DEFAULT_MODEL
         self.max_tokens = max_tokens or self.DEFAULT_MAX_TOKENS
+        self.max_concurrency = max(1, max_concurrency)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+        self.last_batch_metrics: Optional[ExecutionMetrics] = None
+        self.cache = cache
+        self.bypass_cache = bypass_cache
 
         # Initialize components
         self.prompt_builder = PromptBuilder(config)
@@ -153,7 +310,11 @@ class ClaudeRuntime:
         self._client: Optional[Any] = None
 
         if HAS_ANTHROPIC and self._api_key:
-            self._client = anthropic.Anthropic(api_key=self._api_key)
+            self._client = self._create_client(base_url)
+
+    def _create_client(self, base_url: Optional[str]) -> Any:
+        """Create the SDK client; retries are left to retry_policy."""
+        return anthropic.Anthropic(api_key=self._api_key, base_url=base_url, max_retries=0)
 
     @property
     def is_available(self) -> bool:
@@ -182,6 +343,55 @@ class ClaudeRuntime:
         # Execute via API
         result = self._call_api(system_prompt, user_prompt)
 
+        return self._finalize(result, task_type)
+
+    def execute_many(
+        self,
+        tasks: Sequence[TaskSpec],
+        max_concurrency: Optional[int] = None,
+    ) -> List[ExecutionResult]:
+        """
+        Execute several tasks with bounded parallelism.
+
+        Prompt building and post-processing (parsing, validation, feedback,
+        telemetry) run on the calling thread in input order; only the API
+        calls run concurrently, on a thread pool. Aggregated metrics for the
+        batch are stored in last_batch_metrics.
+
+        Args:
+            tasks: Task strings or (task, task_type) pairs
+            max_concurrency: Override for self.max_concurrency
+
+        Returns:
+            ExecutionResults in the order of tasks
+        """
+        jobs = [self._task_pair(task) for task in tasks]
+        prompts = [self.prompt_builder.build(task, task_type) for task, task_type in jobs]
+        workers = min(max_concurrency or self.max_concurrency, len(prompts))
+
+        start_time = time.time()
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                raw = list(pool.map(lambda prompt: self._call_api(*prompt), prompts))
+        else:
+            raw = [self._call_api(*prompt) for prompt in prompts]
+        wall_time_ms = (time.time() - start_time) * 1000
+
+        results = [self._finalize(result, task_type) for result, (_, task_type) in zip(raw, jobs)]
+        self.last_batch_metrics = ExecutionMetrics.aggregate(
+            [result.metrics for result in results], wall_time_ms
+        )
+        return results
+
+    @staticmethod
+    def _task_pair(task: TaskSpec) -> Tuple[str, str]:
+        """Normalize a task string or (task, task_type) pair."""
+        if isinstance(task, str):
+            return task, "default"
+        return task[0], task[1]
+
+    def _finalize(self, result: ExecutionResult, task_type: str) -> ExecutionResult:
+        """Parse, validate and record feedback for an API result."""
         if not result.success:
             return result
 
@@ -253,6 +463,10 @@ class ClaudeRuntime:
         """
         Make API call to Claude.
 
+        Serves identical requests from the response cache when one is set;
+        otherwise waits on the rate limiter before each attempt and retries
+        transient errors according to retry_policy.
+
         Args:
             system_prompt: System prompt
             user_prompt: User prompt
@@ -261,62 +475,129 @@ class ClaudeRuntime:
             ExecutionResult with response and metrics
         """
         if not self.is_available:
-            return ExecutionResult(
-                response="",
-                success=False,
-                error="Anthropic client not available (missing API key or package)",
-            )
+            return self._unavailable_result()
 
         start_time = time.time()
         timestamp = datetime.now().isoformat()
+        params = self._request_params(system_prompt, user_prompt)
+        cached = self._cache_lookup(params, start_time, timestamp)
+        if cached:
+            return cached
+        retries = 0
+
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                message = self._client.messages.create(**params)
+                return self._cache_store(
+                    params, self._result_from_message(message, start_time, timestamp, retries)
+                )
+            except Exception as e:
+                if retries < self.retry_policy.max_retries and self.retry_policy.is_retryable(e):
+                    time.sleep(self.retry_policy.delay(retries))
+                    retries += 1
+                    continue
+                return self._error_result(e, timestamp, retries)
+
+    def _request_params(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Messages API parameters for one call."""
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "system": system_prompt,
+            "messages": [
+                {"role": "user", "content": user_prompt}
+            ],
+        }
 
-        try:
-            message = self._client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ],
-            )
+    def _result_from_message(
+        self,
+        message: Any,
+        start_time: float,
+        timestamp: str,
+        retries: int,
+    ) -> ExecutionResult:
+        """Build an ExecutionResult from a Messages API response."""
+        # Extract response
+        response_text = ""
+        for block in message.content:
+            if hasattr(block, "text"):
+                response_text += block.text
+
+        # Calculate metrics
+        latency_ms = (time.time() - start_time) * 1000
+        metrics = ExecutionMetrics(
+            input_tokens=message.usage.input_tokens,
+            output_tokens=message.usage.output_tokens,
+            total_tokens=message.usage.input_tokens + message.usage.output_tokens,
+            latency_ms=latency_ms,
+            model=self.model,
+            timestamp=timestamp,
+            retries=retries,
+        )
 
-            # Extract response
-            response_text = ""
-            for block in message.content:
-                if hasattr(block, "text"):
-                    response_text += block.text
-
-            # Calculate metrics
-            latency_ms = (time.time() - start_time) * 1000
-            metrics = ExecutionMetrics(
-                input_tokens=message.usage.input_tokens,
-                output_tokens=message.usage.output_tokens,
-                total_tokens=message.usage.input_tokens + message.usage.output_tokens,
-                latency_ms=latency_ms,
-                model=self.model,
-                timestamp=timestamp,
-            )
+        return ExecutionResult(
+            response=response_text,
+            metrics=metrics,
+            success=True,
+        )
 
-            return ExecutionResult(
-                response=response_text,
-                metrics=metrics,
-                success=True,
-            )
+    def _cache_key(self, params: Dict[str, Any]) -> str:
+        return ResponseCache.make_key({"provider": "anthropic-messages", **params})
 
-        except anthropic.APIError as e:
-            return ExecutionResult(
-                response="",
-                success=False,
-                error=f"API error: {e}",
-                metrics=ExecutionMetrics(timestamp=timestamp),
-            )
-        except Exception as e:
-            return ExecutionResult(
-                response="",
-                success=False,
-                error=f"Unexpected error: {e}",
-                metrics=ExecutionMetrics(timestamp=timestamp),
-            )
+    def _cache_lookup(
+        self,
+        params: Dict[str, Any],
+        start_time: float,
+        timestamp: str,
+    ) -> Optional[ExecutionResult]:
+        """Return a cached result for identical request parameters, if any."""
+        if self.cache is None or self.bypass_cache:
+            return None
+        entry = self.cache.get(self._cache_key(params))
+        if entry is None:
+            return None
+        # Token counts are those of the original call, so outcome metrics
+        # do not depend on whether a response came from the cache
+        metrics = ExecutionMetrics(
+            input_tokens=entry["input_tokens"],
+            output_tokens=entry["output_tokens"],
+            total_tokens=entry["input_tokens"] + entry["output_tokens"],
+            latency_ms=(time.time() - start_time) * 1000,
+            model=self.model,
+            timestamp=timestamp,
+            cache_hits=1,
+        )
+        return ExecutionResult(response=entry["response"], metrics=metrics, success=True)
+
+    def _cache_store(self, params: Dict[str, Any], result: ExecutionResult) -> ExecutionResult:
+        """Store a successful result in the cache and return it."""
+        if self.cache is not None:
+            self.cache.put(self._cache_key(params), {
+                "response": result.response,
+                "input_tokens": result.metrics.input_tokens,
+                "output_tokens": result.metrics.output_tokens,
+            })
+        return result
+
+    @staticmethod
+    def _unavailable_result() -> ExecutionResult:
+        return ExecutionResult(
+            response="",
+            success=False,
+            error="Anthropic client not available (missing API key or package)",
+        )
+
+    @staticmethod
+    def _error_result(error: Exception, timestamp: str, retries: int) -> ExecutionResult:
+        prefix = "API error" if isinstance(error, anthropic.APIError) else "Unexpected error"
+        return ExecutionResult(
+            response="",
+            success=False,
+            error=f"{prefix}: {error}",
+            metrics=ExecutionMetrics(timestamp=timestamp, retries=retries),
+        )
 
     def validate_response(self, response: str) -> Tuple[bool, List[str]]:
         """
@@ -386,6 +667,114 @@ class ClaudeRuntime:
         }
 
 
+class AsyncClaudeRuntime(ClaudeRuntime):
+    """
+    asyncio variant of ClaudeRuntime built on anthropic.AsyncAnthropic.
+
+    execute(), execute_raw() and execute_many() are coroutines; prompt
+    building, parsing, validation and feedback are shared with
+    ClaudeRuntime. Concurrency is bounded by a semaphore instead of a
+    thread pool, so many requests can be in flight from one thread.
+    """
+
+    def _create_client(self, base_url: Optional[str]) -> Any:
+        """Create the async SDK client; retries are left to retry_policy."""
+        return anthropic.AsyncAnthropic(api_key=self._api_key, base_url=base_url, max_retries=0)
+
+    async def execute(self, task: str, task_type: str = "default") -> ExecutionResult:
+        """
+        Execute a task and return structured result.
+
+        Args:
+            task: Task description
+            task_type: Category of task
+
+        Returns:
+            ExecutionResult with response, claims, metrics, validation, and feedback
+        """
+        system_prompt, user_prompt = self.prompt_builder.build(task, task_type)
+        result = await self._call_api(system_prompt, user_prompt)
+        return self._finalize(result, task_type)
+
+    async def execute_many(
+        self,
+        tasks: Sequence[TaskSpec],
+        max_concurrency: Optional[int] = None,
+    ) -> List[ExecutionResult]:
+        """
+        Execute several tasks with at most max_concurrency calls in flight.
+
+        Args:
+            tasks: Task strings or (task, task_type) pairs
+            max_concurrency: Override for self.max_concurrency
+
+        Returns:
+            ExecutionResults in the order of tasks
+        """
+        jobs = [self._task_pair(task) for task in tasks]
+        prompts = [self.prompt_builder.build(task, task_type) for task, task_type in jobs]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
+
+        async def call(prompt: Tuple[str, str]) -> ExecutionResult:
+            async with semaphore:
+                return await self._call_api(*prompt)
+
+        start_time = time.time()
+        raw = await asyncio.gather(*(call(prompt) for prompt in prompts))
+        wall_time_ms = (time.time() - start_time) * 1000
+
+        results = [self._finalize(result, task_type) for result, (_, task_type) in zip(raw, jobs)]
+        self.last_batch_metrics = ExecutionMetrics.aggregate(
+            [result.metrics for result in results], wall_time_ms
+        )
+        return results
+
+    async def execute_raw(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+    ) -> ExecutionResult:
+        """Execute with pre-built prompts (bypass PromptBuilder)."""
+        return await self._call_api(system_prompt, user_prompt)
+
+    async def _call_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+    ) -> ExecutionResult:
+        """Make API call to Claude with rate limiting and retries."""
+        if not self.is_available:
+            return self._unavailable_result()
+
+        start_time = time.time()
+        timestamp = datetime.now().isoformat()
+        params = self._request_params(system_prompt, user_prompt)
+        cached = self._cache_lookup(params, start_time, timestamp)
+        if cached:
+            return cached
+        retries = 0
+
+        while True:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+            try:
+                message = await self._client.messages.create(**params)
+                return self._cache_store(
+                    params, self._result_from_message(message, start_time, timestamp, retries)
+                )
+            except Exception as e:
+                if retries < self.retry_policy.max_retries and self.retry_policy.is_retryable(e):
+                    await asyncio.sleep(self.retry_policy.delay(retries))
+                    retries += 1
+                    continue
+                return self._error_result(e, timestamp, retries)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client is not None:
+            await self._client.close()
+
+
 class MockRuntime:
     """
     Mock runtime for testing without API calls.
@@ -401,6 +790,7 @@ class MockRuntime:
         self.verix_parser = VerixParser(config.prompt)
         self.verix_validator = VerixValidator(config.prompt)
         self._call_count = 0
+        self.last_batch_metrics: Optional[ExecutionMetrics] = None
 
     @property
     def is_available(self) -> bool:
@@ -445,6 +835,19 @@ class MockRuntime:
             violations=violations,
         )
 
+    def execute_many(
+        self,
+        tasks: Sequence[TaskSpec],
+        max_concurrency: Optional[int] = None,
+    ) -> List[ExecutionResult]:
+        """Execute tasks in order (same interface as ClaudeRuntime.execute_many)."""
+        start_time = time.time()
+        results = [self.execute(*ClaudeRuntime._task_pair(task)) for task in tasks]
+        self.last_batch_metrics = ExecutionMetrics.aggregate(
+            [result.metrics for result in results], (time.time() - start_time) * 1000
+        )
+        return results
+
     def _generate_mock_response(self, task: str, task_type: str) -> str:
         """Generate a mock VERIX-formatted response."""
         # Extract key terms from task
@@ -516,20 +919,71 @@ def evaluate(config_vector: List[float], tasks: List[Dict[str, Any]]) -> Dict[st
         - edge_robustness: 0.0-1.0
         - epistemic_consistency: 0.0-1.0
     """
+    return aggregate_outcomes(score_tasks(config_vector, tasks))
+
+
+# Per-task evaluation score: (accuracy, total_tokens, validity)
+TaskScore = Tuple[float, int, float]
+
+
+def score_tasks(config_vector: List[float], tasks: List[Dict[str, Any]]) -> List[TaskScore]:
+    """
+    Score each task under a configuration vector.
+
+    Tasks score independently, so a corpus can be split into shards, scored
+    in separate workers and concatenated before aggregate_outcomes().
+
+    Args:
+        config_vector: 14-dimensional configuration vector
+        tasks: List of task dicts with 'task', 'task_type', 'expected' keys
+
+    Returns:
+        One (accuracy, total_tokens, validity) tuple per task, in order
+    """
     from .config import VectorCodec
 
+    if not tasks:
+        return []
+
     # Decode config from vector
     config = VectorCodec.decode(config_vector)
 
     # Create runtime (mock for now, real API would be used in production)
     runtime = create_runtime(config, use_mock=True)
 
-    # Initialize outcome accumulators
-    total_accuracy = 0.0
-    total_tokens = 0
-    total_validity = 0.0
-    task_count = len(tasks)
+    # Evaluate all tasks (concurrently when the runtime supports it)
+    results = runtime.execute_many([
+        (task_data.get("task", ""), task_data.get("task_type", "default"))
+        for task_data in tasks
+    ])
+
+    scores = []
+    for result in results:
+        if not result.success:
+            scores.append((0.0, 0, 0.0))
+            continue
+        # Accuracy: based on VERIX validity
+        accuracy = 1.0 if result.is_valid else 0.5
+        # Validity score (neutral if no claims)
+        validity = (
+            runtime.verix_validator.compliance_score(result.claims)
+            if result.claims else 0.5
+        )
+        scores.append((accuracy, result.metrics.total_tokens, validity))
+    return scores
+
 
+def aggregate_outcomes(scores: List[TaskScore]) -> Dict[str, float]:
+    """
+    Combine per-task scores into the evaluate() outcome dict.
+
+    Args:
+        scores: Output of score_tasks(), in task order
+
+    Returns:
+        Outcome metrics as returned by evaluate()
+    """
+    task_count = len(scores)
     if task_count == 0:
         return {
             "task_accuracy": 0.0,
@@ -538,28 +992,17 @@ def evaluate(config_vector: List[float], tasks: List[Dict[str, Any]]) -> Dict[st
             "epistemic_consistency": 0.0,
         }
 
-    # Evaluate each task
-    for task_data in tasks:
-        task = task_data.get("task", "")
-        task_type = task_data.get("task_type", "default")
-
-        result = runtime.execute(task, task_type)
-
-        if result.success:
-            # Accuracy: based on VERIX validity
-            total_accuracy += 1.0 if result.is_valid else 0.5
-            total_tokens += result.metrics.total_tokens
-
-            # Validity score
-            if result.claims:
-                compliance = runtime.verix_validator.compliance_score(result.claims)
-                total_validity += compliance
-            else:
-                total_validity += 0.5  # Neutral if no claims
+    total_accuracy = 0.0
+    total_tokens = 0
+    total_validity = 0.0
+    for accuracy, tokens, validity in scores:
+        total_accuracy += accuracy
+        total_tokens += tokens
+        total_validity += validity
 
     # Calculate final outcomes
     avg_accuracy = total_accuracy / task_count
-    avg_tokens = total_tokens / task_count if task_count > 0 else 1000
+    avg_tokens = total_tokens / task_count
 
     # Token efficiency: normalize to 0-1 (lower tokens = higher score)
     # Assume baseline is 500 tokens, max is 2000
@@ -42,7 +42,8 @@ Compression Levels:
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from array import array
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
 from enum import Enum
 import re
 
@@ -136,7 +137,7 @@ class MetaLevel(Enum):
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class VerixClaim:
     """
     Parsed VERIX claim with all components.
@@ -327,7 +328,41 @@ class VerixParser:
         """
         Extract all VERIX claims from text.
 
-        Tries L1 format first, then L0 format.
+        L1 claims take precedence; L0 claims are only returned when the text
+        contains no L1 claims. Uses the single-pass VerixTokenizer, which
+        produces the same claims as parse_regex().
+
+        Args:
+            text: Text containing VERIX-formatted claims
+
+        Returns:
+            List of parsed VerixClaim objects
+        """
+        tokenizer = VerixTokenizer()
+        tokenizer.feed(text)
+        return tokenizer.claims()
+
+    def parse_table(self, text: str) -> "ClaimTable":
+        """
+        Extract claims into a compact ClaimTable.
+
+        Same claims as parse(), stored as offsets into text and small-int
+        codes instead of one object and three substrings per claim.
+
+        Args:
+            text: Text containing VERIX-formatted claims
+
+        Returns:
+            ClaimTable whose rows are VerixClaim-compatible views
+        """
+        return ClaimTable.from_text(text)
+
+    def parse_regex(self, text: str) -> List[VerixClaim]:
+        """
+        Extract claims with the original dual-regex scan.
+
+        Tries L1 format first, then L0 format. Kept as the reference
+        implementation for VerixTokenizer.
 
         Args:
             text: Text containing VERIX-formatted claims
@@ -367,85 +402,607 @@ class VerixParser:
 
     def _parse_l1_match(self, match: re.Match) -> Optional[VerixClaim]:
         """Parse an L1 format regex match into VerixClaim."""
-        try:
-            # Extract meta-level if present (FR2.3)
-            meta_str = match.group("meta")
-            meta_level = MetaLevel.from_string(meta_str)
-
-            # Extract agent if present (FR2.1)
-            agent_str = match.group("agent")
-            agent = Agent(agent_str.lower()) if agent_str else None
-
-            claim_id = match.group("claim_id")  # May be None if not present
-            illocution = Illocution(match.group("illocution").lower())
-            affect = Affect(match.group("affect").lower())
-            content = match.group("content").strip()
-            ground = match.group("ground")
-            confidence_str = match.group("confidence")
-            confidence = float(confidence_str) if confidence_str else 0.5
-            state_str = match.group("state")
-            state = State(state_str.lower()) if state_str else State.PROVISIONAL
-
-            return VerixClaim(
-                illocution=illocution,
-                affect=affect,
-                content=content,
-                ground=ground,
-                confidence=confidence,
-                state=state,
-                raw_text=match.group(0),
-                claim_id=claim_id,
-                agent=agent,
-                meta_level=meta_level,
-            )
-        except (ValueError, KeyError):
-            return None
+        return _build_l1_claim(
+            *match.group(
+                "meta", "agent", "claim_id", "illocution", "affect",
+                "content", "ground", "confidence", "state",
+            ),
+            raw_text=match.group(0),
+        )
 
     def _parse_l0_match(self, match: re.Match) -> Optional[VerixClaim]:
         """Parse an L0 format regex match into VerixClaim."""
-        try:
-            agent_map = {
-                "M": Agent.MODEL,
-                "U": Agent.USER,
-                "S": Agent.SYSTEM,
-                "D": Agent.DOC,
-                "P": Agent.PROCESS,
-            }
-            illocution_map = {
-                "A": Illocution.ASSERT,
-                "?": Illocution.QUERY,
-                "!": Illocution.DIRECT,
-                "C": Illocution.COMMIT,
-                "E": Illocution.EXPRESS,
-            }
-            affect_map = {
-                ".": Affect.NEUTRAL,
-                "+": Affect.POSITIVE,
-                "-": Affect.NEGATIVE,
-                "~": Affect.UNCERTAIN,
-            }
+        return _build_l0_claim(match)
+
+
+# Lookup tables for claim construction (built once, not per match)
+_ILLOCUTIONS = {i.value: i for i in Illocution}
+_AFFECTS = {a.value: a for a in Affect}
+_STATES = {s.value: s for s in State}
+_AGENTS = {a.value: a for a in Agent}
+
+_L0_AGENTS = {
+    "M": Agent.MODEL,
+    "U": Agent.USER,
+    "S": Agent.SYSTEM,
+    "D": Agent.DOC,
+    "P": Agent.PROCESS,
+}
+_L0_ILLOCUTIONS = {
+    "A": Illocution.ASSERT,
+    "?": Illocution.QUERY,
+    "!": Illocution.DIRECT,
+    "C": Illocution.COMMIT,
+    "E": Illocution.EXPRESS,
+}
+_L0_AFFECTS = {
+    ".": Affect.NEUTRAL,
+    "+": Affect.POSITIVE,
+    "-": Affect.NEGATIVE,
+    "~": Affect.UNCERTAIN,
+}
+
+
+def _build_l1_claim(
+    meta: Optional[str],
+    agent: Optional[str],
+    claim_id: Optional[str],
+    illocution: str,
+    affect: str,
+    content: str,
+    ground: Optional[str],
+    confidence: Optional[str],
+    state: Optional[str],
+    raw_text: str,
+) -> Optional[VerixClaim]:
+    """Build a VerixClaim from L1 fields; None if a marker is unknown."""
+    try:
+        return VerixClaim(
+            illocution=_ILLOCUTIONS[illocution.lower()],
+            affect=_AFFECTS[affect.lower()],
+            content=content.strip(),
+            ground=ground,
+            confidence=float(confidence) if confidence else 0.5,
+            state=_STATES[state.lower()] if state else State.PROVISIONAL,
+            raw_text=raw_text,
+            claim_id=claim_id,
+            agent=_AGENTS[agent.lower()] if agent else None,
+            meta_level=MetaLevel.from_string(meta),
+        )
+    except (ValueError, KeyError):
+        return None
+
+
+def _build_l0_claim(match: re.Match) -> Optional[VerixClaim]:
+    """Build a VerixClaim from an L0_PATTERN match; None if invalid."""
+    try:
+        agent_char = match.group("agent")
+        return VerixClaim(
+            illocution=_L0_ILLOCUTIONS[match.group("illocution")],
+            affect=_L0_AFFECTS[match.group("affect")],
+            content=match.group("content").strip(),
+            ground=None,  # L0 doesn't include ground
+            confidence=int(match.group("confidence")) / 100.0,
+            state=State.PROVISIONAL,  # L0 doesn't include state
+            raw_text=match.group(0),
+            agent=_L0_AGENTS.get(agent_char) if agent_char else None,
+        )
+    except (ValueError, KeyError):
+        return None
+
+
+class _L1Token(NamedTuple):
+    """Offsets of one L1 claim located by VerixTokenizer ((-1, -1) = absent)."""
+    start: int
+    end: int
+    meta: Optional[str]
+    agent: Optional[str]
+    illocution: str
+    affect: str
+    confidence: Optional[str]
+    state: Optional[str]
+    id_span: Tuple[int, int]
+    content_span: Tuple[int, int]
+    ground_span: Tuple[int, int]
+
+    def to_claim(self, text: str) -> Optional[VerixClaim]:
+        """Build the VerixClaim for this token from the scanned text."""
+        id_start, id_end = self.id_span
+        ground_start, ground_end = self.ground_span
+        return _build_l1_claim(
+            self.meta, self.agent,
+            text[id_start:id_end] if id_start >= 0 else None,
+            self.illocution, self.affect,
+            text[self.content_span[0]:self.content_span[1]],
+            text[ground_start:ground_end] if ground_start >= 0 else None,
+            self.confidence, self.state,
+            raw_text=text[self.start:self.end],
+        )
+
+
+class VerixTokenizer:
+    """
+    Single-pass, incremental VERIX tokenizer.
+
+    Recognizes L1 and L0 claims in one sweep over the text and produces the
+    same VerixClaim objects as VerixParser.parse_regex(). Instead of running
+    the backtracking L1 pattern at every offset, it jumps between
+    [illocution|affect] tags, walks back over the optional [meta]/[agent:X]/
+    [id:X] prefix tags and resolves the content/trailer split with an
+    anchored lookahead. L0 lines are checked once per completed line, and
+    only until the first L1 claim is seen.
+
+    Text can be fed incrementally as model output streams in:
+
+        tokenizer = VerixTokenizer()
+        for chunk in stream:
+            tokenizer.feed(chunk)
+        claims = tokenizer.claims()
+
+    An L1 claim is committed once no later text can change it (its trailer
+    can span lines); claims() always reflects everything fed so far, as if
+    the stream ended there.
+    """
+
+    _L1_TAG = re.compile(r'\[(?P<illocution>\w+)\|(?P<affect>\w+)\]')
+    _PREFIX_TAGS = (
+        ("claim_id", re.compile(r'\[id:([\w\-]+)\]')),
+        ("agent", re.compile(r'\[agent:(\w+)\]')),
+        ("meta", re.compile(r'\[(meta(?::verix)?)\]')),
+    )
+    _ANY_PREFIX_TAG = re.compile(r'\[(?:meta(?::verix)?|agent:\w+|id:[\w\-]+)\]')
+    # First offset where the L1 trailer can take over from the lazy content
+    _L1_TRAILER = re.compile(
+        r'(?=(?:\s*\[ground:(?P<ground>[^\]]+)\])?'
+        r'(?:\s*\[conf:(?P<confidence>[\d.]+)\])?'
+        r'(?:\s*\[state:(?P<state>\w+)\])?'
+        r'(?P<trailing>\s*)$)',
+        re.MULTILINE
+    )
+    _TRAILER_TAGS = ("[ground:", "[conf:", "[state:")
+    _WHITESPACE = re.compile(r'\s*')
+
+    def __init__(self):
+        """Initialize an empty tokenizer."""
+        self._buffer = ""
+        self._resume = 0  # no L1 claim can start before this offset
+        self._scan = 0    # next offset to search for an [illocution|affect] tag
+        self._l0_pos = 0  # start of the first line not yet checked for L0
+        self._l1_claims: List[VerixClaim] = []
+        self._l0_claims: List[VerixClaim] = []
+
+    def feed(self, chunk: str) -> None:
+        """
+        Add streamed text.
+
+        Completed lines are tokenized immediately; a trailing partial line
+        is held until more text (or claims()) arrives.
+
+        Args:
+            chunk: Next piece of model output
+        """
+        if not chunk:
+            return
+        self._buffer += chunk
+        if "\n" not in chunk:
+            return  # nothing can settle until a line completes
+
+        text = self._buffer
+        tokens, self._resume, self._scan = self._scan_l1(
+            text, self._resume, self._scan, final=False
+        )
+        self._l1_claims.extend(self._l1_claims_from(text, tokens))
+
+        last_line = text.rfind("\n") + 1
+        if self._l1_claims:
+            self._l0_claims = []
+            cut = self._resume
+        else:
+            self._l0_claims.extend(self._scan_l0(text, self._l0_pos, last_line - 1))
+            cut = min(self._resume, last_line)
+        self._l0_pos = last_line
+
+        if cut:
+            self._buffer = text[cut:]
+            self._resume -= cut
+            self._scan -= cut
+            self._l0_pos -= cut
+
+    def claims(self) -> List[VerixClaim]:
+        """
+        Return the claims in all text fed so far.
+
+        L1 claims take precedence; L0 claims are only returned when no L1
+        claim has been seen, matching VerixParser.parse_regex().
+
+        Returns:
+            List of parsed VerixClaim objects
+        """
+        tokens, _, _ = self._scan_l1(self._buffer, self._resume, self._scan, final=True)
+        pending = self._l1_claims_from(self._buffer, tokens)
+        if self._l1_claims or pending:
+            return self._l1_claims + pending
+        return self._l0_claims + self._scan_l0(self._buffer, self._l0_pos, len(self._buffer))
+
+    @staticmethod
+    def _scan_l0(text: str, pos: int, endpos: int) -> List[VerixClaim]:
+        """Parse the L0 lines in text[pos:endpos]."""
+        claims = []
+        for match in VerixParser.L0_PATTERN.finditer(text, pos, endpos):
+            claim = _build_l0_claim(match)
+            if claim:
+                claims.append(claim)
+        return claims
 
-            # Extract agent if present (FR2.1)
-            agent_char = match.group("agent")
-            agent = agent_map.get(agent_char) if agent_char else None
+    @staticmethod
+    def _l1_claims_from(text: str, tokens: List["_L1Token"]) -> List[VerixClaim]:
+        claims = []
+        for token in tokens:
+            claim = token.to_claim(text)
+            if claim:
+                claims.append(claim)
+        return claims
+
+    def _scan_l1(
+        self, text: str, resume: int, scan: int, final: bool
+    ) -> Tuple[List["_L1Token"], int, int]:
+        """
+        Locate L1 claims starting at scan.
 
-            illocution = illocution_map[match.group("illocution")]
-            affect = affect_map[match.group("affect")]
-            confidence = int(match.group("confidence")) / 100.0
-            content = match.group("content").strip()
+        With final=False, stops at the first claim that later text could
+        still change and returns the offsets to resume from.
 
-            return VerixClaim(
-                illocution=illocution,
-                affect=affect,
-                content=content,
-                ground=None,  # L0 doesn't include ground
+        Returns:
+            Tuple of (tokens, resume_offset, scan_offset)
+        """
+        tokens = []
+        while True:
+            tag = self._L1_TAG.search(text, scan)
+            if tag is None:
+                if not final:
+                    scan = max(scan, text.rfind("\n") + 1)
+                    resume = self._prefix_floor(text, resume, scan)
+                return tokens, resume, scan
+
+            start, prefix = self._prefix_tags(text, resume, tag.start())
+            content_start = self._WHITESPACE.match(text, tag.end()).end()
+            if content_start < len(text):
+                trailer = self._L1_TRAILER.search(
+                    text, self._trailer_floor(text, content_start)
+                )
+                content_end = trailer.start()
+                ground_span = trailer.span("ground")
+                confidence, state = trailer.group("confidence", "state")
+                end = trailer.end("trailing")
+                settled = final or self._is_settled(text, start, end)
+            else:
+                # Only whitespace follows the tag: the regex backtracks to use
+                # its last non-newline character as one-character content.
+                last = len(text.rstrip("\n")) - 1
+                if last < tag.end() or not final:
+                    return tokens, (resume if final else start), (scan if final else start)
+                content_start, content_end = last, last + 1
+                ground_span = (-1, -1)
+                confidence = state = None
+                end = len(text)
+                settled = True
+
+            if not settled:
+                return tokens, start, start
+
+            claim_id = prefix["claim_id"]
+            tokens.append(_L1Token(
+                start=start,
+                end=end,
+                meta=prefix["meta"] and prefix["meta"].group(1),
+                agent=prefix["agent"] and prefix["agent"].group(1),
+                illocution=tag.group("illocution"),
+                affect=tag.group("affect"),
                 confidence=confidence,
-                state=State.PROVISIONAL,  # L0 doesn't include state
-                raw_text=match.group(0),
-                agent=agent,
-            )
-        except (ValueError, KeyError):
-            return None
+                state=state,
+                id_span=claim_id.span(1) if claim_id else (-1, -1),
+                # content is stripped; it always starts on a non-space
+                # character except in the one-character case above
+                content_span=(
+                    content_start,
+                    self._skip_whitespace_back(text, content_start, content_end),
+                ),
+                ground_span=ground_span,
+            ))
+            resume = scan = end
+
+    def _trailer_floor(self, text: str, content_start: int) -> int:
+        """
+        Lower bound for where the lazy L1 content can end.
+
+        The trailer can only consume whitespace and [..] tags, so it cannot
+        start before the whitespace run ahead of the first "[" on the line
+        (or ahead of the line end when there is none).
+        """
+        line_end = text.find("\n", content_start)
+        if line_end < 0:
+            line_end = len(text)
+        bracket = text.find("[", content_start + 1, line_end)
+        if bracket < 0:
+            bracket = line_end
+        return self._skip_whitespace_back(text, content_start + 1, bracket)
+
+    def _prefix_tags(self, text: str, floor: int, tag_start: int) -> Tuple[int, dict]:
+        """Walk back from an [illocution|affect] tag over [id], [agent], [meta] matches."""
+        prefix = {"meta": None, "agent": None, "claim_id": None}
+        start = tag_start
+        for name, pattern in self._PREFIX_TAGS:
+            close = self._skip_whitespace_back(text, floor, start)
+            if close > floor and text[close - 1] == "]":
+                open_ = text.rfind("[", floor, close)
+                match = pattern.fullmatch(text, open_, close) if open_ >= 0 else None
+                if match:
+                    prefix[name] = match
+                    start = open_
+        return start, prefix
+
+    def _prefix_floor(self, text: str, floor: int, pos: int) -> int:
+        """Earliest offset a claim whose tag starts at/after pos could start from."""
+        for _ in range(len(self._PREFIX_TAGS)):
+            close = self._skip_whitespace_back(text, floor, pos)
+            if close > floor and text[close - 1] == "]":
+                open_ = text.rfind("[", floor, close)
+                if open_ >= 0 and self._ANY_PREFIX_TAG.fullmatch(text, open_, close):
+                    pos = open_
+                    continue
+            return close
+        return pos
+
+    @staticmethod
+    def _skip_whitespace_back(text: str, floor: int, pos: int) -> int:
+        while pos > floor and text[pos - 1].isspace():
+            pos -= 1
+        return pos
+
+    def _is_settled(self, text: str, start: int, end: int) -> bool:
+        """
+        Check that text appended later cannot change the claim text[start:end].
+
+        The trailer's \\s* runs stop at the next non-whitespace character, so
+        the claim is settled once that character's line is complete, it does
+        not open another trailer tag, and every [ground: in between is closed.
+        """
+        after = self._WHITESPACE.match(text, end).end()
+        if after == len(text) or text.find("\n", after) < 0:
+            return False
+        if text.startswith(self._TRAILER_TAGS, after):
+            return False
+        ground = text.find("[ground:", start, after)
+        while ground >= 0:
+            close = text.find("]", ground + len("[ground:"))
+            if close < 0 or close >= after:
+                return False
+            ground = text.find("[ground:", ground + 1, after)
+        return True
+
+
+class ClaimTable:
+    """
+    Struct-of-arrays storage for the claims parsed from one response.
+
+    Each row stores offsets into the response text for raw_text, content,
+    ground and claim_id, small-int codes for the enum fields and the
+    confidence as a double: about 50 bytes per claim instead of a
+    VerixClaim plus three copied substrings. The table keeps a reference
+    to the response, so it pays off when the response is retained anyway,
+    e.g. when holding the claims of many transcripts for an audit.
+
+    Indexing and iteration yield ClaimView rows, which offer the VerixClaim
+    attribute and method API; to_claims() materializes real VerixClaims.
+    The code columns (illocution, affect, state, agent, meta_level) and
+    confidence are arrays that can be scanned without building views.
+    """
+
+    ILLOCUTIONS = tuple(Illocution)
+    AFFECTS = tuple(Affect)
+    STATES = tuple(State)
+    AGENTS = tuple(Agent)
+    META_LEVELS = tuple(MetaLevel)
+
+    _CODES = {
+        member: code
+        for members in (ILLOCUTIONS, AFFECTS, STATES, AGENTS, META_LEVELS)
+        for code, member in enumerate(members)
+    }
+
+    def __init__(self, text: str = ""):
+        """
+        Initialize an empty table over a response.
+
+        Args:
+            text: Response text the row offsets point into
+        """
+        self.text = text
+        self.illocution = array("b")
+        self.affect = array("b")
+        self.state = array("b")
+        self.agent = array("b")  # -1 = no agent
+        self.meta_level = array("b")
+        self.confidence = array("d")
+        # Offsets into text; a start of -1 marks an absent ground/claim_id
+        self.raw_start = array("i")
+        self.raw_end = array("i")
+        self.content_start = array("i")
+        self.content_end = array("i")
+        self.ground_start = array("i")
+        self.ground_end = array("i")
+        self.id_start = array("i")
+        self.id_end = array("i")
+
+    @classmethod
+    def from_text(cls, text: str) -> "ClaimTable":
+        """
+        Parse text into a table (same claims as VerixParser.parse()).
+
+        Args:
+            text: Text containing VERIX-formatted claims
+
+        Returns:
+            ClaimTable over text
+        """
+        table = cls(text)
+        tokens, _, _ = VerixTokenizer()._scan_l1(text, 0, 0, final=True)
+        for token in tokens:
+            claim = token.to_claim(text)
+            if claim:
+                table._append(
+                    claim, (token.start, token.end), token.content_span,
+                    token.ground_span, token.id_span,
+                )
+        if not len(table):
+            for match in VerixParser.L0_PATTERN.finditer(text):
+                claim = _build_l0_claim(match)
+                if claim:
+                    start, end = match.span("content")
+                    while start < end and text[start].isspace():
+                        start += 1
+                    end = VerixTokenizer._skip_whitespace_back(text, start, end)
+                    table._append(claim, match.span(), (start, end), (-1, -1), (-1, -1))
+        return table
+
+    def _append(
+        self,
+        claim: VerixClaim,
+        raw: Tuple[int, int],
+        content: Tuple[int, int],
+        ground: Tuple[int, int],
+        claim_id: Tuple[int, int],
+    ) -> None:
+        codes = self._CODES
+        self.illocution.append(codes[claim.illocution])
+        self.affect.append(codes[claim.affect])
+        self.state.append(codes[claim.state])
+        self.agent.append(codes[claim.agent] if claim.agent else -1)
+        self.meta_level.append(codes[claim.meta_level])
+        self.confidence.append(claim.confidence)
+        self.raw_start.append(raw[0])
+        self.raw_end.append(raw[1])
+        self.content_start.append(content[0])
+        self.content_end.append(content[1])
+        self.ground_start.append(ground[0])
+        self.ground_end.append(ground[1])
+        self.id_start.append(claim_id[0])
+        self.id_end.append(claim_id[1])
+
+    def to_claims(self) -> List[VerixClaim]:
+        """Materialize every row as a VerixClaim."""
+        return [view.to_claim() for view in self]
+
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+    def __iter__(self) -> Iterator["ClaimView"]:
+        for row in range(len(self.confidence)):
+            yield ClaimView(self, row)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["ClaimView", List["ClaimView"]]:
+        rows = range(len(self.confidence))
+        if isinstance(index, slice):
+            return [ClaimView(self, row) for row in rows[index]]
+        return ClaimView(self, rows[index])
+
+
+class ClaimView:
+    """
+    Read-only VerixClaim-compatible view of one ClaimTable row.
+
+    Fields are decoded from the table on access (strings are sliced from
+    the response each time); formatting and predicate methods are shared
+    with VerixClaim.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: ClaimTable, row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def illocution(self) -> Illocution:
+        return ClaimTable.ILLOCUTIONS[self._table.illocution[self._row]]
+
+    @property
+    def affect(self) -> Affect:
+        return ClaimTable.AFFECTS[self._table.affect[self._row]]
+
+    @property
+    def content(self) -> str:
+        table, row = self._table, self._row
+        return table.text[table.content_start[row]:table.content_end[row]]
+
+    @property
+    def ground(self) -> Optional[str]:
+        table, row = self._table, self._row
+        start = table.ground_start[row]
+        return table.text[start:table.ground_end[row]] if start >= 0 else None
+
+    @property
+    def confidence(self) -> float:
+        return self._table.confidence[self._row]
+
+    @property
+    def state(self) -> State:
+        return ClaimTable.STATES[self._table.state[self._row]]
+
+    @property
+    def raw_text(self) -> str:
+        table, row = self._table, self._row
+        return table.text[table.raw_start[row]:table.raw_end[row]]
+
+    @property
+    def claim_id(self) -> Optional[str]:
+        table, row = self._table, self._row
+        start = table.id_start[row]
+        return table.text[start:table.id_end[row]] if start >= 0 else None
+
+    @property
+    def agent(self) -> Optional[Agent]:
+        code = self._table.agent[self._row]
+        return ClaimTable.AGENTS[code] if code >= 0 else None
+
+    @property
+    def meta_level(self) -> MetaLevel:
+        return ClaimTable.META_LEVELS[self._table.meta_level[self._row]]
+
+    is_high_confidence = VerixClaim.is_high_confidence
+    is_grounded = VerixClaim.is_grounded
+    is_meta = VerixClaim.is_meta
+    is_meta_verix = VerixClaim.is_meta_verix
+    to_l0 = VerixClaim.to_l0
+    to_l1 = VerixClaim.to_l1
+    to_l2 = VerixClaim.to_l2
+
+    def to_claim(self) -> VerixClaim:
+        """Materialize this row as a standalone VerixClaim."""
+        return VerixClaim(
+            illocution=self.illocution,
+            affect=self.affect,
+            content=self.content,
+            ground=self.ground,
+            confidence=self.confidence,
+            state=self.state,
+            raw_text=self.raw_text,
+            claim_id=self.claim_id,
+            agent=self.agent,
+            meta_level=self.meta_level,
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ClaimView):
+            other = other.to_claim()
+        if isinstance(other, VerixClaim):
+            return self.to_claim() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ClaimView(row={self._row}, {self.to_claim()!r})"
 
 
 class VerixValidator:
@@ -697,17 +1254,20 @@ class VerixValidator:
                 id_to_claim[claim.claim_id] = claim
 
         # Build adjacency list: claim_id -> list of referenced claim_ids
+        lowered_ids = [(other_id, other_id.lower()) for other_id in id_to_claim]
         graph = {}
         for claim in claims:
-            if claim.claim_id:
-                graph[claim.claim_id] = []
-                if claim.ground:
+            claim_id = claim.claim_id
+            if claim_id:
+                graph[claim_id] = []
+                ground = claim.ground
+                if ground:
                     # Check if ground references another claim by ID
                     # Ground format could be just the ID or contain it
-                    ground_lower = claim.ground.lower().strip()
-                    for other_id in id_to_claim.keys():
-                        if other_id.lower() in ground_lower:
-                            graph[claim.claim_id].append(other_id)
+                    ground_lower = ground.lower().strip()
+                    for other_id, other_lower in lowered_ids:
+                        if other_lower in ground_lower:
+                            graph[claim_id].append(other_id)
 
         # DFS cycle detection
         cycles = []
@@ -18,6 +18,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.verix import VerixClaim, VerixParser, Illocution, State, Affect
+from eval.similarity import jaccard_candidates
 
 
 class ViolationType(Enum):
@@ -79,6 +80,14 @@ class ConsistencyChecker:
     # Thresholds
     HIGH_CONFIDENCE_THRESHOLD = 0.8
     OVERCONFIDENCE_THRESHOLD = 0.95
+    SIMILARITY_THRESHOLD = 0.5
+
+    # (negated marker, affirmed marker) pairs for explicit contradictions
+    NEGATION_PATTERNS = [
+        ("not ", ""), ("n't ", ""), ("false", "true"),
+        ("incorrect", "correct"), ("wrong", "right"),
+        ("no ", "yes "), ("never", "always"),
+    ]
 
     def __init__(
         self,
@@ -146,24 +155,70 @@ class ConsistencyChecker:
         """Check for contradicting claims with high combined confidence."""
         violations = []
 
-        for i, claim1 in enumerate(claims):
-            for j, claim2 in enumerate(claims[i+1:], start=i+1):
-                if self._claims_contradict(claim1, claim2):
-                    # Contradicting claims should have lower combined confidence
-                    combined = claim1.confidence + claim2.confidence
-                    if combined > 1.0:
-                        violations.append(ConsistencyViolation(
-                            violation_type=ViolationType.CONFIDENCE_CONTRADICTION,
-                            claim_indices=[i, j],
-                            description=(
-                                f"Claims {i} and {j} appear to contradict but have "
-                                f"combined confidence of {combined:.2f}"
-                            ),
-                            severity=min(1.0, (combined - 1.0) * 2),
-                        ))
+        # Decode each claim once rather than once per pair
+        keys = [(claim.content.lower(), claim.state) for claim in claims]
+        confidences = [claim.confidence for claim in claims]
+
+        for i, j in self._contradiction_candidates(keys):
+            if self._keys_contradict(keys[i], keys[j]):
+                # Contradicting claims should have lower combined confidence
+                combined = confidences[i] + confidences[j]
+                if combined > 1.0:
+                    violations.append(ConsistencyViolation(
+                        violation_type=ViolationType.CONFIDENCE_CONTRADICTION,
+                        claim_indices=[i, j],
+                        description=(
+                            f"Claims {i} and {j} appear to contradict but have "
+                            f"combined confidence of {combined:.2f}"
+                        ),
+                        severity=min(1.0, (combined - 1.0) * 2),
+                    ))
 
         return violations
 
+    def _contradiction_candidates(
+        self,
+        keys: List[Tuple[str, State]],
+    ) -> List[Tuple[int, int]]:
+        """
+        Sorted (i, j) pairs, i < j, that _keys_contradict could accept.
+
+        Every contradiction needs word-set similarity between the claims (or
+        their negation-stripped cores), so candidates come from an inverted
+        index instead of all n^2 pairs.
+        """
+        pairs = set()
+
+        for neg, pos in self.NEGATION_PATTERNS:
+            negated = {
+                i: set(content.replace(neg, "").split())
+                for i, (content, _) in enumerate(keys) if neg in content
+            }
+            if not negated:
+                continue
+            affirmed = {
+                i: set(content.replace(pos, "").split())
+                for i, (content, _) in enumerate(keys) if pos in content
+            }
+            for a, b in jaccard_candidates(negated, affirmed, self.SIMILARITY_THRESHOLD):
+                if a != b:
+                    pairs.add((min(a, b), max(a, b)))
+
+        # Retraction of an earlier confirmed claim
+        confirmed = {
+            i: set(content.split())
+            for i, (content, state) in enumerate(keys) if state == State.CONFIRMED
+        }
+        retracted = {
+            i: set(content.split())
+            for i, (content, state) in enumerate(keys) if state == State.RETRACTED
+        }
+        for a, b in jaccard_candidates(confirmed, retracted, self.SIMILARITY_THRESHOLD):
+            if a < b:
+                pairs.add((a, b))
+
+        return sorted(pairs)
+
     def _check_ground_coherence(
         self,
         claims: List[VerixClaim],
@@ -388,17 +443,18 @@ class ConsistencyChecker:
 
     def _claims_contradict(self, claim1: VerixClaim, claim2: VerixClaim) -> bool:
         """Check if two claims contradict each other."""
-        content1 = claim1.content.lower()
-        content2 = claim2.content.lower()
+        return self._keys_contradict(
+            (claim1.content.lower(), claim1.state),
+            (claim2.content.lower(), claim2.state),
+        )
 
-        # Check for explicit negation
-        negation_patterns = [
-            ("not ", ""), ("n't ", ""), ("false", "true"),
-            ("incorrect", "correct"), ("wrong", "right"),
-            ("no ", "yes "), ("never", "always"),
-        ]
+    def _keys_contradict(self, key1: Tuple[str, State], key2: Tuple[str, State]) -> bool:
+        """Check contradiction from (lowercased content, state) pairs."""
+        content1, state1 = key1
+        content2, state2 = key2
 
-        for neg, pos in negation_patterns:
+        # Check for explicit negation
+        for neg, pos in self.NEGATION_PATTERNS:
             if neg in content1 and pos in content2:
                 # Check for content similarity
                 core1 = content1.replace(neg, "").strip()
@@ -412,13 +468,18 @@ class ConsistencyChecker:
                     return True
 
         # Check for retraction
-        if claim1.state == State.CONFIRMED and claim2.state == State.RETRACTED:
+        if state1 == State.CONFIRMED and state2 == State.RETRACTED:
             if self._content_similar(content1, content2):
                 return True
 
         return False
 
-    def _content_similar(self, content1: str, content2: str, threshold: float = 0.5) -> bool:
+    def _content_similar(
+        self,
+        content1: str,
+        content2: str,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> bool:
         """Check if two content strings are similar."""
         words1 = set(content1.split())
         words2 = set(content2.split())
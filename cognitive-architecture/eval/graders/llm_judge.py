@@ -8,14 +8,22 @@ Features:
 - RubricGrader: Evaluate against multi-dimensional rubric
 - Cross-model council: Claude + Gemini + Codex consensus
 - Self-referential grading: Evaluate prompts about prompting
+
+Judges without a backend use the heuristic mock judge. With backends, council
+judges are called concurrently (latency is the slowest judge, not the sum),
+each bounded by an optional timeout; an optional early-consensus quorum stops
+waiting once enough judges agree. grade_many shares one response-independent
+judge prompt prefix across many responses.
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple, Callable
 from enum import Enum
 import json
 import os
 import sys
+import time
 
 # Add parent directory for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -30,6 +38,10 @@ class JudgeModel(Enum):
     CODEX = "codex"
 
 
+# A judge backend sends the judge prompt to a model and returns its raw text
+JudgeBackend = Callable[[str], str]
+
+
 @dataclass
 class RubricCriterion:
     """A single criterion in a rubric."""
@@ -70,6 +82,7 @@ class JudgingResult:
     judge_model: str
     raw_response: str = ""
     confidence: float = 0.8
+    parsed: bool = True  # False if the judge's reply could not be parsed
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -118,6 +131,10 @@ class RubricGrader:
         criteria: Optional[List[RubricCriterion]] = None,
         use_council: bool = False,
         council_models: Optional[List[JudgeModel]] = None,
+        judges: Optional[Dict[JudgeModel, JudgeBackend]] = None,
+        judge_timeout: Optional[float] = None,
+        consensus_quorum: Optional[int] = None,
+        consensus_variance: float = 0.005,
     ):
         """
         Initialize rubric grader.
@@ -126,10 +143,18 @@ class RubricGrader:
             criteria: List of rubric criteria (None = use defaults)
             use_council: Whether to use multi-model council
             council_models: Models for council (default: all three)
+            judges: Backend per model (models without one use the mock judge)
+            judge_timeout: Seconds to wait for each council judge (None = no limit)
+            consensus_quorum: Stop once this many judges agree (None = wait for all)
+            consensus_variance: Max score variance for the quorum to count as agreement
         """
         self.criteria = criteria or self.DEFAULT_CRITERIA
         self.use_council = use_council
         self.council_models = council_models or list(JudgeModel)
+        self.judges = judges or {}
+        self.judge_timeout = judge_timeout
+        self.consensus_quorum = consensus_quorum
+        self.consensus_variance = consensus_variance
 
         # Normalize weights
         total_weight = sum(c.weight for c in self.criteria)
@@ -153,10 +178,59 @@ class RubricGrader:
         Returns:
             JudgingResult with scores and reasoning
         """
+        return self._grade(response, task, expected)
+
+    def grade_many(
+        self,
+        responses: List[str],
+        task: Dict[str, Any],
+        expected: Optional[Any] = None,
+        max_workers: int = 8,
+    ) -> List[JudgingResult]:
+        """
+        Grade several responses to the same task.
+
+        The rubric, task and instructions form a prompt prefix that is built
+        once and shared by every judge call, so backends with prompt caching
+        only pay for it once. Responses are graded concurrently.
+
+        Args:
+            responses: Responses to evaluate
+            task: Task all responses answer
+            expected: Expected output or criteria (optional)
+            max_workers: Responses graded at once
+
+        Returns:
+            One JudgingResult per response, in order
+        """
+        prompts: List[Optional[str]] = [None] * len(responses)
+        if self._uses_backends():
+            prefix = self._build_judge_prefix(task, expected)
+            prompts = [self._build_judge_prompt(r, task, expected, prefix=prefix) for r in responses]
+
+        if len(responses) <= 1 or not self._uses_backends():
+            return [self._grade(r, task, expected, p) for r, p in zip(responses, prompts)]
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="grade") as pool:
+            return list(pool.map(lambda args: self._grade(args[0], task, expected, args[1]), zip(responses, prompts)))
+
+    def _grade(
+        self,
+        response: str,
+        task: Dict[str, Any],
+        expected: Optional[Any],
+        prompt: Optional[str] = None,
+    ) -> JudgingResult:
+        """grade() with an optional prebuilt judge prompt."""
         if self.use_council:
-            return self._grade_with_council(response, task, expected)
+            return self._grade_with_council(response, task, expected, prompt)
         else:
-            return self._grade_single(response, task, expected, JudgeModel.CLAUDE)
+            return self._grade_single(response, task, expected, JudgeModel.CLAUDE, prompt)
+
+    def _uses_backends(self) -> bool:
+        """True if any judge that grade() would call has a backend."""
+        models = self.council_models if self.use_council else [JudgeModel.CLAUDE]
+        return any(model in self.judges for model in models)
 
     def _grade_single(
         self,
@@ -164,36 +238,105 @@ class RubricGrader:
         task: Dict[str, Any],
         expected: Optional[Any],
         model: JudgeModel,
+        prompt: Optional[str] = None,
     ) -> JudgingResult:
         """Grade using a single model."""
-        prompt = self._build_judge_prompt(response, task, expected)
+        backend = self.judges.get(model)
+        if backend is None:
+            # No backend configured: heuristic mock, allows testing without API calls
+            return self._mock_judge(response, task, model)
 
-        # For now, return mock result (real implementation would call API)
-        # This allows testing without API calls
-        return self._mock_judge(response, task, model)
+        if prompt is None:
+            prompt = self._build_judge_prompt(response, task, expected)
+        return self._parse_judge_response(backend(prompt), model)
 
     def _grade_with_council(
         self,
         response: str,
         task: Dict[str, Any],
         expected: Optional[Any],
+        prompt: Optional[str] = None,
     ) -> JudgingResult:
         """
         Grade using multi-model council.
 
         Aggregates scores from Claude, Gemini, and Codex for cross-model
-        compatibility and bias reduction.
+        compatibility and bias reduction. Judges run concurrently; a judge
+        that errors, returns an unparseable reply or misses judge_timeout is
+        left out of the aggregate.
+        With consensus_quorum set, grading stops as soon as that many judges
+        agree and the remaining calls are cancelled (a call already in
+        flight finishes in the background and is discarded).
         """
-        results = []
-
-        for model in self.council_models:
-            result = self._grade_single(response, task, expected, model)
-            results.append(result)
-
-        # Aggregate scores
+        if not self._uses_backends():
+            # Mock judges are instant; no point in threads
+            results = [self._grade_single(response, task, expected, model) for model in self.council_models]
+            return self._aggregate_council_results(results)
+
+        if prompt is None:
+            prompt = self._build_judge_prompt(response, task, expected)
+
+        finished: Dict[JudgeModel, JudgingResult] = {}
+        notes: List[str] = []
+        deadline = None if self.judge_timeout is None else time.monotonic() + self.judge_timeout
+
+        pool = ThreadPoolExecutor(max_workers=len(self.council_models), thread_name_prefix="judge")
+        try:
+            futures = {
+                pool.submit(self._grade_single, response, task, expected, model, prompt): model
+                for model in self.council_models
+            }
+            pending = set(futures)
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    notes.extend(
+                        f"[{futures[f].value}] timed out after {self.judge_timeout}s"
+                        for f in sorted(pending, key=lambda f: self.council_models.index(futures[f]))
+                    )
+                    break
+                for future in done:
+                    model = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        notes.append(f"[{model.value}] judge error: {e}")
+                        continue
+                    if not result.parsed:
+                        # Not a vote: counts toward neither the mean nor the quorum
+                        notes.append(f"[{model.value}] judge error: unparseable response")
+                        continue
+                    finished[model] = result
+                if pending and self._has_consensus(list(finished.values())):
+                    notes.append(f"[council] consensus after {len(finished)}/{len(futures)} judges")
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        # Council order, not completion order, so aggregation is deterministic
+        results = [finished[model] for model in self.council_models if model in finished]
         aggregated = self._aggregate_council_results(results)
+        if notes:
+            aggregated.reasoning = "\n\n".join([aggregated.reasoning] + notes)
         return aggregated
 
+    def _has_consensus(self, results: List[JudgingResult]) -> bool:
+        """True once a quorum of judges agrees within consensus_variance."""
+        if self.consensus_quorum is None or len(results) < self.consensus_quorum:
+            return False
+        _, variance, _ = self._council_agreement(results)
+        return variance <= self.consensus_variance
+
+    @staticmethod
+    def _council_agreement(results: List[JudgingResult]) -> Tuple[float, float, float]:
+        """(mean score, score variance, confidence) across judges."""
+        n = len(results)
+        mean_score = sum(r.score for r in results) / n
+        score_variance = sum((r.score - mean_score) ** 2 for r in results) / n
+        confidence = max(0.5, 1.0 - score_variance * 2)
+        return mean_score, score_variance, confidence
+
     def _aggregate_council_results(
         self,
         results: List[JudgingResult],
@@ -207,9 +350,8 @@ class RubricGrader:
                 judge_model="council",
             )
 
-        # Calculate mean scores
-        n = len(results)
-        mean_score = sum(r.score for r in results) / n
+        # Mean score, with confidence based on agreement
+        mean_score, _, confidence = self._council_agreement(results)
 
         # Aggregate criterion scores
         all_criteria = set()
@@ -221,10 +363,6 @@ class RubricGrader:
             scores = [r.criterion_scores.get(criterion, 0.0) for r in results]
             criterion_scores[criterion] = sum(scores) / len(scores)
 
-        # Calculate confidence based on agreement
-        score_variance = sum((r.score - mean_score) ** 2 for r in results) / n
-        confidence = max(0.5, 1.0 - score_variance * 2)
-
         # Combine reasoning
         reasoning_parts = [f"[{r.judge_model}] {r.reasoning}" for r in results]
         combined_reasoning = "\n\n".join(reasoning_parts)
@@ -242,20 +380,31 @@ class RubricGrader:
         response: str,
         task: Dict[str, Any],
         expected: Optional[Any],
+        prefix: Optional[str] = None,
+    ) -> str:
+        """Build the prompt for the LLM judge (shared prefix, then the response)."""
+        if prefix is None:
+            prefix = self._build_judge_prefix(task, expected)
+        return f"""{prefix}
+## Response to Evaluate
+{response}
+"""
+
+    def _build_judge_prefix(
+        self,
+        task: Dict[str, Any],
+        expected: Optional[Any],
     ) -> str:
-        """Build the prompt for the LLM judge."""
+        """Response-independent part of the judge prompt."""
         rubric_text = "\n\n".join(c.to_prompt_text() for c in self.criteria)
 
         task_text = task.get("task", task.get("description", "Unknown task"))
 
-        prompt = f"""You are an expert evaluator for AI responses. Evaluate the following response against the rubric.
+        prompt = f"""You are an expert evaluator for AI responses. Evaluate the response at the end against the rubric.
 
 ## Task
 {task_text}
 
-## Response to Evaluate
-{response}
-
 {"## Expected Output" + chr(10) + str(expected) if expected else ""}
 
 ## Evaluation Rubric
@@ -279,6 +428,54 @@ class RubricGrader:
 """
         return prompt
 
+    def _parse_judge_response(self, raw: str, model: JudgeModel) -> JudgingResult:
+        """Parse a judge's JSON reply (0-4 scale) into a normalized JudgingResult."""
+        max_score = 4.0
+        start, end = raw.find("{"), raw.rfind("}") + 1
+        try:
+            data = json.loads(raw[start:end]) if start >= 0 and end > start else None
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            return JudgingResult(
+                score=0.0,
+                criterion_scores={},
+                reasoning="Failed to parse judge response",
+                judge_model=model.value,
+                raw_response=raw,
+                confidence=0.0,
+                parsed=False,
+            )
+
+        criterion_scores = {}
+        for name, entry in (data.get("criterion_scores") or {}).items():
+            value = entry.get("score", 0) if isinstance(entry, dict) else entry
+            try:
+                criterion_scores[name] = min(1.0, max(0.0, float(value) / max_score))
+            except (TypeError, ValueError):
+                criterion_scores[name] = 0.0
+
+        if "final_score" in data:
+            try:
+                score = float(data["final_score"]) / max_score
+            except (TypeError, ValueError):
+                score = 0.0
+        else:
+            weights = {c.name: c.weight for c in self.criteria}
+            total = sum(weights.get(name, 0.0) for name in criterion_scores)
+            score = (
+                sum(v * weights.get(name, 0.0) for name, v in criterion_scores.items()) / total
+                if total else 0.0
+            )
+
+        return JudgingResult(
+            score=min(1.0, max(0.0, score)),
+            criterion_scores=criterion_scores,
+            reasoning=str(data.get("overall_reasoning", "")),
+            judge_model=model.value,
+            raw_response=raw,
+        )
+
     def _mock_judge(
         self,
         response: str,
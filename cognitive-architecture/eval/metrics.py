@@ -25,6 +25,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.verix import VerixClaim, VerixParser, VerixValidator
 from core.config import FullConfig, PromptConfig
+from eval.similarity import SubstringIndex
 
 
 class MetricType(Enum):
@@ -103,6 +104,12 @@ class MetricCalculator:
     DEFAULT_TOKEN_BASELINE = 500
     DEFAULT_LENGTH_TARGET = 1000
 
+    # (negation marker, affirmation marker) pairs; only the negation is checked
+    NEGATION_PAIRS = [
+        ("not", ""), ("n't", ""), ("false", "true"),
+        ("incorrect", "correct"), ("wrong", "right")
+    ]
+
     def __init__(
         self,
         config: Optional[FullConfig] = None,
@@ -376,29 +383,65 @@ class MetricCalculator:
 
         penalty = 1.0
 
-        for i, claim1 in enumerate(claims):
-            for claim2 in claims[i+1:]:
-                # Check for contradicting content with mismatched confidence
-                if self._claims_contradict(claim1, claim2):
-                    # Contradicting claims should have lower combined confidence
-                    combined = claim1.confidence + claim2.confidence
-                    if combined > 1.5:
-                        penalty *= 0.8
+        # Decode each claim once rather than once per pair
+        contents = [claim.content.lower() for claim in claims]
+        confidences = [claim.confidence for claim in claims]
+
+        for i, j in self._contradiction_candidates(contents):
+            # Check for contradicting content with mismatched confidence
+            if self._contents_contradict(contents[i], contents[j]):
+                # Contradicting claims should have lower combined confidence
+                combined = confidences[i] + confidences[j]
+                if combined > 1.5:
+                    penalty *= 0.8
 
         return penalty
 
+    def _contradiction_candidates(self, contents: List[str]) -> List[Tuple[int, int]]:
+        """
+        Sorted (i, j) pairs, i < j, that _contents_contradict could accept.
+
+        A contradiction needs the negation-stripped core of the earlier claim
+        to contain, or be contained in, the later claim, so candidates come
+        from substring indexes instead of all n^2 pairs.
+        """
+        pairs = set()
+        content_index = SubstringIndex(dict(enumerate(contents)))
+
+        for neg, _ in self.NEGATION_PAIRS:
+            cores = {
+                i: content.replace(neg, "").strip()
+                for i, content in enumerate(contents) if neg in content
+            }
+            if not cores:
+                continue
+
+            # Core of claim i inside a later claim j
+            for i, core in cores.items():
+                for j in content_index.containing(core):
+                    if j > i and j not in cores:
+                        pairs.add((i, j))
+
+            # Later claim j inside the core of claim i
+            core_index = SubstringIndex(cores)
+            for j, content in enumerate(contents):
+                if j in cores:
+                    continue
+                for i in core_index.containing(content):
+                    if i < j:
+                        pairs.add((i, j))
+
+        return sorted(pairs)
+
     def _claims_contradict(self, claim1: VerixClaim, claim2: VerixClaim) -> bool:
         """Check if two claims contradict each other."""
-        # Simple heuristic: check for negation patterns
-        content1 = claim1.content.lower()
-        content2 = claim2.content.lower()
-
-        negation_pairs = [
-            ("not", ""), ("n't", ""), ("false", "true"),
-            ("incorrect", "correct"), ("wrong", "right")
-        ]
+        return self._contents_contradict(claim1.content.lower(), claim2.content.lower())
 
-        for neg, pos in negation_pairs:
+    @classmethod
+    def _contents_contradict(cls, content1: str, content2: str) -> bool:
+        """Check if two lowercased claim contents contradict each other."""
+        # Simple heuristic: check for negation patterns
+        for neg, pos in cls.NEGATION_PAIRS:
             if neg in content1 and neg not in content2:
                 # Check if core content is similar
                 core1 = content1.replace(neg, "").strip()
@@ -0,0 +1,120 @@
+"""
+Candidate-pair generation for claim similarity checks.
+
+ConsistencyChecker and MetricCalculator look for contradicting claim pairs.
+Comparing every pair is O(n^2) per response, which dominates evaluation of
+long research outputs. The indexes here return a superset of the pairs that
+can pass a check, so callers only run their exact predicate on those:
+- jaccard_candidates: word-set Jaccard >= threshold, via an inverted index
+  over prefix-filtered token sets (rare tokens first)
+- SubstringIndex: "a in b" containment, via a word inverted index
+
+Both are exact filters (no false negatives), so results are identical to
+the pairwise scans.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def jaccard_candidates(
+    left: Dict[int, Set[str]],
+    right: Dict[int, Set[str]],
+    threshold: float = 0.5,
+) -> Set[Tuple[int, int]]:
+    """
+    Find (left, right) key pairs whose token sets may reach a Jaccard threshold.
+
+    Uses prefix filtering: with tokens ordered rarest first, two sets with
+    Jaccard >= t must share a token within the first |X| - ceil(t*|X|) + 1
+    tokens of each. Empty sets never match.
+
+    Args:
+        left: Key -> token set
+        right: Key -> token set
+        threshold: Jaccard threshold the caller will test
+
+    Returns:
+        Candidate (left_key, right_key) pairs; a superset of the true matches
+    """
+    left = {key: tokens for key, tokens in left.items() if tokens}
+    right = {key: tokens for key, tokens in right.items() if tokens}
+    if not left or not right:
+        return set()
+    if threshold <= 0:
+        return {(a, b) for a in left for b in right}
+
+    frequency: Counter = Counter()
+    for tokens in left.values():
+        frequency.update(tokens)
+    for tokens in right.values():
+        frequency.update(tokens)
+
+    def prefix(tokens: Set[str]) -> List[str]:
+        # Tolerance keeps float error from shortening the prefix
+        overlap = math.ceil(threshold * len(tokens) - 1e-9)
+        ordered = sorted(tokens, key=lambda token: (frequency[token], token))
+        return ordered[:len(tokens) - overlap + 1]
+
+    postings: Dict[str, List[int]] = {}
+    for key, tokens in right.items():
+        for token in prefix(tokens):
+            postings.setdefault(token, []).append(key)
+
+    pairs = set()
+    for key, tokens in left.items():
+        # Size filter: Jaccard >= t implies t <= |A|/|B| <= 1/t
+        low, high = threshold * len(tokens), len(tokens) / threshold
+        for token in prefix(tokens):
+            for other in postings.get(token, ()):
+                if low <= len(right[other]) <= high:
+                    pairs.add((key, other))
+    return pairs
+
+
+class SubstringIndex:
+    """
+    Word inverted index answering "which indexed strings contain s".
+
+    A token of the needle with whitespace on both sides (any token but the
+    first and last) must also be a whole token of every string containing
+    the needle. A lookup scans the shortest posting list among those
+    interior tokens and verifies the candidates with `in`; needles with
+    fewer than three tokens fall back to checking every string.
+    """
+
+    def __init__(self, texts: Dict[int, str]):
+        """
+        Build the index.
+
+        Args:
+            texts: Key -> string to index
+        """
+        self.texts = texts
+        self.max_length = max((len(text) for text in texts.values()), default=0)
+        self._postings: Dict[str, List[int]] = {}
+        for key, text in texts.items():
+            for token in set(text.split()):
+                self._postings.setdefault(token, []).append(key)
+
+    def containing(self, needle: str) -> List[int]:
+        """
+        Keys of the indexed strings that contain needle.
+
+        Args:
+            needle: Substring to look for
+
+        Returns:
+            Matching keys in index order
+        """
+        if len(needle) > self.max_length:
+            return []
+        candidates: Iterable[int] = self.texts
+        for token in needle.split()[1:-1]:
+            posting = self._postings.get(token)
+            if posting is None:
+                return []
+            if candidates is self.texts or len(posting) < len(candidates):
+                candidates = posting
+        return [key for key in candidates if needle in self.texts[key]]
@@ -9,6 +9,9 @@ Usage:
     from evals.cli_evaluator import CLITaskEvaluator
     evaluator = CLITaskEvaluator("prompt-architect")
     results = evaluator.run_evaluation(max_tasks=5)
+
+    # Four concurrent tasks; an interrupted run resumes from its checkpoint
+    results = evaluator.run_evaluation(max_workers=4)
 """
 
 import os
@@ -25,6 +28,9 @@ from typing import Dict, List, Any, Optional
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.response_cache import ResponseCache
+from evals.parallel_runner import TaskCheckpoint, evaluation_fingerprint, is_transient_failure, run_tasks
+
 
 @dataclass
 class TaskResult:
@@ -73,6 +79,9 @@ class ClaudeCLI:
 
     CLI_COMMAND = "claude"
     DEFAULT_MODEL = "claude-sonnet-4-20250514"
+    # The npm shim on Windows is a .cmd script that needs the shell; elsewhere
+    # shell=True would run only the command name and drop the arguments
+    USE_SHELL = sys.platform == "win32"
 
     def __init__(self):
         self._available: Optional[bool] = None
@@ -93,7 +102,7 @@ class ClaudeCLI:
                 capture_output=True,
                 text=True,
                 timeout=10,
-                shell=True
+                shell=self.USE_SHELL
             )
             return result.returncode == 0
         except Exception:
@@ -123,7 +132,7 @@ class ClaudeCLI:
                 capture_output=True,
                 text=True,
                 timeout=300,  # 5 minute timeout
-                shell=True
+                shell=self.USE_SHELL
             )
 
             execution_time_ms = int((time.time() - start_time) * 1000)
@@ -155,8 +164,23 @@ class CLITaskEvaluator:
     RESULTS_DIR = Path(__file__).parent.parent / "storage" / "eval_results"
     SKILLS_DIR = Path(__file__).parent.parent.parent / "skills" / "foundry"
 
-    def __init__(self, skill_name: str):
+    def __init__(
+        self,
+        skill_name: str,
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False,
+    ):
+        """
+        Initialize evaluator.
+
+        Args:
+            skill_name: One of "prompt-architect", "agent-creator", "skill-forge"
+            cache: ResponseCache for skill executions (None = no caching)
+            bypass_cache: Skip cache lookups but still store fresh outputs
+        """
         self.skill_name = skill_name
+        self.cache = cache
+        self.bypass_cache = bypass_cache
         self.corpus = self._load_corpus()
         self.skill_content = self._load_skill()
         self.cli = ClaudeCLI()
@@ -198,8 +222,19 @@ Now execute this skill with the following input:
 
 Provide the skill's output following its defined behavior and format."""
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key({
+                "provider": "claude-cli", "model": self.cli.model, "prompt": prompt,
+            })
+            entry = None if self.bypass_cache else self.cache.get(cache_key)
+            if entry is not None:
+                return entry["response"]
+
         try:
             result = self.cli.send_message(prompt)
+            if cache_key is not None:
+                self.cache.put(cache_key, {"response": result["response"]})
             return result["response"]
         except Exception as e:
             return f"[ERROR] Skill execution failed: {e}"
@@ -295,13 +330,35 @@ Respond in JSON format ONLY (no other text):
             execution_time_ms=execution_time,
         )
 
+    def _checkpoint(self) -> TaskCheckpoint:
+        """Checkpoint for this skill definition, corpus version and model."""
+        fingerprint = evaluation_fingerprint(
+            evaluation_type="cli",
+            skill=self.skill_content,
+            corpus_version=self.corpus.get('version', 'unknown'),
+            model=self.cli.model,
+        )
+        path = self.RESULTS_DIR / "checkpoints" / f"{self.skill_name}-cli-{fingerprint[:16]}.jsonl"
+        return TaskCheckpoint(path)
+
     def run_evaluation(
         self,
         task_ids: Optional[List[str]] = None,
         difficulty_filter: Optional[str] = None,
         max_tasks: Optional[int] = None,
+        max_workers: int = 1,
+        resume: bool = True,
     ) -> EvaluationResult:
-        """Run evaluation using Claude CLI."""
+        """
+        Run evaluation using Claude CLI.
+
+        Args:
+            task_ids: Specific task IDs to run (None = all)
+            difficulty_filter: "easy", "medium", "hard" (None = all)
+            max_tasks: Maximum number of tasks to run (None = all)
+            max_workers: Tasks evaluated concurrently (each runs its own CLI calls)
+            resume: Reuse tasks finished by an interrupted run (False = start over)
+        """
         tasks = self.corpus['tasks']
 
         if difficulty_filter:
@@ -315,16 +372,19 @@ Respond in JSON format ONLY (no other text):
         print(f"CLI EVALUATION: {self.skill_name}")
         print(f"Tasks to evaluate: {len(tasks)}")
         print(f"Using: Claude CLI (real LLM)")
+        print(f"Workers: {max_workers}")
         print(f"{'='*60}\n")
 
-        results: List[TaskResult] = []
-
-        for i, task in enumerate(tasks, 1):
-            print(f"[{i}/{len(tasks)}] Evaluating {task['id']}...", end=" ", flush=True)
-            result = self.evaluate_task(task)
-            results.append(result)
-            status = "PASS" if result.passed else "FAIL"
-            print(f"{status} ({result.execution_time_ms}ms)")
+        checkpoint = self._checkpoint()
+        if not resume:
+            checkpoint.clear()
+        results = run_tasks(
+            tasks, self.evaluate_task,
+            max_workers=max_workers, checkpoint=checkpoint, result_type=TaskResult,
+        )
+        # Keep the checkpoint while any task needs a retry
+        if not any(is_transient_failure(r) for r in results):
+            checkpoint.clear()
 
         # Aggregate scores
         passed_count = sum(1 for r in results if r.passed)
@@ -434,6 +494,14 @@ def main():
                         help="Comma-separated list of task IDs to run (e.g., PA-020,PA-023)")
     parser.add_argument("--format", choices=["text", "json"], default="text",
                         help="Output format (default: text)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse cached skill outputs for identical prompts")
+    parser.add_argument("--bypass-cache", action="store_true",
+                        help="With --cache: re-run every task and refresh the cache")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Tasks to evaluate concurrently (default: 1)")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Ignore the checkpoint of an interrupted run and start over")
 
     args = parser.parse_args()
 
@@ -443,11 +511,14 @@ def main():
         task_ids = [t.strip() for t in args.tasks.split(",")]
 
     try:
-        evaluator = CLITaskEvaluator(args.skill)
+        cache = ResponseCache() if args.cache else None
+        evaluator = CLITaskEvaluator(args.skill, cache=cache, bypass_cache=args.bypass_cache)
         result = evaluator.run_evaluation(
             task_ids=task_ids,
             difficulty_filter=args.difficulty,
             max_tasks=args.max_tasks,
+            max_workers=args.workers,
+            resume=not args.no_resume,
         )
 
         if args.format == "json":
@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """
-Multi-Model Evaluator - Alternates between Claude, Gemini, and Codex
+Multi-Model Evaluator - Spreads work across Claude, Gemini, and Codex
 Adapted from life-os-dashboard cli-bridge pattern
+
+Providers are routed by ProviderRouter (evals/provider_router.py): health
+checks are cached, failing providers are ejected by a circuit breaker, and
+each provider has its own concurrency cap. Tasks run in parallel up to the
+combined cap of the healthy providers.
 """
 
 import os
@@ -9,14 +14,18 @@ import sys
 import json
 import time
 import subprocess
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
 from dataclasses import dataclass, field, asdict
 
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from evals.parallel_runner import run_tasks
+from evals.provider_router import ProviderRouter
+
 # API Keys
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY", "")
@@ -51,6 +60,7 @@ class EvaluationResult:
     passed_tasks: int
     models_used: List[str] = field(default_factory=list)
     task_results: List[TaskResult] = field(default_factory=list)
+    provider_stats: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def pass_rate(self):
@@ -61,94 +71,158 @@ class MultiModelClient:
     """Client that can use Claude CLI, Gemini API, or OpenAI/Codex API"""
 
     PROVIDERS = ["claude", "gemini", "codex"]
-
-    def __init__(self):
-        self._claude_available = None
+    # Command-line providers: argv that reads the prompt on stdin
+    CLI_COMMANDS = {"claude": ["claude", "--print", "--output-format", "text"]}
+    CLI_TIMEOUT = 300
+    # The npm shim on Windows is a .cmd script that needs the shell; elsewhere
+    # shell=True would run only the command name and drop the arguments
+    USE_SHELL = sys.platform == "win32"
+    # Concurrent calls per provider (each CLI call is its own subprocess)
+    DEFAULT_CONCURRENCY = {"claude": 2, "gemini": 4, "codex": 4}
+
+    def __init__(
+        self,
+        cli_commands: Optional[Dict[str, List[str]]] = None,
+        strategy: str = "fastest",
+        health_ttl: float = 300.0,
+        max_concurrency: Optional[Dict[str, int]] = None,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            cli_commands: Overrides/additions to CLI_COMMANDS (provider -> argv)
+            strategy: Routing strategy, "fastest" or "weighted"
+            health_ttl: Seconds a provider health check is reused
+            max_concurrency: Per-provider in-flight caps (defaults to DEFAULT_CONCURRENCY)
+            failure_threshold: Consecutive failures before a provider is ejected
+            cooldown: Seconds before an ejected provider is probed again
+        """
+        self.cli_commands = {**self.CLI_COMMANDS, **(cli_commands or {})}
+        providers = list(self.PROVIDERS) + [p for p in self.cli_commands if p not in self.PROVIDERS]
         self._gemini_client = None
         self._openai_client = None
-        self._current_index = 0
+        self._client_lock = threading.Lock()
+        self.router = ProviderRouter(
+            providers,
+            health_check=self._check_provider,
+            strategy=strategy,
+            health_ttl=health_ttl,
+            max_concurrency={**self.DEFAULT_CONCURRENCY, **(max_concurrency or {})},
+            failure_threshold=failure_threshold,
+            cooldown=cooldown,
+        )
 
-    def _check_claude_cli(self) -> bool:
-        if self._claude_available is None:
-            try:
-                result = subprocess.run(
-                    ["claude", "--version"],
-                    capture_output=True, text=True, timeout=10, shell=True
-                )
-                self._claude_available = result.returncode == 0
-            except:
-                self._claude_available = False
-        return self._claude_available
+    def _check_provider(self, provider: str) -> bool:
+        if provider in self.cli_commands:
+            return self._check_cli(provider)
+        if provider == "gemini":
+            return self._get_gemini() is not None
+        if provider == "codex":
+            return self._get_openai() is not None
+        return False
+
+    def _check_cli(self, provider: str) -> bool:
+        try:
+            result = subprocess.run(
+                [self.cli_commands[provider][0], "--version"],
+                capture_output=True, text=True, timeout=10, shell=self.USE_SHELL
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
 
     def _get_gemini(self):
-        if self._gemini_client is None and GOOGLE_API_KEY:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=GOOGLE_API_KEY)
-                self._gemini_client = genai.GenerativeModel("gemini-1.5-flash")
-            except ImportError:
-                print("[WARN] google-generativeai not installed")
-        return self._gemini_client
+        with self._client_lock:
+            if self._gemini_client is None and GOOGLE_API_KEY:
+                try:
+                    import google.generativeai as genai
+                    genai.configure(api_key=GOOGLE_API_KEY)
+                    self._gemini_client = genai.GenerativeModel("gemini-1.5-flash")
+                except ImportError:
+                    print("[WARN] google-generativeai not installed")
+            return self._gemini_client
 
     def _get_openai(self):
-        if self._openai_client is None and OPENAI_API_KEY:
-            try:
-                from openai import OpenAI
-                self._openai_client = OpenAI(api_key=OPENAI_API_KEY)
-            except ImportError:
-                print("[WARN] openai package not installed")
-        return self._openai_client
+        with self._client_lock:
+            if self._openai_client is None and OPENAI_API_KEY:
+                try:
+                    from openai import OpenAI
+                    self._openai_client = OpenAI(api_key=OPENAI_API_KEY)
+                except ImportError:
+                    print("[WARN] openai package not installed")
+            return self._openai_client
 
     def get_available_providers(self) -> List[str]:
-        available = []
-        if self._check_claude_cli():
-            available.append("claude")
-        if self._get_gemini():
-            available.append("gemini")
-        if self._get_openai():
-            available.append("codex")
-        return available
-
-    def get_next_provider(self) -> str:
-        """Round-robin through available providers"""
-        available = self.get_available_providers()
-        if not available:
-            raise ValueError("No AI providers available")
-        provider = available[self._current_index % len(available)]
-        self._current_index += 1
-        return provider
+        """Healthy providers (health checks are cached by the router)"""
+        return self.router.available()
 
-    def send_message(self, prompt: str, provider: Optional[str] = None) -> Dict[str, Any]:
-        """Send message to specified or next provider"""
-        if provider is None:
-            provider = self.get_next_provider()
+    def get_next_provider(self, avoid: Sequence[str] = ()) -> str:
+        """Best provider the router would pick next (does not reserve a slot)"""
+        provider = self.router.acquire(avoid=avoid)
+        self.router.cancel(provider)
+        return provider
 
-        start_time = time.time()
+    def send_message(
+        self,
+        prompt: str,
+        provider: Optional[str] = None,
+        avoid: Sequence[str] = (),
+    ) -> Dict[str, Any]:
+        """
+        Send message to specified or routed provider.
+
+        A routed call that fails is retried on each other usable provider in
+        turn; every failure counts against that provider's circuit breaker.
+        """
+        failed: List[str] = []
+        errors: List[str] = []
+        while True:
+            try:
+                name = self.router.acquire(provider=provider, avoid=avoid, exclude=failed)
+            except ValueError:
+                if not errors:
+                    raise
+                raise ValueError(f"All providers failed: {'; '.join(errors)}")
 
-        if provider == "claude":
-            return self._send_claude(prompt, start_time)
+            start_time = time.time()
+            try:
+                result = self._send(name, prompt, start_time)
+            except Exception as e:
+                self.router.release(name, ok=False)
+                if provider is not None:
+                    raise
+                failed.append(name)
+                errors.append(f"{name}: {e}")
+                continue
+            self.router.release(name, ok=True, latency_ms=(time.time() - start_time) * 1000)
+            return result
+
+    def _send(self, provider: str, prompt: str, start_time: float) -> Dict[str, Any]:
+        if provider in self.cli_commands:
+            return self._send_cli(provider, prompt, start_time)
         elif provider == "gemini":
             return self._send_gemini(prompt, start_time)
         elif provider == "codex":
             return self._send_codex(prompt, start_time)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        raise ValueError(f"Unknown provider: {provider}")
 
-    def _send_claude(self, prompt: str, start_time: float) -> Dict[str, Any]:
-        cmd = ["claude", "--print", "--output-format", "text"]
+    def _send_cli(self, provider: str, prompt: str, start_time: float) -> Dict[str, Any]:
         result = subprocess.run(
-            cmd, input=prompt, capture_output=True, text=True,
-            timeout=300, shell=True
+            self.cli_commands[provider], input=prompt, capture_output=True, text=True,
+            timeout=self.CLI_TIMEOUT, shell=self.USE_SHELL
         )
         execution_time_ms = int((time.time() - start_time) * 1000)
 
         if result.returncode != 0:
-            raise ValueError(f"Claude CLI error: {result.stderr}")
+            raise ValueError(f"{provider} CLI error: {result.stderr}")
 
         return {
             "response": result.stdout.strip(),
-            "model": "claude-cli",
-            "provider": "claude",
+            "model": f"{provider}-cli",
+            "provider": provider,
             "execution_time_ms": execution_time_ms
         }
 
@@ -189,17 +263,17 @@ class MultiModelClient:
 
 
 class MultiModelEvaluator:
-    """Evaluator that alternates between multiple AI providers"""
+    """Evaluator that spreads tasks across multiple AI providers"""
 
     CORPUS_DIR = Path(__file__).parent / "corpus"
     RESULTS_DIR = Path(__file__).parent.parent / "storage" / "eval_results"
     SKILLS_DIR = Path(__file__).parent.parent.parent / "skills" / "foundry"
 
-    def __init__(self, skill_name: str):
+    def __init__(self, skill_name: str, client: Optional[MultiModelClient] = None):
         self.skill_name = skill_name
         self.corpus = self._load_corpus()
         self.skill_content = self._load_skill()
-        self.client = MultiModelClient()
+        self.client = client or MultiModelClient()
         self.RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
         available = self.client.get_available_providers()
@@ -239,8 +313,8 @@ Provide the skill's output following its defined behavior and format."""
         result = self.client.send_message(prompt)
         return result["response"], result["provider"]
 
-    def _judge_output(self, task: Dict, skill_output: str) -> Dict[str, Any]:
-        """Use next provider to judge output"""
+    def _judge_output(self, task: Dict, skill_output: str, exec_provider: str = "") -> Dict[str, Any]:
+        """Judge output, preferring a different provider than the one that executed"""
         judge_prompt = f"""You are evaluating a skill's output. Score each dimension from 0.0 to 1.0.
 
 TASK:
@@ -274,7 +348,7 @@ Respond in JSON format ONLY:
   "reasoning": "Brief explanation"
 }}"""
 
-        result = self.client.send_message(judge_prompt)
+        result = self.client.send_message(judge_prompt, avoid=[exec_provider])
         text = result["response"]
 
         # Parse JSON from response
@@ -296,69 +370,73 @@ Respond in JSON format ONLY:
             "reasoning": "Failed to parse judge response"
         }
 
-    def run_evaluation(self, max_tasks: int = 50) -> EvaluationResult:
-        """Run evaluation alternating between providers"""
-        tasks = self.corpus.get("tasks", [])[:max_tasks]
-        results = []
-        models_used = set()
+    def evaluate_task(self, task: Dict) -> TaskResult:
+        """Execute and judge one task (thread-safe; the router picks providers)"""
+        task_id = task["id"]
+        start_time = time.time()
+
+        try:
+            skill_output, exec_provider = self._execute_skill(task["input"])
+            scores = self._judge_output(task, skill_output, exec_provider)
+            execution_time_ms = int((time.time() - start_time) * 1000)
+
+            return TaskResult(
+                task_id=task_id,
+                difficulty=task.get("difficulty", "unknown"),
+                category=task.get("category", "unknown"),
+                input_text=task["input"],
+                skill_output=skill_output[:500],
+                success_criteria=task.get("success_criteria", ""),
+                model_used=exec_provider,
+                intent_accuracy=scores.get("intent_accuracy", 0),
+                constraint_coverage=scores.get("constraint_coverage", 0),
+                output_quality=scores.get("output_quality", 0),
+                verix_compliance=scores.get("verix_compliance", 0),
+                l2_purity=scores.get("l2_purity", 0),
+                passed=scores.get("passed", False),
+                judge_reasoning=scores.get("reasoning", ""),
+                execution_time_ms=execution_time_ms
+            )
+
+        except Exception as e:
+            print(f"{task_id}... ERROR: {e}")
+            return TaskResult(
+                task_id=task_id,
+                difficulty=task.get("difficulty", "unknown"),
+                category=task.get("category", "unknown"),
+                input_text=task["input"],
+                skill_output="",
+                success_criteria=task.get("success_criteria", ""),
+                model_used="error",
+                passed=False,
+                judge_reasoning=f"Error: {str(e)}",
+                execution_time_ms=int((time.time() - start_time) * 1000)
+            )
+
+    def run_evaluation(self, max_tasks: int = 50, max_workers: Optional[int] = None) -> EvaluationResult:
+        """
+        Run evaluation across providers.
+
+        Args:
+            max_tasks: Maximum number of tasks to run
+            max_workers: Tasks evaluated concurrently (None = total provider
+                concurrency, so every healthy provider is kept busy)
+        """
+        tasks = [
+            dict(task, id=task.get("id", f"T-{i+1}"))
+            for i, task in enumerate(self.corpus.get("tasks", [])[:max_tasks])
+        ]
+        if max_workers is None:
+            max_workers = self.client.router.capacity()
 
         print(f"\n{'='*60}")
         print(f"MULTI-MODEL EVALUATION: {self.skill_name}")
-        print(f"Tasks: {len(tasks)} | Providers: {self.client.get_available_providers()}")
+        print(f"Tasks: {len(tasks)} | Providers: {self.client.get_available_providers()} | Workers: {max_workers}")
         print(f"{'='*60}\n")
 
-        for i, task in enumerate(tasks):
-            task_id = task.get("id", f"T-{i+1}")
-            start_time = time.time()
-
-            try:
-                # Execute skill
-                skill_output, exec_provider = self._execute_skill(task["input"])
-                models_used.add(exec_provider)
-
-                # Judge output (will use next provider)
-                scores = self._judge_output(task, skill_output)
-
-                execution_time_ms = int((time.time() - start_time) * 1000)
-
-                result = TaskResult(
-                    task_id=task_id,
-                    difficulty=task.get("difficulty", "unknown"),
-                    category=task.get("category", "unknown"),
-                    input_text=task["input"],
-                    skill_output=skill_output[:500],
-                    success_criteria=task.get("success_criteria", ""),
-                    model_used=exec_provider,
-                    intent_accuracy=scores.get("intent_accuracy", 0),
-                    constraint_coverage=scores.get("constraint_coverage", 0),
-                    output_quality=scores.get("output_quality", 0),
-                    verix_compliance=scores.get("verix_compliance", 0),
-                    l2_purity=scores.get("l2_purity", 0),
-                    passed=scores.get("passed", False),
-                    judge_reasoning=scores.get("reasoning", ""),
-                    execution_time_ms=execution_time_ms
-                )
-
-                status = "PASS" if result.passed else "FAIL"
-                print(f"[{i+1}/{len(tasks)}] {task_id} ({exec_provider})... {status} ({execution_time_ms}ms)")
-
-            except Exception as e:
-                result = TaskResult(
-                    task_id=task_id,
-                    difficulty=task.get("difficulty", "unknown"),
-                    category=task.get("category", "unknown"),
-                    input_text=task["input"],
-                    skill_output="",
-                    success_criteria=task.get("success_criteria", ""),
-                    model_used="error",
-                    passed=False,
-                    judge_reasoning=f"Error: {str(e)}"
-                )
-                print(f"[{i+1}/{len(tasks)}] {task_id}... ERROR: {e}")
-
-            results.append(result)
-
+        results = run_tasks(tasks, self.evaluate_task, max_workers=max_workers)
         passed = sum(1 for r in results if r.passed)
+        models_used = list(dict.fromkeys(r.model_used for r in results if r.model_used != "error"))
 
         eval_result = EvaluationResult(
             skill_name=self.skill_name,
@@ -366,8 +444,9 @@ Respond in JSON format ONLY:
             timestamp=datetime.now().isoformat(),
             total_tasks=len(results),
             passed_tasks=passed,
-            models_used=list(models_used),
-            task_results=results
+            models_used=models_used,
+            task_results=results,
+            provider_stats=self.client.router.snapshot()
         )
 
         # Save results
@@ -385,6 +464,14 @@ Respond in JSON format ONLY:
         print(f"Pass Rate: {result.pass_rate:.1%} ({result.passed_tasks}/{result.total_tasks})")
         print(f"Models Used: {', '.join(result.models_used)}")
 
+        print(f"\nProviders:")
+        for name, stats in result.provider_stats.items():
+            if stats["calls"]:
+                latency = stats["ewma_latency_ms"]
+                latency_text = f"{latency:.0f}ms" if latency is not None else "-"
+                print(f"  {name}: {stats['calls']} calls, {latency_text} ewma, "
+                      f"{stats['error_rate']:.0%} errors, circuit {stats['circuit']}")
+
         # Group by category
         by_category = {}
         for tr in result.task_results:
@@ -413,7 +500,8 @@ Respond in JSON format ONLY:
 if __name__ == "__main__":
     skill = sys.argv[1] if len(sys.argv) > 1 else "prompt-architect"
     max_tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
 
     evaluator = MultiModelEvaluator(skill)
-    result = evaluator.run_evaluation(max_tasks=max_tasks)
+    result = evaluator.run_evaluation(max_tasks=max_tasks, max_workers=max_workers)
     evaluator.print_summary(result)
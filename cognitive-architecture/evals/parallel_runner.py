@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Parallel corpus runner with a resumable checkpoint.
+
+Shared by CLITaskEvaluator and RealTaskEvaluator. Each corpus task costs two
+blocking round trips (skill execution, then judging); run serially a full
+corpus takes hours. The runner:
+- evaluates tasks on a bounded pool of worker threads, each driving its own
+  `claude` subprocess or API request, so execution of one task overlaps the
+  judging of others
+- appends every finished task to a JSONL checkpoint, so an interrupted run
+  resumes without redoing finished tasks
+- returns results in corpus order regardless of completion order, so the
+  aggregated EvaluationResult matches a serial run
+
+Checkpoints are keyed by a fingerprint of the skill definition, corpus
+version and model; editing the skill starts a fresh checkpoint. Tasks that
+failed transiently (skill or judge errors) are not checkpointed and are
+retried on resume.
+
+Usage:
+    from evals.parallel_runner import TaskCheckpoint, run_tasks
+    checkpoint = TaskCheckpoint(path)
+    results = run_tasks(tasks, evaluate_task, max_workers=4, checkpoint=checkpoint)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+
+T = TypeVar("T")
+
+# Markers the evaluators put in outputs when a call failed rather than scored
+TRANSIENT_OUTPUT_PREFIX = "[ERROR]"
+TRANSIENT_REASONING_PREFIX = "Judge error"
+
+
+def evaluation_fingerprint(**parts: Any) -> str:
+    """Stable hash of everything that determines a task's score."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_transient_failure(result: Any) -> bool:
+    """True if a TaskResult records a failed call rather than a judged output."""
+    return (
+        result.skill_output.startswith(TRANSIENT_OUTPUT_PREFIX)
+        or result.judge_reasoning.startswith(TRANSIENT_REASONING_PREFIX)
+    )
+
+
+class TaskCheckpoint:
+    """
+    Append-only JSONL record of finished tasks.
+
+    One line per task ({"task_id", "result"}); a later line for the same
+    task wins. A torn final line from an interrupted write is ignored.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def load(self, result_type: Type[T]) -> Dict[str, T]:
+        """Finished results by task id, rebuilt as result_type instances."""
+        done: Dict[str, T] = {}
+        if not self.path.exists():
+            return done
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    done[record["task_id"]] = result_type(**record["result"])
+                except (ValueError, KeyError, TypeError):
+                    continue  # Torn or foreign line
+        return done
+
+    def append(self, task_id: str, result: Any) -> None:
+        """Record one finished task durably."""
+        line = json.dumps({"task_id": task_id, "result": asdict(result)}) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        """Remove the checkpoint (after a completed run, or to start over)."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+
+def run_tasks(
+    tasks: List[Dict],
+    evaluate: Callable[[Dict], T],
+    max_workers: int = 1,
+    checkpoint: Optional[TaskCheckpoint] = None,
+    result_type: Optional[Type[T]] = None,
+    verbose: bool = True,
+) -> List[T]:
+    """
+    Evaluate tasks, in parallel when max_workers > 1.
+
+    Args:
+        tasks: Corpus task dicts (must have "id")
+        evaluate: Runs one task end to end (execute + judge), returns a TaskResult
+        max_workers: Concurrent tasks; 1 runs inline in the calling thread
+        checkpoint: Resume from and append to this checkpoint (None = no checkpoint)
+        result_type: TaskResult class used to rebuild checkpointed results
+        verbose: Print one progress line per finished task
+
+    Returns:
+        Results in the order of tasks
+    """
+    done: Dict[str, T] = {}
+    if checkpoint is not None and result_type is not None:
+        done = checkpoint.load(result_type)
+    results: Dict[str, T] = {t["id"]: done[t["id"]] for t in tasks if t["id"] in done}
+    pending = [t for t in tasks if t["id"] not in results]
+
+    total = len(tasks)
+    if verbose and results:
+        print(f"Resuming: {len(results)}/{total} tasks already in checkpoint")
+
+    # Called from the submitting thread only, in completion order
+    def finish(task: Dict, result: T) -> None:
+        if checkpoint is not None and not is_transient_failure(result):
+            checkpoint.append(task["id"], result)
+        results[task["id"]] = result
+        if verbose:
+            status = "PASS" if result.passed else "FAIL"
+            print(f"[{len(results)}/{total}] {task['id']} {status} ({result.execution_time_ms}ms)", flush=True)
+
+    if max_workers <= 1:
+        for task in pending:
+            finish(task, evaluate(task))
+    else:
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="eval")
+        try:
+            futures = {pool.submit(evaluate, task): task for task in pending}
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+        finally:
+            # On interrupt, drop queued tasks; finished ones are in the checkpoint
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    return [results[t["id"]] for t in tasks]
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Health-cached, latency-aware routing across AI providers.
+
+Used by MultiModelClient. Before this, every message re-ran the availability
+checks (a `claude --version` subprocess plus client construction) and a dead
+provider kept receiving its share of round-robin traffic. The router keeps,
+per provider:
+- a health verdict cached for health_ttl seconds
+- EWMA latency (successful calls) and EWMA error rate (all calls)
+- a circuit breaker: failure_threshold consecutive failures open it for
+  cooldown seconds; then one half-open probe is let through, and its result
+  closes or re-opens the circuit
+- an in-flight counter capped by max_concurrency
+
+Routing picks among healthy providers with a closed circuit (or a pending
+probe) and a free slot:
+- "fastest": lowest EWMA latency; providers with no samples yet go first
+- "weighted": smooth weighted round-robin, weight = (1 - error rate) / latency
+
+acquire() blocks while every usable provider is at its cap and raises
+ValueError only when none could serve at all.
+
+Usage:
+    router = ProviderRouter(["claude", "gemini"], health_check=check)
+    provider = router.acquire()
+    try:
+        response = call(provider, prompt)
+    except Exception:
+        router.release(provider, ok=False)
+        raise
+    router.release(provider, ok=True, latency_ms=elapsed_ms)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class ProviderStats:
+    """Routing state for one provider."""
+    name: str
+    max_concurrency: int = 1
+    healthy: bool = False
+    checked_at: Optional[float] = None
+    ewma_latency_ms: Optional[float] = None
+    error_rate: float = 0.0
+    consecutive_failures: int = 0
+    circuit: str = CLOSED
+    opened_at: float = 0.0
+    in_flight: int = 0
+    calls: int = 0
+    failures: int = 0
+    # Smooth weighted round-robin credit
+    credit: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "circuit": self.circuit,
+            "ewma_latency_ms": self.ewma_latency_ms,
+            "error_rate": round(self.error_rate, 4),
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "calls": self.calls,
+            "failures": self.failures,
+        }
+
+
+class ProviderRouter:
+    """Routes calls to the best healthy provider under per-provider caps."""
+
+    STRATEGIES = ("fastest", "weighted")
+
+    def __init__(
+        self,
+        providers: Sequence[str],
+        health_check: Callable[[str], bool],
+        strategy: str = "fastest",
+        health_ttl: float = 300.0,
+        max_concurrency: Union[int, Dict[str, int]] = 2,
+        alpha: float = 0.3,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize router.
+
+        Args:
+            providers: Provider names, in tie-break order
+            health_check: Returns True if a provider can be used (may be slow)
+            strategy: "fastest" or "weighted"
+            health_ttl: Seconds a health verdict is reused
+            max_concurrency: In-flight cap, for all providers or per provider
+            alpha: EWMA smoothing factor for latency and error rate
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds an open circuit waits before a probe
+            clock: Monotonic time source (injectable for tests)
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.providers = list(providers)
+        self.health_check = health_check
+        self.strategy = strategy
+        self.health_ttl = health_ttl
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+
+        self._stats: Dict[str, ProviderStats] = {}
+        for name in self.providers:
+            cap = max_concurrency.get(name, 1) if isinstance(max_concurrency, dict) else max_concurrency
+            self._stats[name] = ProviderStats(name=name, max_concurrency=max(1, cap))
+
+        self._cond = threading.Condition()
+        # Serializes health checks so concurrent callers do not all re-check
+        self._health_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Health
+    # -------------------------------------------------------------------------
+
+    def available(self) -> List[str]:
+        """Providers whose (cached) health check passes."""
+        self._refresh_health()
+        with self._cond:
+            return [name for name in self.providers if self._stats[name].healthy]
+
+    def invalidate(self, provider: Optional[str] = None) -> None:
+        """Force a fresh health check for one or all providers."""
+        with self._cond:
+            for name in [provider] if provider else self.providers:
+                self._stats[name].checked_at = None
+
+    def _refresh_health(self) -> None:
+        with self._health_lock:
+            now = self.clock()
+            stale = [
+                name for name in self.providers
+                if self._stats[name].checked_at is None
+                or now - self._stats[name].checked_at >= self.health_ttl
+            ]
+            for name in stale:
+                try:
+                    healthy = bool(self.health_check(name))
+                except Exception:
+                    healthy = False
+                with self._cond:
+                    stats = self._stats[name]
+                    stats.healthy, stats.checked_at = healthy, self.clock()
+                    self._cond.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Routing
+    # -------------------------------------------------------------------------
+
+    def acquire(
+        self,
+        provider: Optional[str] = None,
+        avoid: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Reserve a slot on a provider.
+
+        Args:
+            provider: Use this provider only (still health, breaker and cap checked)
+            avoid: Prefer other providers when one of them is usable
+            exclude: Never use these providers (e.g. ones that just failed)
+            timeout: Seconds to wait for a free slot (None = wait indefinitely)
+
+        Returns:
+            Provider name; pass it to release() when the call finishes
+        """
+        if provider is not None and provider not in self._stats:
+            raise ValueError(f"Unknown provider: {provider}")
+        self._refresh_health()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                names = [provider] if provider else self.providers
+                usable = [n for n in names if n not in exclude and self._usable(self._stats[n])]
+                if not usable:
+                    raise ValueError("No AI providers available")
+
+                preferred = [n for n in usable if n not in avoid] or usable
+                choice = self._choose([n for n in preferred if self._has_slot(self._stats[n])])
+                if choice is None and preferred is not usable:
+                    choice = self._choose([n for n in usable if self._has_slot(self._stats[n])])
+                if choice is not None:
+                    stats = self._stats[choice]
+                    if stats.circuit == OPEN:
+                        stats.circuit = HALF_OPEN  # This call is the probe
+                    stats.in_flight += 1
+                    return choice
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Timed out waiting for a provider slot")
+                # Wake periodically so an open circuit's cooldown can elapse
+                self._cond.wait(min(remaining, 1.0) if remaining is not None else 1.0)
+
+    def release(self, provider: str, ok: bool, latency_ms: Optional[float] = None) -> None:
+        """Return a slot and record the call's outcome."""
+        with self._cond:
+            stats = self._stats[provider]
+            stats.in_flight = max(0, stats.in_flight - 1)
+            stats.calls += 1
+            stats.error_rate += self.alpha * ((0.0 if ok else 1.0) - stats.error_rate)
+            if ok:
+                if latency_ms is not None:
+                    stats.ewma_latency_ms = (
+                        float(latency_ms) if stats.ewma_latency_ms is None
+                        else stats.ewma_latency_ms + self.alpha * (latency_ms - stats.ewma_latency_ms)
+                    )
+                stats.consecutive_failures = 0
+                stats.circuit = CLOSED
+            else:
+                stats.failures += 1
+                stats.consecutive_failures += 1
+                if stats.circuit == HALF_OPEN or stats.consecutive_failures >= self.failure_threshold:
+                    stats.circuit = OPEN
+                    stats.opened_at = self.clock()
+            self._cond.notify_all()
+
+    def cancel(self, provider: str) -> None:
+        """Return a slot without recording an outcome (the call never ran)."""
+        with self._cond:
+            stats = self._stats[provider]
+            stats.in_flight = max(0, stats.in_flight - 1)
+            if stats.circuit == HALF_OPEN:
+                stats.circuit = OPEN  # Let the next caller take the probe
+            self._cond.notify_all()
+
+    def capacity(self) -> int:
+        """Total in-flight slots across healthy providers."""
+        available = self.available()
+        return sum(self._stats[name].max_concurrency for name in available)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider routing state for reports."""
+        with self._cond:
+            return {name: self._stats[name].to_dict() for name in self.providers}
+
+    # Called with self._cond held
+
+    def _usable(self, stats: ProviderStats) -> bool:
+        """Healthy and the circuit lets calls (or a probe) through."""
+        if not stats.healthy:
+            return False
+        if stats.circuit == OPEN:
+            return self.clock() - stats.opened_at >= self.cooldown
+        return True
+
+    def _has_slot(self, stats: ProviderStats) -> bool:
+        if stats.circuit == CLOSED:
+            return stats.in_flight < stats.max_concurrency
+        # One probe at a time while the circuit is not closed
+        return stats.in_flight == 0
+
+    def _choose(self, names: List[str]) -> Optional[str]:
+        if not names:
+            return None
+        if self.strategy == "fastest":
+            # Unmeasured providers sort first so they get sampled
+            return min(names, key=lambda n: (
+                self._stats[n].ewma_latency_ms is not None,
+                self._stats[n].ewma_latency_ms or 0.0,
+            ))
+
+        measured = [self._stats[n].ewma_latency_ms for n in names if self._stats[n].ewma_latency_ms]
+        default_latency = sum(measured) / len(measured) if measured else 1.0
+        weights = {
+            n: max(1.0 - self._stats[n].error_rate, 0.01) / max(self._stats[n].ewma_latency_ms or default_latency, 1e-3)
+            for n in names
+        }
+        total = sum(weights.values())
+        for n in names:
+            self._stats[n].credit += weights[n]
+        choice = max(names, key=lambda n: self._stats[n].credit)
+        self._stats[choice].credit -= total
+        return choice
@@ -11,6 +11,9 @@ Usage:
     from evals.real_evaluator import RealTaskEvaluator
     evaluator = RealTaskEvaluator("prompt-architect")
     results = evaluator.run_evaluation()
+
+    # Four concurrent API workers; an interrupted run resumes from its checkpoint
+    results = evaluator.run_evaluation(max_workers=4)
 """
 
 import os
@@ -25,6 +28,9 @@ from typing import Dict, List, Any, Optional
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.response_cache import ResponseCache
+from evals.parallel_runner import TaskCheckpoint, evaluation_fingerprint, is_transient_failure, run_tasks
+
 # Load environment variables
 from dotenv import load_dotenv
 env_file = Path(__file__).parent.parent / ".env"
@@ -102,16 +108,26 @@ class RealTaskEvaluator:
     RESULTS_DIR = Path(__file__).parent.parent / "storage" / "eval_results"
     SKILLS_DIR = Path(__file__).parent.parent.parent / "skills" / "foundry"
 
-    def __init__(self, skill_name: str, model: str = "claude-sonnet-4-20250514"):
+    def __init__(
+        self,
+        skill_name: str,
+        model: str = "claude-sonnet-4-20250514",
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False,
+    ):
         """
         Initialize evaluator.
 
         Args:
             skill_name: One of "prompt-architect", "agent-creator", "skill-forge"
             model: Claude model to use for evaluation (default: claude-sonnet-4-20250514)
+            cache: ResponseCache for skill executions (None = no caching)
+            bypass_cache: Skip cache lookups but still store fresh outputs
         """
         self.skill_name = skill_name
         self.model = model
+        self.cache = cache
+        self.bypass_cache = bypass_cache
         self.corpus = self._load_corpus()
         self.skill_content = self._load_skill()
 
@@ -170,13 +186,28 @@ Now execute this skill with the following input:
 
 Provide the skill's output following its defined behavior and format."""
 
+        params = {
+            "model": self.model,
+            "max_tokens": 2000,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key({"provider": "anthropic-messages", **params})
+            entry = None if self.bypass_cache else self.cache.get(cache_key)
+            if entry is not None:
+                return entry["response"]
+
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.content[0].text
+            response = self.client.messages.create(**params)
+            text = response.content[0].text
+            if cache_key is not None:
+                self.cache.put(cache_key, {
+                    "response": text,
+                    "input_tokens": response.usage.input_tokens,
+                    "output_tokens": response.usage.output_tokens,
+                })
+            return text
         except Exception as e:
             return f"[ERROR] Skill execution failed: {e}"
 
@@ -296,11 +327,24 @@ Respond in JSON format:
             execution_time_ms=execution_time,
         )
 
+    def _checkpoint(self) -> TaskCheckpoint:
+        """Checkpoint for this skill definition, corpus version and model."""
+        fingerprint = evaluation_fingerprint(
+            evaluation_type="mock" if self.client is None else "api",
+            skill=self.skill_content,
+            corpus_version=self.corpus.get('version', 'unknown'),
+            model=self.model,
+        )
+        path = self.RESULTS_DIR / "checkpoints" / f"{self.skill_name}-{fingerprint[:16]}.jsonl"
+        return TaskCheckpoint(path)
+
     def run_evaluation(
         self,
         task_ids: Optional[List[str]] = None,
         difficulty_filter: Optional[str] = None,
         max_tasks: Optional[int] = None,
+        max_workers: int = 1,
+        resume: bool = True,
     ) -> EvaluationResult:
         """
         Run evaluation on corpus.
@@ -309,6 +353,8 @@ Respond in JSON format:
             task_ids: Specific task IDs to run (None = all)
             difficulty_filter: "easy", "medium", "hard" (None = all)
             max_tasks: Maximum number of tasks to run (None = all)
+            max_workers: Tasks evaluated concurrently (each makes its own API calls)
+            resume: Reuse tasks finished by an interrupted run (False = start over)
 
         Returns:
             EvaluationResult with aggregate scores
@@ -330,16 +376,19 @@ Respond in JSON format:
         print(f"\n{'='*60}")
         print(f"REAL EVALUATION: {self.skill_name}")
         print(f"Tasks to evaluate: {len(tasks)}")
+        print(f"Workers: {max_workers}")
         print(f"{'='*60}\n")
 
-        results: List[TaskResult] = []
-
-        for i, task in enumerate(tasks, 1):
-            print(f"[{i}/{len(tasks)}] Evaluating {task['id']}...", end=" ")
-            result = self.evaluate_task(task)
-            results.append(result)
-            status = "PASS" if result.passed else "FAIL"
-            print(f"{status} ({result.execution_time_ms}ms)")
+        checkpoint = self._checkpoint()
+        if not resume:
+            checkpoint.clear()
+        results = run_tasks(
+            tasks, self.evaluate_task,
+            max_workers=max_workers, checkpoint=checkpoint, result_type=TaskResult,
+        )
+        # Keep the checkpoint while any task needs a retry
+        if not any(is_transient_failure(r) for r in results):
+            checkpoint.clear()
 
         # Aggregate scores
         passed_count = sum(1 for r in results if r.passed)
@@ -449,6 +498,9 @@ def main():
     parser.add_argument("skill", choices=["prompt-architect", "agent-creator", "skill-forge"])
     parser.add_argument("--max-tasks", type=int, default=None, help="Max tasks to run")
     parser.add_argument("--difficulty", choices=["easy", "medium", "hard"], default=None)
+    parser.add_argument("--workers", type=int, default=1, help="Tasks to evaluate concurrently")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Ignore the checkpoint of an interrupted run and start over")
 
     args = parser.parse_args()
 
@@ -456,6 +508,8 @@ def main():
     result = evaluator.run_evaluation(
         difficulty_filter=args.difficulty,
         max_tasks=args.max_tasks,
+        max_workers=args.workers,
+        resume=not args.no_resume,
     )
     evaluator.print_summary(result)
 
@@ -126,6 +126,7 @@ Examples:
         harness = FrozenHarness(
             Path(args.loop_dir),
             use_cli_evaluator=not args.no_cli,
+            use_cache=False,
         )
 
         print(f"\nHarness Version: {harness.harness_version}")
@@ -74,6 +74,7 @@ from integration.unified_bridge import (
 )
 from integration.telemetry_bridge import TelemetryBridge
 from integration.connascence_bridge import ConnascenceBridge, ConnascenceResult
+from loopctl.grade_cache import GradeCache, hash_artifact
 
 
 class FrozenHarness:
@@ -86,6 +87,10 @@ class FrozenHarness:
     Evaluation Strategy (in order):
     1. CLI Evaluator (real LLM-based) - preferred
     2. Heuristic fallback - when CLI unavailable
+
+    Grades are cached in loop_dir/grade_cache.sqlite3, keyed by artifact
+    hash, harness hash and evaluation mode, so byte-identical artifacts
+    are not re-judged.
     """
 
     def __init__(
@@ -94,6 +99,7 @@ class FrozenHarness:
         harness_version: str = "1.0.0",
         use_cli_evaluator: bool = True,
         use_connascence: bool = True,
+        use_cache: bool = True,
     ):
         self.loop_dir = Path(loop_dir)
         self.harness_version = harness_version
@@ -111,6 +117,10 @@ class FrozenHarness:
         if use_connascence:
             self._connascence_bridge = self._init_connascence_bridge()
 
+        self._cache = GradeCache(self.loop_dir) if use_cache else None
+        self.last_artifact_hash: Optional[str] = None
+        self.last_cache_hit = False
+
     def _init_cli_evaluator(self):
         """Initialize CLI evaluator if available."""
         try:
@@ -139,7 +149,6 @@ class FrozenHarness:
     def _compute_hash(self) -> str:
         """Compute hash of harness for integrity verification."""
         # Hash actual harness code for integrity
-        import hashlib
         harness_file = Path(__file__)
         if harness_file.exists():
             content = harness_file.read_bytes()
@@ -163,6 +172,11 @@ class FrozenHarness:
             return self._connascence_bridge.mode
         return "disabled"
 
+    @property
+    def cache_mode(self) -> str:
+        """Evaluation mode part of the grade cache key."""
+        return f"{self.evaluation_mode}+{self.connascence_mode}"
+
     def verify_integrity(self, expected_hash: Optional[str]) -> bool:
         """Verify harness hasn't been modified."""
         if expected_hash is None:
@@ -176,10 +190,14 @@ class FrozenHarness:
         Uses CLI evaluator (real LLM) when available,
         falls back to heuristics otherwise.
         Optionally includes connascence quality metrics.
+        Identical artifacts graded before under the same harness and
+        mode return the cached metrics without re-judging.
 
         Returns metrics dict (NOT model-reported).
         """
         artifact_path = Path(artifact_path)
+        self.last_artifact_hash = hash_artifact(artifact_path)
+        self.last_cache_hit = False
 
         if not artifact_path.exists():
             return {
@@ -192,6 +210,14 @@ class FrozenHarness:
                 "connascence_mode": "disabled",
             }
 
+        # Directories are not content-hashed, so only files are cached
+        cacheable = self._cache is not None and artifact_path.is_file()
+        if cacheable:
+            cached = self._cache.get(self.last_artifact_hash, self._harness_hash, self.cache_mode)
+            if cached is not None:
+                self.last_cache_hit = True
+                return cached
+
         # Read artifact content
         content = artifact_path.read_text(errors="ignore")
 
@@ -204,6 +230,7 @@ class FrozenHarness:
                 # Log but continue to fallback
                 metrics = self._grade_with_heuristics(content)
                 metrics["evaluation_mode"] = "heuristic"
+                cacheable = False  # Don't pin a transient CLI failure
         else:
             # Fallback: heuristic grading
             metrics = self._grade_with_heuristics(content)
@@ -212,6 +239,7 @@ class FrozenHarness:
         # Add connascence quality metrics if enabled
         if self._connascence_bridge:
             connascence_result = self._grade_with_connascence(artifact_path)
+            cacheable = cacheable and connascence_result.success
             metrics["connascence_mode"] = self._connascence_bridge.mode
             metrics["connascence"] = {
                 "sigma_level": connascence_result.sigma_level,
@@ -231,8 +259,14 @@ class FrozenHarness:
         else:
             metrics["connascence_mode"] = "disabled"
 
+        if cacheable:
+            self._cache.put(self.last_artifact_hash, self._harness_hash, self.cache_mode, metrics)
         return metrics
 
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Grade cache counters, or None when caching is disabled."""
+        return self._cache.stats() if self._cache is not None else None
+
     def _grade_with_connascence(self, artifact_path: Path) -> ConnascenceResult:
         """
         Grade using Connascence Analyzer (7-Analyzer Suite).
@@ -459,9 +493,8 @@ def ralph_iteration_complete(
         "iteration": iteration,
         "timestamp": datetime.now().isoformat(),
         "artifact_path": str(artifact_path),
-        "artifact_hash": hashlib.sha256(
-            artifact_path.read_bytes() if artifact_path.exists() else b""
-        ).hexdigest()[:16],
+        "artifact_hash": harness.last_artifact_hash[:16],
+        "grade_cache_hit": harness.last_cache_hit,
         "metrics": harness_metrics,
         "harness_version": harness.harness_version,
         "harness_hash": harness.current_hash,
@@ -563,9 +596,21 @@ def get_status(loop_dir: str) -> Dict[str, Any]:
         "history_length": len(history),
         "max_iterations": policy.get("max_iterations", 50),
         "regression_threshold": policy.get("regression_threshold", 0.03),
+        "grade_cache": grade_cache_stats(loop_dir),
     }
 
 
+def grade_cache_stats(loop_dir: Path) -> Dict[str, Any]:
+    """Grade cache counters for a loop directory (zeros if never graded)."""
+    if not (loop_dir / GradeCache.DB_FILE).exists():
+        return {"hits": 0, "misses": 0, "hit_rate": 0.0, "evictions": 0, "entries": 0}
+    cache = GradeCache(loop_dir)
+    try:
+        return cache.stats()
+    finally:
+        cache.close()
+
+
 def reset_loop(loop_dir: str) -> Dict[str, Any]:
     """Reset loop state to defaults."""
     loop_dir = Path(loop_dir)
@@ -0,0 +1,172 @@
+"""
+Grade cache - persistent FrozenHarness results keyed by artifact content.
+
+Every Ralph stop-hook invocation builds a fresh FrozenHarness and grades the
+iteration's artifact. Loops that stall re-submit byte-identical artifacts,
+and each regrade pays for another LLM judge call plus connascence analysis.
+The cache stores the metrics dict under:
+- artifact hash: full SHA-256 of the artifact bytes
+- harness hash: FrozenHarness.current_hash (changes with the harness code)
+- evaluation mode: "cli_evaluator" or "heuristic", plus the connascence mode
+
+Storage is one SQLite file in the loop directory (WAL mode, shared safely by
+concurrent hook processes). Hit/miss counters live in the same file so
+`loopctl status` can report them across invocations. Entries beyond
+max_entries are evicted least recently used first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+def hash_artifact(artifact_path: Union[str, Path]) -> str:
+    """Hex SHA-256 of an artifact's bytes (of b"" when it does not exist)."""
+    artifact_path = Path(artifact_path)
+    digest = hashlib.sha256()
+    if artifact_path.is_file():
+        with open(artifact_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class GradeCache:
+    """SQLite-backed cache of harness metrics with persistent counters."""
+
+    DB_FILE = "grade_cache.sqlite3"
+    DEFAULT_MAX_ENTRIES = 1000
+
+    def __init__(self, loop_dir: Union[str, Path], max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Open (or create) the cache for a loop directory.
+
+        Args:
+            loop_dir: .loop/ directory; the database is loop_dir/grade_cache.sqlite3
+            max_entries: LRU entry cap
+        """
+        self.path = Path(loop_dir) / self.DB_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS grades (
+                artifact_hash TEXT NOT NULL,
+                harness_hash TEXT NOT NULL,
+                evaluation_mode TEXT NOT NULL,
+                metrics TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (artifact_hash, harness_hash, evaluation_mode)
+            );
+            CREATE INDEX IF NOT EXISTS grades_accessed ON grades(accessed);
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def get(
+        self,
+        artifact_hash: str,
+        harness_hash: str,
+        evaluation_mode: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up stored metrics, counting the hit or miss.
+
+        Returns:
+            Metrics dict from the original grade, or None on a miss
+        """
+        key = (artifact_hash, harness_hash, evaluation_mode)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT metrics FROM grades "
+                "WHERE artifact_hash = ? AND harness_hash = ? AND evaluation_mode = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                self._increment("misses")
+                return None
+            self._conn.execute(
+                "UPDATE grades SET accessed = ?, hits = hits + 1 "
+                "WHERE artifact_hash = ? AND harness_hash = ? AND evaluation_mode = ?",
+                (time.time(), *key),
+            )
+            self._increment("hits")
+        return json.loads(row[0])
+
+    def put(
+        self,
+        artifact_hash: str,
+        harness_hash: str,
+        evaluation_mode: str,
+        metrics: Dict[str, Any],
+    ) -> None:
+        """Store metrics for a key and evict least recently used entries."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO grades "
+                "(artifact_hash, harness_hash, evaluation_mode, metrics, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (artifact_hash, harness_hash, evaluation_mode, json.dumps(metrics), now, now),
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM grades").fetchone()[0]
+            if count > self.max_entries:
+                cursor = self._conn.execute(
+                    "DELETE FROM grades WHERE rowid IN "
+                    "(SELECT rowid FROM grades ORDER BY accessed ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+                self._increment("evictions", cursor.rowcount)
+
+    def stats(self) -> Dict[str, Any]:
+        """Lifetime counters plus the current number of entries."""
+        with self._lock:
+            counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+            entries = self._conn.execute("SELECT COUNT(*) FROM grades").fetchone()[0]
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "evictions": counters.get("evictions", 0),
+            "entries": entries,
+        }
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM grades")
+            self._conn.execute("DELETE FROM counters")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM grades").fetchone()[0]
+
+    def _increment(self, name: str, amount: int = 1) -> None:
+        self._conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
@@ -9,7 +9,6 @@ When enabled, historical performance data influences mode selection.
 
 import os
 import sys
-import re
 import logging
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
@@ -124,20 +123,20 @@ class TaskContext:
 
     def _infer_complexity(self, desc: str) -> TaskComplexity:
         """Infer complexity from description."""
-        # Simple indicators
+        # Simple indicators (plain substrings; runs on every prompt build)
         simple_patterns = [
-            r"simple", r"quick", r"basic", r"just", r"only",
-            r"single", r"one", r"brief"
+            "simple", "quick", "basic", "just", "only",
+            "single", "one", "brief"
         ]
-        if any(re.search(p, desc) for p in simple_patterns):
+        if any(p in desc for p in simple_patterns):
             return TaskComplexity.SIMPLE
 
         # Complex indicators
         complex_patterns = [
-            r"complex", r"comprehensive", r"detailed", r"thorough",
-            r"multi", r"all", r"every", r"complete", r"full"
+            "complex", "comprehensive", "detailed", "thorough",
+            "multi", "all", "every", "complete", "full"
         ]
-        if any(re.search(p, desc) for p in complex_patterns):
+        if any(p in desc for p in complex_patterns):
             return TaskComplexity.COMPLEX
 
         # Default to moderate
@@ -15,10 +15,13 @@ Components:
 - dspy_level1: Monthly structural evolution
 - cascade: Three-phase MOO orchestration
 - distill_modes: Pareto frontier -> named modes
+- pareto: Non-dominated sorting, crowding distance, Pareto archive
 
 RUNTIME OPTIMIZATION (NEW):
 - task_prompt_optimizer: Optimize Task() prompts for subagents
 - skill_execution_tracker: Track skill/command/playbook executions
+- execution_store: SQLite (WAL) persistence for the execution tracker
+- mcp_fallback_store: SQLite + FTS5 fallback storage for MemoryMCPClient
 - language_evolution: Layer 1 - evolve language patterns
 - cascade_optimizer: Full Context Cascade optimization
 """
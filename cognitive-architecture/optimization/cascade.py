@@ -11,6 +11,9 @@ Phases:
 - Phase C: Production frontier refinement (final Pareto points)
 
 Each phase runs a full GlobalMOO optimization loop with different objectives.
+Suggestion batches are evaluated through an EvaluationExecutor (serial,
+thread or process backend); per-phase evaluation stats are recorded in
+CascadeResult.metadata["evaluation"].
 
 Key Classes:
 - ThreeMOOCascade: Main orchestrator
@@ -30,7 +33,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.config import FullConfig, VectorCodec
-from core.runtime import evaluate, create_runtime
+from core.runtime import create_runtime
 from optimization.globalmoo_client import (
     GlobalMOOClient,
     OptimizationOutcome,
@@ -38,6 +41,7 @@ from optimization.globalmoo_client import (
     create_cognitive_project,
 )
 from optimization.dspy_level2 import DSPyLevel2Optimizer
+from optimization.evaluation_executor import EvaluationExecutor, EvaluationStats, create_executor
 
 
 class CascadePhase(Enum):
@@ -160,6 +164,7 @@ class ThreeMOOCascade:
         core_corpus: Optional[List[Dict[str, Any]]] = None,
         edge_corpus: Optional[List[Dict[str, Any]]] = None,
         use_mock: bool = True,
+        executor: Optional[EvaluationExecutor] = None,
     ):
         """
         Initialize cascade orchestrator.
@@ -170,8 +175,10 @@ class ThreeMOOCascade:
             core_corpus: Standard evaluation tasks
             edge_corpus: Adversarial evaluation tasks
             use_mock: Use mock mode for testing
+            executor: Evaluation backend for suggestion batches (default: serial)
         """
         self.moo = globalmoo_client or GlobalMOOClient(use_mock=use_mock)
+        self.executor = executor or EvaluationExecutor("serial")
         self.l2 = l2_optimizer or DSPyLevel2Optimizer()
         self.core_corpus = core_corpus or []
         self.edge_corpus = edge_corpus or []
@@ -252,6 +259,7 @@ class ThreeMOOCascade:
         """
         start_time = time.time()
         objectives = PHASE_OBJECTIVES[CascadePhase.PHASE_A]
+        stats = EvaluationStats()
 
         # Create project for this phase
         project = create_cognitive_project(
@@ -263,6 +271,7 @@ class ThreeMOOCascade:
         seed_outcomes = self._generate_seed_outcomes(
             corpus=self.core_corpus,
             count=10,
+            stats=stats,
         )
         self.moo.load_cases(project.project_id, seed_outcomes)
 
@@ -279,12 +288,13 @@ class ThreeMOOCascade:
                 num_suggestions=3,
             )
 
-            # Evaluate suggestions
-            for suggestion in suggestions:
-                outcome = self._evaluate_config(
-                    suggestion,
-                    self.core_corpus[:20],  # Use subset for speed
-                )
+            # Evaluate suggestions (as one batch), then report in order
+            outcomes = self._evaluate_configs(
+                suggestions,
+                self.core_corpus[:20],  # Use subset for speed
+                stats,
+            )
+            for suggestion, outcome in zip(suggestions, outcomes):
                 self.moo.report_outcome(project.project_id, outcome)
 
                 # Track best
@@ -310,9 +320,12 @@ class ThreeMOOCascade:
             pareto_points=pareto,
             impact_factors=impact,
             best_config_vector=best_vector,
-            best_outcomes=self._evaluate_config(best_vector, self.core_corpus[:10]).outcomes,
+            best_outcomes=self._evaluate_config(best_vector, self.core_corpus[:10], stats).outcomes,
             duration_seconds=time.time() - start_time,
-            metadata={"corpus_size": len(self.core_corpus)},
+            metadata={
+                "corpus_size": len(self.core_corpus),
+                "evaluation": self._evaluation_metadata(stats, start_time),
+            },
         )
 
     def _run_phase_b(
@@ -329,6 +342,7 @@ class ThreeMOOCascade:
         """
         start_time = time.time()
         objectives = PHASE_OBJECTIVES[CascadePhase.PHASE_B]
+        stats = EvaluationStats()
 
         # Create project for this phase
         project = create_cognitive_project(
@@ -360,12 +374,13 @@ class ThreeMOOCascade:
                 num_suggestions=3,
             )
 
-            for suggestion in suggestions:
-                # Use edge corpus for evaluation
-                outcome = self._evaluate_config(
-                    suggestion,
-                    self.edge_corpus if self.edge_corpus else self.core_corpus[:10],
-                )
+            # Use edge corpus for evaluation
+            outcomes = self._evaluate_configs(
+                suggestions,
+                self.edge_corpus if self.edge_corpus else self.core_corpus[:10],
+                stats,
+            )
+            for suggestion, outcome in zip(suggestions, outcomes):
                 self.moo.report_outcome(project.project_id, outcome)
 
                 weighted_score = self._weighted_score(outcome.outcomes, objectives.weights)
@@ -388,9 +403,14 @@ class ThreeMOOCascade:
             pareto_points=pareto,
             impact_factors=impact,
             best_config_vector=best_vector,
-            best_outcomes=self._evaluate_config(best_vector, self.edge_corpus[:10] if self.edge_corpus else []).outcomes,
+            best_outcomes=self._evaluate_config(
+                best_vector, self.edge_corpus[:10] if self.edge_corpus else [], stats,
+            ).outcomes,
             duration_seconds=time.time() - start_time,
-            metadata={"edge_corpus_size": len(self.edge_corpus)},
+            metadata={
+                "edge_corpus_size": len(self.edge_corpus),
+                "evaluation": self._evaluation_metadata(stats, start_time),
+            },
         )
 
     def _run_phase_c(
@@ -407,6 +427,7 @@ class ThreeMOOCascade:
         """
         start_time = time.time()
         objectives = PHASE_OBJECTIVES[CascadePhase.PHASE_C]
+        stats = EvaluationStats()
 
         project = create_cognitive_project(
             self.moo,
@@ -444,11 +465,12 @@ class ThreeMOOCascade:
                 num_suggestions=5,
             )
 
-            for suggestion in suggestions:
-                outcome = self._evaluate_config(
-                    suggestion,
-                    combined_corpus[:30] if combined_corpus else [],
-                )
+            outcomes = self._evaluate_configs(
+                suggestions,
+                combined_corpus[:30] if combined_corpus else [],
+                stats,
+            )
+            for suggestion, outcome in zip(suggestions, outcomes):
                 self.moo.report_outcome(project.project_id, outcome)
 
                 weighted_score = self._weighted_score(outcome.outcomes, objectives.weights)
@@ -471,15 +493,21 @@ class ThreeMOOCascade:
             pareto_points=pareto,
             impact_factors=impact,
             best_config_vector=best_vector,
-            best_outcomes=self._evaluate_config(best_vector, combined_corpus[:10] if combined_corpus else []).outcomes,
+            best_outcomes=self._evaluate_config(
+                best_vector, combined_corpus[:10] if combined_corpus else [], stats,
+            ).outcomes,
             duration_seconds=time.time() - start_time,
-            metadata={"combined_corpus_size": len(combined_corpus)},
+            metadata={
+                "combined_corpus_size": len(combined_corpus),
+                "evaluation": self._evaluation_metadata(stats, start_time),
+            },
         )
 
     def _generate_seed_outcomes(
         self,
         corpus: List[Dict[str, Any]],
         count: int = 10,
+        stats: Optional[EvaluationStats] = None,
     ) -> List[OptimizationOutcome]:
         """Generate initial seed outcomes with varied configs."""
         outcomes = []
@@ -501,29 +529,49 @@ class ThreeMOOCascade:
             config.framework.compositional = i % 3 == 0
             seed_configs.append(config)
 
-        for config in seed_configs[:count]:
-            vector = VectorCodec.encode(config)
-            outcome = self._evaluate_config(vector, corpus[:10] if corpus else [])
-            outcomes.append(outcome)
-
-        return outcomes
+        vectors = [VectorCodec.encode(config) for config in seed_configs[:count]]
+        return self._evaluate_configs(vectors, corpus[:10] if corpus else [], stats)
 
     def _evaluate_config(
         self,
         config_vector: List[float],
         tasks: List[Dict[str, Any]],
+        stats: Optional[EvaluationStats] = None,
     ) -> OptimizationOutcome:
         """Evaluate a configuration against tasks."""
-        outcomes = evaluate(config_vector, tasks)
+        return self._evaluate_configs([config_vector], tasks, stats)[0]
 
-        return OptimizationOutcome(
-            config_vector=config_vector,
-            outcomes=outcomes,
-            metadata={
-                "task_count": len(tasks),
-                "timestamp": time.time(),
-            },
-        )
+    def _evaluate_configs(
+        self,
+        config_vectors: List[List[float]],
+        tasks: List[Dict[str, Any]],
+        stats: Optional[EvaluationStats] = None,
+    ) -> List[OptimizationOutcome]:
+        """Evaluate a batch of configurations; results follow input order."""
+        batch = self.executor.evaluate_batch(config_vectors, tasks, stats)
+        timestamp = time.time()
+
+        return [
+            OptimizationOutcome(
+                config_vector=config_vector,
+                outcomes=outcomes,
+                metadata={
+                    "task_count": len(tasks),
+                    "timestamp": timestamp,
+                },
+            )
+            for config_vector, outcomes in zip(config_vectors, batch)
+        ]
+
+    def _evaluation_metadata(self, stats: EvaluationStats, start_time: float) -> Dict[str, Any]:
+        """Per-phase evaluation stats for CascadeResult.metadata."""
+        return {
+            "backend": self.executor.backend,
+            "max_workers": self.executor.max_workers,
+            "parallel_tasks": self.executor.parallel_tasks,
+            "phase_wall_seconds": time.time() - start_time,
+            **stats.to_dict(),
+        }
 
     def _weighted_score(
         self,
@@ -551,6 +599,17 @@ class ThreeMOOCascade:
         """Get current cascade state."""
         return self._state
 
+    def close(self) -> None:
+        """Shut down the evaluation executor's worker pool."""
+        self.executor.shutdown()
+
+    def __enter__(self) -> "ThreeMOOCascade":
+        self.executor.__enter__()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.executor.__exit__(*exc)
+
 
 # Factory functions
 
@@ -558,10 +617,20 @@ def create_cascade(
     use_mock: bool = True,
     core_corpus: Optional[List[Dict[str, Any]]] = None,
     edge_corpus: Optional[List[Dict[str, Any]]] = None,
+    backend: str = "serial",
+    max_workers: Optional[int] = None,
+    parallel_tasks: bool = False,
 ) -> ThreeMOOCascade:
-    """Create cascade orchestrator with default settings."""
+    """
+    Create cascade orchestrator with default settings.
+
+    backend, max_workers and parallel_tasks select the evaluation executor
+    (see EvaluationExecutor). Use the cascade as a context manager, or call
+    close(), to shut down a thread/process pool when done.
+    """
     return ThreeMOOCascade(
         use_mock=use_mock,
         core_corpus=core_corpus,
         edge_corpus=edge_corpus,
+        executor=create_executor(backend, max_workers=max_workers, parallel_tasks=parallel_tasks),
     )
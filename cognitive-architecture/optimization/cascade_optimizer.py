@@ -41,6 +41,7 @@ from optimization.globalmoo_client import (
     GlobalMOOClient, OptimizationOutcome, ParetoPoint,
     Objective, ObjectiveDirection
 )
+from optimization.pareto import pareto_front
 from optimization.language_evolution import (
     LanguageEvolutionOptimizer, create_language_evolver
 )
@@ -485,6 +486,7 @@ class CascadeOptimizer:
         )
 
         # Override with Pareto-optimal if available
+        pareto = pareto_front(pareto)
         if pareto:
             # Audit: max language_coherence
             audit_point = max(
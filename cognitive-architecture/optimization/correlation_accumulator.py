@@ -0,0 +1,190 @@
+"""
+Streaming config/outcome correlations for ImpactAnalyzer.
+
+Keeps Welford-style co-moment sums for every (config dim, outcome) pair
+instead of the telemetry history:
+- count: rows where both the config value and the outcome are present
+- mean_x, mean_y: means over those rows
+- m2_x, m2_y: sums of squared deviations
+- co_moment: sum of cross deviations
+
+A batch is reduced to the same sums with a few masked matrix products and
+merged in with Chan's parallel update, so ingest costs O(rows x dims x
+outcomes) once and the correlation matrix is O(dims x outcomes) at any time.
+States built on separate shards merge exactly, and serialize to plain dicts
+so a monthly run continues from the last one instead of recomputing.
+
+Missing outcomes (and config dims beyond a short vector) are excluded per
+pair, like ImpactAnalyzer's pure-Python path; with complete config vectors
+the result equals TelemetryColumns.correlate.
+"""
+
+import os
+import sys
+from typing import Any, Dict, Iterable, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import VectorCodec
+
+
+class CorrelationAccumulator:
+    """Mergeable running Pearson statistics for a config x outcome grid."""
+
+    STATE_FIELDS = ("count", "mean_x", "mean_y", "m2_x", "m2_y", "co_moment")
+
+    def __init__(
+        self,
+        outcome_names: Sequence[str],
+        config_dims: int = VectorCodec.VECTOR_SIZE,
+    ):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            outcome_names: Outcome metrics (matrix columns), in order
+            config_dims: Leading config vector dims (matrix rows)
+        """
+        self.outcome_names = list(outcome_names)
+        self.config_dims = config_dims
+        self.points_seen = 0
+
+        shape = (config_dims, len(self.outcome_names))
+        self.count = np.zeros(shape)
+        self.mean_x = np.zeros(shape)
+        self.mean_y = np.zeros(shape)
+        self.m2_x = np.zeros(shape)
+        self.m2_y = np.zeros(shape)
+        self.co_moment = np.zeros(shape)
+
+    def update(self, config_vector: Sequence[float], outcomes: Dict[str, Any]) -> None:
+        """Add one telemetry point."""
+        x = np.full((1, self.config_dims), np.nan)
+        values = list(config_vector)[:self.config_dims]
+        x[0, :len(values)] = values
+        y = np.array([[self._outcome_value(outcomes, name) for name in self.outcome_names]])
+        self.update_batch(x, y)
+
+    def update_points(self, points: Iterable[Any]) -> int:
+        """Add TelemetryPoint-like objects (config_vector, outcomes). Returns count."""
+        from optimization.telemetry_columns import TelemetryColumns
+
+        columns = TelemetryColumns.from_points(points, self.outcome_names)
+        if len(columns):
+            self.update_batch(columns.config_matrix(self.config_dims), columns.outcome_matrix(self.outcome_names))
+        return len(columns)
+
+    def update_batch(self, config: np.ndarray, outcomes: np.ndarray) -> None:
+        """
+        Add a batch of rows.
+
+        Args:
+            config: n x config_dims matrix (NaN = missing)
+            outcomes: n x len(outcome_names) matrix (NaN = missing)
+        """
+        config = np.asarray(config, dtype=float)
+        outcomes = np.asarray(outcomes, dtype=float)
+        if config.shape[1] < self.config_dims:
+            pad = np.full((len(config), self.config_dims - config.shape[1]), np.nan)
+            config = np.hstack([config, pad])
+        config = config[:, :self.config_dims]
+        if not len(config):
+            return
+
+        px = ~np.isnan(config)
+        py = ~np.isnan(outcomes)
+        # Shift each column by one of its own values: keeps the one-pass
+        # sums well conditioned and makes constant columns exactly zero
+        shift_x = self._first_present(config, px)
+        shift_y = self._first_present(outcomes, py)
+        xs = np.where(px, config - shift_x, 0.0)
+        ys = np.where(py, outcomes - shift_y, 0.0)
+        fx, fy = px.astype(float), py.astype(float)
+
+        count = fx.T @ fy
+        sum_x = xs.T @ fy
+        sum_y = fx.T @ ys
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_x = np.where(count > 0, sum_x / count, 0.0)
+            mean_y = np.where(count > 0, sum_y / count, 0.0)
+        m2_x = np.maximum((xs * xs).T @ fy - count * mean_x * mean_x, 0.0)
+        m2_y = np.maximum(fx.T @ (ys * ys) - count * mean_y * mean_y, 0.0)
+        co_moment = xs.T @ ys - count * mean_x * mean_y
+
+        batch = CorrelationAccumulator(self.outcome_names, self.config_dims)
+        batch.count = count
+        batch.mean_x = np.where(count > 0, mean_x + shift_x[:, None], 0.0)
+        batch.mean_y = np.where(count > 0, mean_y + shift_y[None, :], 0.0)
+        batch.m2_x, batch.m2_y, batch.co_moment = m2_x, m2_y, co_moment
+        batch.points_seen = len(config)
+        self.merge(batch)
+
+    def merge(self, other: "CorrelationAccumulator") -> "CorrelationAccumulator":
+        """Fold another accumulator's rows into this one (Chan et al.). Returns self."""
+        if other.outcome_names != self.outcome_names or other.config_dims != self.config_dims:
+            raise ValueError("Cannot merge accumulators over different dims or outcomes")
+
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight_b = np.where(n > 0, n_b / n, 0.0)
+            cross = np.where(n > 0, n_a * n_b / n, 0.0)
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+
+        self.mean_x = self.mean_x + delta_x * weight_b
+        self.mean_y = self.mean_y + delta_y * weight_b
+        self.m2_x = self.m2_x + other.m2_x + delta_x * delta_x * cross
+        self.m2_y = self.m2_y + other.m2_y + delta_y * delta_y * cross
+        self.co_moment = self.co_moment + other.co_moment + delta_x * delta_y * cross
+        self.count = n
+        self.points_seen += other.points_seen
+        return self
+
+    def correlation(self, min_count: int = 10) -> np.ndarray:
+        """
+        Pearson correlation matrix (config_dims x outcomes).
+
+        Cells with fewer than min_count rows or a constant input are 0.0.
+        """
+        valid = (self.count >= min_count) & (self.m2_x > 0) & (self.m2_y > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = self.co_moment / np.sqrt(self.m2_x * self.m2_y)
+        return np.where(valid, np.clip(r, -1.0, 1.0), 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        data: Dict[str, Any] = {
+            "outcome_names": self.outcome_names,
+            "config_dims": self.config_dims,
+            "points_seen": self.points_seen,
+        }
+        for name in self.STATE_FIELDS:
+            data[name] = getattr(self, name).tolist()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CorrelationAccumulator":
+        """Deserialize from dictionary."""
+        accumulator = cls(data["outcome_names"], data["config_dims"])
+        accumulator.points_seen = data.get("points_seen", 0)
+        for name in cls.STATE_FIELDS:
+            values = np.array(data[name], dtype=float)
+            if values.shape != accumulator.count.shape:
+                raise ValueError(f"State field '{name}' has shape {values.shape}")
+            setattr(accumulator, name, values)
+        return accumulator
+
+    @staticmethod
+    def _first_present(matrix: np.ndarray, present: np.ndarray) -> np.ndarray:
+        """First non-NaN value of each column (0.0 for all-NaN columns)."""
+        first = np.argmax(present, axis=0)
+        values = matrix[first, np.arange(matrix.shape[1])]
+        return np.where(present.any(axis=0), values, 0.0)
+
+    @staticmethod
+    def _outcome_value(outcomes: Dict[str, Any], name: str) -> float:
+        value = outcomes.get(name)
+        return np.nan if value is None else float(value)
@@ -26,6 +26,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.config import FullConfig, VectorCodec, VerixStrictness, CompressionLevel
 from optimization.globalmoo_client import ParetoPoint
+from optimization.pareto import pareto_front
 
 
 class ModeCategory(Enum):
@@ -320,6 +321,9 @@ class ModeDistiller:
         if not candidates:
             return None
 
+        # Never pick a candidate another candidate dominates
+        candidates = pareto_front(candidates)
+
         # Select best
         if primary:
             # Best for primary objective
@@ -21,6 +21,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.config import FullConfig, VectorCodec
 
+try:
+    import numpy as np
+    from optimization.telemetry_columns import TelemetryColumns, FRAME_NAMES
+    COLUMNS_AVAILABLE = True
+except ImportError:
+    COLUMNS_AVAILABLE = False
+
 
 class ProposalType(Enum):
     """Types of evolution proposals."""
@@ -107,10 +114,31 @@ class TelemetryAggregator:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self._points: List[TelemetryPoint] = []
+        # Bumped on every change to the points; keys the columnar cache
+        self._version = 0
+        self._columns: Optional["TelemetryColumns"] = None
+        self._columns_key: Optional[tuple] = None
 
     def record(self, point: TelemetryPoint) -> None:
         """Record a telemetry point."""
         self._points.append(point)
+        self._version += 1
+
+    def columns(self) -> "TelemetryColumns":
+        """
+        Columnar view of all points, shared by the aggregations below and
+        by ImpactAnalyzer. Rebuilt only after the points change (a record,
+        a load, or the point list being replaced or resized).
+        """
+        key = (self._version, id(self._points), len(self._points))
+        if self._columns is None or self._columns_key != key:
+            self._columns = TelemetryColumns.from_points(self._points)
+            self._columns_key = key
+        return self._columns
+
+    def invalidate(self) -> None:
+        """Mark the points as changed (after editing get_points() in place)."""
+        self._version += 1
 
     def record_outcome(
         self,
@@ -158,6 +186,13 @@ class TelemetryAggregator:
         Returns:
             Dict mapping cluster_key -> average outcomes
         """
+        if COLUMNS_AVAILABLE:
+            if not self._points:
+                return {}
+            columns = self.columns()
+            codes, labels = columns.cluster_codes()
+            return self._group_averages(columns, codes, labels)
+
         clusters: Dict[str, List[Dict[str, float]]] = {}
 
         for point in self._points:
@@ -168,20 +203,7 @@ class TelemetryAggregator:
                 clusters[cluster_key] = []
             clusters[cluster_key].append(point.outcomes)
 
-        # Average outcomes per cluster
-        aggregated = {}
-        for cluster_key, outcome_list in clusters.items():
-            if not outcome_list:
-                continue
-
-            avg_outcomes = {}
-            for key in outcome_list[0].keys():
-                values = [o.get(key, 0.0) for o in outcome_list]
-                avg_outcomes[key] = sum(values) / len(values)
-
-            aggregated[cluster_key] = avg_outcomes
-
-        return aggregated
+        return self._average_outcome_lists(clusters)
 
     def aggregate_by_frame(self) -> Dict[str, Dict[str, float]]:
         """
@@ -195,6 +217,22 @@ class TelemetryAggregator:
             "compositional", "honorific", "classifier", "spatial"
         ]
 
+        if COLUMNS_AVAILABLE:
+            if not self._points:
+                return {}
+            columns = self.columns()
+            # Same validation as VectorCodec.decode
+            columns.cluster_codes()
+            config = columns.config_matrix()
+
+            aggregated = {}
+            for i, frame in enumerate(FRAME_NAMES):
+                active = columns.select(config[:, i] > 0.5)
+                if len(active):
+                    codes = np.zeros(len(active), dtype=np.int64)
+                    aggregated.update(self._group_averages(active, codes, [frame]))
+            return aggregated
+
         frame_outcomes: Dict[str, List[Dict[str, float]]] = {
             f: [] for f in frame_names
         }
@@ -208,9 +246,15 @@ class TelemetryAggregator:
                 if is_active:
                     frame_outcomes[frame].append(point.outcomes)
 
-        # Average per frame
+        return self._average_outcome_lists(frame_outcomes)
+
+    @staticmethod
+    def _average_outcome_lists(
+        groups: Dict[str, List[Dict[str, float]]],
+    ) -> Dict[str, Dict[str, float]]:
+        """Average outcome dicts per group over the first dict's keys (missing = 0)."""
         aggregated = {}
-        for frame, outcome_list in frame_outcomes.items():
+        for group, outcome_list in groups.items():
             if not outcome_list:
                 continue
 
@@ -219,8 +263,29 @@ class TelemetryAggregator:
                 values = [o.get(key, 0.0) for o in outcome_list]
                 avg_outcomes[key] = sum(values) / len(values)
 
-            aggregated[frame] = avg_outcomes
+            aggregated[group] = avg_outcomes
+
+        return aggregated
 
+    @staticmethod
+    def _group_averages(
+        columns: "TelemetryColumns",
+        codes: "np.ndarray",
+        labels: List[str],
+    ) -> Dict[str, Dict[str, float]]:
+        """Columnar equivalent of _average_outcome_lists for coded groups."""
+        sums, counts = columns.group_sums(codes, len(labels))
+        outcomes = columns.outcome_matrix()
+        _, first_rows = np.unique(codes, return_index=True)
+
+        aggregated = {}
+        for group, first in zip(np.unique(codes), first_rows):
+            present = ~np.isnan(outcomes[first])
+            aggregated[labels[group]] = {
+                name: float(sums[group, j]) / int(counts[group])
+                for j, name in enumerate(columns.outcome_names)
+                if present[j]
+            }
         return aggregated
 
     def save(self, filename: str = "telemetry.jsonl") -> int:
@@ -248,6 +313,7 @@ class TelemetryAggregator:
             return 0
 
         self._points = []
+        self._version += 1
         with open(filepath) as f:
             for line in f:
                 if line.strip():
@@ -11,7 +11,9 @@ and ensuring consistency within evaluation runs.
 import os
 import json
 import time
+import copy
 import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
@@ -65,16 +67,32 @@ class CompiledPrompt:
 
 @dataclass
 class ClusterCache:
-    """Cache for compiled prompts by cluster."""
+    """
+    Size-bounded LRU cache for compiled prompts, with TTL and a lazy disk index.
+
+    Each prompt is stored as its own JSON file. Only a small manifest
+    (cluster key -> compiled_at) is read at start; prompt files are loaded
+    on first access, and at most max_entries prompts stay in memory.
+    Evicted prompts remain on disk and are faulted back in on demand.
+    """
 
     cache_dir: Path
     max_age_seconds: float = 3600.0  # 1 hour default
-    _cache: Dict[str, CompiledPrompt] = field(default_factory=dict)
+    max_entries: int = 256
+    _cache: "OrderedDict[str, CompiledPrompt]" = field(default_factory=OrderedDict)
+
+    MANIFEST_FILE = "manifest.jsonl"
 
     def __post_init__(self):
         self.cache_dir = Path(self.cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._load_from_disk()
+        self._index: Dict[str, float] = {}  # cluster_key -> compiled_at, for every prompt on disk
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.disk_loads = 0
+        self._load_manifest()
 
     def get(self, cluster_key: str) -> Optional[CompiledPrompt]:
         """
@@ -82,19 +100,41 @@ class ClusterCache:
 
         Returns None if not cached or expired.
         """
-        if cluster_key in self._cache:
-            prompt = self._cache[cluster_key]
-            if prompt.age_seconds() < self.max_age_seconds:
-                return prompt
-            # Expired - remove
-            del self._cache[cluster_key]
+        prompt = self._lookup(cluster_key)
+        if prompt is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return prompt
 
-        return None
+    def get_many(self, cluster_keys: List[str]) -> Dict[str, CompiledPrompt]:
+        """
+        Prefetch several prompts, loading any that are only on disk.
+
+        Returns:
+            Dict of the keys that are cached (missing/expired keys are absent)
+        """
+        found = {}
+        for cluster_key in dict.fromkeys(cluster_keys):
+            prompt = self.get(cluster_key)
+            if prompt is not None:
+                found[cluster_key] = prompt
+        return found
 
     def put(self, prompt: CompiledPrompt) -> None:
         """Cache a compiled prompt."""
-        self._cache[prompt.cluster_key] = prompt
-        self._save_to_disk(prompt)
+        self.put_many([prompt])
+
+    def put_many(self, prompts: List[CompiledPrompt]) -> None:
+        """Cache several prompts with a single manifest append."""
+        lines = []
+        for prompt in prompts:
+            with open(self._cache_file(prompt.cluster_key), "w") as f:
+                json.dump(prompt.to_dict(), f, indent=2)
+            self._index[prompt.cluster_key] = prompt.compiled_at
+            self._remember(prompt)
+            lines.append(json.dumps({"key": prompt.cluster_key, "compiled_at": prompt.compiled_at}))
+        self._append_manifest(lines)
 
     def invalidate(self, cluster_key: str) -> bool:
         """
@@ -102,64 +142,161 @@ class ClusterCache:
 
         Returns True if prompt was cached.
         """
-        if cluster_key in self._cache:
-            del self._cache[cluster_key]
-            cache_file = self._cache_file(cluster_key)
-            if cache_file.exists():
-                cache_file.unlink()
-            return True
-        return False
+        if cluster_key not in self._index:
+            return False
+        self._remove(cluster_key)
+        return True
 
     def invalidate_all(self) -> int:
         """Invalidate all cached prompts. Returns count."""
-        count = len(self._cache)
+        count = len(self._index)
         self._cache.clear()
+        self._index.clear()
         for f in self.cache_dir.glob("*.json"):
             f.unlink()
+        self._write_manifest()
         return count
 
+    def purge_expired(self) -> int:
+        """Drop expired prompts using manifest timestamps only. Returns count."""
+        now = time.time()
+        expired = [k for k, t in self._index.items() if now - t >= self.max_age_seconds]
+        for cluster_key in expired:
+            self._remove(cluster_key)
+        self.expirations += len(expired)
+        return len(expired)
+
     def list_clusters(self) -> List[str]:
-        """List all cached cluster keys."""
-        return list(self._cache.keys())
+        """List all cached cluster keys (in memory or on disk)."""
+        return list(self._index.keys())
 
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        now = time.time()
+        oldest = min(self._index.values(), default=now)
+        newest = max(self._index.values(), default=now)
+        lookups = self.hits + self.misses
         return {
-            "cached_count": len(self._cache),
-            "oldest_age": max(
-                (p.age_seconds() for p in self._cache.values()),
-                default=0.0
-            ),
-            "newest_age": min(
-                (p.age_seconds() for p in self._cache.values()),
-                default=0.0
-            ),
+            "cached_count": len(self._index),
+            "resident_count": len(self._cache),
+            "max_entries": self.max_entries,
+            "oldest_age": now - oldest,
+            "newest_age": now - newest,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "disk_loads": self.disk_loads,
         }
 
+    def _lookup(self, cluster_key: str) -> Optional[CompiledPrompt]:
+        """Resident prompt, else fault in from disk; drops expired entries."""
+        compiled_at = self._index.get(cluster_key)
+        if compiled_at is None:
+            # Written by another process since the manifest was read?
+            if not self._cache_file(cluster_key).exists():
+                return None
+        elif time.time() - compiled_at >= self.max_age_seconds:
+            self._remove(cluster_key)
+            self.expirations += 1
+            return None
+
+        prompt = self._cache.get(cluster_key)
+        if prompt is not None:
+            self._cache.move_to_end(cluster_key)
+            return prompt
+
+        try:
+            with open(self._cache_file(cluster_key)) as f:
+                prompt = CompiledPrompt.from_dict(json.load(f))
+        except Exception:
+            # Missing or corrupted prompt file
+            if compiled_at is not None:
+                self._remove(cluster_key)
+            return None
+        self.disk_loads += 1
+        if compiled_at is None:
+            if prompt.age_seconds() >= self.max_age_seconds:
+                return None
+            self._index[cluster_key] = prompt.compiled_at
+            self._append_manifest([json.dumps({"key": cluster_key, "compiled_at": prompt.compiled_at})])
+        self._remember(prompt)
+        return prompt
+
+    def _remember(self, prompt: CompiledPrompt) -> None:
+        """Make a prompt resident, evicting least recently used ones."""
+        self._cache[prompt.cluster_key] = prompt
+        self._cache.move_to_end(prompt.cluster_key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+
+    def _remove(self, cluster_key: str) -> None:
+        """Forget a prompt in memory, in the manifest and on disk."""
+        self._cache.pop(cluster_key, None)
+        self._index.pop(cluster_key, None)
+        cache_file = self._cache_file(cluster_key)
+        if cache_file.exists():
+            cache_file.unlink()
+        self._append_manifest([json.dumps({"key": cluster_key, "compiled_at": None})])
+
     def _cache_file(self, cluster_key: str) -> Path:
         """Get cache file path for cluster key."""
         safe_key = hashlib.md5(cluster_key.encode()).hexdigest()
         return self.cache_dir / f"{safe_key}.json"
 
-    def _save_to_disk(self, prompt: CompiledPrompt) -> None:
-        """Persist prompt to disk."""
-        cache_file = self._cache_file(prompt.cluster_key)
-        with open(cache_file, "w") as f:
-            json.dump(prompt.to_dict(), f, indent=2)
-
-    def _load_from_disk(self) -> None:
-        """Load cached prompts from disk."""
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                prompt = CompiledPrompt.from_dict(data)
-                if prompt.age_seconds() < self.max_age_seconds:
-                    self._cache[prompt.cluster_key] = prompt
-                else:
-                    cache_file.unlink()  # Remove expired
-            except Exception:
-                pass  # Skip corrupted cache files
+    def _append_manifest(self, lines: List[str]) -> None:
+        if lines:
+            with open(self.cache_dir / self.MANIFEST_FILE, "a") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def _write_manifest(self) -> None:
+        """Rewrite the manifest with only the live entries (atomic replace)."""
+        manifest = self.cache_dir / self.MANIFEST_FILE
+        tmp = manifest.with_name(manifest.name + ".tmp")
+        with open(tmp, "w") as f:
+            for cluster_key, compiled_at in self._index.items():
+                f.write(json.dumps({"key": cluster_key, "compiled_at": compiled_at}) + "\n")
+        os.replace(tmp, manifest)
+
+    def _load_manifest(self) -> None:
+        """Read the manifest (or index legacy prompt files), dropping expired entries."""
+        manifest = self.cache_dir / self.MANIFEST_FILE
+        line_count = 0
+        if manifest.exists():
+            with open(manifest) as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        entry = json.loads(line)
+                        cluster_key, compiled_at = entry["key"], entry["compiled_at"]
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Torn line
+                    if compiled_at is None:
+                        self._index.pop(cluster_key, None)
+                    else:
+                        self._index[cluster_key] = compiled_at
+        else:
+            # Cache written before the manifest existed: index it once
+            for cache_file in self.cache_dir.glob("*.json"):
+                try:
+                    with open(cache_file) as f:
+                        data = json.load(f)
+                    self._index[data["cluster_key"]] = data.get("compiled_at", time.time())
+                except Exception:
+                    pass  # Skip corrupted cache files
+
+        now = time.time()
+        for cluster_key in [k for k, t in self._index.items() if now - t >= self.max_age_seconds]:
+            del self._index[cluster_key]
+            cache_file = self._cache_file(cluster_key)
+            if cache_file.exists():
+                cache_file.unlink()  # Remove expired
+
+        # Compact when the log has grown past the live entries
+        if line_count != len(self._index) or not manifest.exists():
+            self._write_manifest()
 
 
 class DSPyLevel2Optimizer:
@@ -174,6 +311,7 @@ class DSPyLevel2Optimizer:
         self,
         cache_dir: Optional[Path] = None,
         max_cache_age: float = 3600.0,
+        max_cache_entries: int = 256,
     ):
         """
         Initialize L2 optimizer.
@@ -181,6 +319,7 @@ class DSPyLevel2Optimizer:
         Args:
             cache_dir: Directory for cache storage
             max_cache_age: Maximum cache age in seconds
+            max_cache_entries: Compiled prompts kept in memory (LRU)
         """
         if cache_dir is None:
             cache_dir = Path(__file__).parent.parent / "storage" / "prompts"
@@ -188,6 +327,7 @@ class DSPyLevel2Optimizer:
         self.cache = ClusterCache(
             cache_dir=cache_dir,
             max_age_seconds=max_cache_age,
+            max_entries=max_cache_entries,
         )
         self._compile_count = 0
         self._cache_hits = 0
@@ -209,8 +349,7 @@ class DSPyLevel2Optimizer:
         Returns:
             Compiled prompt
         """
-        cluster_key = VectorCodec.cluster_key(config)
-        cache_key = f"{cluster_key}:{task_type}"
+        cache_key = self._cache_key(config, task_type)
 
         # Check cache
         cached = self.cache.get(cache_key)
@@ -251,6 +390,9 @@ class DSPyLevel2Optimizer:
         """
         Pre-compile prompts for multiple configurations.
 
+        Cached prompts are prefetched in one pass; the rest are compiled
+        and stored together.
+
         Args:
             configs: List of configurations
             task_type: Type of task
@@ -258,11 +400,10 @@ class DSPyLevel2Optimizer:
         Returns:
             List of compiled prompts
         """
-        prompts = []
-        for config in configs:
-            prompt = self.get_prompt(config, task_type)
-            prompts.append(prompt)
-        return prompts
+        keys = [self._cache_key(config, task_type) for config in configs]
+        prompts, compiled = self._prefetch(list(zip(keys, configs)), task_type)
+        self._cache_hits += len(keys) - compiled
+        return [prompts[key] for key in keys]
 
     def warm_cache(
         self,
@@ -279,17 +420,9 @@ class DSPyLevel2Optimizer:
         Returns:
             Number of new prompts compiled
         """
-        new_count = 0
-        for vector in vectors:
-            config = VectorCodec.decode(vector)
-            cluster_key = VectorCodec.cluster_key(config)
-            cache_key = f"{cluster_key}:{task_type}"
-
-            if self.cache.get(cache_key) is None:
-                self.get_prompt(config, task_type)
-                new_count += 1
-
-        return new_count
+        configs = [VectorCodec.decode(vector) for vector in vectors]
+        _, compiled = self._prefetch([(self._cache_key(c, task_type), c) for c in configs], task_type)
+        return compiled
 
     def stats(self) -> Dict[str, Any]:
         """Get optimizer statistics."""
@@ -298,24 +431,51 @@ class DSPyLevel2Optimizer:
         hit_rate = self._cache_hits / total_requests if total_requests > 0 else 0.0
 
         return {
+            **cache_stats,
             "compile_count": self._compile_count,
             "cache_hits": self._cache_hits,
             "hit_rate": hit_rate,
-            **cache_stats,
         }
 
+    @staticmethod
+    def _cache_key(config: FullConfig, task_type: str) -> str:
+        return f"{VectorCodec.cluster_key(config)}:{task_type}"
+
+    def _prefetch(
+        self,
+        keyed_configs: List[Tuple[str, FullConfig]],
+        task_type: str,
+    ) -> Tuple[Dict[str, CompiledPrompt], int]:
+        """
+        Bulk-load cached prompts and compile the missing ones.
+
+        Returns:
+            (prompt for every key, number of distinct keys compiled)
+        """
+        prompts = self.cache.get_many([key for key, _ in keyed_configs])
+        compiled = []
+        for key, config in keyed_configs:
+            if key not in prompts:
+                prompts[key] = self._compile(config, task_type)
+                compiled.append(prompts[key])
+        self.cache.put_many(compiled)
+        self._compile_count += len(compiled)
+        return prompts, len(compiled)
+
     def _compile(
         self,
         config: FullConfig,
         task_type: str,
     ) -> CompiledPrompt:
         """Compile prompt for configuration."""
+        # Mode selection in the builder rewrites the config's frames; build from
+        # a copy so the prompt is stored under the key lookups use
+        cache_key = self._cache_key(config, task_type)
+        config = copy.deepcopy(config)
+
         builder = PromptBuilder(config)
         system_prompt, user_template = builder.build("{task}", task_type)
 
-        cluster_key = VectorCodec.cluster_key(config)
-        cache_key = f"{cluster_key}:{task_type}"
-
         return CompiledPrompt(
             cluster_key=cache_key,
             system_prompt=system_prompt,
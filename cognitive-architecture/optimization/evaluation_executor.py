@@ -0,0 +1,187 @@
+"""
+Evaluation executor for the Three-MOO Cascade.
+
+Each cascade iteration evaluates a batch of independent GlobalMOO
+suggestions, and each evaluation scores a corpus subset task by task.
+EvaluationExecutor runs such a batch on one of three backends:
+- serial: in-process, one config after another (the original behavior)
+- thread: ThreadPoolExecutor (useful when evaluation waits on an API)
+- process: ProcessPoolExecutor (CPU-bound mock evaluation scales with cores)
+
+With parallel_tasks=True a config's corpus is also split into shards that
+are scored concurrently. Shards are concatenated in task order before
+aggregation, so outcomes are identical to core.runtime.evaluate() and
+results always come back in suggestion order.
+
+Key Classes:
+- EvaluationExecutor: Batch evaluation on a chosen backend
+- EvaluationStats: Wall-clock and throughput counters for one phase
+"""
+
+import math
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.runtime import TaskScore, aggregate_outcomes, score_tasks
+
+
+BACKENDS = ("serial", "thread", "process")
+
+
+@dataclass
+class EvaluationStats:
+    """Wall-clock and throughput counters for a run of evaluate_batch() calls."""
+
+    batches: int = 0
+    evaluations: int = 0
+    tasks_evaluated: int = 0
+    wall_seconds: float = 0.0
+
+    @property
+    def evaluations_per_second(self) -> float:
+        return self.evaluations / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def tasks_per_second(self) -> float:
+        return self.tasks_evaluated / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "evaluations": self.evaluations,
+            "tasks_evaluated": self.tasks_evaluated,
+            "wall_seconds": self.wall_seconds,
+            "evaluations_per_second": self.evaluations_per_second,
+            "tasks_per_second": self.tasks_per_second,
+        }
+
+
+class EvaluationExecutor:
+    """
+    Evaluate batches of config vectors on a serial, thread or process backend.
+
+    The pool is created on first use and reused across batches; call
+    shutdown() (or use the executor as a context manager) when done.
+    """
+
+    def __init__(
+        self,
+        backend: str = "serial",
+        max_workers: Optional[int] = None,
+        parallel_tasks: bool = False,
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            backend: "serial", "thread" or "process"
+            max_workers: Pool size (default: CPU count)
+            parallel_tasks: Also split each config's corpus into shards
+                scored concurrently
+
+        Raises:
+            ValueError: If backend is unknown or max_workers < 1
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+        self.backend = backend
+        self.max_workers = 1 if backend == "serial" else (max_workers or os.cpu_count() or 1)
+        self.parallel_tasks = parallel_tasks
+        self._pool: Optional[Executor] = None
+
+    def evaluate_batch(
+        self,
+        config_vectors: Sequence[List[float]],
+        tasks: List[Dict[str, Any]],
+        stats: Optional[EvaluationStats] = None,
+    ) -> List[Dict[str, float]]:
+        """
+        Evaluate every config vector against the same tasks.
+
+        Args:
+            config_vectors: Configs to evaluate
+            tasks: Task dicts passed to core.runtime.evaluate()
+            stats: Optional counters to update with this batch
+
+        Returns:
+            One outcome dict per config vector, in input order
+        """
+        start_time = time.perf_counter()
+
+        if self.backend == "serial" or not config_vectors:
+            outcomes = [aggregate_outcomes(score_tasks(v, tasks)) for v in config_vectors]
+        else:
+            shards = self._shard(tasks, len(config_vectors))
+            pool = self._get_pool()
+            futures = [
+                [pool.submit(score_tasks, vector, shard) for shard in shards]
+                for vector in config_vectors
+            ]
+            outcomes = []
+            for shard_futures in futures:
+                scores: List[TaskScore] = []
+                for future in shard_futures:
+                    scores.extend(future.result())
+                outcomes.append(aggregate_outcomes(scores))
+
+        if stats is not None:
+            stats.batches += 1
+            stats.evaluations += len(config_vectors)
+            stats.tasks_evaluated += len(config_vectors) * len(tasks)
+            stats.wall_seconds += time.perf_counter() - start_time
+        return outcomes
+
+    def evaluate(
+        self,
+        config_vector: List[float],
+        tasks: List[Dict[str, Any]],
+        stats: Optional[EvaluationStats] = None,
+    ) -> Dict[str, float]:
+        """Evaluate a single config vector (see evaluate_batch)."""
+        return self.evaluate_batch([config_vector], tasks, stats)[0]
+
+    def _shard(self, tasks: List[Dict[str, Any]], batch_size: int) -> List[List[Dict[str, Any]]]:
+        """Split tasks so a batch yields about one work unit per worker."""
+        if not self.parallel_tasks or not tasks:
+            return [tasks]
+        shard_count = min(len(tasks), max(1, math.ceil(self.max_workers / batch_size)))
+        size = math.ceil(len(tasks) / shard_count)
+        return [tasks[i:i + size] for i in range(0, len(tasks), size)]
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.backend == "thread":
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "EvaluationExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+def create_executor(
+    backend: str = "serial",
+    max_workers: Optional[int] = None,
+    parallel_tasks: bool = False,
+) -> EvaluationExecutor:
+    """Create an evaluation executor (see EvaluationExecutor)."""
+    return EvaluationExecutor(backend, max_workers=max_workers, parallel_tasks=parallel_tasks)
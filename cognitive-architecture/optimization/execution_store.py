@@ -0,0 +1,347 @@
+"""
+Execution Store - SQLite persistence for SkillExecutionTracker.
+
+Hooks track every skill/command/playbook start and end, often from several
+processes at once. Instead of rewriting one JSON file of every skill config
+per event, the store keeps:
+- skill_configs: one row per "type:name" key, updated by an atomic upsert
+  (counters and the compliance EMA are computed inside SQLite, so parallel
+  writers never lose an update)
+- executions: append-only history indexed by key and timestamp
+
+The database runs in WAL mode, so readers do not block the writer and
+concurrent writers wait on the busy timeout instead of failing. Stats and
+top-performing queries aggregate in SQL rather than loading every row.
+
+Trackers created by older versions (skill_configs.json plus
+execution_history.jsonl) are imported once on open.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+class ExecutionStore:
+    """SQLite-backed skill config and execution history store."""
+
+    DB_FILE = "executions.sqlite3"
+    LEGACY_CONFIGS = "skill_configs.json"
+    LEGACY_HISTORY = "execution_history.jsonl"
+    STALE_CLAIM_SECONDS = 300  # Age after which an import claim is orphaned
+
+    CONFIG_COLUMNS = (
+        "key", "name", "execution_type", "config_vector", "execution_count",
+        "success_count", "avg_compliance", "last_updated",
+    )
+
+    def __init__(self, path: Union[str, Path], busy_timeout: float = 30.0):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite file, or ":memory:" for a process-local store
+            busy_timeout: Seconds a writer waits for another process's lock
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=busy_timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS skill_configs (
+                key TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                execution_type TEXT NOT NULL,
+                config_vector TEXT NOT NULL,
+                execution_count INTEGER NOT NULL,
+                success_count INTEGER NOT NULL,
+                avg_compliance REAL NOT NULL,
+                last_updated REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS executions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                execution_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                execution_type TEXT NOT NULL,
+                name TEXT NOT NULL,
+                success INTEGER NOT NULL,
+                verix_compliance REAL NOT NULL,
+                duration_ms REAL NOT NULL,
+                timestamp REAL NOT NULL,
+                record TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS executions_key_time ON executions(key, timestamp);
+            CREATE INDEX IF NOT EXISTS executions_time ON executions(timestamp);
+            CREATE INDEX IF NOT EXISTS executions_execution_id ON executions(execution_id);
+            """
+        )
+        self._conn.commit()
+
+    def record_execution(
+        self,
+        key: str,
+        record: Dict[str, Any],
+        config_vector: List[float],
+        alpha: float,
+        updated_at: float,
+    ) -> None:
+        """
+        Append an execution and upsert its skill config in one transaction.
+
+        Args:
+            key: "type:name" config key
+            record: ExecutionRecord.to_dict()
+            config_vector: Config stored when the key is first seen
+            alpha: EMA factor for avg_compliance
+            updated_at: last_updated timestamp
+        """
+        success = 1 if record["success"] else 0
+        compliance = record["verix_compliance"]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO executions (execution_id, key, execution_type, name, success, "
+                "verix_compliance, duration_ms, timestamp, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record["execution_id"], key, record["execution_type"], record["name"],
+                    success, compliance, record["duration_ms"], record["timestamp"],
+                    json.dumps(record, separators=(",", ":")),
+                ),
+            )
+            # Same EMA as before: alpha * x + (1 - alpha) * avg, starting from 0.0
+            self._conn.execute(
+                "INSERT INTO skill_configs (key, name, execution_type, config_vector, "
+                "execution_count, success_count, avg_compliance, last_updated) "
+                "VALUES (:key, :name, :type, :vector, 1, :success, "
+                ":alpha * :compliance + (1 - :alpha) * 0.0, :now) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "execution_count = execution_count + 1, "
+                "success_count = success_count + :success, "
+                "avg_compliance = :alpha * :compliance + (1 - :alpha) * avg_compliance, "
+                "last_updated = :now",
+                {
+                    "key": key, "name": record["name"], "type": record["execution_type"],
+                    "vector": json.dumps(config_vector), "success": success,
+                    "alpha": alpha, "compliance": compliance, "now": updated_at,
+                },
+            )
+
+    def get_config(self, key: str) -> Optional[Dict[str, Any]]:
+        """One skill config row as a dict (config_vector decoded), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self.CONFIG_COLUMNS)} FROM skill_configs WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return self._config_row(row) if row else None
+
+    def configs(self) -> List[Dict[str, Any]]:
+        """Every skill config row, ordered by key."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(self.CONFIG_COLUMNS)} FROM skill_configs ORDER BY key"
+            ).fetchall()
+        return [self._config_row(row) for row in rows]
+
+    def summary(self) -> Dict[str, Any]:
+        """Config count and execution/success totals, overall and per type."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT execution_type, COUNT(*), SUM(execution_count), SUM(success_count) "
+                "FROM skill_configs GROUP BY execution_type ORDER BY MIN(rowid)"
+            ).fetchall()
+        return {
+            "tracked": sum(row[1] for row in rows),
+            "executions": sum(row[2] for row in rows),
+            "successes": sum(row[3] for row in rows),
+            "by_type": {row[0]: {"count": row[2], "success": row[3]} for row in rows},
+        }
+
+    def top_performing(
+        self,
+        n: int,
+        min_executions: int,
+        success_weight: float,
+        compliance_weight: float,
+    ) -> List[Dict[str, Any]]:
+        """
+        Best configs by weighted success rate and compliance.
+
+        Args:
+            n: Maximum rows
+            min_executions: Skip configs with fewer executions
+            success_weight: Weight of the success rate
+            compliance_weight: Weight of avg_compliance
+
+        Returns:
+            Config row dicts with an added "score", best first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(self.CONFIG_COLUMNS)}, "
+                "(CAST(success_count AS REAL) / execution_count) * ? + avg_compliance * ? AS score "
+                "FROM skill_configs WHERE execution_count >= ? "
+                "ORDER BY score DESC, key DESC LIMIT ?",
+                (success_weight, compliance_weight, min_executions, n),
+            ).fetchall()
+        return [dict(self._config_row(row[:-1]), score=row[-1]) for row in rows]
+
+    def history(
+        self,
+        key: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execution records, newest first.
+
+        Args:
+            key: Only this "type:name" key
+            since: Only executions with timestamp >= since
+            limit: Maximum records
+
+        Returns:
+            ExecutionRecord.to_dict() dicts
+        """
+        clauses, params = [], []
+        if key is not None:
+            clauses.append("key = ?")
+            params.append(key)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        params.append(-1 if limit is None else limit)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT record FROM executions {where}ORDER BY timestamp DESC, id DESC LIMIT ?",
+                params,
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count_executions(self, key: Optional[str] = None) -> int:
+        """Number of history rows (for one key, or all)."""
+        with self._lock:
+            if key is None:
+                return self._conn.execute("SELECT COUNT(*) FROM executions").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM executions WHERE key = ?", (key,)
+            ).fetchone()[0]
+
+    def migrate_legacy(self, directory: Path) -> int:
+        """
+        Import skill_configs.json / execution_history.jsonl from a directory.
+
+        Each file is claimed by renaming it first, so two processes opening
+        the same tracker never import it twice; imported files are kept with
+        a `.migrated` suffix. A claim older than STALE_CLAIM_SECONDS was left
+        by a process that died mid-import and is retried; history records
+        whose execution_id is already stored are not inserted again.
+
+        Returns:
+            Number of configs plus history records imported
+        """
+        imported = 0
+        directory = Path(directory)
+
+        configs_file = directory / self.LEGACY_CONFIGS
+        claimed = self._claim(configs_file)
+        if claimed is not None:
+            try:
+                with open(claimed) as f:
+                    data = json.load(f)
+                rows = [
+                    (
+                        key, c["name"], c["execution_type"], json.dumps(c["optimal_config_vector"]),
+                        c["execution_count"], c["success_count"], c["avg_compliance"], c["last_updated"],
+                    )
+                    for key, c in data.items()
+                ]
+                with self._lock, self._conn:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO skill_configs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows,
+                    )
+                imported += len(rows)
+                self._finish_claim(claimed, configs_file.name + ".migrated")
+            except (OSError, ValueError, KeyError, TypeError):
+                # Unreadable legacy file: leave it for inspection
+                self._finish_claim(claimed, configs_file.name + ".corrupt")
+
+        history_file = directory / self.LEGACY_HISTORY
+        claimed = self._claim(history_file)
+        if claimed is not None:
+            rows = []
+            with open(claimed) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        rows.append((
+                            record["execution_id"],
+                            f"{record['execution_type']}:{record['name']}",
+                            record["execution_type"], record["name"],
+                            1 if record.get("success") else 0,
+                            record.get("verix_compliance", 0.0),
+                            record.get("duration_ms", 0.0),
+                            record["timestamp"],
+                            json.dumps(record, separators=(",", ":")),
+                        ))
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Skip torn or malformed lines
+            with self._lock, self._conn:
+                # A retried claim may already be partly imported
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT INTO executions (execution_id, key, execution_type, name, success, "
+                    "verix_compliance, duration_ms, timestamp, record) "
+                    "SELECT ?, ?, ?, ?, ?, ?, ?, ?, ? "
+                    "WHERE NOT EXISTS (SELECT 1 FROM executions WHERE execution_id = ?)",
+                    [row + (row[0],) for row in rows],
+                )
+                inserted = self._conn.total_changes - before
+            imported += inserted
+            self._finish_claim(claimed, history_file.name + ".migrated")
+
+        return imported
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @classmethod
+    def _claim(cls, path: Path) -> Optional[Path]:
+        claimed = path.with_name(path.name + ".migrating")
+        try:
+            if claimed.stat().st_mtime < time.time() - cls.STALE_CLAIM_SECONDS:
+                claimed.rename(path)  # Orphaned by a crash: release and retry
+        except OSError:
+            pass  # No claim, or a live one
+        if not path.exists():
+            return None
+        try:
+            # Touch first so the claim's mtime is its claim time
+            os.utime(path)
+            path.rename(claimed)
+        except OSError:
+            return None  # Claimed by another process
+        return claimed
+
+    @staticmethod
+    def _finish_claim(claimed: Path, new_name: str) -> None:
+        try:
+            claimed.rename(claimed.with_name(new_name))
+        except FileNotFoundError:
+            pass  # Released as stale and finished by another process
+
+    def _config_row(self, row) -> Dict[str, Any]:
+        data = dict(zip(self.CONFIG_COLUMNS, row))
+        data["config_vector"] = json.loads(data["config_vector"])
+        return data
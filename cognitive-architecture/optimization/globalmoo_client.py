@@ -33,6 +33,8 @@ import sys
 import logging
 from functools import wraps
 
+import numpy as np
+
 # Add parent for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -79,6 +81,7 @@ except ImportError:
     HTTPX_AVAILABLE = False
 
 from core.config import FullConfig, VectorCodec
+from optimization.pareto import ParetoArchive
 
 
 class ObjectiveDirection(Enum):
@@ -212,6 +215,11 @@ class ThrashingDetector:
     - Configuration similarity (Euclidean distance)
     - Objective stagnation (no improvement over window)
     - Oscillation patterns (A->B->A->B)
+
+    History is kept in fixed-size NumPy ring buffers, so memory stays
+    constant however long the optimizer runs. The window centroid is a
+    running sum and oscillation flags are computed once per record, so
+    detect_thrashing() never rescans the history.
     """
 
     # Thresholds for thrashing detection
@@ -220,14 +228,90 @@ class ThrashingDetector:
     improvement_threshold: float = 0.01  # Minimum improvement to count as progress
     oscillation_count_threshold: int = 3  # Number of oscillations to trigger
 
-    # History tracking
-    config_history: List[List[float]] = field(default_factory=list)
-    outcome_history: List[Dict[str, float]] = field(default_factory=list)
+    # Configs retained (at least stagnation_window and the 6 used for oscillation)
+    history_size: int = 10
+
+    # Oscillation looks at the last 6 configs, i.e. the last 4 triples
+    OSCILLATION_CONFIGS = 6
+
+    def __post_init__(self) -> None:
+        self._capacity = max(self.history_size, self.stagnation_window, self.OSCILLATION_CONFIGS)
+        self.clear_history()
+
+    @property
+    def record_count(self) -> int:
+        """Records since the last clear_history()."""
+        return self._count
+
+    @property
+    def config_history(self) -> List[List[float]]:
+        """Retained configs, oldest first (at most history_size)."""
+        return self.recent_configs(self._capacity).tolist()
+
+    @property
+    def outcome_history(self) -> List[Dict[str, float]]:
+        """Outcomes of the current stagnation window, oldest first."""
+        rows = self._outcomes[self._ring_index(min(self._count, self.stagnation_window), self.stagnation_window)]
+        return [
+            {key: float(row[col]) for key, col in self._outcome_columns.items() if not np.isnan(row[col])}
+            for row in rows
+        ]
+
+    def recent_configs(self, n: int) -> np.ndarray:
+        """The last n retained configs as a matrix, oldest first."""
+        if self._configs is None:
+            return np.zeros((0, 0))
+        return self._configs[self._ring_index(min(n, self._count, self._capacity), self._capacity)]
+
+    def _ring_index(self, n: int, size: int) -> np.ndarray:
+        """Ring slots of the last n records in a buffer of the given size."""
+        return np.arange(self._count - n, self._count) % size
 
     def record(self, config: List[float], outcomes: Dict[str, float]) -> None:
-        """Record a configuration and its outcomes."""
-        self.config_history.append(list(config))
-        self.outcome_history.append(dict(outcomes))
+        """Record a configuration and its outcomes (O(dims + objectives))."""
+        row = np.asarray(config, dtype=float)
+        if self._configs is None or row.shape != self._configs.shape[1:]:
+            if self._count:
+                logger.debug("Config length changed; restarting thrashing history")
+                self.clear_history()
+            self._configs = np.zeros((self._capacity, len(row)))
+            self._window_sum = np.zeros(len(row))
+
+        n = self._count
+        window = self.stagnation_window
+
+        # Oscillation flag for the triple (n-2, n-1, n)
+        if n >= 2:
+            base = self._configs[(n - 2) % self._capacity]
+            dist_to_next, dist_to_skip = np.sqrt(
+                ((np.stack([self._configs[(n - 1) % self._capacity], row]) - base) ** 2).sum(axis=1)
+            )
+            self._oscillation_flags[n % 4] = (
+                dist_to_next > self.similarity_threshold * 2
+                and dist_to_skip < self.similarity_threshold
+            )
+
+        # Running sum of the last stagnation_window configs
+        if n >= window:
+            self._window_sum -= self._configs[(n - window) % self._capacity]
+        self._window_sum += row
+        self._configs[n % self._capacity] = row
+
+        # Outcomes: one NaN-padded column per objective name
+        for key in outcomes:
+            if key not in self._outcome_columns:
+                self._outcome_columns[key] = self._outcomes.shape[1]
+                self._outcomes = np.hstack([self._outcomes, np.full((window, 1), np.nan)])
+        slot = self._outcomes[n % window]
+        slot[:] = np.nan
+        for key, value in outcomes.items():
+            slot[self._outcome_columns[key]] = value
+
+        self._count += 1
+
+        # Re-anchor the running sum once per window to bound float drift
+        if self._count % window == 0:
+            self._window_sum = self.recent_configs(window).sum(axis=0)
 
     def detect_thrashing(self) -> Tuple[bool, Optional[str]]:
         """
@@ -236,7 +320,7 @@ class ThrashingDetector:
         Returns:
             Tuple of (is_thrashing, reason_if_thrashing)
         """
-        if len(self.config_history) < self.stagnation_window:
+        if self._count < self.stagnation_window:
             return False, None
 
         # Check for stagnation
@@ -254,58 +338,37 @@ class ThrashingDetector:
         return False, None
 
     def _check_stagnation(self) -> bool:
-        """Check if objectives are stagnating."""
-        if len(self.outcome_history) < self.stagnation_window:
-            return False
-
-        recent = self.outcome_history[-self.stagnation_window:]
-        if not recent:
+        """Check if objectives are stagnating (first vs last of the window)."""
+        if self._count < self.stagnation_window:
             return False
 
-        # Check if any objective has improved
-        first_outcomes = recent[0]
-        last_outcomes = recent[-1]
-
-        for key in first_outcomes:
-            if key in last_outcomes:
-                improvement = last_outcomes[key] - first_outcomes[key]
-                if abs(improvement) > self.improvement_threshold:
-                    return False
+        first = self._outcomes[self._count % self.stagnation_window]
+        last = self._outcomes[(self._count - 1) % self.stagnation_window]
 
-        return True  # No objective improved
+        # Objectives missing from either end are NaN and never count
+        improved = np.abs(last - first) > self.improvement_threshold
+        return not improved.any()  # No objective improved
 
     def _check_oscillation(self) -> bool:
         """Check for A->B->A->B oscillation patterns."""
-        if len(self.config_history) < 4:
+        if self._count < 4:
             return False
 
-        recent = self.config_history[-6:]  # Last 6 configs
-        oscillations = 0
-
-        for i in range(len(recent) - 2):
-            dist_to_next = self._config_distance(recent[i], recent[i + 1])
-            dist_to_skip = self._config_distance(recent[i], recent[i + 2])
-
-            # If config[i] is far from config[i+1] but close to config[i+2]
-            if dist_to_next > self.similarity_threshold * 2 and dist_to_skip < self.similarity_threshold:
-                oscillations += 1
-
+        # Flags of triples older than the last 6 configs have been overwritten
+        oscillations = int(self._oscillation_flags.sum())
         return oscillations >= self.oscillation_count_threshold
 
     def _check_similarity_clustering(self) -> bool:
         """Check if recent configs are too similar (stuck in local area)."""
-        if len(self.config_history) < self.stagnation_window:
+        if self._count < self.stagnation_window:
             return False
 
-        recent = self.config_history[-self.stagnation_window:]
-        centroid = [sum(c[i] for c in recent) / len(recent) for i in range(len(recent[0]))]
+        recent = self.recent_configs(self.stagnation_window)
+        centroid = self._window_sum / self.stagnation_window
 
         # Check if all configs are close to centroid
-        for config in recent:
-            if self._config_distance(config, centroid) > self.similarity_threshold * 2:
-                return False
-
-        return True  # All clustered together
+        distances = np.sqrt(((recent - centroid) ** 2).sum(axis=1))
+        return bool(np.all(distances <= self.similarity_threshold * 2))
 
     def _config_distance(self, a: List[float], b: List[float]) -> float:
         """Euclidean distance between configs."""
@@ -373,8 +436,12 @@ class ThrashingDetector:
 
     def clear_history(self) -> None:
         """Clear tracking history (e.g., after recovery)."""
-        self.config_history.clear()
-        self.outcome_history.clear()
+        self._count = 0
+        self._configs: Optional[np.ndarray] = None
+        self._window_sum: Optional[np.ndarray] = None
+        self._oscillation_flags = np.zeros(4, dtype=bool)
+        self._outcome_columns: Dict[str, int] = {}
+        self._outcomes = np.zeros((self.stagnation_window, 0))
 
 
 @dataclass
@@ -510,6 +577,7 @@ class GlobalMOOClient:
         # Mock storage
         self._mock_cases: List[OptimizationOutcome] = []
         self._mock_pareto: List[ParetoPoint] = []
+        self._mock_archive = ParetoArchive()
 
         # FR3.3: Thrashing detection
         self.thrashing_detector = ThrashingDetector()
@@ -756,7 +824,7 @@ class GlobalMOOClient:
         """
         if self.use_mock:
             self._mock_cases.extend(cases)
-            self._update_mock_pareto()
+            self._update_mock_pareto(cases)
             return len(cases)
 
         response = self.client.post(f"/projects/{project_id}/cases", json={
@@ -831,7 +899,7 @@ class GlobalMOOClient:
 
         if self.use_mock:
             self._mock_cases.append(outcome)
-            self._update_mock_pareto()
+            self._update_mock_pareto([outcome])
             return
 
         response = self.client.post(f"/projects/{project_id}/outcomes", json={
@@ -942,6 +1010,8 @@ class GlobalMOOClient:
             List of Pareto-optimal points
         """
         if self.use_mock:
+            for point, distance in zip(self._mock_pareto, self._mock_archive.crowding_distances()):
+                point.crowding_distance = float(distance)
             return self._mock_pareto
 
         response = self.client.get(f"/projects/{project_id}/pareto")
@@ -1026,47 +1096,19 @@ class GlobalMOOClient:
             distance += (target_val - actual_val) ** 2
         return distance ** 0.5
 
-    def _update_mock_pareto(self) -> None:
-        """Update mock Pareto frontier."""
-        if not self._mock_cases:
-            return
+    def _update_mock_pareto(self, new_cases: List[OptimizationOutcome]) -> None:
+        """Insert new cases into the mock Pareto archive (O(front) per case)."""
+        changed = False
+        for case in new_cases:
+            point = ParetoPoint(
+                config_vector=case.config_vector,
+                outcomes=case.outcomes,
+                dominance_rank=0,
+            )
+            changed |= self._mock_archive.insert(case.outcomes, point)
 
-        # Simple non-dominated sorting
-        pareto = []
-        for case in self._mock_cases:
-            is_dominated = False
-            for other in self._mock_cases:
-                if self._dominates(other.outcomes, case.outcomes):
-                    is_dominated = True
-                    break
-            if not is_dominated:
-                pareto.append(ParetoPoint(
-                    config_vector=case.config_vector,
-                    outcomes=case.outcomes,
-                    dominance_rank=0,
-                ))
-
-        self._mock_pareto = pareto
-
-    def _dominates(
-        self,
-        outcomes_a: Dict[str, float],
-        outcomes_b: Dict[str, float],
-    ) -> bool:
-        """Check if A dominates B (all objectives >= and at least one >)."""
-        dominated_in_any = False
-        better_in_all = True
-
-        for key in outcomes_a:
-            val_a = outcomes_a.get(key, 0.0)
-            val_b = outcomes_b.get(key, 0.0)
-
-            if val_a < val_b:
-                better_in_all = False
-            if val_a > val_b:
-                dominated_in_any = True
-
-        return better_in_all and dominated_in_any
+        if changed:
+            self._mock_pareto = self._mock_archive.items()
 
     def _mock_impact_factors(self) -> Dict[str, Dict[int, float]]:
         """Generate mock impact factors."""
@@ -7,13 +7,36 @@ Produces:
 - High-impact variables (|r| >= 0.3)
 - Low-impact removal candidates (|r| < 0.1)
 - Ablation analysis for top candidates
+- Pairwise ablation (interaction effects between candidates)
+
+Ablations share one set of baseline evaluations: the baseline configs and
+every ablated vector are generated up front and scored as one batch, either
+through a vectorized batch_evaluation_fn (e.g. an EvaluationExecutor) or on
+a thread pool. Every trial is evaluated, so a stochastic evaluator keeps
+its sampling; with deterministic=True identical vectors are evaluated once.
+
+With NumPy, correlations come from a CorrelationAccumulator fed
+incrementally from telemetry (a timestamp high-water mark skips points
+already ingested), so the matrix and impact factors are current after each
+ingest without a pass over the history. With a state_path the accumulator
+and mark persist between runs, so the matrix covers every point since the
+state was created; coverage() reports that span, and window_correlations()
+gives a one-shot matrix over the telemetry source's current points only.
+
+Points are expected in timestamp order. A point older than the mark is
+treated as already ingested: late or backfilled points are never added to
+the accumulator, and those that appear in a source already read are
+counted in coverage()["late_points_skipped"].
 
 Part of the DSPy Level 1 monthly structural evolution system.
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple, Callable
+from itertools import combinations
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Callable
 from pathlib import Path
 
 # Try to import numpy, fallback to pure Python if not available
@@ -71,6 +94,34 @@ class AblationResult:
         }
 
 
+@dataclass
+class InteractionResult:
+    """Result of ablating a pair of config dimensions together."""
+    config_indices: Tuple[int, int]
+    config_names: Tuple[str, str]
+    baseline_score: float
+    ablated_score: float
+    delta: float
+    expected_delta: float      # Sum of the two single-dimension deltas
+    interaction: float         # delta - expected_delta (0 = additive)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        return {
+            "config_indices": list(self.config_indices),
+            "config_names": list(self.config_names),
+            "baseline_score": self.baseline_score,
+            "ablated_score": self.ablated_score,
+            "delta": self.delta,
+            "expected_delta": self.expected_delta,
+            "interaction": self.interaction,
+        }
+
+
+EvaluationFn = Callable[[List[float]], Dict[str, float]]
+BatchEvaluationFn = Callable[[List[List[float]]], List[Dict[str, float]]]
+
+
 class ImpactAnalyzer:
     """
     Analyzes correlations between 14 config dimensions and 11 outcome metrics.
@@ -119,22 +170,216 @@ class ImpactAnalyzer:
     HIGH_IMPACT_THRESHOLD = 0.3     # |r| >= 0.3 is high impact
     LOW_IMPACT_THRESHOLD = 0.1      # |r| < 0.1 is candidate for removal
 
-    def __init__(self, telemetry=None):
+    def __init__(self, telemetry=None, state_path: Optional[Path] = None):
         """
         Initialize impact analyzer.
 
         Args:
             telemetry: TelemetryAggregator instance (optional)
+            state_path: JSON file persisting the correlation accumulator
+                between runs (None = in-memory only)
         """
         self.telemetry = telemetry
+        self.state_path = Path(state_path) if state_path is not None else None
         self._correlation_matrix: Optional[List[List[float]]] = None
         self._impact_factors: List[ImpactFactor] = []
         self._ablation_results: List[AblationResult] = []
+        self._interaction_results: List[InteractionResult] = []
+
+        # Streaming correlations and the telemetry high-water mark: newest
+        # ingested timestamp and how many points with exactly that timestamp
+        self._accumulator = self._new_accumulator()
+        self._ingest_mark: Optional[float] = None
+        self._ingest_mark_count = 0
+        self._first_timestamp: Optional[float] = None
+        self._late_points = 0
+        # Source read by the last ingest and its size then, to spot late points
+        self._source = None
+        self._source_size = 0
+
+        if self.state_path is not None:
+            self.load_state()
 
     def set_telemetry(self, telemetry) -> None:
-        """Set or update the telemetry aggregator."""
+        """
+        Set or update the telemetry aggregator.
+
+        Accumulated correlations are kept; only points newer than the
+        high-water mark are ingested from the new source.
+        """
         self.telemetry = telemetry
 
+    def _new_accumulator(self):
+        """Empty accumulator for the full grid (None without NumPy)."""
+        if not NUMPY_AVAILABLE:
+            return None
+        from optimization.correlation_accumulator import CorrelationAccumulator
+        return CorrelationAccumulator(self.OUTCOME_METRICS, len(self.CONFIG_DIMENSIONS))
+
+    def ingest_telemetry(self) -> int:
+        """
+        Feed telemetry points newer than the high-water mark to the accumulator.
+
+        Refreshes the correlation matrix and impact factors in
+        O(dims x outcomes) when anything new arrived. Points older than the
+        mark are skipped; when the same source grew by more points than were
+        ingested, the difference arrived late and is counted as skipped.
+
+        Returns:
+            Number of points ingested
+        """
+        if self.telemetry is None or self._accumulator is None:
+            return 0
+
+        source_size = len(self.telemetry.get_points())
+        points = self.telemetry.get_points(since=self._ingest_mark)
+        if self._ingest_mark is not None:
+            # get_points(since) includes the mark itself; skip the ties seen before
+            seen = self._ingest_mark_count
+            fresh = []
+            for point in points:
+                if point.timestamp == self._ingest_mark and seen > 0:
+                    seen -= 1
+                    continue
+                fresh.append(point)
+            points = fresh
+        if self._source is self.telemetry:
+            self._late_points += max(0, source_size - self._source_size - len(points))
+        self._source = self.telemetry
+        self._source_size = source_size
+        if not points:
+            return 0
+
+        self._accumulator.update_points(points)
+
+        oldest = min(p.timestamp for p in points)
+        if self._first_timestamp is None or oldest < self._first_timestamp:
+            self._first_timestamp = oldest
+        newest = max(p.timestamp for p in points)
+        ties = sum(1 for p in points if p.timestamp == newest)
+        if newest == self._ingest_mark:
+            self._ingest_mark_count += ties
+        else:
+            self._ingest_mark = newest
+            self._ingest_mark_count = ties
+
+        self._refresh_correlations()
+        return len(points)
+
+    def merge_accumulator(self, accumulator) -> None:
+        """Fold in a CorrelationAccumulator built elsewhere (e.g. another shard)."""
+        if self._accumulator is None:
+            raise RuntimeError("Streaming correlations require numpy")
+        self._accumulator.merge(accumulator)
+        self._refresh_correlations()
+
+    def get_accumulator(self):
+        """The streaming CorrelationAccumulator (None without NumPy)."""
+        return self._accumulator
+
+    def _refresh_correlations(self) -> None:
+        """Rebuild the matrix and impact factors from the accumulator."""
+        self._correlation_matrix = self._accumulator.correlation(min_count=10).tolist()
+        self._extract_impact_factors()
+
+    def save_state(self, path: Optional[Path] = None) -> None:
+        """Persist the accumulator and high-water mark (atomically)."""
+        path = Path(path) if path is not None else self.state_path
+        if path is None or self._accumulator is None:
+            return
+        data = {
+            "accumulator": self._accumulator.to_dict(),
+            "ingest_mark": self._ingest_mark,
+            "ingest_mark_count": self._ingest_mark_count,
+            "first_timestamp": self._first_timestamp,
+            "late_points": self._late_points,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def load_state(self, path: Optional[Path] = None) -> bool:
+        """
+        Restore state saved by save_state().
+
+        Returns:
+            True if state was loaded (missing, unreadable or mismatched
+            files are ignored)
+        """
+        path = Path(path) if path is not None else self.state_path
+        if path is None or self._accumulator is None or not path.exists():
+            return False
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            accumulator = type(self._accumulator).from_dict(data["accumulator"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if (accumulator.outcome_names != self._accumulator.outcome_names
+                or accumulator.config_dims != self._accumulator.config_dims):
+            return False
+
+        self._accumulator = accumulator
+        self._ingest_mark = data.get("ingest_mark")
+        self._ingest_mark_count = data.get("ingest_mark_count", 0)
+        self._first_timestamp = data.get("first_timestamp")
+        self._late_points = data.get("late_points", 0)
+        if accumulator.points_seen:
+            self._refresh_correlations()
+        return True
+
+    def coverage(self) -> Dict[str, Any]:
+        """
+        What the correlation matrix covers.
+
+        Returns:
+            Dict with the number of points, the oldest and newest ingested
+            timestamps, and how many late points the mark skipped
+        """
+        if self._accumulator is None:
+            # Pure Python correlations are recomputed over the source each time
+            points = self.telemetry.get_points() if self.telemetry is not None else []
+            timestamps = [p.timestamp for p in points]
+            return {
+                "points": len(points),
+                "first_timestamp": min(timestamps) if timestamps else None,
+                "last_timestamp": max(timestamps) if timestamps else None,
+                "late_points_skipped": 0,
+            }
+        return {
+            "points": self._accumulator.points_seen,
+            "first_timestamp": self._first_timestamp,
+            "last_timestamp": self._ingest_mark,
+            "late_points_skipped": self._late_points,
+        }
+
+    def window_correlations(self, min_count: int = 10) -> List[List[float]]:
+        """
+        Correlation matrix over the telemetry source's current points only.
+
+        Leaves the accumulator, matrix and impact factors untouched.
+
+        Returns:
+            14 x 11 correlation matrix (list of lists)
+        """
+        if self.telemetry is None:
+            raise ValueError("Telemetry aggregator not set")
+
+        n_configs = len(self.CONFIG_DIMENSIONS)
+        if NUMPY_AVAILABLE and hasattr(self.telemetry, "columns"):
+            columns = self.telemetry.columns()
+            return columns.correlate(n_configs, self.OUTCOME_METRICS, min_count).tolist()
+
+        saved = self._correlation_matrix, self._impact_factors
+        try:
+            return self._compute_correlations_pure(
+                self.telemetry.get_points(), n_configs, len(self.OUTCOME_METRICS)
+            )
+        finally:
+            self._correlation_matrix, self._impact_factors = saved
+
     def compute_correlations(self, min_samples: int = 100) -> List[List[float]]:
         """
         Compute correlation matrix between configs and outcomes.
@@ -142,6 +387,9 @@ class ImpactAnalyzer:
         Args:
             min_samples: Minimum samples required for analysis
 
+        With NumPy this ingests new telemetry into the streaming accumulator
+        and counts every point accumulated so far (including restored state).
+
         Returns:
             14 x 11 correlation matrix (list of lists)
 
@@ -151,6 +399,14 @@ class ImpactAnalyzer:
         if self.telemetry is None:
             raise ValueError("Telemetry aggregator not set")
 
+        if self._accumulator is not None:
+            self.ingest_telemetry()
+            seen = self._accumulator.points_seen
+            if seen < min_samples:
+                raise ValueError(f"Need {min_samples} samples, have {seen}")
+            self._refresh_correlations()
+            return self._correlation_matrix
+
         points = self.telemetry.get_points()
 
         if len(points) < min_samples:
@@ -159,48 +415,7 @@ class ImpactAnalyzer:
         n_configs = len(self.CONFIG_DIMENSIONS)
         n_outcomes = len(self.OUTCOME_METRICS)
 
-        if NUMPY_AVAILABLE:
-            return self._compute_correlations_numpy(points, n_configs, n_outcomes)
-        else:
-            return self._compute_correlations_pure(points, n_configs, n_outcomes)
-
-    def _compute_correlations_numpy(
-        self,
-        points: List,
-        n_configs: int,
-        n_outcomes: int,
-    ) -> List[List[float]]:
-        """Compute correlations using numpy."""
-        # Build arrays
-        config_data = np.array([p.config_vector[:n_configs] for p in points])
-        outcome_data = np.array([
-            [p.outcomes.get(m, float('nan')) for m in self.OUTCOME_METRICS]
-            for p in points
-        ])
-
-        correlations = np.zeros((n_configs, n_outcomes))
-
-        for i in range(n_configs):
-            for j in range(n_outcomes):
-                # Filter NaN values
-                mask = ~np.isnan(outcome_data[:, j])
-                if mask.sum() < 10:
-                    correlations[i, j] = 0.0
-                    continue
-
-                x = config_data[mask, i]
-                y = outcome_data[mask, j]
-
-                # Pearson correlation
-                if np.std(x) > 0 and np.std(y) > 0:
-                    correlations[i, j] = np.corrcoef(x, y)[0, 1]
-                else:
-                    correlations[i, j] = 0.0
-
-        self._correlation_matrix = correlations.tolist()
-        self._extract_impact_factors()
-
-        return self._correlation_matrix
+        return self._compute_correlations_pure(points, n_configs, n_outcomes)
 
     def _compute_correlations_pure(
         self,
@@ -320,78 +535,203 @@ class ImpactAnalyzer:
     def run_ablation_analysis(
         self,
         candidates: List[int],
-        evaluation_fn: Callable[[List[float]], Dict[str, float]],
+        evaluation_fn: Optional[EvaluationFn] = None,
         n_trials: int = 10,
+        batch_evaluation_fn: Optional[BatchEvaluationFn] = None,
+        max_workers: int = 1,
+        deterministic: bool = False,
     ) -> List[AblationResult]:
         """
         Run ablation analysis on candidate dimensions.
 
-        Tests the impact of setting each candidate dimension to 0.
+        Tests the impact of setting each candidate dimension to 0. Baseline
+        configs are evaluated once and shared by all candidates.
 
         Args:
             candidates: Config indices to ablate
             evaluation_fn: Function(config_vector) -> outcomes dict
             n_trials: Number of trials per ablation
+            batch_evaluation_fn: Function(config_vectors) -> outcomes list;
+                scores the whole ablation matrix in one call (preferred
+                over evaluation_fn when given)
+            max_workers: Thread pool size for evaluation_fn (1 = serial)
+            deterministic: The evaluator returns the same outcomes for the
+                same vector, so repeated vectors are evaluated once
 
         Returns:
             Ablation results for each candidate
         """
-        results = []
-
-        # Get baseline configs from telemetry
-        baseline_configs = self._get_baseline_configs()
-
-        if not baseline_configs:
-            return results
-
-        for idx in candidates:
-            if idx >= len(self.CONFIG_DIMENSIONS):
-                continue
-
-            name = self.CONFIG_DIMENSIONS[idx]
-
-            baseline_scores = []
-            ablated_scores = []
-
-            for config in baseline_configs[:n_trials]:
-                # Baseline evaluation
-                outcomes = evaluation_fn(config)
-                baseline_scores.append(self._composite_score(outcomes))
-
-                # Ablated evaluation (set dimension to 0)
-                ablated_config = config.copy()
-                ablated_config[idx] = 0.0
-                ablated_outcomes = evaluation_fn(ablated_config)
-                ablated_scores.append(self._composite_score(ablated_outcomes))
-
-            if not baseline_scores:
-                continue
+        groups = [(idx,) for idx in candidates if idx < len(self.CONFIG_DIMENSIONS)]
+        matrix = self._ablation_matrix(
+            groups, n_trials, evaluation_fn, batch_evaluation_fn, max_workers, deterministic,
+        )
+        if matrix is None:
+            self._ablation_results = []
+            return []
 
-            baseline_avg = sum(baseline_scores) / len(baseline_scores)
-            ablated_avg = sum(ablated_scores) / len(ablated_scores)
+        baseline_avg, ablated_avgs = matrix
+        results = []
+        for (idx,) in groups:
+            ablated_avg = ablated_avgs[(idx,)]
             delta = ablated_avg - baseline_avg
 
-            # Recommendation based on delta
-            if delta > 0.05:
-                recommendation = "remove"    # Removing improves score
-            elif delta < -0.05:
-                recommendation = "keep"      # Removing hurts score
-            else:
-                recommendation = "investigate"  # Marginal impact
-
             result = AblationResult(
                 config_index=idx,
-                config_name=name,
+                config_name=self.CONFIG_DIMENSIONS[idx],
                 baseline_score=baseline_avg,
                 ablated_score=ablated_avg,
                 delta=delta,
-                recommendation=recommendation,
+                recommendation=self._recommend(delta),
             )
             results.append(result)
 
         self._ablation_results = results
         return results
 
+    def run_interaction_analysis(
+        self,
+        candidates: List[int],
+        evaluation_fn: Optional[EvaluationFn] = None,
+        n_trials: int = 10,
+        batch_evaluation_fn: Optional[BatchEvaluationFn] = None,
+        max_workers: int = 1,
+        deterministic: bool = False,
+    ) -> List[InteractionResult]:
+        """
+        Run pairwise ablation on candidate dimensions.
+
+        Ablates every pair of candidates together and compares the delta
+        with the sum of the single-dimension deltas; a non-zero interaction
+        means the two dimensions are not independent. Singles, pairs and
+        baselines are scored in the same batch.
+
+        Args:
+            candidates: Config indices to ablate pairwise
+            evaluation_fn: Function(config_vector) -> outcomes dict
+            n_trials: Number of trials per ablation
+            batch_evaluation_fn: Function(config_vectors) -> outcomes list
+            max_workers: Thread pool size for evaluation_fn (1 = serial)
+            deterministic: Evaluate repeated vectors once
+
+        Returns:
+            One result per candidate pair, sorted by |interaction|
+        """
+        valid = sorted({idx for idx in candidates if idx < len(self.CONFIG_DIMENSIONS)})
+        pairs = list(combinations(valid, 2))
+        groups = [(idx,) for idx in valid] + pairs
+        matrix = self._ablation_matrix(
+            groups, n_trials, evaluation_fn, batch_evaluation_fn, max_workers, deterministic,
+        )
+        if matrix is None or not pairs:
+            self._interaction_results = []
+            return []
+
+        baseline_avg, ablated_avgs = matrix
+        results = []
+        for i, j in pairs:
+            delta = ablated_avgs[(i, j)] - baseline_avg
+            expected_delta = (ablated_avgs[(i,)] - baseline_avg) + (ablated_avgs[(j,)] - baseline_avg)
+            results.append(InteractionResult(
+                config_indices=(i, j),
+                config_names=(self.CONFIG_DIMENSIONS[i], self.CONFIG_DIMENSIONS[j]),
+                baseline_score=baseline_avg,
+                ablated_score=ablated_avgs[(i, j)],
+                delta=delta,
+                expected_delta=expected_delta,
+                interaction=delta - expected_delta,
+            ))
+
+        results.sort(key=lambda r: -abs(r.interaction))
+        self._interaction_results = results
+        return results
+
+    def _ablation_matrix(
+        self,
+        groups: List[Tuple[int, ...]],
+        n_trials: int,
+        evaluation_fn: Optional[EvaluationFn],
+        batch_evaluation_fn: Optional[BatchEvaluationFn],
+        max_workers: int,
+        deterministic: bool = False,
+    ) -> Optional[Tuple[float, Dict[Tuple[int, ...], float]]]:
+        """
+        Score baselines and every ablated vector in one batch.
+
+        Returns:
+            (baseline average, ablated average per group), or None when
+            there are no baseline configs or trials
+        """
+        if evaluation_fn is None and batch_evaluation_fn is None:
+            raise ValueError("evaluation_fn or batch_evaluation_fn is required")
+
+        baselines = self._get_baseline_configs()[:n_trials]
+        if not baselines or not groups:
+            return None
+
+        vectors = [list(config) for config in baselines]
+        for group in groups:
+            for config in baselines:
+                ablated_config = list(config)
+                for idx in group:
+                    ablated_config[idx] = 0.0
+                vectors.append(ablated_config)
+
+        scores = self._score_vectors(
+            vectors, evaluation_fn, batch_evaluation_fn, max_workers, deterministic,
+        )
+
+        n = len(baselines)
+        baseline_avg = sum(scores[:n]) / n
+        ablated_avgs = {
+            group: sum(scores[n * (k + 1):n * (k + 2)]) / n
+            for k, group in enumerate(groups)
+        }
+        return baseline_avg, ablated_avgs
+
+    def _score_vectors(
+        self,
+        vectors: Sequence[List[float]],
+        evaluation_fn: Optional[EvaluationFn],
+        batch_evaluation_fn: Optional[BatchEvaluationFn],
+        max_workers: int,
+        deterministic: bool = False,
+    ) -> List[float]:
+        """
+        Composite score per vector.
+
+        Every vector is evaluated, since repeated trials of a stochastic
+        evaluator are separate samples; with deterministic=True each
+        distinct vector is evaluated once and its score reused.
+        """
+        to_evaluate = [list(vector) for vector in vectors]
+        positions: Optional[List[int]] = None
+        if deterministic:
+            index: Dict[Tuple[float, ...], int] = {}
+            positions = [index.setdefault(tuple(vector), len(index)) for vector in vectors]
+            to_evaluate = [list(key) for key in index]
+
+        if batch_evaluation_fn is not None:
+            outcomes = list(batch_evaluation_fn(to_evaluate))
+        elif max_workers > 1 and len(to_evaluate) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                outcomes = list(pool.map(evaluation_fn, to_evaluate))
+        else:
+            outcomes = [evaluation_fn(vector) for vector in to_evaluate]
+
+        scores = [self._composite_score(o) for o in outcomes]
+        if positions is None:
+            return scores
+        return [scores[position] for position in positions]
+
+    def _recommend(self, delta: float) -> str:
+        """Recommendation for an ablation delta."""
+        if delta > 0.05:
+            return "remove"    # Removing improves score
+        elif delta < -0.05:
+            return "keep"      # Removing hurts score
+        else:
+            return "investigate"  # Marginal impact
+
     def _get_baseline_configs(self) -> List[List[float]]:
         """Get baseline configs for ablation from telemetry."""
         if self.telemetry is None:
@@ -440,6 +780,10 @@ class ImpactAnalyzer:
         """Get ablation analysis results."""
         return self._ablation_results
 
+    def get_interaction_results(self) -> List[InteractionResult]:
+        """Get pairwise ablation results."""
+        return self._interaction_results
+
     def generate_report(self) -> str:
         """Generate human-readable impact analysis report."""
         lines = ["# Impact Analysis Report", ""]
@@ -478,6 +822,17 @@ class ImpactAnalyzer:
                 )
             lines.append("")
 
+        # Interaction results section
+        if self._interaction_results:
+            lines.append("## Pairwise Interactions")
+            lines.append("")
+            for r in self._interaction_results[:10]:  # Top 10
+                lines.append(
+                    f"- {r.config_names[0]} + {r.config_names[1]}: delta={r.delta:+.3f}, "
+                    f"expected={r.expected_delta:+.3f}, interaction={r.interaction:+.3f}"
+                )
+            lines.append("")
+
         # Summary
         lines.append("## Summary")
         lines.append("")
@@ -500,6 +855,7 @@ class ImpactAnalyzer:
             "correlation_matrix": self._correlation_matrix,
             "impact_factors": [f.to_dict() for f in self._impact_factors],
             "ablation_results": [r.to_dict() for r in self._ablation_results],
+            "interaction_results": [r.to_dict() for r in self._interaction_results],
             "high_impact_count": len(self.get_high_impact_variables()),
             "removal_candidates": self.get_removal_candidates(),
         }
@@ -508,6 +864,6 @@ class ImpactAnalyzer:
 
 
 # Factory function
-def create_impact_analyzer(telemetry=None) -> ImpactAnalyzer:
+def create_impact_analyzer(telemetry=None, state_path: Optional[Path] = None) -> ImpactAnalyzer:
     """Create an ImpactAnalyzer instance."""
-    return ImpactAnalyzer(telemetry=telemetry)
+    return ImpactAnalyzer(telemetry=telemetry, state_path=state_path)
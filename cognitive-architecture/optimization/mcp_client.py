@@ -8,7 +8,8 @@ Uses subprocess to communicate with MCP servers via JSON-RPC over stdio.
 This client can:
 1. Detect MCP server availability
 2. Execute MCP tool calls (memory_store, vector_search)
-3. Gracefully fall back to file storage when MCP is unavailable
+3. Gracefully fall back to local storage when MCP is unavailable
+   (an indexed SQLite store, see mcp_fallback_store.py)
 """
 
 import json
@@ -18,9 +19,11 @@ import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 import logging
 
+from .mcp_fallback_store import FallbackMemoryStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,7 +116,8 @@ class MemoryMCPClient:
     - Vector/semantic search
     - Graph relationships
 
-    Falls back to file-based storage when MCP is unavailable.
+    Falls back to an indexed local store (SQLite + FTS5) when MCP is
+    unavailable.
     """
 
     # Default MCP server configuration
@@ -133,7 +137,8 @@ class MemoryMCPClient:
         Args:
             endpoint: MCP server endpoint (default: localhost:50051)
             namespace: Default namespace for operations
-            fallback_dir: Directory for file-based fallback
+            fallback_dir: Directory for the fallback store (per-key JSON
+                files from older versions there are imported on first open)
             timeout_ms: Timeout for MCP operations in milliseconds
         """
         self.endpoint = endpoint or self.DEFAULT_ENDPOINT
@@ -144,6 +149,8 @@ class MemoryMCPClient:
             fallback_dir = Path(__file__).parent.parent / "storage" / "mcp-fallback"
         self.fallback_dir = Path(fallback_dir)
         self.fallback_dir.mkdir(parents=True, exist_ok=True)
+        self.fallback_store = FallbackMemoryStore(self.fallback_dir / FallbackMemoryStore.DB_FILE)
+        self.fallback_store.migrate_legacy(self.fallback_dir)
 
         self._mcp_available: Optional[bool] = None
         self._last_check_time: float = 0
@@ -222,7 +229,48 @@ class MemoryMCPClient:
         """
         start_time = time.time()
         full_key = f"{self.namespace}/{key}"
+        value_str, meta = self._prepare(value, metadata)
+
+        if self._check_mcp_availability():
+            result = self._mcp_store(full_key, value_str, meta)
+        else:
+            result = self._fallback_store(full_key, value_str, meta)
+
+        result.execution_time_ms = (time.time() - start_time) * 1000
+        return result
+
+    def memory_store_many(
+        self,
+        items: Iterable[Tuple[str, Union[str, Dict], Optional[Dict[str, str]]]],
+    ) -> MCPToolResult:
+        """
+        Store many values in one operation.
+
+        Args:
+            items: (key, value, metadata) tuples, as for memory_store()
+
+        Returns:
+            MCPToolResult with the stored keys
+        """
+        start_time = time.time()
+        entries = []
+        for key, value, metadata in items:
+            value_str, meta = self._prepare(value, metadata)
+            entries.append((f"{self.namespace}/{key}", value_str, meta))
+
+        if self._check_mcp_availability():
+            logger.info(f"MCP store: {len(entries)} keys (would use MCP if running)")
+        result = self._fallback_store_many(entries)
 
+        result.execution_time_ms = (time.time() - start_time) * 1000
+        return result
+
+    @staticmethod
+    def _prepare(
+        value: Union[str, Dict],
+        metadata: Optional[Dict[str, str]],
+    ) -> Tuple[str, Dict[str, str]]:
+        """JSON-encode the value and stamp metadata with a timestamp."""
         # Ensure value is JSON string
         if isinstance(value, dict):
             value_str = json.dumps(value)
@@ -233,14 +281,7 @@ class MemoryMCPClient:
         meta = metadata or {}
         if "timestamp" not in meta:
             meta["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-
-        if self._check_mcp_availability():
-            result = self._mcp_store(full_key, value_str, meta)
-        else:
-            result = self._fallback_store(full_key, value_str, meta)
-
-        result.execution_time_ms = (time.time() - start_time) * 1000
-        return result
+        return value_str, meta
 
     def _mcp_store(
         self,
@@ -263,37 +304,45 @@ class MemoryMCPClient:
         value: str,
         metadata: Dict[str, str],
     ) -> MCPToolResult:
-        """Store to file-based fallback."""
-        try:
-            # Sanitize key for filename
-            safe_key = key.replace("/", "_").replace(":", "_")
-            filepath = self.fallback_dir / f"{safe_key}.json"
-
-            data = {
+        """Store to the local fallback store."""
+        result = self._fallback_store_many([(key, value, metadata)])
+        result.tool_name = "memory_store"
+        if result.success:
+            result.data = {
                 "key": key,
-                "value": json.loads(value) if value.startswith("{") else value,
-                "metadata": metadata,
-                "stored_at": time.time(),
+                "location": "fallback",
+                "filepath": self.fallback_store.path,
             }
+        return result
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+    def _fallback_store_many(
+        self,
+        entries: List[Tuple[str, str, Dict[str, str]]],
+    ) -> MCPToolResult:
+        """Store (full key, value string, metadata) entries in one transaction."""
+        try:
+            rows = [
+                (key, json.loads(value) if value.startswith("{") else value, metadata, None)
+                for key, value, metadata in entries
+            ]
+            self.fallback_store.put_many(rows)
 
             return MCPToolResult(
                 success=True,
                 data={
-                    "key": key,
+                    "keys": [row[0] for row in rows],
+                    "count": len(rows),
                     "location": "fallback",
-                    "filepath": str(filepath),
+                    "filepath": self.fallback_store.path,
                 },
-                tool_name="memory_store",
+                tool_name="memory_store_many",
             )
 
         except Exception as e:
             return MCPToolResult(
                 success=False,
                 error=str(e),
-                tool_name="memory_store",
+                tool_name="memory_store_many",
             )
 
     def vector_search(
@@ -341,40 +390,9 @@ class MemoryMCPClient:
         limit: int,
         namespace: str,
     ) -> MCPToolResult:
-        """Search in file-based fallback (keyword matching)."""
+        """Search the fallback store (FTS5 keyword match, BM25 ranked)."""
         try:
-            matches = []
-            query_lower = query.lower()
-            query_words = set(query_lower.split())
-
-            for filepath in self.fallback_dir.glob("*.json"):
-                try:
-                    with open(filepath, encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    # Check if matches namespace
-                    key = data.get("key", "")
-                    if namespace and not key.startswith(namespace):
-                        continue
-
-                    # Simple keyword matching score
-                    content = json.dumps(data).lower()
-                    score = sum(1 for word in query_words if word in content)
-
-                    if score > 0:
-                        matches.append({
-                            "key": key,
-                            "score": score / len(query_words),
-                            "value": data.get("value"),
-                            "metadata": data.get("metadata", {}),
-                        })
-
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-            # Sort by score and limit
-            matches.sort(key=lambda x: x["score"], reverse=True)
-            matches = matches[:limit]
+            matches = self.fallback_store.search(query, limit=limit, prefix=namespace or "")
 
             return MCPToolResult(
                 success=True,
@@ -423,21 +441,17 @@ class MemoryMCPClient:
         return self._fallback_load(key)
 
     def _fallback_load(self, key: str) -> MCPToolResult:
-        """Load from file-based fallback."""
+        """Load from the fallback store."""
         try:
-            safe_key = key.replace("/", "_").replace(":", "_")
-            filepath = self.fallback_dir / f"{safe_key}.json"
+            data = self.fallback_store.get(key)
 
-            if not filepath.exists():
+            if data is None:
                 return MCPToolResult(
                     success=False,
                     error=f"Key not found: {key}",
                     tool_name="memory_load",
                 )
 
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
-
             return MCPToolResult(
                 success=True,
                 data={
@@ -469,23 +483,13 @@ class MemoryMCPClient:
             MCPToolResult with list of keys
         """
         try:
-            keys = []
             full_prefix = f"{self.namespace}/{prefix}" if prefix else self.namespace
-
-            for filepath in self.fallback_dir.glob("*.json"):
-                try:
-                    with open(filepath, encoding="utf-8") as f:
-                        data = json.load(f)
-                    key = data.get("key", "")
-                    if key.startswith(full_prefix):
-                        keys.append(key)
-                except (json.JSONDecodeError, KeyError):
-                    continue
+            keys = self.fallback_store.keys(full_prefix)
 
             return MCPToolResult(
                 success=True,
                 data={
-                    "keys": sorted(keys),
+                    "keys": keys,
                     "count": len(keys),
                     "prefix": full_prefix,
                 },
@@ -0,0 +1,246 @@
+"""
+MCP Fallback Store - embedded SQLite storage for MemoryMCPClient.
+
+When the Memory MCP server is unavailable the client keeps memories locally.
+The original fallback wrote one pretty-printed JSON file per key and answered
+every search or key listing by loading (and re-serializing) all of them. The
+store replaces that with a single SQLite file holding:
+- memories: one row per full key ("namespace/key"); the unique key index
+  doubles as the namespace/prefix index for range scans
+- memories_fts: an FTS5 index over key, value and metadata, kept in sync by
+  triggers and searched with BM25 ranking
+
+The database runs in WAL mode and is shared safely by threads and processes.
+Per-key JSON files left by older versions are imported once, on first open;
+the files themselves are left in place.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Upper bound for prefix range scans (sorts after any UTF-8 continuation)
+_PREFIX_END = "\U0010ffff"
+
+
+class FallbackMemoryStore:
+    """SQLite + FTS5 key/value store with ranked full-text search."""
+
+    DB_FILE = "memories.sqlite3"
+
+    def __init__(self, path: Union[str, Path], busy_timeout: float = 30.0):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite file, or ":memory:" for a process-local store
+            busy_timeout: Seconds a writer waits for another process's lock
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=busy_timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS memories (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL UNIQUE,
+                value TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+                key, value, metadata,
+                content='memories', content_rowid='id', prefix='2 3'
+            );
+            CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN
+                INSERT INTO memories_fts(rowid, key, value, metadata)
+                VALUES (new.id, new.key, new.value, new.metadata);
+            END;
+            CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, key, value, metadata)
+                VALUES ('delete', old.id, old.key, old.value, old.metadata);
+            END;
+            CREATE TRIGGER IF NOT EXISTS memories_au AFTER UPDATE ON memories BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, key, value, metadata)
+                VALUES ('delete', old.id, old.key, old.value, old.metadata);
+                INSERT INTO memories_fts(rowid, key, value, metadata)
+                VALUES (new.id, new.key, new.value, new.metadata);
+            END;
+            CREATE TABLE IF NOT EXISTS meta (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def put(self, key: str, value: Any, metadata: Dict[str, str], stored_at: Optional[float] = None) -> None:
+        """Insert or replace one memory."""
+        self.put_many([(key, value, metadata, stored_at)])
+
+    def put_many(self, rows: Iterable[Tuple[str, Any, Dict[str, str], Optional[float]]]) -> int:
+        """
+        Insert or replace memories in one transaction.
+
+        Args:
+            rows: (full key, decoded value, metadata, stored_at or None) tuples
+
+        Returns:
+            Number of rows written
+        """
+        now = time.time()
+        params = [
+            (key, json.dumps(value), json.dumps(metadata), now if stored_at is None else stored_at)
+            for key, value, metadata, stored_at in rows
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO memories (key, value, metadata, stored_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+                "metadata = excluded.metadata, stored_at = excluded.stored_at",
+                params,
+            )
+        return len(params)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """One memory as {"key", "value", "metadata", "stored_at"}, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, value, metadata, stored_at FROM memories WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "key": row[0],
+            "value": json.loads(row[1]),
+            "metadata": json.loads(row[2]),
+            "stored_at": row[3],
+        }
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """Sorted keys starting with prefix (an index range scan)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM memories WHERE key >= ? AND key < ? ORDER BY key",
+                (prefix, prefix + _PREFIX_END),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def search(self, query: str, limit: int = 10, prefix: str = "") -> List[Dict[str, Any]]:
+        """
+        Full-text search ranked by BM25.
+
+        Every whitespace-separated query word is matched as a token prefix;
+        a memory matches if any word does.
+
+        Args:
+            query: Free-text query
+            limit: Maximum results
+            prefix: Only keys starting with this (e.g. the namespace)
+
+        Returns:
+            Dicts with key, score (higher is more relevant), value and metadata
+        """
+        match = self._match_expression(query)
+        if not match:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT m.key, m.value, m.metadata, bm25(memories_fts) AS rank "
+                "FROM memories_fts JOIN memories m ON m.id = memories_fts.rowid "
+                "WHERE memories_fts MATCH ? AND m.key >= ? AND m.key < ? "
+                "ORDER BY rank LIMIT ?",
+                (match, prefix, prefix + _PREFIX_END, limit),
+            ).fetchall()
+        return [
+            {
+                "key": key,
+                "score": -rank,
+                "value": json.loads(value),
+                "metadata": json.loads(metadata),
+            }
+            for key, value, metadata, rank in rows
+        ]
+
+    def delete(self, key: str) -> bool:
+        """Remove one memory; True if it existed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM memories WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def migrate_legacy(self, directory: Path) -> int:
+        """
+        Import per-key JSON files written by the old file fallback.
+
+        Runs once per database: the import is recorded in the meta table
+        inside the same transaction, so concurrent openers import only once.
+        Unreadable files are skipped; files are never modified.
+
+        Returns:
+            Number of memories imported (0 if already done)
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                done = self._conn.execute(
+                    "SELECT value FROM meta WHERE name = 'legacy_imported'"
+                ).fetchone()
+                if done is not None:
+                    self._conn.commit()
+                    return 0
+
+                rows = []
+                for filepath in sorted(Path(directory).glob("*.json")):
+                    try:
+                        with open(filepath, encoding="utf-8") as f:
+                            data = json.load(f)
+                        rows.append((
+                            data["key"],
+                            json.dumps(data.get("value")),
+                            json.dumps(data.get("metadata", {})),
+                            float(data.get("stored_at", filepath.stat().st_mtime)),
+                        ))
+                    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                        continue  # Not a fallback record
+                # Newer entries in the database win over legacy files
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO memories (key, value, metadata, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute(
+                    "INSERT INTO meta (name, value) VALUES ('legacy_imported', ?)",
+                    (str(len(rows)),),
+                )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        """OR of quoted prefix terms; words without letters or digits are dropped."""
+        terms = [
+            '"' + word.replace('"', '""') + '"*'
+            for word in query.lower().split()
+            if any(c.isalnum() for c in word)
+        ]
+        return " OR ".join(terms)
@@ -77,6 +77,11 @@ class MonthlyAnalyzer:
 
     Combines failure classification, impact analysis, and proposal generation
     to produce monthly improvement recommendations.
+
+    Failure classification covers the loaded window. Impact correlations come
+    from a persisted accumulator and cover all telemetry since its state was
+    created; the impact summary reports that span under "coverage" and a
+    matrix over the window alone under "window".
     """
 
     # Thresholds for proposal generation
@@ -84,6 +89,9 @@ class MonthlyAnalyzer:
     HIGH_FAILURE_RATE_THRESHOLD = 0.1   # Flag if failure rate exceeds
     ABLATION_IMPROVEMENT_THRESHOLD = 0.05  # Generate removal proposal if delta >
 
+    # Streaming correlation state carried from one monthly run to the next
+    IMPACT_STATE_FILE = "impact-state.json"
+
     def __init__(
         self,
         telemetry: Optional[TelemetryAggregatorWithMCP] = None,
@@ -97,19 +105,23 @@ class MonthlyAnalyzer:
         Args:
             telemetry: Telemetry aggregator with MCP support
             failure_classifier: Failure classifier instance
-            impact_analyzer: Impact analyzer instance
+            impact_analyzer: Impact analyzer instance (default: one whose
+                correlation state persists in proposals_dir, so each month
+                only ingests new telemetry)
             proposals_dir: Directory for storing proposals
         """
-        self.telemetry = telemetry or create_telemetry_aggregator_with_mcp()
-        self.failure_classifier = failure_classifier or create_failure_classifier()
-        self.impact_analyzer = impact_analyzer or create_impact_analyzer()
-
         if proposals_dir is None:
             proposals_dir = Path(__file__).parent.parent / "storage" / "monthly-proposals"
 
         self.proposals_dir = Path(proposals_dir)
         self.proposals_dir.mkdir(parents=True, exist_ok=True)
 
+        self.telemetry = telemetry or create_telemetry_aggregator_with_mcp()
+        self.failure_classifier = failure_classifier or create_failure_classifier()
+        self.impact_analyzer = impact_analyzer or create_impact_analyzer(
+            state_path=self.proposals_dir / self.IMPACT_STATE_FILE,
+        )
+
         self._proposal_counter = 0
         self._last_analysis: Optional[MonthlyAnalysisResult] = None
 
@@ -148,6 +160,7 @@ class MonthlyAnalyzer:
         days: int = 30,
         evaluation_fn: Optional[Callable[[List[float]], Dict[str, float]]] = None,
         force: bool = False,
+        batch_evaluation_fn: Optional[Callable[[List[List[float]]], List[Dict[str, float]]]] = None,
     ) -> MonthlyAnalysisResult:
         """
         Run monthly structural evolution analysis.
@@ -156,6 +169,8 @@ class MonthlyAnalyzer:
             days: Number of days to analyze
             evaluation_fn: Optional evaluation function for ablation
             force: Run even if not scheduled
+            batch_evaluation_fn: Optional batch evaluation function for
+                ablation (scores all ablated configs in one call)
 
         Returns:
             Analysis result with proposals
@@ -178,8 +193,8 @@ class MonthlyAnalyzer:
         impact_summary = self._analyze_impact()
 
         # Step 4: Run ablation if evaluation function provided
-        if evaluation_fn:
-            self._run_ablation(evaluation_fn)
+        if evaluation_fn or batch_evaluation_fn:
+            self._run_ablation(evaluation_fn, batch_evaluation_fn)
 
         # Step 5: Generate proposals
         proposals = self._generate_proposals(failure_summary, impact_summary)
@@ -261,6 +276,8 @@ class MonthlyAnalyzer:
                 "high_impact_factors": [f.to_dict() for f in high_impact[:10]],
                 "removal_candidates": removal_candidates,
                 "correlation_matrix_computed": True,
+                "coverage": self.impact_analyzer.coverage(),
+                "window": self._window_impact(),
             }
 
         except ValueError as e:
@@ -270,12 +287,33 @@ class MonthlyAnalyzer:
                 "high_impact_factors": [],
                 "removal_candidates": [],
                 "correlation_matrix_computed": False,
+                "coverage": self.impact_analyzer.coverage(),
+                "window": self._window_impact(),
                 "error": str(e),
             }
 
+        finally:
+            # Keep what was ingested even when there is not enough data yet
+            self.impact_analyzer.save_state()
+
+    def _window_impact(self) -> Dict[str, Any]:
+        """High-impact cells over the loaded window (the points classified above)."""
+        points = len(self.telemetry.get_points())
+        if points < 50 or self.impact_analyzer.telemetry is None:
+            return {"points": points, "high_impact_count": 0, "correlation_matrix_computed": False}
+
+        threshold = self.impact_analyzer.HIGH_IMPACT_THRESHOLD
+        matrix = self.impact_analyzer.window_correlations()
+        return {
+            "points": points,
+            "high_impact_count": sum(abs(r) >= threshold for row in matrix for r in row),
+            "correlation_matrix_computed": True,
+        }
+
     def _run_ablation(
         self,
-        evaluation_fn: Callable[[List[float]], Dict[str, float]],
+        evaluation_fn: Optional[Callable[[List[float]], Dict[str, float]]],
+        batch_evaluation_fn: Optional[Callable[[List[List[float]]], List[Dict[str, float]]]] = None,
     ) -> None:
         """Run ablation analysis on removal candidates."""
         candidates = self.impact_analyzer.get_removal_candidates()
@@ -291,6 +329,7 @@ class MonthlyAnalyzer:
                 candidates=candidate_indices,
                 evaluation_fn=evaluation_fn,
                 n_trials=10,
+                batch_evaluation_fn=batch_evaluation_fn,
             )
 
     def _generate_proposals(
@@ -0,0 +1,259 @@
+"""
+Pareto dominance, non-dominated sorting and crowding distance.
+
+Shared by every Pareto code path (GlobalMOO mock frontier, telemetry
+steering, mode distillation). All objectives are maximized, matching the
+outcome dicts used throughout the cascade; missing objectives count as 0.0.
+
+Outcomes are held as NumPy matrices (one row per point, one column per
+objective). Sorting uses the efficient non-dominated sort (ENS-SS): points
+are visited in order of decreasing objective sum (ties broken
+lexicographically), so every point's dominators are placed before it, and
+each point is only compared against the members of existing fronts.
+ParetoArchive keeps a frontier up to date one outcome at a time at
+O(front size) per insertion.
+
+Key Functions:
+- outcome_matrix: Outcome dicts -> (matrix, objective names)
+- non_dominated_mask: Boolean mask of the first front
+- fast_non_dominated_sort: Front rank of every point (0 = Pareto optimal)
+- crowding_distance: NSGA-II crowding distance within one front
+- pareto_front: Non-dominated subset of arbitrary items
+
+Key Classes:
+- ParetoArchive: Incrementally maintained non-dominated archive
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def outcome_matrix(
+    outcomes: Sequence[Dict[str, float]],
+    objectives: Optional[Sequence[str]] = None,
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Convert outcome dicts into a float matrix.
+
+    Args:
+        outcomes: One outcome dict per point
+        objectives: Column order (default: keys in first-seen order)
+
+    Returns:
+        (n x k matrix, objective names); missing values are 0.0
+    """
+    if objectives is None:
+        names: Dict[str, None] = {}
+        for outcome in outcomes:
+            names.update(dict.fromkeys(outcome))
+        objectives = list(names)
+    objectives = list(objectives)
+
+    F = np.zeros((len(outcomes), len(objectives)))
+    for i, outcome in enumerate(outcomes):
+        F[i] = [outcome.get(name, 0.0) for name in objectives]
+    return F, objectives
+
+
+def dominates(a: Sequence[float], b: Sequence[float]) -> bool:
+    """Check if A dominates B (all objectives >= and at least one >)."""
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    return bool(np.all(a >= b) and np.any(a > b))
+
+
+def _dominated_by_any(F: np.ndarray, row: np.ndarray) -> bool:
+    """Check if any row of F dominates row."""
+    return bool(np.any(np.all(F >= row, axis=1) & np.any(F > row, axis=1)))
+
+
+def _sum_order(F: np.ndarray) -> np.ndarray:
+    """Visit order in which every dominator precedes the points it dominates."""
+    # A dominator's sum is never smaller, but rounding can make it equal
+    # (1e16 + 1.0 == 1e16 + 0.0), so ties fall back to descending
+    # lexicographic order, where a dominator always comes first. lexsort
+    # takes its primary key last and is stable for identical rows.
+    if F.size == 0:
+        return np.arange(len(F))
+    keys = [-F[:, j] for j in range(F.shape[1] - 1, -1, -1)]
+    return np.lexsort(keys + [-F.sum(axis=1)])
+
+
+def fast_non_dominated_sort(F: np.ndarray) -> np.ndarray:
+    """
+    Rank points into non-dominated fronts.
+
+    Args:
+        F: n x k outcome matrix (maximized)
+
+    Returns:
+        Integer array of front ranks, 0 for the Pareto-optimal front
+    """
+    F = np.asarray(F, dtype=float)
+    ranks = np.zeros(len(F), dtype=int)
+    fronts: List[List[int]] = []
+
+    for i in _sum_order(F):
+        row = F[i]
+        # Fronts only get harder to enter: find the first without a dominator
+        k = 0
+        while k < len(fronts) and _dominated_by_any(F[fronts[k]], row):
+            k += 1
+        if k == len(fronts):
+            fronts.append([])
+        fronts[k].append(i)
+        ranks[i] = k
+
+    return ranks
+
+
+def non_dominated_mask(F: np.ndarray) -> np.ndarray:
+    """
+    Mark the Pareto-optimal points of an outcome matrix.
+
+    Args:
+        F: n x k outcome matrix (maximized)
+
+    Returns:
+        Boolean array, True where no other point dominates the row
+    """
+    F = np.asarray(F, dtype=float)
+    mask = np.zeros(len(F), dtype=bool)
+    front: List[int] = []
+
+    for i in _sum_order(F):
+        if not front or not _dominated_by_any(F[front], F[i]):
+            front.append(i)
+            mask[i] = True
+
+    return mask
+
+
+def crowding_distance(F: np.ndarray) -> np.ndarray:
+    """
+    NSGA-II crowding distance of the points in one front.
+
+    Boundary points of each objective get infinity; interior points get the
+    normalized side lengths of the cuboid spanned by their neighbours.
+
+    Args:
+        F: n x k outcome matrix of a single front
+
+    Returns:
+        Float array of crowding distances
+    """
+    F = np.asarray(F, dtype=float)
+    n = len(F)
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+
+    for column in F.T:
+        order = np.argsort(column, kind="stable")
+        values = column[order]
+        distance[order[0]] = distance[order[-1]] = np.inf
+        span = values[-1] - values[0]
+        if span > 0:
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+
+    return distance
+
+
+def pareto_front(
+    items: Sequence[Any],
+    key: Callable[[Any], Dict[str, float]] = lambda item: item.outcomes,
+) -> List[Any]:
+    """
+    Return the non-dominated items, in input order.
+
+    Args:
+        items: Items carrying outcome dicts (e.g. ParetoPoint)
+        key: Extracts the outcome dict of an item
+
+    Returns:
+        Items that no other item dominates
+    """
+    if not items:
+        return []
+    F, _ = outcome_matrix([key(item) for item in items])
+    mask = non_dominated_mask(F)
+    return [item for item, keep in zip(items, mask) if keep]
+
+
+class ParetoArchive:
+    """
+    Non-dominated archive updated one outcome at a time.
+
+    insert() compares the new point against the current front only: it is
+    rejected if a member dominates it, otherwise members it dominates are
+    dropped. The archive always equals the first front of everything
+    inserted so far, with members kept in insertion order.
+    """
+
+    def __init__(self, objectives: Optional[Sequence[str]] = None):
+        """
+        Initialize archive.
+
+        Args:
+            objectives: Objective names (default: learned from inserted
+                outcomes; new names extend the matrix with 0.0)
+        """
+        self.objectives: List[str] = list(objectives or [])
+        self._F = np.zeros((0, len(self.objectives)))
+        self._items: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, outcomes: Dict[str, float], item: Any = None) -> bool:
+        """
+        Insert a point if it is non-dominated.
+
+        Args:
+            outcomes: Objective values of the point
+            item: Payload returned by items() (default: outcomes)
+
+        Returns:
+            True if the point joined the front
+        """
+        for name in outcomes:
+            if name not in self.objectives:
+                self.objectives.append(name)
+                self._F = np.hstack([self._F, np.zeros((len(self._F), 1))])
+        row = np.array([outcomes.get(name, 0.0) for name in self.objectives])
+
+        if len(self._items):
+            if _dominated_by_any(self._F, row):
+                return False
+            dominated = np.all(row >= self._F, axis=1) & np.any(row > self._F, axis=1)
+            if dominated.any():
+                keep = ~dominated
+                self._F = self._F[keep]
+                self._items = [m for m, k in zip(self._items, keep) if k]
+
+        self._F = np.vstack([self._F, row])
+        self._items.append(outcomes if item is None else item)
+        return True
+
+    def extend(self, points: Iterable[Tuple[Dict[str, float], Any]]) -> int:
+        """Insert (outcomes, item) pairs; return how many joined the front."""
+        return sum(self.insert(outcomes, item) for outcomes, item in points)
+
+    def items(self) -> List[Any]:
+        """Front members in insertion order."""
+        return list(self._items)
+
+    def matrix(self) -> np.ndarray:
+        """Outcome matrix of the front (rows match items())."""
+        return self._F.copy()
+
+    def crowding_distances(self) -> np.ndarray:
+        """Crowding distance of each front member (see crowding_distance)."""
+        return crowding_distance(self._F)
+
+    def clear(self) -> None:
+        """Remove every member."""
+        self._F = np.zeros((0, len(self.objectives)))
+        self._items = []
@@ -14,6 +14,7 @@ import os
 import sys
 import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Callable
 from abc import ABC, abstractmethod
@@ -22,6 +23,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.config import FullConfig, VectorCodec, FrameworkConfig, PromptConfig
 from core.prompt_builder import PromptBuilder
+from core.response_cache import ResponseCache
 from core.verilingua import score_all_frames, aggregate_frame_score
 from core.verix import VerixParser, VerixValidator
 from optimization.telemetry_schema import ExecutionTelemetry, TelemetryStore
@@ -120,6 +122,10 @@ class LLMRuntime(ABC):
         """Execute a prompt and return result."""
         pass
 
+    def execute_many(self, prompts: List[str]) -> List[ExecutionResult]:
+        """Execute prompts and return results in the same order."""
+        return [self.execute(prompt) for prompt in prompts]
+
 
 class MockRuntime(LLMRuntime):
     """Mock runtime for testing without API calls."""
@@ -157,15 +163,38 @@ Response generated for prompt of length {len(prompt)} characters.
 class AnthropicRuntime(LLMRuntime):
     """Real Anthropic API runtime."""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-haiku-20240307"):
-        """Initialize with API key and model."""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "claude-3-haiku-20240307",
+        max_concurrency: int = 4,
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False,
+    ):
+        """
+        Initialize with API key and model.
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            model: Model to use
+            max_concurrency: Max API calls in flight in execute_many()
+            cache: ResponseCache for identical requests (None = no caching)
+            bypass_cache: Skip cache lookups but still store fresh responses
+        """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache
+        self.bypass_cache = bypass_cache
         self._client = None
 
     @property
     def client(self):
         """Lazy-init Anthropic client."""
+        return self._ensure_client()
+
+    def _ensure_client(self):
+        """Create the Anthropic client if it does not exist yet."""
         if self._client is None:
             try:
                 import anthropic
@@ -175,20 +204,39 @@ class AnthropicRuntime(LLMRuntime):
         return self._client
 
     def execute(self, prompt: str) -> ExecutionResult:
-        """Execute via Anthropic API."""
+        """Execute via Anthropic API (or the response cache)."""
         start = time.time()
+        params = {
+            "model": self.model,
+            "max_tokens": 1024,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key({"provider": "anthropic-messages", **params})
+            entry = None if self.bypass_cache else self.cache.get(cache_key)
+            if entry is not None:
+                return ExecutionResult(
+                    response=entry["response"],
+                    tokens_used=entry["output_tokens"],
+                    latency_ms=int((time.time() - start) * 1000),
+                    success=True,
+                )
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            response = self.client.messages.create(**params)
 
             latency = int((time.time() - start) * 1000)
             text = response.content[0].text
             tokens = response.usage.output_tokens
 
+            if cache_key is not None:
+                self.cache.put(cache_key, {
+                    "response": text,
+                    "input_tokens": response.usage.input_tokens,
+                    "output_tokens": tokens,
+                })
+
             return ExecutionResult(
                 response=text,
                 tokens_used=tokens,
@@ -205,6 +253,15 @@ class AnthropicRuntime(LLMRuntime):
                 error=str(e),
             )
 
+    def execute_many(self, prompts: List[str]) -> List[ExecutionResult]:
+        """Execute prompts with up to max_concurrency API calls in flight."""
+        if self.max_concurrency == 1 or len(prompts) < 2:
+            return super().execute_many(prompts)
+        # Create the shared client up front so worker threads don't race to build it
+        self._ensure_client()
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(prompts))) as pool:
+            return list(pool.map(self.execute, prompts))
+
 
 class TaskGrader:
     """Grade task outputs for accuracy."""
@@ -305,18 +362,30 @@ class RealTaskEvaluator:
             Complete EvaluationResult with all metrics
         """
         # 1. Build prompt with config
+        full_prompt = self._build_prompt(config, task)
+
+        # 2. Execute via runtime
+        execution = self.runtime.execute(full_prompt)
+
+        return self._score(config, task, execution)
+
+    def _build_prompt(self, config: FullConfig, task: Task) -> str:
+        """Build the full prompt for a task."""
         builder = PromptBuilder(config)
         prompt_parts = builder.build(task.prompt, task.task_type)
 
         # Handle tuple return from builder
         if isinstance(prompt_parts, tuple):
-            full_prompt = "\n".join(prompt_parts)
-        else:
-            full_prompt = prompt_parts
-
-        # 2. Execute via runtime
-        execution = self.runtime.execute(full_prompt)
+            return "\n".join(prompt_parts)
+        return prompt_parts
 
+    def _score(
+        self,
+        config: FullConfig,
+        task: Task,
+        execution: ExecutionResult,
+    ) -> EvaluationResult:
+        """Score an execution and store its telemetry."""
         # 3. Score frame compliance
         frame_scores = {}
         frame_compliance = 0.0
@@ -374,8 +443,19 @@ class RealTaskEvaluator:
         config: FullConfig,
         tasks: List[Task]
     ) -> List[EvaluationResult]:
-        """Evaluate multiple tasks with same config."""
-        return [self.evaluate(config, task) for task in tasks]
+        """
+        Evaluate multiple tasks with same config.
+
+        Prompts are built up front and executed together through
+        runtime.execute_many() (concurrent for AnthropicRuntime); scoring
+        and telemetry then run in task order.
+        """
+        prompts = [self._build_prompt(config, task) for task in tasks]
+        executions = self.runtime.execute_many(prompts)
+        return [
+            self._score(config, task, execution)
+            for task, execution in zip(tasks, executions)
+        ]
 
     def compare_configs(
         self,
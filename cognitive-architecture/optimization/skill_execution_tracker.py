@@ -11,9 +11,9 @@ Every execution of a VERIX/VERILINGUA skill is a learning opportunity:
 This creates a CONTINUOUS IMPROVEMENT LOOP that runs inside Claude Code.
 """
 
+import logging
 import os
 import sys
-import json
 import time
 import hashlib
 from dataclasses import dataclass, field
@@ -29,6 +29,9 @@ from optimization.globalmoo_client import (
     GlobalMOOClient, OptimizationOutcome, ParetoPoint,
     Objective, ObjectiveDirection
 )
+from optimization.execution_store import ExecutionStore
+
+logger = logging.getLogger(__name__)
 
 
 class ExecutionType(Enum):
@@ -120,8 +123,20 @@ class SkillExecutionTracker:
     - Per-skill optimal configurations
     - GlobalMOO project for optimization
     - VERIX compliance analysis
+
+    History and per-skill configs live in an ExecutionStore (SQLite, WAL),
+    so parallel hook processes can track executions into the same
+    storage_dir and every event costs one small transaction.
     """
 
+    # Exponential moving average factor for avg_compliance
+    COMPLIANCE_EMA_ALPHA = 0.3
+
+    # get_top_performing() scoring
+    MIN_EXECUTIONS_FOR_RANKING = 3
+    SUCCESS_WEIGHT = 0.6
+    COMPLIANCE_WEIGHT = 0.4
+
     def __init__(
         self,
         storage_dir: Optional[Path] = None,
@@ -138,19 +153,20 @@ class SkillExecutionTracker:
         self.verix_parser = VerixParser(PromptConfig())
         self.verix_validator = VerixValidator(PromptConfig())
 
-        # Storage files
-        self.history_file = self.storage_dir / "execution_history.jsonl"
-        self.configs_file = self.storage_dir / "skill_configs.json"
+        # Storage (legacy JSON files are imported into the store on open)
+        self.db_file = self.storage_dir / ExecutionStore.DB_FILE
+        self.history_file = self.storage_dir / ExecutionStore.LEGACY_HISTORY
+        self.configs_file = self.storage_dir / ExecutionStore.LEGACY_CONFIGS
         self.pareto_file = self.storage_dir / "pareto_frontier.json"
+        self.store = ExecutionStore(self.db_file)
 
         # In-memory state
-        self._skill_configs: Dict[str, SkillConfig] = {}
         self._active_executions: Dict[str, ExecutionRecord] = {}
 
         # GlobalMOO project
         self._project_id: Optional[str] = None
 
-        # Load existing configs
+        # Import configs/history written by older versions
         self._load_configs()
 
     def setup_project(self, name: str = "skill-execution-optimizer") -> str:
@@ -245,12 +261,9 @@ class SkillExecutionTracker:
         if claims:
             record.verix_compliance = self.verix_validator.compliance_score(claims)
 
-        # Save to history
+        # Save to history and update skill config (one transaction)
         self._save_execution(record)
 
-        # Update skill config
-        self._update_skill_config(record)
-
         # Report to GlobalMOO
         self._report_to_moo(record)
 
@@ -266,10 +279,9 @@ class SkillExecutionTracker:
 
         Uses learned configuration if available, otherwise defaults.
         """
-        key = f"{execution_type.value}:{name}"
-
-        if key in self._skill_configs:
-            return self._skill_configs[key].optimal_config
+        skill_config = self._get_skill_config(execution_type, name)
+        if skill_config is not None:
+            return skill_config.optimal_config
 
         # Try GlobalMOO suggestion
         if self._project_id and self.moo._mock_cases:
@@ -335,36 +347,33 @@ class SkillExecutionTracker:
         )
 
     def _save_execution(self, record: ExecutionRecord) -> None:
-        """Save execution to history file."""
-        with open(self.history_file, "a") as f:
-            f.write(json.dumps(record.to_dict()) + "\n")
-
-    def _update_skill_config(self, record: ExecutionRecord) -> None:
-        """Update skill configuration based on execution result."""
+        """Append execution to history and update its skill config."""
         key = f"{record.execution_type.value}:{record.name}"
-
-        if key not in self._skill_configs:
-            self._skill_configs[key] = SkillConfig(
-                name=record.name,
-                execution_type=record.execution_type,
-                optimal_config=VectorCodec.decode(record.config_vector),
-            )
-
-        config = self._skill_configs[key]
-        config.execution_count += 1
-        if record.success:
-            config.success_count += 1
-
-        # Update rolling average compliance
-        alpha = 0.3  # Exponential moving average factor
-        config.avg_compliance = (
-            alpha * record.verix_compliance +
-            (1 - alpha) * config.avg_compliance
+        self.store.record_execution(
+            key,
+            record.to_dict(),
+            # Stored as the optimal config the first time the key is seen
+            VectorCodec.encode(VectorCodec.decode(record.config_vector)),
+            alpha=self.COMPLIANCE_EMA_ALPHA,
+            updated_at=time.time(),
         )
-        config.last_updated = time.time()
 
-        # Save configs
-        self._save_configs()
+    def _get_skill_config(self, execution_type: ExecutionType, name: str) -> Optional[SkillConfig]:
+        """Load one skill config from the store."""
+        row = self.store.get_config(f"{execution_type.value}:{name}")
+        return self._skill_config_from_row(row) if row else None
+
+    @staticmethod
+    def _skill_config_from_row(row: Dict[str, Any]) -> SkillConfig:
+        return SkillConfig(
+            name=row["name"],
+            execution_type=ExecutionType(row["execution_type"]),
+            optimal_config=VectorCodec.decode(row["config_vector"]),
+            execution_count=row["execution_count"],
+            success_count=row["success_count"],
+            avg_compliance=row["avg_compliance"],
+            last_updated=row["last_updated"],
+        )
 
     def _report_to_moo(self, record: ExecutionRecord) -> None:
         """Report execution outcome to GlobalMOO."""
@@ -383,44 +392,32 @@ class SkillExecutionTracker:
 
         self.moo.report_outcome(self._project_id, outcome)
 
-    def _save_configs(self) -> None:
-        """Save skill configs to file."""
-        data = {}
-        for key, config in self._skill_configs.items():
-            data[key] = {
-                "name": config.name,
-                "execution_type": config.execution_type.value,
-                "optimal_config_vector": VectorCodec.encode(config.optimal_config),
-                "execution_count": config.execution_count,
-                "success_count": config.success_count,
-                "avg_compliance": config.avg_compliance,
-                "last_updated": config.last_updated,
-            }
-
-        with open(self.configs_file, "w") as f:
-            json.dump(data, f, indent=2)
-
     def _load_configs(self) -> None:
-        """Load skill configs from file."""
-        if not self.configs_file.exists():
-            return
-
+        """Import skill_configs.json / execution_history.jsonl from older versions."""
         try:
-            with open(self.configs_file) as f:
-                data = json.load(f)
-
-            for key, config_data in data.items():
-                self._skill_configs[key] = SkillConfig(
-                    name=config_data["name"],
-                    execution_type=ExecutionType(config_data["execution_type"]),
-                    optimal_config=VectorCodec.decode(config_data["optimal_config_vector"]),
-                    execution_count=config_data["execution_count"],
-                    success_count=config_data["success_count"],
-                    avg_compliance=config_data["avg_compliance"],
-                    last_updated=config_data["last_updated"],
-                )
-        except Exception:
-            pass
+            self.store.migrate_legacy(self.storage_dir)
+        except Exception as e:
+            # Claims left behind are retried once stale
+            logger.warning(f"Could not import legacy tracker files: {e}")
+
+    def get_execution_history(
+        self,
+        execution_type: Optional[ExecutionType] = None,
+        name: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: Optional[int] = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Recorded executions, newest first.
+
+        Args:
+            execution_type: With name, restrict to one skill/command/playbook
+            name: Skill/command/playbook name
+            since: Only executions at or after this timestamp
+            limit: Maximum records (None = all)
+        """
+        key = f"{execution_type.value}:{name}" if execution_type and name else None
+        return self.store.history(key=key, since=since, limit=limit)
 
     def get_pareto_frontier(self) -> List[ParetoPoint]:
         """Get current Pareto frontier."""
@@ -469,33 +466,24 @@ class SkillExecutionTracker:
 
     def stats(self) -> Dict[str, Any]:
         """Get tracker statistics."""
-        total_executions = sum(c.execution_count for c in self._skill_configs.values())
-        total_success = sum(c.success_count for c in self._skill_configs.values())
-
-        by_type = {}
-        for config in self._skill_configs.values():
-            t = config.execution_type.value
-            if t not in by_type:
-                by_type[t] = {"count": 0, "success": 0}
-            by_type[t]["count"] += config.execution_count
-            by_type[t]["success"] += config.success_count
+        summary = self.store.summary()
+        total_executions = summary["executions"]
 
         return {
-            "tracked_skills": len(self._skill_configs),
+            "tracked_skills": summary["tracked"],
             "total_executions": total_executions,
-            "overall_success_rate": total_success / total_executions if total_executions > 0 else 0,
-            "by_type": by_type,
+            "overall_success_rate": summary["successes"] / total_executions if total_executions > 0 else 0,
+            "by_type": summary["by_type"],
             "pareto_points": len(self.get_pareto_frontier()),
             "active_executions": len(self._active_executions),
         }
 
     def get_skill_stats(self, execution_type: ExecutionType, name: str) -> Optional[Dict[str, Any]]:
         """Get stats for a specific skill."""
-        key = f"{execution_type.value}:{name}"
-        if key not in self._skill_configs:
+        config = self._get_skill_config(execution_type, name)
+        if config is None:
             return None
 
-        config = self._skill_configs[key]
         return {
             "name": config.name,
             "execution_count": config.execution_count,
@@ -507,25 +495,24 @@ class SkillExecutionTracker:
 
     def get_top_performing(self, n: int = 10) -> List[Dict[str, Any]]:
         """Get top N performing skills by success rate and compliance."""
-        scored = []
-        for key, config in self._skill_configs.items():
-            if config.execution_count >= 3:  # Minimum executions
-                score = config.success_rate() * 0.6 + config.avg_compliance * 0.4
-                scored.append((score, key, config))
-
-        scored.sort(reverse=True)
+        rows = self.store.top_performing(
+            n,
+            min_executions=self.MIN_EXECUTIONS_FOR_RANKING,
+            success_weight=self.SUCCESS_WEIGHT,
+            compliance_weight=self.COMPLIANCE_WEIGHT,
+        )
 
         return [
             {
-                "key": key,
-                "name": config.name,
-                "type": config.execution_type.value,
-                "score": score,
-                "success_rate": config.success_rate(),
-                "avg_compliance": config.avg_compliance,
-                "executions": config.execution_count,
+                "key": row["key"],
+                "name": row["name"],
+                "type": row["execution_type"],
+                "score": row["score"],
+                "success_rate": row["success_count"] / row["execution_count"],
+                "avg_compliance": row["avg_compliance"],
+                "executions": row["execution_count"],
             }
-            for score, key, config in scored[:n]
+            for row in rows
         ]
 
 
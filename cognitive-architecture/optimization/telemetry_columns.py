@@ -0,0 +1,490 @@
+"""
+Columnar telemetry batches for analytics.
+
+Holds telemetry as NumPy columns instead of lists of dataclasses:
+- config: float64 matrix (n x 14), NaN-padded for missing or short vectors
+- outcomes: float64 matrix (n x k) named by outcome_names, NaN where absent
+- categoricals: dictionary-encoded int32 codes (task_type, mode, ...)
+- frame_mask: uint64 bitmask of active frames, bit i -> frame_names[i]
+
+Filtering (select/where/since) returns views that share the base arrays and
+carry only a row selection. Group-by, aggregation and correlation primitives
+run on the selected rows and are shared by TelemetryBatch, TelemetryAggregator
+and ImpactAnalyzer.
+"""
+
+import array
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import VectorCodec
+
+
+# Frame order of VectorCodec indices 0-6
+FRAME_NAMES = [
+    "evidential", "aspectual", "morphological",
+    "compositional", "honorific", "classifier", "spatial",
+]
+
+# Outcome columns derived from ExecutionTelemetry records
+EXECUTION_OUTCOMES = [
+    "aggregate_frame_score",
+    "verix_compliance_score",
+    "response_tokens",
+    "latency_ms",
+    "task_success",
+]
+
+MAX_FRAMES = 64
+
+
+class CategoricalColumn:
+    """Dictionary-encoded string column (codes index into categories)."""
+
+    __slots__ = ("codes", "categories", "_lookup")
+
+    def __init__(self, codes: np.ndarray, categories: List[Any]):
+        self.codes = codes
+        self.categories = categories
+        self._lookup = {c: i for i, c in enumerate(categories)}
+
+    @classmethod
+    def encode(cls, values: Iterable[Any]) -> "CategoricalColumn":
+        """Encode values; codes are assigned in order of first appearance."""
+        lookup: Dict[Any, int] = {}
+        codes = array.array("i")
+        for value in values:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(lookup)
+            codes.append(code)
+        return cls(np.frombuffer(codes, dtype=np.int32), list(lookup))
+
+    def code_of(self, value: Any) -> int:
+        """Code for a category value, or -1 if it never occurs."""
+        return self._lookup.get(value, -1)
+
+
+class TelemetryColumnsBuilder:
+    """
+    Incrementally builds TelemetryColumns from row-shaped input.
+
+    Rows are appended into compact array buffers, so streaming a large log
+    never materializes per-record objects.
+    """
+
+    def __init__(
+        self,
+        outcome_names: Optional[Sequence[str]] = None,
+        categorical_names: Sequence[str] = ("task_type",),
+        config_dims: int = VectorCodec.VECTOR_SIZE,
+    ):
+        self.config_dims = config_dims
+        self.fixed_outcomes = outcome_names is not None
+        self.outcome_names: List[str] = list(outcome_names or [])
+        self._outcome_index = {name: i for i, name in enumerate(self.outcome_names)}
+        self._outcomes: List[array.array] = [array.array("d") for _ in self.outcome_names]
+        self._config = array.array("d")
+        self._timestamps = array.array("d")
+        self._frame_mask = array.array("Q")
+        self.frame_names: List[str] = list(FRAME_NAMES)
+        self._frame_index = {name: i for i, name in enumerate(self.frame_names)}
+        self._categoricals: Dict[str, List[Any]] = {name: [] for name in categorical_names}
+        self._rows = 0
+
+    def add(
+        self,
+        config_vector: Sequence[float],
+        outcomes: Dict[str, Any],
+        categoricals: Optional[Dict[str, Any]] = None,
+        frames: Iterable[str] = (),
+        timestamp: float = float("nan"),
+    ) -> None:
+        """Append one row."""
+        nan = float("nan")
+        dims = self.config_dims
+        vector = list(config_vector[:dims])
+        if len(vector) < dims:
+            vector.extend([nan] * (dims - len(vector)))
+        self._config.extend(vector)
+
+        for name, value in outcomes.items():
+            idx = self._outcome_index.get(name)
+            if idx is None:
+                if self.fixed_outcomes:
+                    continue
+                idx = self._outcome_index[name] = len(self.outcome_names)
+                self.outcome_names.append(name)
+                self._outcomes.append(array.array("d", [nan] * self._rows))
+            self._outcomes[idx].append(nan if value is None else float(value))
+        for column in self._outcomes:
+            if len(column) == self._rows:
+                column.append(nan)
+
+        categoricals = categoricals or {}
+        for name, values in self._categoricals.items():
+            values.append(categoricals.get(name))
+
+        mask = 0
+        for frame in frames:
+            bit = self._frame_index.get(frame)
+            if bit is None:
+                if len(self.frame_names) >= MAX_FRAMES:
+                    continue
+                bit = self._frame_index[frame] = len(self.frame_names)
+                self.frame_names.append(frame)
+            mask |= 1 << bit
+        self._frame_mask.append(mask)
+
+        self._timestamps.append(timestamp)
+        self._rows += 1
+
+    def add_execution(self, data: Dict[str, Any]) -> None:
+        """Append an ExecutionTelemetry-shaped dict (as stored on disk)."""
+        success = data.get("task_success")
+        self.add(
+            data.get("config_vector") or [],
+            {
+                "aggregate_frame_score": data.get("aggregate_frame_score", 0.0),
+                "verix_compliance_score": data.get("verix_compliance_score", 0.0),
+                "response_tokens": data.get("response_tokens", 0),
+                "latency_ms": data.get("latency_ms", 0),
+                "task_success": None if success is None else float(success),
+            },
+            {
+                "task_type": data.get("task_type", "general"),
+                "outcome_signal": data.get("outcome_signal", "unknown"),
+            },
+            data.get("active_frames") or [],
+        )
+
+    def build(self) -> "TelemetryColumns":
+        n = self._rows
+        config = np.frombuffer(self._config, dtype=np.float64).reshape(n, self.config_dims)
+        if self._outcomes:
+            outcomes = np.column_stack(
+                [np.frombuffer(column, dtype=np.float64) for column in self._outcomes]
+            )
+        else:
+            outcomes = np.empty((n, 0))
+        return TelemetryColumns(
+            config=config,
+            outcomes=outcomes,
+            outcome_names=self.outcome_names,
+            categoricals={
+                name: CategoricalColumn.encode(values)
+                for name, values in self._categoricals.items()
+            },
+            frame_mask=np.frombuffer(self._frame_mask, dtype=np.uint64),
+            frame_names=self.frame_names,
+            timestamps=np.frombuffer(self._timestamps, dtype=np.float64),
+        )
+
+
+class TelemetryColumns:
+    """
+    Columnar telemetry batch with zero-copy filtered views.
+
+    Base arrays are never copied by filtering; a view only stores the row
+    indices it selects. Accessors return the base array itself for unfiltered
+    batches and gather selected rows otherwise.
+    """
+
+    def __init__(
+        self,
+        config: np.ndarray,
+        outcomes: np.ndarray,
+        outcome_names: List[str],
+        categoricals: Dict[str, CategoricalColumn],
+        frame_mask: np.ndarray,
+        frame_names: List[str],
+        timestamps: np.ndarray,
+        rows: Optional[np.ndarray] = None,
+    ):
+        self._config = config
+        self._outcomes = outcomes
+        self.outcome_names = list(outcome_names)
+        self._outcome_index = {name: i for i, name in enumerate(self.outcome_names)}
+        self._categoricals = categoricals
+        self._frame_mask = frame_mask
+        self.frame_names = list(frame_names)
+        self._timestamps = timestamps
+        self._rows = rows
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> "TelemetryColumns":
+        """Build from ExecutionTelemetry records."""
+        builder = TelemetryColumnsBuilder(
+            outcome_names=EXECUTION_OUTCOMES,
+            categorical_names=("task_type", "outcome_signal"),
+        )
+        for r in records:
+            builder.add(
+                r.config_vector,
+                {
+                    "aggregate_frame_score": r.aggregate_frame_score,
+                    "verix_compliance_score": r.verix_compliance_score,
+                    "response_tokens": r.response_tokens,
+                    "latency_ms": r.latency_ms,
+                    "task_success": None if r.task_success is None else float(r.task_success),
+                },
+                {"task_type": r.task_type, "outcome_signal": r.outcome_signal},
+                r.active_frames,
+            )
+        return builder.build()
+
+    @classmethod
+    def from_points(
+        cls,
+        points: Iterable[Any],
+        outcome_names: Optional[Sequence[str]] = None,
+    ) -> "TelemetryColumns":
+        """
+        Build from TelemetryPoint-like objects (config_vector, outcomes, task_type).
+
+        Args:
+            points: Telemetry points
+            outcome_names: Fixed outcome columns; discovered from the data if None
+        """
+        builder = TelemetryColumnsBuilder(
+            outcome_names=outcome_names,
+            categorical_names=("task_type", "mode"),
+        )
+        for p in points:
+            metadata = getattr(p, "metadata", None) or {}
+            builder.add(
+                p.config_vector,
+                p.outcomes,
+                {"task_type": p.task_type, "mode": metadata.get("mode")},
+                timestamp=getattr(p, "timestamp", float("nan")),
+            )
+        return builder.build()
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        if self._rows is None:
+            return len(self._timestamps)
+        return len(self._rows)
+
+    def _take(self, values: np.ndarray) -> np.ndarray:
+        if self._rows is None:
+            return values
+        return values[self._rows]
+
+    def row_indices(self) -> np.ndarray:
+        """Indices of the selected rows in the base arrays."""
+        if self._rows is None:
+            return np.arange(len(self._timestamps))
+        return self._rows
+
+    def select(self, selector: np.ndarray) -> "TelemetryColumns":
+        """
+        Return a view over a subset of rows.
+
+        Args:
+            selector: Boolean mask or integer indices relative to this view
+        """
+        selector = np.asarray(selector)
+        if selector.dtype == bool:
+            selector = np.flatnonzero(selector)
+        rows = selector if self._rows is None else self._rows[selector]
+        return TelemetryColumns(
+            self._config, self._outcomes, self.outcome_names, self._categoricals,
+            self._frame_mask, self.frame_names, self._timestamps, rows=rows,
+        )
+
+    def where(self, **equals: Any) -> "TelemetryColumns":
+        """View of rows whose categorical columns equal the given values."""
+        mask = np.ones(len(self), dtype=bool)
+        for name, value in equals.items():
+            column = self._categoricals[name]
+            mask &= self._take(column.codes) == column.code_of(value)
+        return self.select(mask)
+
+    def since(self, timestamp: float) -> "TelemetryColumns":
+        """View of rows with timestamp >= the given value."""
+        return self.select(self.timestamps() >= timestamp)
+
+    # ------------------------------------------------------------------
+    # Column access
+    # ------------------------------------------------------------------
+
+    def config_matrix(self, dims: Optional[int] = None) -> np.ndarray:
+        config = self._take(self._config)
+        return config if dims is None else config[:, :dims]
+
+    def outcome_matrix(self, names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Outcome values (NaN where absent) for the given names, in order."""
+        outcomes = self._take(self._outcomes)
+        if names is None:
+            return outcomes
+        n = len(self)
+        columns = [
+            outcomes[:, self._outcome_index[name]] if name in self._outcome_index
+            else np.full(n, np.nan)
+            for name in names
+        ]
+        return np.column_stack(columns) if columns else np.empty((n, 0))
+
+    def outcome(self, name: str) -> np.ndarray:
+        return self.outcome_matrix([name])[:, 0]
+
+    def categorical(self, name: str) -> Tuple[np.ndarray, List[Any]]:
+        """(codes, categories) for a dictionary-encoded column."""
+        column = self._categoricals[name]
+        return self._take(column.codes), column.categories
+
+    def timestamps(self) -> np.ndarray:
+        return self._take(self._timestamps)
+
+    def frame_mask(self) -> np.ndarray:
+        return self._take(self._frame_mask)
+
+    # ------------------------------------------------------------------
+    # Aggregation primitives
+    # ------------------------------------------------------------------
+
+    def value_counts(self, name: str) -> Dict[Any, int]:
+        """Count rows per category value (categories with zero rows omitted)."""
+        codes, categories = self.categorical(name)
+        counts = np.bincount(codes, minlength=len(categories))
+        return {categories[i]: int(c) for i, c in enumerate(counts) if c}
+
+    def frame_usage(self) -> Dict[str, int]:
+        """Count how often each frame name appears in active_frames."""
+        mask = self.frame_mask()
+        usage = {}
+        for bit, frame in enumerate(self.frame_names):
+            count = int(np.count_nonzero(mask & np.uint64(1 << bit)))
+            if count:
+                usage[frame] = count
+        return usage
+
+    def cluster_codes(self) -> Tuple[np.ndarray, List[str]]:
+        """
+        Group rows by VectorCodec.cluster_key without decoding each vector.
+
+        Raises:
+            ValueError: If any row lacks a full 14-dim config vector
+        """
+        config = self.config_matrix(VectorCodec.VECTOR_SIZE)
+        if np.isnan(config).any():
+            raise ValueError(
+                f"Vector must have {VectorCodec.VECTOR_SIZE} dimensions"
+            )
+
+        frames = config[:, :len(FRAME_NAMES)] >= 0.5
+        strict = np.clip(np.round(config[:, VectorCodec.IDX_VERIX_STRICTNESS]), 0, 2).astype(np.int64)
+        compress = np.clip(np.round(config[:, VectorCodec.IDX_COMPRESSION_LEVEL]), 0, 2).astype(np.int64)
+        bits = frames.astype(np.int64) @ (1 << np.arange(len(FRAME_NAMES), dtype=np.int64))
+        packed = bits | (strict << 7) | (compress << 9)
+
+        uniques, first_index, codes = np.unique(packed, return_index=True, return_inverse=True)
+        # Label order follows first appearance, like dict insertion
+        order = np.argsort(first_index, kind="stable")
+        remap = np.empty_like(order)
+        remap[order] = np.arange(len(order))
+
+        labels = []
+        for key in uniques[order]:
+            key = int(key)
+            active = sorted(f for i, f in enumerate(FRAME_NAMES) if key & (1 << i))
+            frames_str = "+".join(active) if active else "none"
+            labels.append(f"frames:{frames_str}|strict:{(key >> 7) & 3}|compress:{(key >> 9) & 3}")
+        return remap[codes.reshape(-1)], labels
+
+    def group_sums(
+        self,
+        codes: np.ndarray,
+        n_groups: int,
+        names: Optional[Sequence[str]] = None,
+        missing_as_zero: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-group outcome sums and row counts.
+
+        Args:
+            codes: Group code per selected row (0..n_groups-1)
+            n_groups: Number of groups
+            names: Outcome columns (all if None)
+            missing_as_zero: Treat NaN as 0 (else NaN rows are excluded per column)
+
+        Returns:
+            (sums [n_groups x k], counts [n_groups] or [n_groups x k])
+        """
+        values = self.outcome_matrix(names)
+        missing = np.isnan(values)
+        values = np.where(missing, 0.0, values)
+        sums = np.column_stack([
+            np.bincount(codes, weights=values[:, j], minlength=n_groups)
+            for j in range(values.shape[1])
+        ]) if values.shape[1] else np.zeros((n_groups, 0))
+
+        if missing_as_zero:
+            counts = np.bincount(codes, minlength=n_groups)
+        else:
+            present = (~missing).astype(np.float64)
+            counts = np.column_stack([
+                np.bincount(codes, weights=present[:, j], minlength=n_groups)
+                for j in range(values.shape[1])
+            ]) if values.shape[1] else np.zeros((n_groups, 0))
+        return sums, counts
+
+    def correlate(
+        self,
+        n_configs: int = VectorCodec.VECTOR_SIZE,
+        names: Optional[Sequence[str]] = None,
+        min_count: int = 10,
+    ) -> np.ndarray:
+        """
+        Pearson correlation of each config dim with each outcome.
+
+        Rows missing an outcome are excluded for that outcome only. Cells
+        with fewer than min_count rows or a constant input are 0.0.
+
+        Returns:
+            n_configs x n_outcomes matrix
+        """
+        x_all = self.config_matrix(n_configs)
+        y_all = self.outcome_matrix(names)
+        result = np.zeros((n_configs, y_all.shape[1]))
+        if not y_all.shape[1]:
+            return result
+
+        # Outcomes sharing a presence mask share one centered config matrix
+        present = ~np.isnan(y_all)
+        packed = np.packbits(present, axis=0)
+        patterns: Dict[bytes, List[int]] = {}
+        for j in range(y_all.shape[1]):
+            patterns.setdefault(packed[:, j].tobytes(), []).append(j)
+
+        for outcome_idx in patterns.values():
+            mask = present[:, outcome_idx[0]]
+            if mask.sum() < min_count:
+                continue
+
+            x = x_all if mask.all() else x_all[mask]
+            y = y_all[:, outcome_idx] if mask.all() else y_all[np.ix_(mask, outcome_idx)]
+            x_centered = x - x.mean(axis=0)
+            y_centered = y - y.mean(axis=0)
+
+            ss_x = np.einsum("ij,ij->j", x_centered, x_centered)
+            ss_y = np.einsum("ij,ij->j", y_centered, y_centered)
+            valid = (ss_x[:, None] > 0) & (ss_y[None, :] > 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r = (x_centered.T @ y_centered) / np.sqrt(np.outer(ss_x, ss_y))
+            result[:, outcome_idx] = np.where(valid, np.clip(r, -1.0, 1.0), 0.0)
+
+        return result
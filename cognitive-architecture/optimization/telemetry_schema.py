@@ -28,6 +28,12 @@ from enum import Enum
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import numpy  # noqa: F401  (TelemetryColumns backend)
+    COLUMNS_AVAILABLE = True
+except ImportError:
+    COLUMNS_AVAILABLE = False
+
 
 class TaskType(Enum):
     """Types of tasks for mode selection."""
@@ -150,22 +156,50 @@ class ExecutionTelemetry:
 
 @dataclass
 class TelemetryBatch:
-    """Batch of telemetry records for aggregation."""
+    """
+    Batch of telemetry records for aggregation.
+
+    Statistics, distributions and task-type filters run on a columnar view
+    (TelemetryColumns) built once per batch contents.
+    """
     records: List[ExecutionTelemetry] = field(default_factory=list)
     start_date: str = ""
     end_date: str = ""
+    _columns: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _columns_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
 
     def add(self, record: ExecutionTelemetry) -> None:
         """Add a record to the batch."""
         self.records.append(record)
+        self._version += 1
         if not self.start_date or record.timestamp < self.start_date:
             self.start_date = record.timestamp
         if not self.end_date or record.timestamp > self.end_date:
             self.end_date = record.timestamp
 
+    def columns(self):
+        """
+        Columnar view of the records, rebuilt after add(), after records is
+        replaced or resized, or after invalidate() for in-place edits.
+        """
+        key = (self._version, id(self.records), len(self.records))
+        if self._columns is None or self._columns_key != key:
+            from optimization.telemetry_columns import TelemetryColumns
+            self._columns = TelemetryColumns.from_records(self.records)
+            self._columns_key = key
+        return self._columns
+
+    def invalidate(self) -> None:
+        """Mark the records as changed (after editing the list in place)."""
+        self._version += 1
+
     def filter_by_task_type(self, task_type: str) -> List[ExecutionTelemetry]:
         """Get records for a specific task type."""
-        return [r for r in self.records if r.task_type == task_type]
+        if not COLUMNS_AVAILABLE:
+            return [r for r in self.records if r.task_type == task_type]
+        view = self.columns().where(task_type=task_type)
+        return [self.records[i] for i in view.row_indices()]
 
     def filter_successful(self) -> List[ExecutionTelemetry]:
         """Get only successful executions."""
@@ -176,22 +210,42 @@ class TelemetryBatch:
         if not self.records:
             return {}
 
-        successful = self.filter_successful()
+        n = len(self.records)
+        if COLUMNS_AVAILABLE:
+            columns = self.columns()
+            successful = int((columns.outcome("task_success") == 1.0).sum())
+            total = {
+                name: float(columns.outcome(name).sum())
+                for name in (
+                    "aggregate_frame_score", "verix_compliance_score",
+                    "response_tokens", "latency_ms",
+                )
+            }
+        else:
+            successful = len(self.filter_successful())
+            total = {
+                "aggregate_frame_score": sum(r.aggregate_frame_score for r in self.records),
+                "verix_compliance_score": sum(r.verix_compliance_score for r in self.records),
+                "response_tokens": sum(r.response_tokens for r in self.records),
+                "latency_ms": sum(r.latency_ms for r in self.records),
+            }
 
         return {
-            "total_records": len(self.records),
-            "successful_records": len(successful),
-            "success_rate": len(successful) / len(self.records) if self.records else 0,
-            "avg_frame_score": sum(r.aggregate_frame_score for r in self.records) / len(self.records),
-            "avg_verix_compliance": sum(r.verix_compliance_score for r in self.records) / len(self.records),
-            "avg_response_tokens": sum(r.response_tokens for r in self.records) / len(self.records),
-            "avg_latency_ms": sum(r.latency_ms for r in self.records) / len(self.records),
+            "total_records": n,
+            "successful_records": successful,
+            "success_rate": successful / n,
+            "avg_frame_score": total["aggregate_frame_score"] / n,
+            "avg_verix_compliance": total["verix_compliance_score"] / n,
+            "avg_response_tokens": total["response_tokens"] / n,
+            "avg_latency_ms": total["latency_ms"] / n,
             "task_type_distribution": self._task_type_distribution(),
             "frame_usage": self._frame_usage(),
         }
 
     def _task_type_distribution(self) -> Dict[str, int]:
         """Count records by task type."""
+        if COLUMNS_AVAILABLE:
+            return self.columns().value_counts("task_type")
         dist = {}
         for r in self.records:
             dist[r.task_type] = dist.get(r.task_type, 0) + 1
@@ -199,6 +253,8 @@ class TelemetryBatch:
 
     def _frame_usage(self) -> Dict[str, int]:
         """Count how often each frame is used."""
+        if COLUMNS_AVAILABLE:
+            return self.columns().frame_usage()
         usage = {}
         for r in self.records:
             for frame in r.active_frames:
@@ -210,45 +266,118 @@ class TelemetryStore:
     """
     Persistent storage for telemetry data.
 
-    Uses file-based storage with memory-mcp compatible structure.
+    Append-only segmented log: one compact JSONL segment per UTC day under
+    `segments/YYYY-MM-DD.jsonl`. The segment file name is the date index, so
+    range loads only open segments inside the requested window. store() is a
+    single O_APPEND write, safe for concurrent hook processes.
+
+    Stores created by older versions (one `telemetry_executions_*.json` file
+    per record) are migrated into segments on open.
     """
 
-    def __init__(self, base_path: Optional[str] = None):
+    SEGMENT_DIR = "segments"
+    SEGMENT_SUFFIX = ".jsonl"
+    LEGACY_PATTERN = "telemetry_executions_*.json"
+    STALE_CLAIM_SECONDS = 300  # Age after which a migration claim is orphaned
+
+    def __init__(self, base_path: Optional[str] = None, migrate_legacy: bool = True):
         """Initialize store with base path."""
         if base_path is None:
             base_path = os.path.expanduser("~/.claude/memory-mcp-data/telemetry")
         self.base_path = Path(base_path)
-        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.segment_path = self.base_path / self.SEGMENT_DIR
+        self.segment_path.mkdir(parents=True, exist_ok=True)
 
-    def store(self, record: ExecutionTelemetry) -> str:
-        """Store a telemetry record, return the key."""
-        key = record.memory_key()
-        file_path = self.base_path / f"{key.replace('/', '_')}.json"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if migrate_legacy:
+            self.migrate_legacy()
+
+    def _segment_file(self, date: str) -> Path:
+        return self.segment_path / f"{date}{self.SEGMENT_SUFFIX}"
 
-        with open(file_path, 'w') as f:
-            json.dump(record.to_dict(), f, indent=2)
+    def _append(self, records: List[ExecutionTelemetry]) -> None:
+        """Append records to their day segments, one write per segment."""
+        by_date: Dict[str, List[str]] = {}
+        for record in records:
+            line = json.dumps(record.to_dict(), separators=(",", ":")) + "\n"
+            by_date.setdefault(record.timestamp[:10], []).append(line)
 
-        return key
+        for date, lines in by_date.items():
+            # Unbuffered append: each segment gets a single write() call
+            with open(self._segment_file(date), "ab", buffering=0) as f:
+                f.write("".join(lines).encode("utf-8"))
+
+    def store(self, record: ExecutionTelemetry) -> str:
+        """Store a telemetry record, return the key."""
+        self._append([record])
+        return record.memory_key()
+
+    def store_many(self, records: List[ExecutionTelemetry]) -> List[str]:
+        """Store several records with one append per affected segment."""
+        self._append(records)
+        return [record.memory_key() for record in records]
+
+    def segment_dates(self, start_date: str = "", end_date: str = "\uffff") -> List[str]:
+        """List segment dates (YYYY-MM-DD) within [start_date, end_date], sorted."""
+        suffix_len = len(self.SEGMENT_SUFFIX)
+        dates = [
+            path.name[:-suffix_len]
+            for path in self.segment_path.glob(f"*{self.SEGMENT_SUFFIX}")
+        ]
+        return sorted(d for d in dates if start_date <= d <= end_date)
+
+    def iter_segment(self, date: str):
+        """Yield records from one day segment, skipping torn or corrupt lines."""
+        try:
+            f = open(self._segment_file(date), encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield ExecutionTelemetry.from_dict(json.loads(line))
+                except Exception:
+                    continue
 
     def load_range(self, start_date: str, end_date: str) -> TelemetryBatch:
         """Load all records in a date range."""
         batch = TelemetryBatch()
 
-        for file_path in self.base_path.glob("telemetry_executions_*.json"):
-            try:
-                with open(file_path) as f:
-                    data = json.load(f)
-                    record = ExecutionTelemetry.from_dict(data)
-
-                    # Filter by date
-                    if start_date <= record.timestamp[:10] <= end_date:
-                        batch.add(record)
-            except Exception:
-                continue
+        for date in self.segment_dates(start_date, end_date):
+            for record in self.iter_segment(date):
+                batch.add(record)
 
         return batch
 
+    def load_columns(self, start_date: str, end_date: str):
+        """
+        Load a date range straight into a TelemetryColumns batch.
+
+        Segment lines are parsed into column buffers without building
+        ExecutionTelemetry objects, so memory stays proportional to the
+        numeric columns.
+        """
+        from optimization.telemetry_columns import TelemetryColumnsBuilder, EXECUTION_OUTCOMES
+
+        builder = TelemetryColumnsBuilder(
+            outcome_names=EXECUTION_OUTCOMES,
+            categorical_names=("task_type", "outcome_signal"),
+        )
+        for date in self.segment_dates(start_date, end_date):
+            try:
+                f = open(self._segment_file(date), encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            with f:
+                for line in f:
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        continue
+                    builder.add_execution(data)
+        return builder.build()
+
     def load_last_n_days(self, days: int = 3) -> TelemetryBatch:
         """Load records from the last N days."""
         from datetime import timedelta
@@ -261,6 +390,76 @@ class TelemetryStore:
             end.strftime("%Y-%m-%d")
         )
 
+    def migrate_legacy(self, remove: bool = True) -> int:
+        """
+        Move one-file-per-record telemetry into day segments.
+
+        Each legacy file is claimed by renaming it first, so concurrent
+        processes opening the same store never migrate a record twice. The
+        file is touched just before the rename, so a claim's mtime is its
+        claim time: claims older than STALE_CLAIM_SECONDS were left by a
+        process that died mid-migration and are released and retried. A
+        retried record whose key is already in its day segment is not
+        appended again.
+
+        Args:
+            remove: Delete legacy files after migration (otherwise they are
+                kept with a `.migrated` suffix)
+
+        Returns:
+            Number of records migrated
+        """
+        stale_before = time.time() - self.STALE_CLAIM_SECONDS
+        for orphan in self.base_path.glob(self.LEGACY_PATTERN + ".migrating"):
+            try:
+                if orphan.stat().st_mtime < stale_before:
+                    orphan.rename(orphan.with_suffix(""))
+            except OSError:
+                continue  # Finished or released by another process
+
+        migrated = 0
+        day_keys: Dict[str, set] = {}  # Segment keys, read once per day
+        for file_path in sorted(self.base_path.glob(self.LEGACY_PATTERN)):
+            claimed = file_path.with_name(file_path.name + ".migrating")
+            try:
+                os.utime(file_path)
+                file_path.rename(claimed)
+            except OSError:
+                continue  # Claimed by another process
+
+            try:
+                with open(claimed) as f:
+                    record = ExecutionTelemetry.from_dict(json.load(f))
+            except FileNotFoundError:
+                continue
+            except Exception:
+                # Unreadable legacy file: leave it for inspection
+                self._finish_claim(claimed, file_path.name + ".corrupt")
+                continue
+
+            date = record.timestamp[:10]
+            if date not in day_keys:
+                day_keys[date] = {r.memory_key() for r in self.iter_segment(date)}
+            key = record.memory_key()
+            if key not in day_keys[date]:
+                self._append([record])
+                day_keys[date].add(key)
+                migrated += 1
+            self._finish_claim(claimed, None if remove else file_path.name + ".migrated")
+
+        return migrated
+
+    @staticmethod
+    def _finish_claim(claimed: Path, new_name: Optional[str]) -> None:
+        """Delete a migration claim, or rename it to new_name."""
+        try:
+            if new_name is None:
+                claimed.unlink()
+            else:
+                claimed.rename(claimed.with_name(new_name))
+        except FileNotFoundError:
+            pass  # Released as stale and finished by another process
+
 
 # Convenience functions for hook integration
 def create_telemetry_record(
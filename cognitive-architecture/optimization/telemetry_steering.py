@@ -30,11 +30,14 @@ from pathlib import Path
 from enum import Enum
 import logging
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from optimization.dspy_level1 import TelemetryAggregator, TelemetryPoint
 from modes.library import Mode, ModeLibrary, ModeType, BUILTIN_MODES
 from modes.selector import TaskDomain, TaskComplexity, ModeSelector, TaskContext
+from optimization.pareto import non_dominated_mask
 
 logger = logging.getLogger(__name__)
 
@@ -136,6 +139,11 @@ class TelemetrySteeringEngine:
 
     The engine maintains a performance database that maps
     (mode, domain) -> performance metrics.
+
+    Frontiers are maintained incrementally: an outcome only triggers a
+    full domain recompute when a frontier member gets worse in some
+    objective. Recommendations are memoized per domain until the domain
+    receives a new outcome.
     """
 
     # Minimum samples before trusting a mode's performance
@@ -173,8 +181,21 @@ class TelemetrySteeringEngine:
         # Performance database: (mode_name, domain) -> record
         self._performance_db: Dict[Tuple[str, str], ModePerformanceRecord] = {}
 
+        # Records per domain (mode_name -> record, in insertion order)
+        self._domain_records: Dict[str, Dict[str, ModePerformanceRecord]] = {}
+
         # Pareto frontiers per domain
         self._pareto_frontiers: Dict[str, List[ParetoPoint]] = {}
+        self._frontier_members: Dict[str, Set[str]] = {}
+
+        # Memoized recommendations, dropped when a domain changes
+        self._recommendation_cache: Dict[str, List[SteeringRecommendation]] = {}
+        self._steering_cache: Dict[Tuple[str, bool], Optional[SteeringRecommendation]] = {}
+
+        # Telemetry high-water mark: newest ingested timestamp and how many
+        # points with exactly that timestamp were ingested
+        self._ingest_mark: Optional[float] = None
+        self._ingest_mark_count = 0
 
         # Load existing data
         self._load_performance_db()
@@ -197,34 +218,66 @@ class TelemetrySteeringEngine:
             efficiency: Token efficiency (0.0 - 1.0)
             consistency: Epistemic consistency (0.0 - 1.0)
         """
-        key = (mode_name, domain)
+        record = self._get_record(mode_name, domain)
+        before = self._point(record) if record.sample_count >= self.MIN_SAMPLES_FOR_TRUST else None
 
-        if key not in self._performance_db:
-            self._performance_db[key] = ModePerformanceRecord(
-                mode_name=mode_name,
-                domain=domain,
-            )
-
-        self._performance_db[key].update(accuracy, efficiency, consistency)
+        record.update(accuracy, efficiency, consistency)
 
-        # Recalculate Pareto frontier for this domain
-        self._update_pareto_frontier(domain)
+        # Update the Pareto frontier for this domain
+        self._advance_frontier(record, before)
+        self._invalidate(domain)
 
         logger.debug(
             f"Recorded outcome for {mode_name}/{domain}: "
             f"acc={accuracy:.2f}, eff={efficiency:.2f}"
         )
 
+    def record_outcomes(
+        self,
+        outcomes: List[Tuple[str, str, float, float, float]],
+    ) -> None:
+        """
+        Record many outcomes, updating each touched frontier once.
+
+        Args:
+            outcomes: (mode_name, domain, accuracy, efficiency, consistency) tuples
+        """
+        domains = set()
+        for mode_name, domain, accuracy, efficiency, consistency in outcomes:
+            self._get_record(mode_name, domain).update(accuracy, efficiency, consistency)
+            domains.add(domain)
+
+        for domain in domains:
+            self._update_pareto_frontier(domain)
+            self._invalidate(domain)
+
     def ingest_telemetry(self) -> int:
         """
-        Ingest telemetry data into performance database.
+        Ingest new telemetry data into performance database.
+
+        Points are ingested as one batch, in timestamp order. A high-water
+        mark (saved with the performance database) skips points ingested
+        by earlier calls.
 
         Returns:
             Number of points ingested
         """
-        points = self.telemetry.get_points()
-        ingested = 0
+        points = self.telemetry.get_points(since=self._ingest_mark)
+        if self._ingest_mark is not None:
+            # get_points(since) includes the mark itself; skip the ties seen before
+            seen = self._ingest_mark_count
+            fresh = []
+            for point in points:
+                if point.timestamp == self._ingest_mark and seen > 0:
+                    seen -= 1
+                    continue
+                fresh.append(point)
+            points = fresh
+        if not points:
+            return 0
+        points = sorted(points, key=lambda p: p.timestamp)
 
+        outcomes = []
         for point in points:
             # Extract mode from config vector (need to decode)
             # For now, we'll use a heuristic based on config
@@ -234,14 +287,24 @@ class TelemetrySteeringEngine:
             domain = self._task_type_to_domain(point.task_type)
 
             # Extract outcomes
-            accuracy = point.outcomes.get("task_accuracy", 0.5)
-            efficiency = point.outcomes.get("token_efficiency", 0.5)
-            consistency = point.outcomes.get("epistemic_consistency", 0.5)
+            outcomes.append((
+                mode_name,
+                domain,
+                point.outcomes.get("task_accuracy", 0.5),
+                point.outcomes.get("token_efficiency", 0.5),
+                point.outcomes.get("epistemic_consistency", 0.5),
+            ))
+        self.record_outcomes(outcomes)
 
-            self.record_outcome(mode_name, domain, accuracy, efficiency, consistency)
-            ingested += 1
+        newest = points[-1].timestamp
+        ties = sum(1 for p in points if p.timestamp == newest)
+        if newest == self._ingest_mark:
+            self._ingest_mark_count += ties
+        else:
+            self._ingest_mark = newest
+            self._ingest_mark_count = ties
 
-        return ingested
+        return len(points)
 
     def _infer_mode_from_vector(self, vector: List[float]) -> str:
         """Infer mode name from config vector."""
@@ -275,30 +338,95 @@ class TelemetrySteeringEngine:
         }
         return mapping.get(task_type.lower(), "general")
 
+    def _get_record(self, mode_name: str, domain: str) -> ModePerformanceRecord:
+        """Record for (mode, domain), created on first use."""
+        key = (mode_name, domain)
+        record = self._performance_db.get(key)
+        if record is None:
+            record = ModePerformanceRecord(mode_name=mode_name, domain=domain)
+            self._performance_db[key] = record
+            self._domain_records.setdefault(domain, {})[mode_name] = record
+        return record
+
+    def _invalidate(self, domain: str) -> None:
+        """Drop memoized recommendations for a domain."""
+        self._recommendation_cache.pop(domain, None)
+        self._steering_cache.pop((domain, True), None)
+        self._steering_cache.pop((domain, False), None)
+
+    @staticmethod
+    def _point(record: ModePerformanceRecord) -> ParetoPoint:
+        return ParetoPoint(
+            mode_name=record.mode_name,
+            accuracy=record.avg_accuracy,
+            efficiency=record.avg_efficiency,
+            is_pareto_optimal=True,
+        )
+
     def _update_pareto_frontier(self, domain: str) -> None:
-        """Update Pareto frontier for a domain."""
+        """Recompute the Pareto frontier for a domain from scratch."""
         # Get all points for this domain
-        points = []
-        for (mode_name, d), record in self._performance_db.items():
-            if d == domain and record.sample_count >= self.MIN_SAMPLES_FOR_TRUST:
-                points.append(ParetoPoint(
-                    mode_name=mode_name,
-                    accuracy=record.avg_accuracy,
-                    efficiency=record.avg_efficiency,
-                ))
+        points = [
+            self._point(record)
+            for record in self._domain_records.get(domain, {}).values()
+            if record.sample_count >= self.MIN_SAMPLES_FOR_TRUST
+        ]
 
         if not points:
+            self._frontier_members[domain] = set()
             self._pareto_frontiers[domain] = []
             return
 
         # Calculate Pareto optimal points
-        for p in points:
-            p.is_pareto_optimal = not any(
-                other.dominates(p) for other in points if other != p
-            )
+        mask = non_dominated_mask(np.array([[p.accuracy, p.efficiency] for p in points]))
+        self._frontier_members[domain] = {p.mode_name for p, optimal in zip(points, mask) if optimal}
+        self._publish_frontier(domain)
+
+    def _advance_frontier(
+        self,
+        record: ModePerformanceRecord,
+        before: Optional[ParetoPoint],
+    ) -> None:
+        """
+        Update a domain frontier after one record changed.
+
+        Args:
+            record: The updated record
+            before: Its point before the update (None if it was untrusted)
+        """
+        if record.sample_count < self.MIN_SAMPLES_FOR_TRUST:
+            return  # Untrusted records never enter the frontier
+
+        domain = record.domain
+        members = self._frontier_members.setdefault(domain, set())
+        records = self._domain_records[domain]
+        point = self._point(record)
+
+        if record.mode_name in members:
+            if not (before is not None
+                    and point.accuracy >= before.accuracy
+                    and point.efficiency >= before.efficiency):
+                # A member got worse somewhere: it may uncover dominated modes
+                self._update_pareto_frontier(domain)
+                return
+        elif any(self._point(records[m]).dominates(point) for m in members):
+            return  # Still dominated: frontier unchanged
 
-        # Store frontier (Pareto optimal points sorted by accuracy)
-        frontier = [p for p in points if p.is_pareto_optimal]
+        # The point is (still) non-dominated: it joins and evicts what it dominates
+        members.difference_update(
+            [m for m in members if m != record.mode_name and point.dominates(self._point(records[m]))]
+        )
+        members.add(record.mode_name)
+        self._publish_frontier(domain)
+
+    def _publish_frontier(self, domain: str) -> None:
+        """Store the frontier list (Pareto optimal points sorted by accuracy)."""
+        members = self._frontier_members[domain]
+        frontier = [
+            self._point(record)
+            for mode_name, record in self._domain_records[domain].items()
+            if mode_name in members
+        ]
         frontier.sort(key=lambda p: p.accuracy, reverse=True)
         self._pareto_frontiers[domain] = frontier
 
@@ -317,14 +445,21 @@ class TelemetrySteeringEngine:
         Returns:
             Steering recommendation or None if insufficient data
         """
+        key = (domain, prefer_accuracy)
+        if key not in self._steering_cache:
+            self._steering_cache[key] = self._compute_steering_recommendation(domain, prefer_accuracy)
+        return self._steering_cache[key]
+
+    def _compute_steering_recommendation(
+        self,
+        domain: str,
+        prefer_accuracy: bool,
+    ) -> Optional[SteeringRecommendation]:
         frontier = self._pareto_frontiers.get(domain, [])
 
         if not frontier:
             # Check if we have any data for this domain
-            domain_records = [
-                r for (m, d), r in self._performance_db.items()
-                if d == domain
-            ]
+            domain_records = list(self._domain_records.get(domain, {}).values())
 
             if not domain_records:
                 return None
@@ -384,12 +519,15 @@ class TelemetrySteeringEngine:
         Returns:
             List of recommendations sorted by score
         """
-        recommendations = []
+        if domain not in self._recommendation_cache:
+            self._recommendation_cache[domain] = self._compute_recommendations(domain)
+        return list(self._recommendation_cache[domain])
 
-        for (mode_name, d), record in self._performance_db.items():
-            if d != domain:
-                continue
+    def _compute_recommendations(self, domain: str) -> List[SteeringRecommendation]:
+        recommendations = []
+        members = self._frontier_members.get(domain, set())
 
+        for mode_name, record in self._domain_records.get(domain, {}).items():
             # Calculate weighted score
             score = (
                 self.OBJECTIVE_WEIGHTS["accuracy"] * record.avg_accuracy +
@@ -398,10 +536,7 @@ class TelemetrySteeringEngine:
             )
 
             # Check Pareto optimality
-            frontier = self._pareto_frontiers.get(domain, [])
-            pareto_rank = 0 if any(
-                p.mode_name == mode_name for p in frontier
-            ) else 1
+            pareto_rank = 0 if mode_name in members else 1
 
             # Confidence based on samples
             confidence = min(1.0, record.sample_count / (self.MIN_SAMPLES_FOR_TRUST * 4))
@@ -468,6 +603,10 @@ class TelemetrySteeringEngine:
                 f"{k[0]}:{k[1]}": v.to_dict()
                 for k, v in self._performance_db.items()
             },
+            "ingest_mark": {
+                "timestamp": self._ingest_mark,
+                "count": self._ingest_mark_count,
+            },
             "saved_at": time.time(),
         }
 
@@ -489,10 +628,14 @@ class TelemetrySteeringEngine:
                 mode_name, domain = key_str.split(":", 1)
                 record = ModePerformanceRecord.from_dict(record_data)
                 self._performance_db[(mode_name, domain)] = record
+                self._domain_records.setdefault(domain, {})[mode_name] = record
+
+            mark = data.get("ingest_mark") or {}
+            self._ingest_mark = mark.get("timestamp")
+            self._ingest_mark_count = mark.get("count", 0)
 
             # Rebuild Pareto frontiers
-            domains = set(d for (_, d) in self._performance_db.keys())
-            for domain in domains:
+            for domain in self._domain_records:
                 self._update_pareto_frontier(domain)
 
             logger.info(f"Loaded {len(self._performance_db)} performance records")
@@ -391,6 +391,95 @@ def evaluate_config_14dim(x: np.ndarray) -> np.ndarray:
     ])
 
 
+def evaluate_population_5dim(X: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a population of 5-dimensional config vectors at once.
+
+    Array form of evaluate_config_5dim: same coefficients, same operation
+    order, with np.clip / np.minimum in place of min/max, so each row of the
+    result equals evaluate_config_5dim(X[i]) exactly.
+
+    Args:
+        X: (n, 5) matrix, one config vector per row (a single vector is
+            treated as n=1)
+
+    Returns:
+        (n, 4) matrix of negated objectives
+    """
+    X = np.asarray(X, dtype=float).reshape(-1, 5)
+    evidential = X[:, 0]
+    aspectual = X[:, 1]
+    strictness = X[:, 2]
+    compression = X[:, 3]
+    require_ground = X[:, 4]
+
+    frame_count = evidential + aspectual + 0.5
+
+    task_accuracy = BASE_ACCURACY + (frame_count * FRAME_ACCURACY_COEFFICIENT) + (strictness * STRICTNESS_ACCURACY_COEFFICIENT)
+    task_accuracy = np.minimum(task_accuracy, 0.98)
+
+    token_efficiency = BASE_EFFICIENCY - (frame_count * FRAME_EFFICIENCY_COST) - (strictness * STRICTNESS_EFFICIENCY_COST) + (compression * COMPRESSION_EFFICIENCY_GAIN)
+    token_efficiency = np.clip(token_efficiency, 0.3, 0.95)
+
+    edge_robustness = BASE_ROBUSTNESS + (evidential * EVIDENTIAL_ROBUSTNESS_GAIN) + (require_ground * GROUND_ROBUSTNESS_GAIN) + (strictness * 0.05)
+    edge_robustness = np.minimum(edge_robustness, 0.95)
+
+    epistemic_consistency = BASE_CONSISTENCY + (strictness * STRICTNESS_CONSISTENCY_GAIN) + (require_ground * CONFIDENCE_CONSISTENCY_GAIN) + (evidential * 0.1)
+    epistemic_consistency = np.minimum(epistemic_consistency, 0.95)
+
+    return -np.column_stack([task_accuracy, token_efficiency, edge_robustness, epistemic_consistency])
+
+
+def evaluate_population_14dim(X: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a population of 14-dimensional config vectors at once.
+
+    Array form of evaluate_config_14dim (see evaluate_population_5dim).
+
+    Args:
+        X: (n, 14) matrix, one config vector per row
+
+    Returns:
+        (n, 4) matrix of negated objectives
+    """
+    X = np.asarray(X, dtype=float).reshape(-1, 14)
+    evidential = X[:, 0]
+    aspectual = X[:, 1]
+    morphological = X[:, 2]
+    compositional = X[:, 3]
+    honorific = X[:, 4]
+    classifier = X[:, 5]
+    spatial = X[:, 6]
+    strictness = X[:, 7]
+    compression = X[:, 8]
+    require_ground = X[:, 9]
+    require_confidence = X[:, 10]
+    temperature = X[:, 11]
+    coherence_weight = X[:, 12]
+    evidence_weight = X[:, 13]
+
+    # Summed left to right (not X[:, :7].sum) to keep the scalar rounding
+    frame_count = evidential + aspectual + morphological + compositional + honorific + classifier + spatial
+
+    task_accuracy = 0.6 + (frame_count * 0.035) + (strictness * 0.06) + (evidence_weight * 0.08)
+    task_accuracy = task_accuracy + ((classifier * 0.03) + (evidential * 0.02))
+    task_accuracy = np.minimum(task_accuracy, 0.98)
+
+    token_efficiency = 0.95 - (frame_count * 0.055) - (strictness * 0.03) + (compression * 0.06)
+    token_efficiency = token_efficiency - ((morphological * 0.02) - (temperature * 0.02))
+    token_efficiency = np.clip(token_efficiency, 0.25, 0.95)
+
+    edge_robustness = 0.45 + (evidential * 0.15) + (require_ground * 0.18) + (spatial * 0.08)
+    edge_robustness = edge_robustness + ((strictness * 0.04) + (coherence_weight * 0.05))
+    edge_robustness = np.minimum(edge_robustness, 0.95)
+
+    epistemic_consistency = 0.35 + (strictness * 0.18) + (require_confidence * 0.15)
+    epistemic_consistency = epistemic_consistency + ((require_ground * 0.1) + (evidence_weight * 0.12) + (evidential * 0.05))
+    epistemic_consistency = np.minimum(epistemic_consistency, 0.95)
+
+    return -np.column_stack([task_accuracy, token_efficiency, edge_robustness, epistemic_consistency])
+
+
 # =============================================================================
 # PYMOO PROBLEM DEFINITIONS
 # =============================================================================
@@ -409,8 +498,7 @@ class CognitiveProblem5D(Problem):
 
     def _evaluate(self, X, out, *args, **kwargs):
         """Evaluate population."""
-        F = np.array([evaluate_config_5dim(x) for x in X])
-        out["F"] = F
+        out["F"] = evaluate_population_5dim(X)
 
 
 class CognitiveProblem14D(Problem):
@@ -427,8 +515,7 @@ class CognitiveProblem14D(Problem):
 
     def _evaluate(self, X, out, *args, **kwargs):
         """Evaluate population."""
-        F = np.array([evaluate_config_14dim(x) for x in X])
-        out["F"] = F
+        out["F"] = evaluate_population_14dim(X)
 
 
 # Alias for spec compatibility - use 14D as the main problem
@@ -658,7 +745,7 @@ def run_pymoo_refinement_stage(
     )
 
     # Seed with expanded Stage 1 solutions
-    seed_F = np.array([evaluate_config_14dim(x) for x in seed_X])
+    seed_F = evaluate_population_14dim(seed_X)
 
     result = minimize(
         problem,
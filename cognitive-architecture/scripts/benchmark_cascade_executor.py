@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark ThreeMOOCascade evaluation backends in mock mode.
+
+Runs the same seeded mock cascade on the serial, thread and process
+executors (corpus sharding on) and reports evaluations/s and speedup over
+serial. Mock evaluation is CPU-bound, so the process backend should scale
+with core count while threads stay near 1x. Results must match serial.
+
+Usage:
+    python scripts/benchmark_cascade_executor.py [--iterations N] [--tasks N] [--workers 2,4]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from optimization.cascade import ThreeMOOCascade  # noqa: E402
+from optimization.evaluation_executor import EvaluationExecutor  # noqa: E402
+
+TASK_TYPES = ["reasoning", "coding", "analysis", "creative", "default"]
+
+
+def run_cascade(executor, corpus, iterations):
+    random.seed(0)
+    cascade = ThreeMOOCascade(
+        use_mock=True,
+        core_corpus=corpus,
+        edge_corpus=corpus[:10],
+        executor=executor,
+    )
+    start = time.perf_counter()
+    results = cascade.run(max_iterations_per_phase=iterations, early_stop_threshold=1.1)
+    elapsed = time.perf_counter() - start
+    evaluations = sum(r.metadata["evaluation"]["evaluations"] for r in results)
+    return elapsed, evaluations, [(r.best_config_vector, r.best_outcomes) for r in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=5, help="Iterations per phase")
+    parser.add_argument("--tasks", type=int, default=30, help="Core corpus size")
+    parser.add_argument("--workers", default=None, help="Comma-separated worker counts (default: 2..cpu_count)")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    workers = (
+        [int(w) for w in args.workers.split(",")] if args.workers
+        else sorted({2, max(2, cpus // 2), max(2, cpus)})
+    )
+    corpus = [
+        {"id": str(i), "task": f"Task {i}: analyze the cache fix", "task_type": TASK_TYPES[i % 5]}
+        for i in range(args.tasks)
+    ]
+
+    print(f"CPUs: {cpus}")
+    print(f"{'backend':<8} {'workers':>7} {'wall s':>7} {'evals/s':>8} {'speedup':>8}")
+    base_time, evaluations, baseline = run_cascade(None, corpus, args.iterations)
+    print(f"{'serial':<8} {1:>7} {base_time:>7.2f} {evaluations / base_time:>8.1f} {1.0:>7.1f}x")
+
+    for backend in ("thread", "process"):
+        for count in workers:
+            with EvaluationExecutor(backend, max_workers=count, parallel_tasks=True) as executor:
+                elapsed, evaluations, results = run_cascade(executor, corpus, args.iterations)
+            if results != baseline:
+                raise SystemExit(f"{backend}/{count}: results differ from serial")
+            print(
+                f"{backend:<8} {count:>7} {elapsed:>7.2f} {evaluations / elapsed:>8.1f} "
+                f"{base_time / elapsed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark indexed contradiction detection against the pairwise scans.
+
+Builds synthetic research-style responses (distinct claims plus a few
+negated or retracted restatements) and times, per claim count:
+- ConsistencyChecker._check_confidence_contradictions
+- MetricCalculator._check_confidence_consistency
+each with the eval/similarity.py candidate indexes and with the original
+all-pairs loop. Also verifies that both return the same results.
+
+Usage:
+    python scripts/benchmark_claim_similarity.py [--sizes 100,400,1600] [--rounds N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from core.verix import State, create_claim  # noqa: E402
+from eval.consistency import ConsistencyChecker  # noqa: E402
+from eval.metrics import MetricCalculator  # noqa: E402
+
+
+def build_claims(count, seed=0):
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(2000)] + ["the", "a", "of", "is", "and"]
+    claims = []
+    while len(claims) < count:
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(6, 18))]
+        content = " ".join(words)
+        claims.append(create_claim(content, confidence=rng.random(), state=State.CONFIRMED))
+        roll = rng.random()
+        if roll < 0.05:
+            negated = " ".join(words[:3] + ["is not"] + words[3:])
+            claims.append(create_claim(negated, confidence=rng.random()))
+        elif roll < 0.08:
+            claims.append(create_claim(content, confidence=rng.random(), state=State.RETRACTED))
+    return claims[:count]
+
+
+def pairwise_violations(checker, claims):
+    keys = [(claim.content.lower(), claim.state) for claim in claims]
+    return [
+        (i, j)
+        for i in range(len(keys))
+        for j in range(i + 1, len(keys))
+        if checker._keys_contradict(keys[i], keys[j])
+        and claims[i].confidence + claims[j].confidence > 1.0
+    ]
+
+
+def pairwise_penalty(calculator, claims):
+    contents = [claim.content.lower() for claim in claims]
+    penalty = 1.0
+    for i in range(len(contents)):
+        for j in range(i + 1, len(contents)):
+            if calculator._contents_contradict(contents[i], contents[j]):
+                if claims[i].confidence + claims[j].confidence > 1.5:
+                    penalty *= 0.8
+    return penalty
+
+
+def best_seconds(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="100,400,1600", help="Comma-separated claim counts")
+    parser.add_argument("--rounds", type=int, default=3, help="Timing rounds (best is kept)")
+    args = parser.parse_args()
+
+    checker = ConsistencyChecker()
+    calculator = MetricCalculator()
+    mismatches = []
+
+    print(f"{'claims':>7} {'check':<12} {'pairwise ms':>12} {'indexed ms':>11} {'speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        claims = build_claims(size)
+
+        indexed = [tuple(v.claim_indices) for v in checker._check_confidence_contradictions(claims)]
+        if indexed != pairwise_violations(checker, claims):
+            mismatches.append(f"consistency / {size}")
+        if calculator._check_confidence_consistency(claims) != pairwise_penalty(calculator, claims):
+            mismatches.append(f"metrics / {size}")
+
+        variants = {
+            "consistency": (
+                lambda: pairwise_violations(checker, claims),
+                lambda: checker._check_confidence_contradictions(claims),
+            ),
+            "metrics": (
+                lambda: pairwise_penalty(calculator, claims),
+                lambda: calculator._check_confidence_consistency(claims),
+            ),
+        }
+        for name, (pairwise, indexed_fn) in variants.items():
+            before = best_seconds(pairwise, args.rounds) * 1000
+            after = best_seconds(indexed_fn, args.rounds) * 1000
+            print(f"{size:>7} {name:<12} {before:>12.1f} {after:>11.1f} {before / after:>7.1f}x")
+
+    if mismatches:
+        print(f"\n[WARN] Results differ for: {', '.join(mismatches)}")
+        sys.exit(1)
+    print("\nResults identical for all sizes.")
+
+
+if __name__ == "__main__":
+    main()
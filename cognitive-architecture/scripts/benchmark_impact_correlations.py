@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark ImpactAnalyzer correlation refreshes as telemetry grows.
+
+For a history of N points that receives a batch of M new points, compares:
+- percell: the original per-cell loop (np.corrcoef per config/outcome pair,
+  re-masking NaNs each time) over the whole history
+- columns: a full columnar recompute (TelemetryColumns.correlate)
+- stream: CorrelationAccumulator ingest of only the M new points, then the
+  O(dims x outcomes) matrix
+All three must agree to 1e-9.
+
+Usage:
+    python scripts/benchmark_impact_correlations.py [--sizes 10000,100000] [--batch 1000] [--percell-max 20000] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from optimization.correlation_accumulator import CorrelationAccumulator  # noqa: E402
+from optimization.dspy_level1 import TelemetryPoint  # noqa: E402
+from optimization.impact_analyzer import ImpactAnalyzer  # noqa: E402
+from optimization.telemetry_columns import TelemetryColumns  # noqa: E402
+
+NAMES = ImpactAnalyzer.OUTCOME_METRICS
+
+
+def make_points(n, rng):
+    points = []
+    for i in range(n):
+        vector = [float(rng.random() > 0.5) for _ in range(7)] + [float(rng.randint(0, 2))] * 2
+        vector += [float(rng.random() > 0.5), float(rng.random() > 0.5), 0.0, 0.0, 0.0]
+        outcomes = {m: rng.random() + 0.2 * vector[j % 11] for j, m in enumerate(NAMES) if rng.random() > 0.2}
+        points.append(TelemetryPoint(config_vector=vector, outcomes=outcomes, task_type="coding", timestamp=float(i)))
+    return points
+
+
+def percell(points):
+    """The original per-cell implementation."""
+    x_all = np.array([p.config_vector[:14] for p in points])
+    y_all = np.array([[p.outcomes.get(m, np.nan) for m in NAMES] for p in points])
+    result = np.zeros((14, len(NAMES)))
+    for i in range(14):
+        for j in range(len(NAMES)):
+            mask = ~np.isnan(y_all[:, j])
+            if mask.sum() < 10:
+                continue
+            x, y = x_all[mask, i], y_all[mask, j]
+            if x.std() == 0 or y.std() == 0:
+                continue
+            r = np.corrcoef(x, y)[0, 1]
+            result[i, j] = 0.0 if np.isnan(r) else r
+    return result
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="10000,100000", help="Comma-separated history sizes")
+    parser.add_argument("--batch", type=int, default=1000, help="New points per refresh")
+    parser.add_argument("--percell-max", type=int, default=20000, help="Largest history to run percell on")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    print(f"{'history':>9} {'new':>6} {'percell s':>10} {'columns s':>10} {'stream ms':>10} {'speedup':>8}")
+    for n in [int(s) for s in args.sizes.split(",")]:
+        points = make_points(n + args.batch, random.Random(args.seed))
+        history, new = points[:n], points[n:]
+
+        accumulator = CorrelationAccumulator(NAMES)
+        accumulator.update_points(history)
+
+        def stream():
+            accumulator.update_points(new)
+            return accumulator.correlation()
+
+        stream_time, streamed = timed(stream)
+        columns_time, expected = timed(
+            lambda: TelemetryColumns.from_points(points, NAMES).correlate(14, NAMES, min_count=10)
+        )
+        if not np.allclose(streamed, expected, atol=1e-9):
+            raise SystemExit(f"{n} points: streamed correlations differ from full recompute")
+
+        percell_text = f"{'-':>10}"
+        if n <= args.percell_max:
+            percell_time, reference = timed(percell, points)
+            if not np.allclose(reference, expected, atol=1e-9):
+                raise SystemExit(f"{n} points: columnar correlations differ from per-cell loop")
+            percell_text = f"{percell_time:>10.3f}"
+
+        print(
+            f"{n:>9} {args.batch:>6} {percell_text} {columns_time:>10.3f} "
+            f"{stream_time * 1000:>10.2f} {columns_time / stream_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark MemoryMCPClient fallback search and key listing.
+
+Compares, over N stored memories:
+- files: the original per-key JSON fallback (glob + json.load every file for
+  each search or key listing)
+- store: FallbackMemoryStore (SQLite, FTS5 BM25 search, key index), for
+  queries on common words (matching a large share of memories) and rare ones
+Both must return the same key set for an exact-word query.
+
+Usage:
+    python scripts/benchmark_memory_search.py [--sizes 1000,10000,100000] [--legacy-max 10000] [--seed S]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from optimization.mcp_fallback_store import FallbackMemoryStore  # noqa: E402
+
+# Zipf-distributed vocabulary: a few common domain words, a long tail of rare ones
+WORDS = [
+    "telemetry", "snapshot", "cascade", "pareto", "frontier", "mode", "config",
+    "verix", "frame", "evidential", "aspectual", "harness", "iteration", "policy",
+] + [f"term{i}" for i in range(5000)]
+WEIGHTS = [1.0 / (rank + 1) for rank in range(len(WORDS))]
+
+
+def make_records(n, rng):
+    for i in range(n):
+        yield (
+            f"ns/memory/{i:06d}",
+            {"text": " ".join(rng.choices(WORDS, WEIGHTS, k=12)), "index": i},
+            {"WHO": "benchmark", "WHY": rng.choice(WORDS[:14])},
+        )
+
+
+def legacy_search(directory, query, namespace):
+    """Original _fallback_search: load and re-serialize every file."""
+    query_words = set(query.lower().split())
+    matches = []
+    for filepath in directory.glob("*.json"):
+        with open(filepath, encoding="utf-8") as f:
+            data = json.load(f)
+        key = data.get("key", "")
+        if namespace and not key.startswith(namespace):
+            continue
+        content = json.dumps(data).lower()
+        score = sum(1 for word in query_words if word in content)
+        if score > 0:
+            matches.append(key)
+    return matches
+
+
+def legacy_keys(directory, prefix):
+    """Original list_keys: load every file."""
+    keys = []
+    for filepath in directory.glob("*.json"):
+        with open(filepath, encoding="utf-8") as f:
+            key = json.load(f).get("key", "")
+        if key.startswith(prefix):
+            keys.append(key)
+    return sorted(keys)
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated memory counts")
+    parser.add_argument("--legacy-max", type=int, default=10000, help="Largest size to run the file fallback on")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    print(
+        f"{'memories':>9} {'files search s':>15} {'common ms':>10} {'rare ms':>8} "
+        f"{'files keys s':>13} {'store keys ms':>14} {'insert s':>9}"
+    )
+    for n in [int(s) for s in args.sizes.split(",")]:
+        records = list(make_records(n, random.Random(args.seed)))
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            store = FallbackMemoryStore(directory / FallbackMemoryStore.DB_FILE)
+            insert_time, _ = timed(store.put_many, ((k, v, m, None) for k, v, m in records))
+
+            matches = store.search("evidential", limit=n, prefix="ns")
+            keys_time, keys = timed(store.keys, "ns/memory/00")
+            # Top-10 queries: common words match a large share of memories
+            common_time, _ = timed(store.search, "evidential frontier", limit=10, prefix="ns")
+            rare_time, _ = timed(store.search, "term42 term977", limit=10, prefix="ns")
+
+            files_search, files_keys = f"{'-':>15}", f"{'-':>13}"
+            if n <= args.legacy_max:
+                for key, value, metadata in records:
+                    path = directory / (key.replace("/", "_") + ".json")
+                    path.write_text(json.dumps({"key": key, "value": value, "metadata": metadata}, indent=2))
+                legacy_time, expected = timed(legacy_search, directory, "evidential", "ns")
+                if sorted(expected) != sorted(m["key"] for m in matches):
+                    raise SystemExit(f"{n} memories: store search differs from file fallback")
+                legacy_keys_time, expected_keys = timed(legacy_keys, directory, "ns/memory/00")
+                if expected_keys != keys:
+                    raise SystemExit(f"{n} memories: store keys differ from file fallback")
+                files_search = f"{legacy_time:>15.3f}"
+                files_keys = f"{legacy_keys_time:>13.3f}"
+            store.close()
+
+        print(
+            f"{n:>9} {files_search} {common_time * 1000:>10.2f} {rare_time * 1000:>8.2f} "
+            f"{files_keys} {keys_time * 1000:>14.2f} {insert_time:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark the population objective kernels in two_stage_optimizer.py.
+
+Times the per-row evaluate_config_5dim / evaluate_config_14dim loop (the
+old CognitiveProblem._evaluate) against evaluate_population_5dim /
+evaluate_population_14dim over growing population sizes, and checks the
+outputs are identical.
+
+Usage:
+    python scripts/benchmark_objective_kernels.py [--sizes 100,1000,10000,100000] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from optimization.two_stage_optimizer import (  # noqa: E402
+    CognitiveProblem5D,
+    CognitiveProblem14D,
+    evaluate_config_5dim,
+    evaluate_config_14dim,
+    evaluate_population_5dim,
+    evaluate_population_14dim,
+)
+
+
+def best_time(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="100,1000,10000,100000", help="Comma-separated population sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is reported)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    cases = [
+        ("5D", CognitiveProblem5D(), evaluate_config_5dim, evaluate_population_5dim),
+        ("14D", CognitiveProblem14D(), evaluate_config_14dim, evaluate_population_14dim),
+    ]
+
+    print(f"{'problem':<7} {'pop':>7} {'loop ms':>9} {'kernel ms':>10} {'speedup':>8}")
+    for name, problem, row_fn, kernel in cases:
+        for size in (int(s) for s in args.sizes.split(",")):
+            X = problem.xl + rng.random((size, problem.n_var)) * (problem.xu - problem.xl)
+            loop_time, expected = best_time(lambda: np.array([row_fn(x) for x in X]), args.repeat)
+            kernel_time, F = best_time(lambda: kernel(X), args.repeat)
+            if not np.array_equal(F, expected):
+                raise SystemExit(f"{name} pop={size}: kernel output differs from per-row loop")
+            print(
+                f"{name:<7} {size:>7} {loop_time * 1000:>9.2f} {kernel_time * 1000:>10.3f} "
+                f"{loop_time / kernel_time:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark incremental Pareto maintenance against full rescans.
+
+Streams N mock outcomes into a frontier the way GlobalMOOClient.report_outcome
+does, comparing:
+- rescan: the original O(n^2) pairwise rescan of all cases after every report
+- archive: ParetoArchive.insert(), O(front size) per report
+Also times one-shot non_dominated_mask / fast_non_dominated_sort over all N
+points. Frontiers of both approaches are checked for equality.
+
+Usage:
+    python scripts/benchmark_pareto.py [--sizes 200,1000] [--budget S] [--objectives 4] [--seed S]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from optimization.pareto import (  # noqa: E402
+    ParetoArchive,
+    fast_non_dominated_sort,
+    non_dominated_mask,
+)
+
+
+def dominates(a, b):
+    """Original dict-based dominance check from GlobalMOOClient."""
+    better_in_all = all(a[k] >= b.get(k, 0.0) for k in a)
+    return better_in_all and any(a[k] > b.get(k, 0.0) for k in a)
+
+
+def stream_rescan(outcomes, budget):
+    """Full rescan after every report; stops once the time budget is spent."""
+    cases = []
+    pareto = []
+    start = time.perf_counter()
+    for outcome in outcomes:
+        cases.append(outcome)
+        pareto = [c for c in cases if not any(dominates(o, c) for o in cases)]
+        if time.perf_counter() - start > budget:
+            return None, None
+    return time.perf_counter() - start, pareto
+
+
+def stream_archive(outcomes):
+    archive = ParetoArchive()
+    start = time.perf_counter()
+    for outcome in outcomes:
+        archive.insert(outcome)
+    return time.perf_counter() - start, archive.items()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="200,1000,3000", help="Comma-separated outcome counts")
+    parser.add_argument("--objectives", type=int, default=4, help="Objectives per outcome")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--budget", type=float, default=30.0, help="Seconds before the rescan is skipped")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    names = [f"objective_{i}" for i in range(args.objectives)]
+
+    print(
+        f"{'points':>7} {'front':>6} {'rescan s':>9} {'archive s':>10} {'speedup':>8} "
+        f"{'mask s':>8} {'ranks s':>8}"
+    )
+    for n in [int(s) for s in args.sizes.split(",")]:
+        F = rng.random((n, args.objectives)).round(2)
+        outcomes = [dict(zip(names, row.tolist())) for row in F]
+
+        archive_time, front = stream_archive(outcomes)
+        rescan_time, expected = stream_rescan(outcomes, args.budget)
+        if expected is not None and expected != front:
+            raise SystemExit(f"{n} points: archive frontier differs from rescan")
+
+        start = time.perf_counter()
+        mask = non_dominated_mask(F)
+        mask_time = time.perf_counter() - start
+        start = time.perf_counter()
+        fast_non_dominated_sort(F)
+        ranks_time = time.perf_counter() - start
+        if int(mask.sum()) != len(front):
+            raise SystemExit(f"{n} points: mask disagrees with archive")
+
+        rescan = f"{rescan_time:>9.3f}" if rescan_time is not None else f"{'>budget':>9}"
+        speedup = f"{rescan_time / archive_time:>7.1f}x" if rescan_time is not None else f"{'-':>8}"
+        print(
+            f"{n:>7} {len(front):>6} {rescan} {archive_time:>10.3f} {speedup} "
+            f"{mask_time:>8.3f} {ranks_time:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
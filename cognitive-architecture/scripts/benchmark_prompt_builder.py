@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark PromptBuilder.build with and without compiled templates.
+
+Compares builds/sec of the memoized builder against one that recompiles the
+system prompt on every call, for:
+- a single FullConfig building many tasks
+- the cascade's 14-dim sweep: one builder per decoded config vector
+each with and without per-task mode selection (which still runs per build,
+since the selected mode depends on the task text). Outputs of both builders
+are checked for equality.
+
+Usage:
+    python scripts/benchmark_prompt_builder.py [--tasks N] [--configs N] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from core.config import FullConfig, VectorCodec  # noqa: E402
+from core.prompt_builder import TASK_TYPE_INSTRUCTIONS, PromptBuilder  # noqa: E402
+
+TASKS = [
+    "Analyze why the cache returns stale entries",
+    "Implement a retry wrapper for the API client",
+    "Write a brief summary of the research findings",
+    "Review the security of the auth middleware",
+    "Explain how the scheduler picks the next job",
+]
+
+
+class UncachedPromptBuilder(PromptBuilder):
+    """Baseline: recompile the system prompt on every build."""
+
+    def _compiled_template(self, task_type):
+        return self._compile_template(task_type)
+
+
+def random_vector(rng):
+    vector = [rng.random() for _ in range(VectorCodec.VECTOR_SIZE)]
+    vector[VectorCodec.IDX_VERIX_STRICTNESS] = rng.uniform(0, 2)
+    vector[VectorCodec.IDX_COMPRESSION_LEVEL] = rng.uniform(0, 2)
+    return vector
+
+
+def run(builders, jobs):
+    """Build every job on every builder; return (seconds, outputs)."""
+    outputs = []
+    start = time.perf_counter()
+    for builder in builders:
+        for task, task_type in jobs:
+            outputs.append(builder.build(task, task_type))
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tasks", type=int, default=2000, help="Builds for the single config")
+    parser.add_argument("--configs", type=int, default=500, help="Configs in the sweep")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    task_types = list(TASK_TYPE_INSTRUCTIONS)
+    single_jobs = [(f"{rng.choice(TASKS)} #{i}", rng.choice(task_types)) for i in range(args.tasks)]
+    # Cascade-style corpus: each config evaluates the same tasks, fixed types
+    sweep_jobs = [(f"{TASKS[i % len(TASKS)]} #{i}", task_types[i % 3]) for i in range(10)]
+    vectors = [random_vector(rng) for _ in range(args.configs)]
+
+    scenarios = {
+        "single config": ([FullConfig], single_jobs),
+        "14-dim sweep": ([lambda v=v: VectorCodec.decode(v) for v in vectors], sweep_jobs),
+    }
+
+    # Warm up lazy imports and the telemetry steering engine
+    PromptBuilder(FullConfig()).build(TASKS[0], "default")
+
+    print(
+        f"{'scenario':<14} {'modes':>5} {'builds':>7} {'uncached/s':>11} "
+        f"{'cached/s':>10} {'speedup':>8} {'compiled':>9}"
+    )
+    for name, (configs, jobs) in scenarios.items():
+        for auto_select_mode in (True, False):
+            def make(cls):
+                return [cls(config(), auto_select_mode=auto_select_mode) for config in configs]
+
+            PromptBuilder.clear_template_cache()
+            base_time, base_out = run(make(UncachedPromptBuilder), jobs)
+            PromptBuilder.clear_template_cache()
+            cached_time, cached_out = run(make(PromptBuilder), jobs)
+            if cached_out != base_out:
+                raise SystemExit(f"{name}: cached prompts differ from uncached prompts")
+
+            builds = len(base_out)
+            modes = "on" if auto_select_mode else "off"
+            compiled = PromptBuilder.template_cache_info()["misses"]
+            print(
+                f"{name:<14} {modes:>5} {builds:>7} {builds / base_time:>11.0f} "
+                f"{builds / cached_time:>10.0f} {base_time / cached_time:>7.1f}x {compiled:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
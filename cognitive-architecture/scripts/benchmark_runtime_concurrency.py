@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark ClaudeRuntime.execute_many / AsyncClaudeRuntime throughput.
+
+Starts the local Messages API stub (tests/stub_messages_api.py) with a fixed
+per-request latency and runs a task batch through both runtimes at several
+concurrency caps, reporting requests/s and the speedup over a cap of 1.
+Throughput should grow linearly with the cap while requests are latency-bound.
+
+Usage:
+    python scripts/benchmark_runtime_concurrency.py [--tasks N] [--latency S] [--caps 1,2,4,8,16]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from core.config import FullConfig  # noqa: E402
+from core.runtime import AsyncClaudeRuntime, ClaudeRuntime  # noqa: E402
+from tests.stub_messages_api import StubMessagesServer  # noqa: E402
+
+
+def run_sync(base_url, tasks, cap):
+    runtime = ClaudeRuntime(FullConfig(), api_key="stub", base_url=base_url, max_concurrency=cap)
+    runtime.execute_many(tasks)
+    return runtime.last_batch_metrics
+
+
+def run_async(base_url, tasks, cap):
+    runtime = AsyncClaudeRuntime(
+        FullConfig(), api_key="stub", base_url=base_url, max_concurrency=cap,
+    )
+
+    async def run():
+        try:
+            await runtime.execute_many(tasks)
+        finally:
+            await runtime.aclose()
+
+    asyncio.run(run())
+    return runtime.last_batch_metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tasks", type=int, default=64, help="Tasks per batch")
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub latency in seconds")
+    parser.add_argument("--caps", default="1,2,4,8,16", help="Comma-separated concurrency caps")
+    args = parser.parse_args()
+
+    tasks = [f"Evaluate corpus task {i}" for i in range(args.tasks)]
+    caps = [int(c) for c in args.caps.split(",")]
+
+    print(f"{'runtime':<8} {'cap':>4} {'req/s':>8} {'speedup':>8} {'wall s':>7}")
+    with StubMessagesServer(delay=args.latency) as server:
+        for name, run in (("sync", run_sync), ("async", run_async)):
+            baseline = None
+            for cap in caps:
+                metrics = run(server.base_url, tasks, cap)
+                rate = metrics.requests_per_second
+                baseline = baseline or rate
+                print(
+                    f"{name:<8} {cap:>4} {rate:>8.1f} {rate / baseline:>7.1f}x "
+                    f"{metrics.wall_time_ms / 1000:>7.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
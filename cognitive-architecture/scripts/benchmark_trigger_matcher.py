@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark SkillTriggerMatcher.match (indexed) against match_linear (per-skill scan).
+
+Runs a fixed prompt set against the real skill-index.json and reports p50/p99
+latency for:
+- linear: the original per-skill extractOne scan
+- indexed-cold: TriggerIndex with an empty fuzzy-row cache for every prompt
+- indexed-warm: TriggerIndex with the row cache populated
+
+Also verifies that both paths return the same ranking.
+
+Usage:
+    python scripts/benchmark_trigger_matcher.py [--index PATH] [--rounds N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR / "skills"))
+
+from trigger_matcher import SkillTriggerMatcher  # noqa: E402
+
+PROMPTS = [
+    "help me debug this API error",
+    "deploy the backend to kubernetes with terraform",
+    "write a literature review on retrieval augmented generation",
+    "create a new skill for code review automation",
+    "audit the authentication flow for security vulnerabilities",
+    "orchestrate a swarm of agents to refactor the frontend",
+    "set up cicd pipeline with docker and github actions",
+    "analyze test coverage and fix flaky tests",
+    "generate release notes and documentation for the new version",
+    "train a neural network and debug the loss curve",
+    "build a feature flag system with gradual rollout",
+    "reverse engineer this binary and triage the malware sample",
+    "optimize database queries for the reporting dashboard",
+    "plan the sprint and break the epic into tasks",
+    "improve this prompt so the agent follows instructions",
+    "investigate the memory leak in the websocket server",
+]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    k = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def time_calls(fn, prompts, rounds, before_each=None):
+    samples = []
+    for _ in range(rounds):
+        for prompt in prompts:
+            if before_each:
+                before_each()
+            start = time.perf_counter()
+            fn(prompt)
+            samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def ranking(matches):
+    return [(m.name, m.confidence, sorted(m.matched_triggers)) for m in matches]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--index", default=None, help="Path to skill-index.json")
+    parser.add_argument("--rounds", type=int, default=5, help="Passes over the prompt set")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    matcher = SkillTriggerMatcher(args.index)
+    load_ms = (time.perf_counter() - start) * 1000.0
+
+    index = matcher.trigger_index
+    print(f"Index: {matcher.index_path}")
+    print(f"Skills: {len(index.names)}  Trigger vocabulary: {len(index.vocab)}")
+    print(f"Load + compile: {load_ms:.1f} ms\n")
+
+    mismatches = [p for p in PROMPTS if ranking(matcher.match(p)) != ranking(matcher.match_linear(p))]
+
+    results = {
+        "linear": time_calls(matcher.match_linear, PROMPTS, args.rounds),
+        "indexed-cold": time_calls(
+            matcher.match, PROMPTS, args.rounds, before_each=index._row_cache.clear
+        ),
+        "indexed-warm": time_calls(matcher.match, PROMPTS, args.rounds),
+    }
+
+    print(f"{'variant':<14} {'p50 ms':>10} {'p99 ms':>10} {'mean ms':>10}")
+    for name, samples in results.items():
+        print(
+            f"{name:<14} {percentile(samples, 50):>10.2f} {percentile(samples, 99):>10.2f} "
+            f"{statistics.mean(samples):>10.2f}"
+        )
+
+    baseline = percentile(results["linear"], 50)
+    for name in ("indexed-cold", "indexed-warm"):
+        print(f"\n{name} p50 speedup: {baseline / max(percentile(results[name], 50), 1e-9):.1f}x", end="")
+    print()
+
+    if mismatches:
+        print(f"\n[WARN] Ranking differs for {len(mismatches)} prompt(s):")
+        for prompt in mismatches:
+            print(f"  - {prompt}")
+        sys.exit(1)
+    print("\nRankings identical for all prompts.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark VerixParser.parse (VerixTokenizer) against parse_regex (dual regex).
+
+Builds a synthetic agent transcript (prose, markdown tables, L1 claims) and an
+L0-only transcript, then reports throughput in MB/s for:
+- regex: the original L1_PATTERN scan with L0_PATTERN fallback
+- tokenizer: VerixTokenizer over the whole text
+- streaming: VerixTokenizer fed in fixed-size chunks
+
+Also verifies that all variants return identical claims, and reports the
+retained bytes per claim for a list of VerixClaims versus a ClaimTable.
+
+Usage:
+    python scripts/benchmark_verix_parser.py [--lines N] [--chunk-size N] [--rounds N]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from core.verix import ClaimTable, VerixParser, VerixTokenizer  # noqa: E402
+
+WORDS = (
+    "the model found evidence that the cache layer reduces latency because "
+    "requests reuse warm connections while cold paths still dominate tail latency"
+).split()
+
+
+def build_transcript(lines, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for i in range(lines):
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 20)))
+        roll = rng.random()
+        if roll < 0.10:
+            out.append(
+                f"[agent:model] [assert|neutral] {sentence} "
+                f"[ground:doc-{i}] [conf:0.85] [state:confirmed]"
+            )
+        elif roll < 0.15:
+            out.append(f"[query|uncertain] {sentence}?")
+        elif roll < 0.20:
+            out.append(f"| {sentence} | [link](#{i}) | ok |")
+        else:
+            out.append(sentence)
+    return "\n".join(out)
+
+
+def build_l0_transcript(lines, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for i in range(lines):
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 20)))
+        out.append(f"MA.{rng.randint(10, 99)}:{sentence}" if i % 10 == 0 else sentence)
+    return "\n".join(out)
+
+
+def stream(text, chunk_size):
+    tokenizer = VerixTokenizer()
+    for pos in range(0, len(text), chunk_size):
+        tokenizer.feed(text[pos:pos + chunk_size])
+    return tokenizer.claims()
+
+
+def best_seconds(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def retained_bytes(fn):
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lines", type=int, default=20000, help="Lines per transcript")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Streaming chunk size")
+    parser.add_argument("--rounds", type=int, default=3, help="Timing rounds (best is kept)")
+    args = parser.parse_args()
+
+    verix = VerixParser()
+    corpora = {
+        "L1 transcript": build_transcript(args.lines),
+        "L0 transcript": build_l0_transcript(args.lines),
+    }
+
+    mismatches = []
+    print(f"{'corpus':<15} {'variant':<11} {'MB/s':>8} {'claims':>8}")
+    for corpus, text in corpora.items():
+        megabytes = len(text.encode("utf-8")) / 1e6
+        expected = verix.parse_regex(text)
+        variants = {
+            "regex": lambda: verix.parse_regex(text),
+            "tokenizer": lambda: verix.parse(text),
+            "streaming": lambda: stream(text, args.chunk_size),
+        }
+        for name, fn in variants.items():
+            seconds = best_seconds(fn, args.rounds)
+            claims = fn()
+            if claims != expected:
+                mismatches.append(f"{corpus} / {name}")
+            print(f"{corpus:<15} {name:<11} {megabytes / seconds:>8.1f} {len(claims):>8}")
+
+    text = corpora["L1 transcript"]
+    claims, list_bytes = retained_bytes(lambda: verix.parse(text))
+    table, table_bytes = retained_bytes(lambda: ClaimTable.from_text(text))
+    if table.to_claims() != claims:
+        mismatches.append("L1 transcript / table")
+    print(f"\nbytes/claim: list {list_bytes / len(claims):.0f}, "
+          f"table {table_bytes / len(table):.0f}")
+
+    if mismatches:
+        print(f"\n[WARN] Claims differ for: {', '.join(mismatches)}")
+        sys.exit(1)
+    print("\nClaims identical for all variants.")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,17 @@ FIX-1 from REMEDIATION-PLAN.md:
 Problem: 199 skills define TRIGGER_POSITIVE patterns, but matching is only exact/substring.
 Solution: Use rapidfuzz for fuzzy matching with configurable threshold.
 
+Indexes (trigger vocabulary, posting lists, description tokens, category
+members) are compiled once in TriggerIndex at load time, so match() scores each
+prompt token against the deduplicated trigger vocabulary instead of re-running
+extractOne per skill. match_linear() keeps the original per-skill scan as the
+reference implementation.
+
+Routing daemon: `trigger_matcher.py --serve` keeps the compiled matcher resident
+behind a local Unix socket (hot-reloading skill-index.json on mtime change).
+SkillRouterClient and route-skill.sh talk to it and fall back to in-process
+matching when it is not running.
+
 Usage:
     from trigger_matcher import SkillTriggerMatcher
     matcher = SkillTriggerMatcher()
@@ -15,6 +26,13 @@ Usage:
 import json
 import os
 import re
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -52,6 +70,104 @@ class SkillMatch:
         }
 
 
+class TriggerIndex:
+    """
+    Precompiled matching indexes over a skill index.
+
+    Built once per load:
+    - vocab: every distinct trigger string (positive and negative)
+    - postings / negative_postings: vocab id -> [(skill ordinal, position)]
+    - desc_postings: description token -> skill ordinals containing it
+    - category_members: category -> skill ordinals
+
+    Per-token fuzzy rows (vocab id -> WRatio score above the cutoff) are
+    memoized in a bounded LRU, so repeated prompt words cost a dict lookup.
+    """
+
+    ROW_CACHE_SIZE = 4096
+
+    def __init__(self, skills: Dict, tokenize):
+        self.names: List[str] = list(skills.keys())
+        self.vocab: List[str] = []
+        self.vocab_ids: Dict[str, int] = {}
+        self.postings: List[List[Tuple[int, int]]] = []
+        self.negative_postings: List[List[Tuple[int, int]]] = []
+        self.desc_postings: Dict[str, List[int]] = {}
+        self.category_members: Dict[str, List[int]] = {}
+        self._row_cache: "OrderedDict[Tuple[str, float], List[Tuple[int, float]]]" = OrderedDict()
+
+        for ordinal, skill_data in enumerate(skills.values()):
+            for position, trigger in enumerate(skill_data.get('triggers', [])):
+                self.postings[self._vocab_id(trigger)].append((ordinal, position))
+            for position, trigger in enumerate(skill_data.get('negativeTriggers', [])):
+                self.negative_postings[self._vocab_id(trigger)].append((ordinal, position))
+
+            for word in set(tokenize(skill_data.get('description', ''))):
+                self.desc_postings.setdefault(word, []).append(ordinal)
+
+            category = skill_data.get('category', 'unknown')
+            self.category_members.setdefault(category, []).append(ordinal)
+
+    def _vocab_id(self, trigger: str) -> int:
+        vid = self.vocab_ids.get(trigger)
+        if vid is None:
+            vid = len(self.vocab)
+            self.vocab_ids[trigger] = vid
+            self.vocab.append(trigger)
+            self.postings.append([])
+            self.negative_postings.append([])
+        return vid
+
+    def fuzzy_row(self, token: str, score_cutoff: float) -> List[Tuple[int, float]]:
+        """Return (vocab id, WRatio score) for every trigger scoring >= score_cutoff."""
+        key = (token, score_cutoff)
+        row = self._row_cache.get(key)
+        if row is not None:
+            self._row_cache.move_to_end(key)
+            return row
+
+        row = [
+            (vid, score)
+            for _, score, vid in process.extract(
+                token,
+                self.vocab,
+                scorer=fuzz.WRatio,
+                score_cutoff=score_cutoff,
+                limit=None,
+            )
+        ]
+        self._row_cache[key] = row
+        if len(self._row_cache) > self.ROW_CACHE_SIZE:
+            self._row_cache.popitem(last=False)
+        return row
+
+    def best_per_skill(
+        self,
+        row: List[Tuple[int, float]],
+        postings: List[List[Tuple[int, int]]],
+    ) -> Dict[int, Tuple[float, int, int]]:
+        """
+        Reduce a fuzzy row to each skill's best trigger.
+
+        Mirrors extractOne over the skill's own trigger list: highest score
+        wins, ties go to the earliest trigger position.
+
+        Returns:
+            Dict of skill ordinal -> (score, position, vocab id)
+        """
+        best: Dict[int, Tuple[float, int, int]] = {}
+        for vid, score in row:
+            for ordinal, position in postings[vid]:
+                current = best.get(ordinal)
+                if (
+                    current is None
+                    or score > current[0]
+                    or (score == current[0] and position < current[1])
+                ):
+                    best[ordinal] = (score, position, vid)
+        return best
+
+
 class SkillTriggerMatcher:
     """
     Fuzzy matcher for skill triggers using rapidfuzz.
@@ -123,6 +239,7 @@ class SkillTriggerMatcher:
         self.skills = self.index.get('skills', {})
         self.keyword_index = self.index.get('keyword_index', {})
         self.categories = self.index.get('categories', {})
+        self.trigger_index = TriggerIndex(self.skills, self._tokenize)
 
     def _tokenize(self, text: str) -> List[str]:
         """Extract meaningful keywords from text."""
@@ -175,20 +292,22 @@ class SkillTriggerMatcher:
                 normalized_score = match_score / 100.0
 
                 if normalized_score >= threshold:
-                    # Weight by match quality
-                    if normalized_score >= 0.95:  # Near-exact match
-                        score += 10.0
-                    elif normalized_score >= 0.85:  # Strong match
-                        score += 7.0
-                    elif normalized_score >= 0.75:  # Good match
-                        score += 5.0
-                    else:  # Acceptable match
-                        score += 3.0
-
+                    score += self._match_weight(normalized_score)
                     matched.append(match_trigger)
 
         return score, list(set(matched))
 
+    @staticmethod
+    def _match_weight(normalized_score: float) -> float:
+        """Weight a fuzzy match by quality."""
+        if normalized_score >= 0.95:  # Near-exact match
+            return 10.0
+        if normalized_score >= 0.85:  # Strong match
+            return 7.0
+        if normalized_score >= 0.75:  # Good match
+            return 5.0
+        return 3.0  # Acceptable match
+
     def _score_category(self, tokens: List[str], category: str) -> float:
         """Score how well tokens match a category."""
         if category not in self.CATEGORY_KEYWORDS:
@@ -213,6 +332,10 @@ class SkillTriggerMatcher:
         """
         Match a user prompt against all skills.
 
+        Uses the precompiled TriggerIndex: each token is fuzzy-scored once
+        against the trigger vocabulary, then reduced to per-skill best matches
+        through the posting lists. Produces the same ranking as match_linear().
+
         Args:
             prompt: User's request text
             threshold: Minimum fuzzy match score (0.0-1.0)
@@ -221,6 +344,82 @@ class SkillTriggerMatcher:
         Returns:
             List of SkillMatch objects, sorted by confidence
         """
+        if not RAPIDFUZZ_AVAILABLE:
+            return self.match_linear(prompt, threshold, top_k)
+
+        tokens = self._tokenize(prompt)
+
+        if not tokens:
+            return []
+
+        index = self.trigger_index
+        score_cutoff = threshold * 100
+        trigger_scores: Dict[int, float] = {}
+        neg_scores: Dict[int, float] = {}
+        matched: Dict[int, List[str]] = {}
+
+        for token in tokens:
+            row = index.fuzzy_row(token, score_cutoff)
+            if not row:
+                continue
+
+            for ordinal, (match_score, _, vid) in index.best_per_skill(row, index.postings).items():
+                normalized_score = match_score / 100.0
+                if normalized_score >= threshold:
+                    trigger_scores[ordinal] = (
+                        trigger_scores.get(ordinal, 0.0) + self._match_weight(normalized_score)
+                    )
+                    matched.setdefault(ordinal, []).append(index.vocab[vid])
+
+            for ordinal, (match_score, _, _) in index.best_per_skill(
+                row, index.negative_postings
+            ).items():
+                normalized_score = match_score / 100.0
+                if normalized_score >= threshold:
+                    neg_scores[ordinal] = (
+                        neg_scores.get(ordinal, 0.0) + self._match_weight(normalized_score)
+                    )
+
+        desc_scores: Dict[int, float] = {}
+        for token in tokens:
+            for ordinal in index.desc_postings.get(token, ()):
+                desc_scores[ordinal] = desc_scores.get(ordinal, 0) + 2.0
+
+        cat_scores: Dict[int, float] = {}
+        for category, members in index.category_members.items():
+            cat_score = self._score_category(tokens, category)
+            if cat_score:
+                for ordinal in members:
+                    cat_scores[ordinal] = cat_score
+
+        candidates = set(trigger_scores) | set(desc_scores) | set(cat_scores)
+        skill_scores: List[Tuple[str, float, List[str], List[str]]] = []
+
+        for ordinal in sorted(candidates):
+            total_score = (
+                trigger_scores.get(ordinal, 0.0)
+                + cat_scores.get(ordinal, 0.0)
+                + desc_scores.get(ordinal, 0)
+                - (neg_scores.get(ordinal, 0.0) * 0.5)
+            )
+            if total_score > 0:
+                skill_scores.append((
+                    index.names[ordinal],
+                    total_score,
+                    list(set(matched.get(ordinal, []))),
+                    tokens
+                ))
+
+        return self._build_matches(skill_scores, top_k)
+
+    def match_linear(self, prompt: str, threshold: float = 0.6, top_k: int = 5) -> List[SkillMatch]:
+        """
+        Match a user prompt by scanning every skill (reference implementation).
+
+        Re-runs fuzzy matching per skill and re-tokenizes descriptions on
+        every call. Kept for the rapidfuzz-less fallback and as the baseline
+        for equivalence tests and benchmarks.
+        """
         tokens = self._tokenize(prompt)
 
         if not tokens:
@@ -263,6 +462,14 @@ class SkillTriggerMatcher:
                     tokens
                 ))
 
+        return self._build_matches(skill_scores, top_k)
+
+    def _build_matches(
+        self,
+        skill_scores: List[Tuple[str, float, List[str], List[str]]],
+        top_k: int,
+    ) -> List[SkillMatch]:
+        """Rank scored skills (stable on index order) and convert to SkillMatch."""
         # Sort by score descending
         skill_scores.sort(key=lambda x: x[1], reverse=True)
 
@@ -294,35 +501,329 @@ class SkillTriggerMatcher:
         return json.dumps([m.to_dict() for m in matches], indent=2)
 
 
+def format_matches(prompt: str, matches: List[SkillMatch]) -> str:
+    """Render matches in the text format consumed by route-skill.sh."""
+    if not matches:
+        return f"No matching skills found for: {prompt}"
+
+    lines = ["MATCHED_SKILLS:", ""]
+    for i, m in enumerate(matches, 1):
+        lines.append(f"{i}. {m.name} ({m.confidence}%)")
+        lines.append(f"   Category: {m.category}")
+        lines.append(f"   Path: {m.path}")
+        lines.append(f"   Description: {m.description[:100]}...")
+        lines.append(f"   Matched triggers: {', '.join(m.matched_triggers) or 'category match'}")
+        lines.append(f"   Files: {', '.join(m.files)}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+# =============================================================================
+# ROUTING DAEMON
+# =============================================================================
+#
+# Protocol: one JSON request line per connection, one JSON response line back.
+#   request:  {"op": "match" | "match_json" | "match_text" | "ping" | "reload" | "shutdown",
+#              "prompt": str, "threshold": float, "top_k": int}
+#   response: {"ok": true, "result": ...} or {"ok": false, "error": str}
+
+def default_socket_path() -> str:
+    """
+    Socket path shared by the daemon, the Python client and route-skill.sh.
+
+    $SKILL_ROUTER_SOCKET if set, else $XDG_RUNTIME_DIR/skill-router.sock,
+    else router.sock inside a private skill-router-<uid> directory in the
+    temp dir (created 0700 by the daemon), so no other user can plant or
+    reach the socket.
+    """
+    env_path = os.environ.get("SKILL_ROUTER_SOCKET")
+    if env_path:
+        return env_path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "skill-router.sock")
+    return os.path.join(_temp_socket_dir(), "router.sock")
+
+
+def _temp_socket_dir() -> str:
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f"skill-router-{uid}")
+
+
+def _owned_by_user(path: str, kind) -> bool:
+    """True if path is of the given stat kind (not a symlink) and owned by this user."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return kind(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _private_socket_dir(directory: str) -> None:
+    """Create the socket's directory 0700, or verify an existing one is private to us."""
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    mode = os.lstat(directory).st_mode
+    if not _owned_by_user(directory, stat.S_ISDIR) or mode & 0o077:
+        raise OSError(f"Socket directory {directory} is not private to this user")
+
+
+class _RouterRequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single JSON request line."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline(SkillRouterServer.MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line)
+            response = {"ok": True, "result": self.server.dispatch(request)}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    _UnixStreamServer = socketserver.UnixStreamServer
+else:  # Windows: daemon unavailable, clients fall back to in-process matching
+    _UnixStreamServer = object
+
+
+class SkillRouterServer(_UnixStreamServer):
+    """
+    Long-lived routing server that keeps SkillTriggerMatcher resident.
+
+    The index, TriggerIndex and fuzzy-row cache stay warm between requests.
+    skill-index.json is re-stat'ed before each request and reloaded when its
+    mtime changes. Requests are handled one at a time (the matcher caches are
+    not thread-safe), which is fine for one hook call per user turn.
+    """
+
+    MAX_REQUEST_BYTES = 1 << 20
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        index_path: Optional[str] = None,
+        idle_timeout: Optional[float] = None,
+    ):
+        if _UnixStreamServer is object:
+            raise OSError("Unix domain sockets are not supported on this platform")
+
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.matcher = SkillTriggerMatcher(index_path)
+        self._index_mtime = self._current_mtime()
+        self._last_request = time.monotonic()
+        self._stopping = False
+
+        if os.path.dirname(self.socket_path) == _temp_socket_dir():
+            _private_socket_dir(os.path.dirname(self.socket_path))
+        self._remove_stale_socket()
+        # Bind under a restrictive umask so the socket is never reachable by others
+        umask = os.umask(0o177)
+        try:
+            super().__init__(self.socket_path, _RouterRequestHandler)
+        finally:
+            os.umask(umask)
+
+    def _remove_stale_socket(self) -> None:
+        """Unlink a leftover socket file, refusing if a daemon still answers."""
+        if not os.path.lexists(self.socket_path):
+            return
+        if not _owned_by_user(self.socket_path, stat.S_ISSOCK):
+            raise OSError(f"{self.socket_path} exists and is not this user's socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+        else:
+            raise OSError(f"Skill router already running on {self.socket_path}")
+        finally:
+            probe.close()
+
+    def _current_mtime(self) -> Optional[float]:
+        try:
+            return self.matcher.index_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _reload_if_changed(self) -> None:
+        mtime = self._current_mtime()
+        if mtime is not None and mtime != self._index_mtime:
+            try:
+                self.reload()
+            except (OSError, ValueError):
+                # Index mid-rewrite: keep serving the previous one, retry next request
+                pass
+
+    def reload(self) -> None:
+        """Rebuild the matcher from disk, keeping the old one if loading fails."""
+        self.matcher = SkillTriggerMatcher(str(self.matcher.index_path))
+        self._index_mtime = self._current_mtime()
+
+    def dispatch(self, request: Dict):
+        """Execute one protocol request and return its result payload."""
+        self._last_request = time.monotonic()
+        op = request.get("op", "match")
+
+        if op == "ping":
+            return {
+                "pid": os.getpid(),
+                "index_path": str(self.matcher.index_path),
+                "skills": len(self.matcher.skills),
+            }
+        if op == "reload":
+            self.reload()
+            return {"skills": len(self.matcher.skills)}
+        if op == "shutdown":
+            self._stop_async()
+            return {"stopping": True}
+
+        self._reload_if_changed()
+        prompt = request.get("prompt", "")
+        threshold = float(request.get("threshold", 0.6))
+        top_k = int(request.get("top_k", 5))
+
+        if op == "match":
+            return [m.to_dict() for m in self.matcher.match(prompt, threshold, top_k)]
+        if op == "match_json":
+            return self.matcher.match_json(prompt, threshold, top_k)
+        if op == "match_text":
+            return format_matches(prompt, self.matcher.match(prompt, threshold, top_k))
+        raise ValueError(f"Unknown op: {op}")
+
+    def _stop_async(self) -> None:
+        if not self._stopping:
+            self._stopping = True
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def service_actions(self) -> None:
+        """Called by serve_forever between polls; enforces the idle timeout."""
+        if self.idle_timeout and time.monotonic() - self._last_request > self.idle_timeout:
+            self._stop_async()
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+class SkillRouterClient:
+    """
+    Thin client for SkillRouterServer with in-process fallback.
+
+    When no daemon is listening (or the platform lacks Unix sockets), requests
+    are served by a lazily created local SkillTriggerMatcher instead.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        index_path: Optional[str] = None,
+        timeout: float = 2.0,
+    ):
+        self.socket_path = socket_path or default_socket_path()
+        self.index_path = index_path
+        self.timeout = timeout
+        self._local: Optional[SkillTriggerMatcher] = None
+
+    def _request(self, payload: Dict):
+        """Send one request; return None if the daemon is unreachable."""
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        if not _owned_by_user(self.socket_path, stat.S_ISSOCK):
+            return None  # Missing, or planted by another user: never trust its output
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+                sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+                with sock.makefile("rb") as reader:
+                    line = reader.readline()
+        except OSError:
+            return None
+        if not line:
+            return None
+
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise RuntimeError(f"Skill router error: {response.get('error')}")
+        return response["result"]
+
+    def local_matcher(self) -> SkillTriggerMatcher:
+        if self._local is None:
+            self._local = SkillTriggerMatcher(self.index_path)
+        return self._local
+
+    def is_alive(self) -> bool:
+        return self._request({"op": "ping"}) is not None
+
+    def match(self, prompt: str, threshold: float = 0.6, top_k: int = 5) -> List[SkillMatch]:
+        result = self._request(
+            {"op": "match", "prompt": prompt, "threshold": threshold, "top_k": top_k}
+        )
+        if result is None:
+            return self.local_matcher().match(prompt, threshold, top_k)
+        return [SkillMatch(**m) for m in result]
+
+    def match_json(self, prompt: str, threshold: float = 0.6, top_k: int = 5) -> str:
+        result = self._request(
+            {"op": "match_json", "prompt": prompt, "threshold": threshold, "top_k": top_k}
+        )
+        if result is None:
+            return self.local_matcher().match_json(prompt, threshold, top_k)
+        return result
+
+
 def main():
-    """CLI interface for testing the matcher."""
+    """CLI interface: match a prompt (via the daemon when running) or run the daemon."""
+    import argparse
     import sys
 
-    if len(sys.argv) < 2:
-        print("Usage: python trigger_matcher.py \"your prompt here\" [threshold] [top_k]")
-        sys.exit(1)
-
-    prompt = sys.argv[1]
-    threshold = float(sys.argv[2]) if len(sys.argv) > 2 else 0.6
-    top_k = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    parser = argparse.ArgumentParser(
+        usage='python trigger_matcher.py "your prompt here" [threshold] [top_k]\n'
+              '       python trigger_matcher.py --serve [--socket PATH] [--idle-timeout SECONDS]'
+    )
+    parser.add_argument("prompt", nargs="?")
+    parser.add_argument("threshold", nargs="?", type=float, default=0.6)
+    parser.add_argument("top_k", nargs="?", type=int, default=5)
+    parser.add_argument("--serve", action="store_true", help="Run the routing daemon")
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument("--index", default=None, help="Path to skill-index.json")
+    parser.add_argument("--idle-timeout", type=float, default=None,
+                        help="Exit the daemon after this many idle seconds")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Always match in-process")
+    args = parser.parse_args()
 
     try:
-        matcher = SkillTriggerMatcher()
-        matches = matcher.match(prompt, threshold, top_k)
-
-        if not matches:
-            print(f"No matching skills found for: {prompt}")
-            sys.exit(0)
-
-        print("MATCHED_SKILLS:\n")
-        for i, m in enumerate(matches, 1):
-            print(f"{i}. {m.name} ({m.confidence}%)")
-            print(f"   Category: {m.category}")
-            print(f"   Path: {m.path}")
-            print(f"   Description: {m.description[:100]}...")
-            print(f"   Matched triggers: {', '.join(m.matched_triggers) or 'category match'}")
-            print(f"   Files: {', '.join(m.files)}")
-            print()
+        if args.serve:
+            server = SkillRouterServer(args.socket, args.index, args.idle_timeout)
+            try:
+                server.serve_forever(poll_interval=1.0)
+            finally:
+                server.server_close()
+            return
+
+        client = SkillRouterClient(args.socket, args.index)
+        if args.stop:
+            client._request({"op": "shutdown"})
+            return
+
+        if not args.prompt:
+            parser.print_usage()
+            sys.exit(1)
+
+        if args.no_daemon:
+            matches = client.local_matcher().match(args.prompt, args.threshold, args.top_k)
+        else:
+            matches = client.match(args.prompt, args.threshold, args.top_k)
+        print(format_matches(args.prompt, matches))
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -0,0 +1,122 @@
+"""
+Local stub of the Anthropic Messages API for runtime tests and benchmarks.
+
+Serves POST /v1/messages on 127.0.0.1 with a fixed per-request delay,
+echoing the user prompt back as the response text. Failures can be
+injected to exercise retries, and the server records peak concurrency.
+
+Usage:
+    with StubMessagesServer(delay=0.05) as server:
+        runtime = ClaudeRuntime(config, api_key="test", base_url=server.base_url)
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 stalls bursts of concurrent connects
+    request_queue_size = 256
+
+
+class StubMessagesServer:
+    """Threaded HTTP server mimicking the Messages API."""
+
+    def __init__(self, delay: float = 0.0, failures: Optional[List[int]] = None):
+        """
+        Initialize the stub.
+
+        Args:
+            delay: Seconds to sleep before answering each request
+            failures: HTTP status codes returned, in order, before succeeding
+                (e.g. [429, 529] fails the first two requests)
+        """
+        self.delay = delay
+        self.failures = list(failures or [])
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubMessagesServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "StubMessagesServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes on keep-alive
+            # connections; avoid the Nagle/delayed-ACK stall between them
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub._lock:
+                    stub.requests += 1
+                    status = stub.failures.pop(0) if stub.failures else 200
+                    stub.in_flight += 1
+                    stub.peak_in_flight = max(stub.peak_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.delay)
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+                if status != 200:
+                    payload = {
+                        "type": "error",
+                        "error": {"type": "overloaded_error", "message": f"stub {status}"},
+                    }
+                else:
+                    prompt = body["messages"][-1]["content"]
+                    text = f"[assert|neutral] Echo {prompt} [conf:0.7] [state:provisional]"
+                    payload = {
+                        "id": f"msg_stub_{stub.requests}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": body["model"],
+                        "content": [{"type": "text", "text": text}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {
+                            "input_tokens": len(body.get("system", "").split()) + len(prompt.split()),
+                            "output_tokens": len(text.split()),
+                        },
+                    }
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -216,3 +216,15 @@ class TestCreateCascade:
             core_corpus=[{"id": "1", "task": "Test"}],
         )
         assert len(cascade.core_corpus) == 1
+
+    def test_create_cascade_with_executor(self):
+        """create_cascade should select the evaluation backend and shut it down."""
+        with create_cascade(use_mock=True, backend="thread", max_workers=2) as cascade:
+            assert cascade.executor.backend == "thread"
+            assert cascade.executor.max_workers == 2
+            cascade.executor.evaluate([0.5] * 14, [{"id": "1", "task": "Test"}])
+            assert cascade.executor._pool is not None
+        assert cascade.executor._pool is None
+
+        with pytest.raises(ValueError):
+            create_cascade(backend="gpu")
@@ -0,0 +1,215 @@
+"""
+Tests for optimization/correlation_accumulator.py
+
+Tests:
+- Incremental and merged states equal a full recompute (NaN-aware)
+- Numerical stability and exact zeros for constant inputs
+- ImpactAnalyzer ingest with a high-water mark and persisted state
+- Coverage of the accumulated matrix, late points, and the monthly window
+"""
+
+import json
+import random
+
+import numpy as np
+import pytest
+from optimization.correlation_accumulator import CorrelationAccumulator
+from optimization.dspy_level1 import TelemetryAggregator, TelemetryPoint
+from optimization.impact_analyzer import ImpactAnalyzer
+from optimization.memory_mcp_integration import MemoryMCPTelemetryStore, TelemetryAggregatorWithMCP
+from optimization.monthly_analyzer import MonthlyAnalyzer
+from optimization.telemetry_columns import TelemetryColumns
+
+NAMES = ImpactAnalyzer.OUTCOME_METRICS
+
+
+def make_points(n, seed=0, start=0.0):
+    rng = random.Random(seed)
+    points = []
+    for i in range(n):
+        vector = [float(rng.random() > 0.5) for _ in range(7)] + [float(rng.randint(0, 2))] * 2
+        vector += [float(rng.random() > 0.5), rng.random(), 0.0, 0.0, 0.0]
+        outcomes = {m: rng.random() + 0.3 * vector[j % 11] for j, m in enumerate(NAMES) if rng.random() > 0.25}
+        points.append(TelemetryPoint(config_vector=vector, outcomes=outcomes, task_type="coding", timestamp=start + i))
+    return points
+
+
+def full_recompute(points):
+    return TelemetryColumns.from_points(points, NAMES).correlate(14, NAMES, min_count=10)
+
+
+class TestAccumulator:
+    """CorrelationAccumulator statistics."""
+
+    def test_batches_match_full_recompute(self):
+        """Any split into batches gives the full-history matrix."""
+        points = make_points(600, seed=1)
+        accumulator = CorrelationAccumulator(NAMES)
+        for lo, hi in [(0, 1), (1, 50), (50, 51), (51, 400), (400, 600)]:
+            accumulator.update_points(points[lo:hi])
+        np.testing.assert_allclose(accumulator.correlation(), full_recompute(points), atol=1e-12)
+        assert accumulator.points_seen == 600
+
+    def test_single_updates_and_shard_merge(self):
+        """Per-point updates and merged shards agree with one batch."""
+        points = make_points(200, seed=2)
+        single = CorrelationAccumulator(NAMES)
+        for p in points:
+            single.update(p.config_vector, p.outcomes)
+
+        shards = [CorrelationAccumulator(NAMES) for _ in range(3)]
+        for i, p in enumerate(points):
+            shards[i % 3].update_points([p])
+        merged = shards[0].merge(shards[1]).merge(shards[2])
+
+        expected = full_recompute(points)
+        np.testing.assert_allclose(single.correlation(), expected, atol=1e-12)
+        np.testing.assert_allclose(merged.correlation(), expected, atol=1e-12)
+        np.testing.assert_array_equal(merged.count, single.count)
+
+        with pytest.raises(ValueError):
+            single.merge(CorrelationAccumulator(NAMES[:3]))
+
+    def test_stability_and_constants(self):
+        """Large offsets do not lose precision; constant inputs are exactly 0."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(5000, 2))
+        x[:, 0] += 1e8
+        x[:, 1] = 0.1
+        y = (x[:, :1] - 1e8) * 0.5 + rng.normal(size=(5000, 1))
+        accumulator = CorrelationAccumulator(["y"], config_dims=2)
+        for chunk in np.array_split(np.arange(5000), 7):
+            accumulator.update_batch(x[chunk], y[chunk])
+        r = accumulator.correlation()
+        assert r[0, 0] == pytest.approx(np.corrcoef(x[:, 0] - 1e8, y[:, 0])[0, 1], abs=1e-9)
+        assert r[1, 0] == 0.0 and accumulator.m2_x[1, 0] == 0.0
+
+    def test_short_vectors_and_min_count(self):
+        """Missing dims are excluded per pair; thin cells stay 0."""
+        accumulator = CorrelationAccumulator(["y"], config_dims=3)
+        for i in range(12):
+            accumulator.update([float(i), float(i % 2)] + ([float(i)] if i < 6 else []), {"y": float(i)})
+        assert accumulator.count[:, 0].tolist() == [12, 12, 6]
+        r = accumulator.correlation(min_count=10)
+        assert r[0, 0] == pytest.approx(1.0) and r[2, 0] == 0.0
+        assert accumulator.correlation(min_count=5)[2, 0] == pytest.approx(1.0)
+
+    def test_dict_round_trip(self):
+        """State survives JSON serialization."""
+        accumulator = CorrelationAccumulator(NAMES)
+        accumulator.update_points(make_points(50, seed=3))
+        restored = CorrelationAccumulator.from_dict(json.loads(json.dumps(accumulator.to_dict())))
+        np.testing.assert_array_equal(restored.correlation(), accumulator.correlation())
+        assert restored.points_seen == 50
+
+
+class TestImpactAnalyzerStreaming:
+    """ImpactAnalyzer on top of the accumulator."""
+
+    def test_incremental_ingest(self, tmp_path):
+        """Only new points are ingested; factors stay current."""
+        telemetry = TelemetryAggregator(storage_dir=tmp_path / "telemetry")
+        analyzer = ImpactAnalyzer(telemetry=telemetry)
+        points = make_points(300, seed=4)
+        for p in points[:150]:
+            telemetry.record(p)
+        assert analyzer.ingest_telemetry() == 150
+        assert analyzer.ingest_telemetry() == 0
+
+        # A tie at the mark is new, not a repeat
+        telemetry.record(TelemetryPoint(points[0].config_vector, points[0].outcomes, "coding", points[149].timestamp))
+        for p in points[150:]:
+            telemetry.record(p)
+        assert analyzer.ingest_telemetry() == 151
+        assert analyzer.get_accumulator().points_seen == 301
+
+        matrix = analyzer.compute_correlations(min_samples=100)
+        np.testing.assert_allclose(matrix, full_recompute(telemetry.get_points()), atol=1e-12)
+        assert analyzer.get_high_impact_variables()
+
+    def test_state_persists_between_runs(self, tmp_path):
+        """A new run resumes from saved state and ingests only newer points."""
+        state = tmp_path / "impact-state.json"
+        first = TelemetryAggregator(storage_dir=tmp_path / "a")
+        old_points = make_points(120, seed=5)
+        for p in old_points:
+            first.record(p)
+        analyzer = ImpactAnalyzer(telemetry=first, state_path=state)
+        analyzer.compute_correlations(min_samples=100)
+        analyzer.save_state()
+
+        # Next month: the source holds the tail of last month plus new points
+        second = TelemetryAggregator(storage_dir=tmp_path / "b")
+        new_points = make_points(80, seed=6, start=1000.0)
+        for p in old_points[-30:] + new_points:
+            second.record(p)
+        resumed = ImpactAnalyzer(telemetry=second, state_path=state)
+        assert resumed.get_correlation_matrix() == analyzer.get_correlation_matrix()
+        assert resumed.ingest_telemetry() == 80
+        np.testing.assert_allclose(
+            resumed.compute_correlations(min_samples=150), full_recompute(old_points + new_points), atol=1e-12,
+        )
+
+    def test_corrupt_state_ignored(self, tmp_path):
+        """An unreadable state file starts from empty."""
+        state = tmp_path / "impact-state.json"
+        state.write_text("{torn")
+        analyzer = ImpactAnalyzer(state_path=state)
+        assert analyzer.get_accumulator().points_seen == 0
+        assert analyzer.get_correlation_matrix() is None
+
+    def test_coverage_and_late_points(self, tmp_path):
+        """Coverage spans every ingested point; late arrivals are counted, not ingested."""
+        state = tmp_path / "impact-state.json"
+        telemetry = TelemetryAggregator(storage_dir=tmp_path / "telemetry")
+        analyzer = ImpactAnalyzer(telemetry=telemetry, state_path=state)
+        points = make_points(170, seed=7)
+        for p in points[:150]:
+            telemetry.record(p)
+        analyzer.ingest_telemetry()
+
+        # Backfilled behind the mark, then newer points
+        telemetry.record(make_points(1, seed=8, start=10.5)[0])
+        for p in points[150:]:
+            telemetry.record(p)
+        assert analyzer.ingest_telemetry() == 20
+
+        expected = {"points": 170, "first_timestamp": 0.0, "last_timestamp": 169.0, "late_points_skipped": 1}
+        assert analyzer.coverage() == expected
+        analyzer.save_state()
+        assert ImpactAnalyzer(state_path=state).coverage() == expected
+
+    def test_window_correlations(self, tmp_path):
+        """The window matrix covers the source only and leaves the accumulated one alone."""
+        state = tmp_path / "impact-state.json"
+        old_points = make_points(120, seed=9)
+        first = TelemetryAggregator(storage_dir=tmp_path / "a")
+        for p in old_points:
+            first.record(p)
+        previous = ImpactAnalyzer(telemetry=first, state_path=state)
+        previous.compute_correlations(min_samples=100)
+        previous.save_state()
+
+        second = TelemetryAggregator(storage_dir=tmp_path / "b")
+        new_points = make_points(80, seed=10, start=1000.0)
+        for p in new_points:
+            second.record(p)
+        analyzer = ImpactAnalyzer(telemetry=second, state_path=state)
+        accumulated = analyzer.compute_correlations(min_samples=150)
+        np.testing.assert_allclose(analyzer.window_correlations(), full_recompute(new_points), atol=1e-12)
+        assert analyzer.get_correlation_matrix() == accumulated
+
+    def test_monthly_summary_reports_coverage(self, tmp_path):
+        """The monthly impact summary states both the accumulated span and the window."""
+        base = TelemetryAggregator(storage_dir=tmp_path / "telemetry")
+        for p in make_points(60, seed=11):
+            base.record(p)
+        telemetry = TelemetryAggregatorWithMCP(base, MemoryMCPTelemetryStore(fallback_dir=tmp_path / "mcp"))
+        monthly = MonthlyAnalyzer(telemetry=telemetry, proposals_dir=tmp_path / "proposals")
+        monthly.impact_analyzer.set_telemetry(base)
+
+        summary = monthly._analyze_impact()
+        assert summary["coverage"]["points"] == 60
+        assert summary["coverage"]["first_timestamp"] == 0.0
+        assert summary["window"]["points"] == 60
+        assert summary["window"]["correlation_matrix_computed"] is True
@@ -4,12 +4,14 @@ Tests for optimization/dspy_level2.py and optimization/dspy_level1.py
 Tests:
 - DSPyLevel2Optimizer caching
 - ClusterCache operations
+- ClusterCache LRU bound, TTL and lazy disk loading
 - DSPyLevel1Analyzer telemetry
 - EvolutionProposal generation
 """
 
 import pytest
 import tempfile
+import time
 import sys
 import os
 from pathlib import Path
@@ -164,6 +166,89 @@ class TestClusterCache:
             assert stats["cached_count"] == 1
 
 
+def make_prompt(key, compiled_at=None):
+    prompt = CompiledPrompt(
+        cluster_key=key,
+        system_prompt=f"System for {key}",
+        user_template="{task}",
+        config_vector=[0.5] * 14,
+    )
+    if compiled_at is not None:
+        prompt.compiled_at = compiled_at
+    return prompt
+
+
+class TestClusterCacheBounds:
+    """Tests for the bounded, lazily loaded ClusterCache."""
+
+    def test_lru_eviction_and_fault_in(self, tmp_path):
+        """Only max_entries stay resident; evicted prompts reload from disk."""
+        cache = ClusterCache(cache_dir=tmp_path, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(make_prompt(key))
+        assert list(cache._cache) == ["b", "c"]
+        assert cache.evictions == 1
+
+        assert cache.get("a").system_prompt == "System for a"
+        assert cache.disk_loads == 1
+        assert list(cache._cache) == ["c", "a"]
+        assert sorted(cache.list_clusters()) == ["a", "b", "c"]
+
+    def test_lazy_start(self, tmp_path):
+        """A new cache reads only the manifest, then loads on demand."""
+        first = ClusterCache(cache_dir=tmp_path)
+        first.put_many([make_prompt(f"k{i}") for i in range(20)])
+
+        cache = ClusterCache(cache_dir=tmp_path)
+        assert cache.stats()["cached_count"] == 20
+        assert cache.stats()["resident_count"] == 0
+        assert cache.get("k7").cluster_key == "k7"
+        assert cache.get("missing") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["disk_loads"]) == (1, 1, 1)
+
+    def test_ttl(self, tmp_path):
+        """Expired prompts are dropped at start and on access."""
+        cache = ClusterCache(cache_dir=tmp_path, max_age_seconds=60)
+        cache.put(make_prompt("old", compiled_at=time.time() - 120))
+        cache.put(make_prompt("fresh"))
+        assert cache.get("old") is None
+        assert cache.expirations == 1
+
+        cache.put(make_prompt("stale", compiled_at=time.time() - 120))
+        reopened = ClusterCache(cache_dir=tmp_path, max_age_seconds=60)
+        assert reopened.list_clusters() == ["fresh"]
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_invalidate_persists(self, tmp_path):
+        """Invalidations survive a reopen through the manifest."""
+        cache = ClusterCache(cache_dir=tmp_path)
+        cache.put_many([make_prompt("a"), make_prompt("b")])
+        assert cache.invalidate("a")
+        assert not cache.invalidate("a")
+        assert ClusterCache(cache_dir=tmp_path).list_clusters() == ["b"]
+
+        assert cache.invalidate_all() == 1
+        assert ClusterCache(cache_dir=tmp_path).list_clusters() == []
+
+    def test_legacy_directory(self, tmp_path):
+        """Prompt files written without a manifest are indexed once."""
+        legacy = ClusterCache(cache_dir=tmp_path)
+        legacy.put(make_prompt("legacy"))
+        (tmp_path / ClusterCache.MANIFEST_FILE).unlink()
+        (tmp_path / "corrupt.json").write_text("{")
+
+        cache = ClusterCache(cache_dir=tmp_path)
+        assert cache.list_clusters() == ["legacy"]
+        assert (tmp_path / ClusterCache.MANIFEST_FILE).exists()
+
+    def test_unindexed_file_from_other_process(self, tmp_path):
+        """A prompt written by another cache instance is still found."""
+        cache = ClusterCache(cache_dir=tmp_path)
+        ClusterCache(cache_dir=tmp_path).put(make_prompt("shared"))
+        assert cache.get("shared") is not None
+
+
 class TestDSPyLevel2Optimizer:
     """Tests for DSPyLevel2Optimizer."""
 
@@ -203,6 +288,21 @@ class TestDSPyLevel2Optimizer:
 
             assert len(prompts) == 3
 
+    def test_batch_prefetch_counts(self, tmp_path):
+        """Batches compile each missing cluster once and reuse cached ones."""
+        optimizer = DSPyLevel2Optimizer(cache_dir=tmp_path, max_cache_entries=2)
+        vectors = [VectorCodec.encode(FullConfig())] * 3
+        assert optimizer.warm_cache(vectors, "coding") == 1
+        assert optimizer.warm_cache(vectors, "coding") == 0
+
+        reopened = DSPyLevel2Optimizer(cache_dir=tmp_path, max_cache_entries=2)
+        prompts = reopened.compile_batch([FullConfig()] * 3, "coding")
+        assert len({id(p) for p in prompts}) == 1
+        stats = reopened.stats()
+        assert stats["compile_count"] == 0
+        assert stats["cache_hits"] == 3
+        assert stats["disk_loads"] == 1
+
     def test_stats_tracks_hits_and_compiles(self):
         """stats should track cache hits and compiles."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,148 @@
+"""
+Tests for optimization/evaluation_executor.py
+
+Tests:
+- EvaluationExecutor backends match core.runtime.evaluate()
+- Result ordering and corpus sharding
+- EvaluationStats counters
+- ThreeMOOCascade with parallel executors
+"""
+
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.evaluation_executor import (
+    EvaluationExecutor,
+    EvaluationStats,
+    create_executor,
+)
+from optimization.cascade import ThreeMOOCascade
+from core.config import FullConfig, VectorCodec, STRICT_CONFIG, MINIMAL_CONFIG
+from core.runtime import aggregate_outcomes, evaluate, score_tasks
+
+TASK_TYPES = ["reasoning", "coding", "analysis", "creative", "default"]
+
+CORPUS = [
+    {"id": str(i), "task": f"Task {i}: review the quick cache fix", "task_type": TASK_TYPES[i % 5]}
+    for i in range(12)
+]
+
+VECTORS = [
+    VectorCodec.encode(FullConfig()),
+    VectorCodec.encode(STRICT_CONFIG),
+    VectorCodec.encode(MINIMAL_CONFIG),
+    [0.7, 0.2, 0.9, 0.1, 0.6, 0.4, 0.8, 1.6, 0.3, 0.9, 0.2, 0.0, 0.0, 0.0],
+]
+
+
+class TestScoreTasks:
+    """Tests for the evaluate() split used by the executor."""
+
+    def test_aggregate_matches_evaluate(self):
+        """aggregate_outcomes(score_tasks()) should equal evaluate()."""
+        for vector in VECTORS:
+            assert aggregate_outcomes(score_tasks(vector, CORPUS)) == evaluate(vector, CORPUS)
+
+    def test_shards_concatenate(self):
+        """Scoring shards separately should equal scoring the whole corpus."""
+        vector = VECTORS[3]
+        shards = score_tasks(vector, CORPUS[:5]) + score_tasks(vector, CORPUS[5:])
+        assert shards == score_tasks(vector, CORPUS)
+
+    def test_empty_tasks(self):
+        """No tasks should give zero outcomes."""
+        assert evaluate(VECTORS[0], []) == aggregate_outcomes([])
+        assert aggregate_outcomes([])["task_accuracy"] == 0.0
+
+
+class TestEvaluationExecutor:
+    """Tests for EvaluationExecutor."""
+
+    def test_rejects_unknown_backend(self):
+        """Unknown backends and bad worker counts should raise."""
+        with pytest.raises(ValueError):
+            EvaluationExecutor("gpu")
+        with pytest.raises(ValueError):
+            EvaluationExecutor("thread", max_workers=0)
+
+    @pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+    @pytest.mark.parametrize("parallel_tasks", [False, True])
+    def test_batch_matches_evaluate(self, backend, parallel_tasks):
+        """Every backend should return evaluate() outcomes in input order."""
+        expected = [evaluate(vector, CORPUS) for vector in VECTORS]
+        with EvaluationExecutor(backend, max_workers=3, parallel_tasks=parallel_tasks) as executor:
+            assert executor.evaluate_batch(VECTORS, CORPUS) == expected
+            assert executor.evaluate(VECTORS[1], CORPUS) == expected[1]
+
+    def test_shard_covers_tasks_in_order(self):
+        """Shards should partition the corpus without reordering it."""
+        executor = EvaluationExecutor("thread", max_workers=8, parallel_tasks=True)
+        for batch_size in (1, 2, 3, 8, 20):
+            shards = executor._shard(CORPUS, batch_size)
+            assert [task for shard in shards for task in shard] == CORPUS
+            assert len(shards) <= max(1, -(-8 // batch_size))
+
+    def test_stats_accumulate(self):
+        """Stats should count batches, evaluations and tasks."""
+        stats = EvaluationStats()
+        executor = create_executor("thread", max_workers=2)
+        try:
+            executor.evaluate_batch(VECTORS[:3], CORPUS[:4], stats)
+            executor.evaluate(VECTORS[0], CORPUS[:4], stats)
+        finally:
+            executor.shutdown()
+
+        assert stats.batches == 2
+        assert stats.evaluations == 4
+        assert stats.tasks_evaluated == 16
+        assert stats.wall_seconds > 0
+        assert stats.to_dict()["tasks_per_second"] == pytest.approx(16 / stats.wall_seconds)
+
+    def test_empty_batch(self):
+        """An empty batch should not start a pool."""
+        executor = EvaluationExecutor("process", max_workers=2)
+        assert executor.evaluate_batch([], CORPUS) == []
+        assert executor._pool is None
+
+
+class TestCascadeExecutor:
+    """ThreeMOOCascade results should not depend on the backend."""
+
+    def _run(self, executor):
+        random.seed(11)
+        cascade = ThreeMOOCascade(
+            use_mock=True,
+            core_corpus=CORPUS,
+            edge_corpus=CORPUS[:4],
+            executor=executor,
+        )
+        return cascade.run(max_iterations_per_phase=2, early_stop_threshold=1.1)
+
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_matches_serial(self, backend):
+        """Parallel cascades should reproduce the serial results."""
+        serial = self._run(None)
+        with EvaluationExecutor(backend, max_workers=2, parallel_tasks=True) as executor:
+            parallel = self._run(executor)
+
+        for a, b in zip(serial, parallel):
+            assert a.best_config_vector == b.best_config_vector
+            assert a.best_outcomes == b.best_outcomes
+            assert [p.config_vector for p in a.pareto_points] == [p.config_vector for p in b.pareto_points]
+
+    def test_phase_metadata(self):
+        """Each phase should report evaluation stats in its metadata."""
+        results = self._run(EvaluationExecutor("thread", max_workers=2))
+        for result in results:
+            evaluation = result.metadata["evaluation"]
+            assert evaluation["backend"] == "thread"
+            assert evaluation["max_workers"] == 2
+            assert evaluation["evaluations"] > 0
+            assert evaluation["tasks_evaluated"] > 0
+            assert 0 < evaluation["wall_seconds"] <= evaluation["phase_wall_seconds"]
+            assert evaluation["evaluations_per_second"] > 0
@@ -0,0 +1,225 @@
+"""
+Tests for optimization/execution_store.py
+
+Tests:
+- Per-key upserts match the original in-memory config update
+- Stats, top-performing and history queries
+- Legacy JSON/JSONL import, including claims left by a crashed import
+- Concurrent writers from threads and processes
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import threading
+import time
+
+import pytest
+from core.config import FullConfig, VectorCodec
+from optimization.execution_store import ExecutionStore
+from optimization.skill_execution_tracker import ExecutionType, SkillExecutionTracker
+
+OUTPUTS = [
+    "[assert|neutral] Done [ground:tests] [conf:0.9] [state:confirmed]",
+    "[assert|emphatic] Probably fine [conf:0.5]",
+    "no claims here",
+]
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = SkillExecutionTracker(storage_dir=tmp_path)
+    yield tracker
+    tracker.store.close()
+
+
+def run(tracker, execution_type, name, success, output):
+    execution_id = tracker.start_execution(execution_type, name)
+    return tracker.end_execution(execution_id, success, output)
+
+
+def worker(path, prefix, count):
+    """Process target: record executions into a shared store."""
+    store = ExecutionStore(path)
+    for i in range(count):
+        record = {
+            "execution_id": f"{prefix}-{i}", "execution_type": "skill", "name": f"s{i % 3}",
+            "success": i % 2 == 0, "verix_compliance": 0.5, "duration_ms": 1.0,
+            "timestamp": time.time(),
+        }
+        store.record_execution(f"skill:s{i % 3}", record, [0.0] * 14, alpha=0.3, updated_at=time.time())
+    store.close()
+
+
+class TestTrackerPersistence:
+    """SkillExecutionTracker on top of the store."""
+
+    def test_matches_in_memory_update(self, tracker):
+        """Counters and the compliance EMA should match the original math."""
+        rng = random.Random(1)
+        expected = {}
+        for _ in range(60):
+            name = rng.choice(["code-review", "research-audit", "deploy"])
+            execution_type = rng.choice([ExecutionType.SKILL, ExecutionType.COMMAND])
+            record = run(tracker, execution_type, name, rng.random() < 0.7, rng.choice(OUTPUTS))
+
+            key = f"{execution_type.value}:{name}"
+            count, success, avg = expected.get(key, (0, 0, 0.0))
+            expected[key] = (
+                count + 1,
+                success + record.success,
+                0.3 * record.verix_compliance + (1 - 0.3) * avg,
+            )
+
+        for key, (count, success, avg) in expected.items():
+            execution_type, name = key.split(":")
+            stats = tracker.get_skill_stats(ExecutionType(execution_type), name)
+            assert stats["execution_count"] == count
+            assert stats["success_rate"] == success / count
+            assert stats["avg_compliance"] == avg
+
+        stats = tracker.stats()
+        assert stats["tracked_skills"] == len(expected)
+        assert stats["total_executions"] == 60
+        assert sum(t["count"] for t in stats["by_type"].values()) == 60
+
+    def test_optimal_config_is_first_seen(self, tracker):
+        """The stored config should be the one used on first execution."""
+        record = run(tracker, ExecutionType.SKILL, "research-audit", True, OUTPUTS[0])
+        config = tracker.get_optimal_config(ExecutionType.SKILL, "research-audit")
+        assert VectorCodec.encode(config) == VectorCodec.encode(VectorCodec.decode(record.config_vector))
+        assert tracker.get_skill_stats(ExecutionType.SKILL, "unknown") is None
+
+    def test_top_performing(self, tracker):
+        """Ranking should use 0.6 * success_rate + 0.4 * avg_compliance."""
+        for _ in range(3):
+            run(tracker, ExecutionType.SKILL, "good", True, OUTPUTS[0])
+            run(tracker, ExecutionType.SKILL, "bad", False, OUTPUTS[2])
+        run(tracker, ExecutionType.SKILL, "rare", True, OUTPUTS[0])
+
+        top = tracker.get_top_performing(5)
+        assert [t["name"] for t in top] == ["good", "bad"]
+        good = tracker.get_skill_stats(ExecutionType.SKILL, "good")
+        assert top[0]["score"] == good["success_rate"] * 0.6 + good["avg_compliance"] * 0.4
+        assert top[1]["score"] == 0.0
+        assert tracker.get_top_performing(1)[0]["name"] == "good"
+
+    def test_execution_history(self, tracker):
+        """History queries should filter by key and time, newest first."""
+        for i in range(4):
+            run(tracker, ExecutionType.SKILL, "a" if i % 2 else "b", True, "")
+        cutoff = time.time()
+        run(tracker, ExecutionType.SKILL, "a", False, "")
+
+        history = tracker.get_execution_history(ExecutionType.SKILL, "a")
+        assert [h["success"] for h in history] == [False, True, True]
+        assert len(tracker.get_execution_history(limit=None)) == 5
+        assert len(tracker.get_execution_history(limit=2)) == 2
+        assert len(tracker.get_execution_history(since=cutoff)) == 1
+
+    def test_reopen(self, tmp_path):
+        """A new tracker on the same directory should see stored configs."""
+        first = SkillExecutionTracker(storage_dir=tmp_path)
+        run(first, ExecutionType.PLAYBOOK, "ship", True, OUTPUTS[0])
+        second = SkillExecutionTracker(storage_dir=tmp_path)
+        assert second.get_skill_stats(ExecutionType.PLAYBOOK, "ship")["execution_count"] == 1
+
+
+class TestLegacyImport:
+    """Trackers written by older versions should be imported once."""
+
+    def test_imports_json_files(self, tmp_path):
+        """skill_configs.json and execution_history.jsonl move into SQLite."""
+        vector = VectorCodec.encode(FullConfig())
+        (tmp_path / "skill_configs.json").write_text(json.dumps({
+            "skill:legacy": {
+                "name": "legacy", "execution_type": "skill", "optimal_config_vector": vector,
+                "execution_count": 4, "success_count": 3, "avg_compliance": 0.5, "last_updated": 1.0,
+            },
+        }, indent=2))
+        lines = [
+            json.dumps({
+                "execution_id": f"skill-legacy-{i}", "execution_type": "skill", "name": "legacy",
+                "success": True, "verix_compliance": 0.5, "duration_ms": 2.0, "timestamp": float(i),
+            })
+            for i in range(4)
+        ]
+        (tmp_path / "execution_history.jsonl").write_text("\n".join(lines) + "\n{torn")
+
+        tracker = SkillExecutionTracker(storage_dir=tmp_path)
+        stats = tracker.get_skill_stats(ExecutionType.SKILL, "legacy")
+        assert stats["execution_count"] == 4
+        assert stats["success_rate"] == 0.75
+        assert tracker.store.count_executions("skill:legacy") == 4
+        assert (tmp_path / "skill_configs.json.migrated").exists()
+        assert (tmp_path / "execution_history.jsonl.migrated").exists()
+        assert not (tmp_path / "skill_configs.json").exists()
+
+        # Reopening does not import again
+        again = SkillExecutionTracker(storage_dir=tmp_path)
+        assert again.store.count_executions() == 4
+
+    def test_recovers_stale_claims(self, tmp_path):
+        """An import that crashed after its claim is retried once stale, without duplicates."""
+        lines = [
+            json.dumps({
+                "execution_id": f"skill-legacy-{i}", "execution_type": "skill", "name": "legacy",
+                "success": True, "verix_compliance": 0.5, "duration_ms": 2.0, "timestamp": float(i),
+            })
+            for i in range(4)
+        ]
+        store = ExecutionStore(tmp_path / "executions.sqlite3")
+        (tmp_path / "execution_history.jsonl").write_text("\n".join(lines[:2]) + "\n")
+        assert store.migrate_legacy(tmp_path) == 2
+
+        # Crashed after inserting the first two records, before the final rename
+        claimed = tmp_path / "execution_history.jsonl.migrating"
+        claimed.write_text("\n".join(lines) + "\n")
+        assert store.migrate_legacy(tmp_path) == 0  # A fresh claim may still be live
+        stale = time.time() - ExecutionStore.STALE_CLAIM_SECONDS - 1
+        os.utime(claimed, (stale, stale))
+        assert store.migrate_legacy(tmp_path) == 2
+        assert store.count_executions("skill:legacy") == 4
+        assert not claimed.exists()
+
+
+class TestConcurrentWriters:
+    """Upserts should not lose updates under concurrency."""
+
+    def test_threads(self, tmp_path):
+        """Threads sharing one store should all land."""
+        store = ExecutionStore(tmp_path / "executions.sqlite3")
+        threads = [
+            threading.Thread(target=worker, args=(tmp_path / "executions.sqlite3", f"t{n}", 30))
+            for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.count_executions() == 120
+        assert store.summary()["executions"] == 120
+        store.close()
+
+    def test_processes(self, tmp_path):
+        """Parallel hook processes should share the database safely."""
+        path = tmp_path / "executions.sqlite3"
+        ExecutionStore(path).close()
+        processes = [
+            multiprocessing.Process(target=worker, args=(path, f"p{n}", 40))
+            for n in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        assert all(process.exitcode == 0 for process in processes)
+
+        store = ExecutionStore(path)
+        summary = store.summary()
+        assert summary["executions"] == 160
+        assert summary["successes"] == 80
+        assert sum(row["execution_count"] for row in store.configs()) == 160
+        store.close()
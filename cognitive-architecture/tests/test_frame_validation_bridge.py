@@ -0,0 +1,294 @@
+"""
+Tests for core/frame_validation_bridge.py
+
+Tests:
+- Validation does no synchronous file I/O
+- Restart replays snapshot + journal tail
+- Compaction, crash recovery and torn journal lines
+- Weight deltas survive restarts and compaction
+- Legacy snapshot loading and persisted correlation resets
+- Processes sharing a directory keep each other's events through compaction
+"""
+
+import copy
+import json
+import threading
+import time
+
+import pytest
+from core.config import FullConfig, MINIMAL_CONFIG
+from core.frame_validation_bridge import FeedbackJournal, FrameValidationBridge
+
+RESPONSES = [
+    "[assert|neutral] The cache is stale [ground:logs] [conf:0.9] [state:confirmed]",
+    "The cache is probably stale.",
+    "[assert|emphatic] Retries fix it [conf:0.4]",
+]
+
+
+@pytest.fixture
+def feedback_dir(tmp_path):
+    yield tmp_path / "feedback"
+    FeedbackJournal.close_all()
+
+
+def make_bridge(feedback_dir, config=None):
+    return FrameValidationBridge(config or FullConfig(), feedback_dir=feedback_dir, flush_interval=60)
+
+
+def state(bridge):
+    return (
+        [fb.to_dict() for fb in bridge.feedback_history],
+        {name: (c.activation_count, c.total_compliance) for name, c in bridge.correlations.items()},
+        bridge.baseline_compliance,
+    )
+
+
+def restart(bridge):
+    """Close the process-wide journal and reopen the directory from disk."""
+    bridge._journal.close()
+    return make_bridge(bridge.feedback_dir)
+
+
+def feed(bridge, count, start=0):
+    for i in range(start, start + count):
+        bridge.validate_and_feedback(RESPONSES[i % len(RESPONSES)], task_type=f"t{i % 2}")
+
+
+class TestWriteBehind:
+    """validate_and_feedback should only enqueue journal writes."""
+
+    def test_no_io_on_validation_path(self, feedback_dir):
+        """Nothing is written until the flusher (or flush()) runs."""
+        bridge = make_bridge(feedback_dir)
+        feed(bridge, 25)
+        assert not (feedback_dir / FeedbackJournal.JOURNAL_FILE).exists()
+        assert not (feedback_dir / FeedbackJournal.SNAPSHOT_FILE).exists()
+
+        bridge._journal.flush()
+        lines = (feedback_dir / FeedbackJournal.JOURNAL_FILE).read_text().splitlines()
+        assert [json.loads(line)["seq"] for line in lines] == list(range(1, 26))
+
+    def test_background_flush(self, feedback_dir):
+        """The flusher thread should write on its interval."""
+        journal = FeedbackJournal.for_directory(feedback_dir, flush_interval=0.01)
+        bridge = make_bridge(feedback_dir)
+        assert bridge._journal is journal
+        feed(bridge, 3)
+        journal_file = feedback_dir / FeedbackJournal.JOURNAL_FILE
+        deadline = time.monotonic() + 5
+        lines = []
+        while len(lines) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            lines = journal_file.read_text().splitlines() if journal_file.exists() else []
+        assert len(lines) == 3
+
+    def test_bridges_share_directory_journal(self, feedback_dir):
+        """A new bridge in the same process sees earlier feedback."""
+        first = make_bridge(feedback_dir)
+        feed(first, 5)
+        second = make_bridge(feedback_dir)
+        assert state(second) == state(first)
+
+
+class TestReplay:
+    """Restart should rebuild the exact in-memory state."""
+
+    def test_journal_replay(self, feedback_dir):
+        """Snapshot-less restart replays every journal event."""
+        bridge = make_bridge(feedback_dir, MINIMAL_CONFIG)
+        feed(bridge, 30)
+        expected = state(bridge)
+        assert expected[2] is not None  # Minimal config tracks the baseline
+
+        assert state(restart(bridge)) == expected
+
+    def test_compaction(self, feedback_dir):
+        """compact() writes a snapshot and truncates the journal."""
+        bridge = make_bridge(feedback_dir)
+        feed(bridge, 20)
+        bridge._save_history()
+        assert (feedback_dir / FeedbackJournal.JOURNAL_FILE).read_text() == ""
+        snapshot = json.loads((feedback_dir / FeedbackJournal.SNAPSHOT_FILE).read_text())
+        assert snapshot["journal_seq"] == 20
+        assert not (feedback_dir / (FeedbackJournal.SNAPSHOT_FILE + ".tmp")).exists()
+
+        feed(bridge, 7, start=20)
+        expected = state(bridge)
+        assert state(restart(bridge)) == expected
+
+    def test_history_bounded(self, feedback_dir):
+        """Replay keeps only the newest HISTORY_LIMIT entries but all correlations."""
+        bridge = make_bridge(feedback_dir)
+        feed(bridge, 1005)
+        expected = state(bridge)
+        assert len(expected[0]) == 1000
+        assert state(restart(bridge)) == expected
+
+    def test_crash_before_truncate(self, feedback_dir):
+        """Journal lines already covered by the snapshot are not applied twice."""
+        bridge = make_bridge(feedback_dir)
+        feed(bridge, 12)
+        bridge._journal.flush()
+        journal_file = feedback_dir / FeedbackJournal.JOURNAL_FILE
+        stale = journal_file.read_text()
+        bridge._save_history()
+        feed(bridge, 3, start=12)
+        bridge._journal.flush()
+        expected = state(bridge)
+
+        # Simulate a crash after os.replace() but before the truncate
+        journal_file.write_text(stale + journal_file.read_text())
+        assert state(restart(bridge)) == expected
+
+    def test_torn_line_skipped(self, feedback_dir):
+        """A partially written final line should be ignored."""
+        bridge = make_bridge(feedback_dir)
+        feed(bridge, 4)
+        bridge._journal.flush()
+        expected = state(bridge)
+        with open(feedback_dir / FeedbackJournal.JOURNAL_FILE, "a") as f:
+            f.write('{"seq": 5, "feedb')
+        assert state(restart(bridge)) == expected
+
+    def test_append_after_torn_line(self, feedback_dir):
+        """Events written after a torn line are not glued onto it."""
+        bridge = make_bridge(feedback_dir)
+        feed(bridge, 4)
+        bridge._journal.flush()
+        journal_file = feedback_dir / FeedbackJournal.JOURNAL_FILE
+        with open(journal_file, "a") as f:
+            f.write('{"seq": 5, "feedb')
+        reopened = restart(bridge)
+        feed(reopened, 3, start=4)
+        reopened._journal.flush()
+        again = restart(reopened)
+        assert state(again) == state(reopened)
+        assert len(again.feedback_history) == 7
+
+        # A complete final event that only lost its newline is kept
+        data = journal_file.read_bytes()
+        journal_file.write_bytes(data[:-1])
+        assert state(restart(again)) == state(reopened)
+        assert journal_file.read_bytes() == data
+
+    def test_legacy_snapshot(self, feedback_dir):
+        """Snapshots written before journaling should still load."""
+        bridge = make_bridge(feedback_dir)
+        feed(bridge, 6)
+        data = bridge._journal.snapshot()
+        del data["journal_seq"]
+        bridge._journal.close()
+        (feedback_dir / FeedbackJournal.SNAPSHOT_FILE).write_text(json.dumps(data, indent=2))
+        (feedback_dir / FeedbackJournal.JOURNAL_FILE).unlink()
+
+        reloaded = make_bridge(feedback_dir)
+        assert state(reloaded) == state(bridge)
+        feed(reloaded, 1)
+        reloaded._journal.flush()
+        assert state(restart(reloaded)) == state(reloaded)
+
+    def test_reset_persisted(self, feedback_dir):
+        """reset_correlations() should survive a restart."""
+        bridge = make_bridge(feedback_dir)
+        feed(bridge, 8)
+        bridge.reset_correlations()
+        feed(bridge, 2, start=8)
+        expected = state(bridge)
+        assert state(restart(bridge)) == expected
+
+
+class TestWeightDeltas:
+    """Computed weight deltas are persisted, not reset on reload."""
+
+    def feed_split(self, bridge):
+        """Full-config frames see good responses, then only evidential sees bad ones."""
+        for _ in range(15):
+            bridge.validate_and_feedback(RESPONSES[0])
+        bridge.config = copy.deepcopy(MINIMAL_CONFIG)
+        for _ in range(15):
+            bridge.validate_and_feedback(RESPONSES[1])
+
+    def deltas(self, bridge):
+        return {name: c.weight_delta for name, c in bridge.correlations.items()}
+
+    def test_deltas_survive_reload(self, feedback_dir):
+        bridge = make_bridge(feedback_dir)
+        self.feed_split(bridge)
+        expected = self.deltas(bridge)
+        assert any(expected.values())
+
+        bridge._journal.flush()
+        assert self.deltas(restart(bridge)) == expected
+
+        reloaded = make_bridge(feedback_dir)
+        reloaded._save_history()
+        assert self.deltas(restart(reloaded)) == expected
+
+    def test_suggestion_deltas_persisted(self, feedback_dir):
+        """Deltas computed for suggestions (no auto-adjust) are journaled too."""
+        bridge = FrameValidationBridge(FullConfig(), feedback_dir=feedback_dir, auto_adjust=False, flush_interval=60)
+        self.feed_split(bridge)
+        assert not any(self.deltas(bridge).values())
+        bridge.get_adjustment_suggestions()
+        expected = self.deltas(bridge)
+        assert any(expected.values())
+        bridge._journal.flush()
+        assert self.deltas(restart(bridge)) == expected
+
+
+class TestSharedDirectory:
+    """Journals in separate processes (separate instances) on one directory."""
+
+    def open_journal(self, feedback_dir):
+        # Not for_directory(): that would share one instance in this process
+        return FeedbackJournal(feedback_dir, flush_interval=60)
+
+    def test_compaction_keeps_other_writers(self, feedback_dir):
+        """A compaction must not drop lines another process appended."""
+        bridge = make_bridge(feedback_dir)
+        bridge.validate_and_feedback(RESPONSES[0])
+        feedback = bridge.feedback_history[-1]
+        bridge._journal.close()
+        first, second = self.open_journal(feedback_dir), self.open_journal(feedback_dir)
+        for _ in range(30):
+            first.append(feedback)
+        first.flush()
+        for _ in range(20):
+            second.append(feedback)
+        second.compact()
+        for _ in range(5):
+            first.append(feedback)
+        first.flush()
+
+        lines = (feedback_dir / FeedbackJournal.JOURNAL_FILE).read_text().splitlines()
+        assert [json.loads(line)["seq"] for line in lines] == list(range(52, 57))
+        reopened = self.open_journal(feedback_dir)
+        assert len(reopened.history) == 56
+
+    def test_concurrent_writers(self, feedback_dir):
+        """Interleaved appends and compactions lose no events."""
+        journals = [self.open_journal(feedback_dir) for _ in range(2)]
+        bridge = make_bridge(feedback_dir)
+        bridge.validate_and_feedback(RESPONSES[1])
+        feedback = bridge.feedback_history[-1]
+        bridge._journal.close()
+
+        def write(journal):
+            for i in range(200):
+                journal.append(feedback)
+                if i % 10 == 0:
+                    journal.flush()
+                if i % 50 == 0:
+                    journal.compact()
+            journal.flush()
+
+        threads = [threading.Thread(target=write, args=(j,)) for j in journals]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        reopened = self.open_journal(feedback_dir)
+        assert len(reopened.history) == 401
+        frame = feedback.active_frames[0]
+        assert reopened.correlations[frame].activation_count == 401
@@ -6,8 +6,11 @@ Tests:
 - OptimizationOutcome structure
 - Pareto frontier operations
 - Impact factors
+- ThrashingDetector ring buffers match the list-based detector
 """
 
+import random
+
 import pytest
 import sys
 import os
@@ -19,6 +22,7 @@ from optimization.globalmoo_client import (
     OptimizationOutcome,
     ParetoPoint,
     Objective,
+    ThrashingDetector,
     ObjectiveDirection,
     create_client,
     create_cognitive_project,
@@ -206,6 +210,122 @@ class TestGlobalMOOClient:
         assert "task_accuracy" in impact
 
 
+class ReferenceThrashingDetector:
+    """The original list-based detector, kept to check decisions."""
+
+    def __init__(self, window=10, threshold=0.1, improvement=0.01, oscillations=3):
+        self.window = window
+        self.threshold = threshold
+        self.improvement = improvement
+        self.oscillations = oscillations
+        self.configs = []
+        self.outcomes = []
+
+    def record(self, config, outcomes):
+        self.configs.append(list(config))
+        self.outcomes.append(dict(outcomes))
+
+    def distance(self, a, b):
+        return sum((ai - bi) ** 2 for ai, bi in zip(a, b)) ** 0.5
+
+    def detect(self):
+        if len(self.configs) < self.window:
+            return False, None
+
+        first, last = self.outcomes[-self.window], self.outcomes[-1]
+        if not any(
+            abs(last[key] - first[key]) > self.improvement
+            for key in first if key in last
+        ):
+            return True, "stagnation"
+
+        recent = self.configs[-6:]
+        count = sum(
+            self.distance(recent[i], recent[i + 1]) > self.threshold * 2
+            and self.distance(recent[i], recent[i + 2]) < self.threshold
+            for i in range(len(recent) - 2)
+        )
+        if len(self.configs) >= 4 and count >= self.oscillations:
+            return True, "oscillation"
+
+        recent = self.configs[-self.window:]
+        centroid = [sum(c[i] for c in recent) / len(recent) for i in range(len(recent[0]))]
+        if all(self.distance(c, centroid) <= self.threshold * 2 for c in recent):
+            return True, "similarity_clustering"
+        return False, None
+
+
+class TestThrashingDetector:
+    """Tests for the ring-buffer ThrashingDetector."""
+
+    def _stream(self, rng, n):
+        """Configs and outcomes that hit every thrashing pattern."""
+        a = [rng.random() for _ in range(14)]
+        b = [v + 0.3 for v in a]
+        for i in range(n):
+            phase = (i // 40) % 4
+            if phase == 0:  # random search
+                config = [rng.random() for _ in range(14)]
+            elif phase == 1:  # A->B->A->B
+                config = [v + rng.uniform(-0.01, 0.01) for v in (a if i % 2 else b)]
+            else:  # clustered around A
+                config = [v + rng.uniform(-0.02, 0.02) for v in a]
+            outcomes = {"task_accuracy": round(rng.random(), 2) if phase != 3 else 0.5}
+            if rng.random() < 0.2:
+                outcomes["token_efficiency"] = rng.random()
+            yield config, outcomes
+
+    @pytest.mark.parametrize("window", [4, 10])
+    def test_matches_reference(self, window):
+        """Decisions should equal the list-based detector, including after recovery clears."""
+        rng = random.Random(window)
+        detector = ThrashingDetector(stagnation_window=window)
+        reference = ReferenceThrashingDetector(window=window)
+        reasons = set()
+
+        for config, outcomes in self._stream(rng, 2000):
+            detector.record(config, outcomes)
+            reference.record(config, outcomes)
+            decision = detector.detect_thrashing()
+            assert decision == reference.detect()
+            if decision[0]:
+                reasons.add(decision[1])
+                detector.clear_history()
+                reference = ReferenceThrashingDetector(window=window)
+
+        assert reasons == {"stagnation", "oscillation", "similarity_clustering"}
+
+    def test_constant_memory(self):
+        """Retained history should not grow with run length."""
+        detector = ThrashingDetector()
+        rng = random.Random(0)
+        for i in range(5000):
+            detector.record([rng.random() for _ in range(14)], {"task_accuracy": i / 5000})
+            if i == 100:
+                nbytes = detector._configs.nbytes + detector._outcomes.nbytes
+
+        assert detector.record_count == 5000
+        assert detector._configs.nbytes + detector._outcomes.nbytes == nbytes
+        assert len(detector.config_history) == 10
+        assert len(detector.outcome_history) == 10
+        assert detector.outcome_history[-1] == {"task_accuracy": 4999 / 5000}
+
+    def test_history_views(self):
+        """config_history/outcome_history should list records oldest first."""
+        detector = ThrashingDetector(stagnation_window=3, history_size=6)
+        for i in range(8):
+            outcomes = {"a": float(i)} if i % 2 else {"b": float(i)}
+            detector.record([float(i), 0.0], outcomes)
+
+        assert detector.config_history == [[float(i), 0.0] for i in range(2, 8)]
+        assert detector.outcome_history == [{"a": 5.0}, {"b": 6.0}, {"a": 7.0}]
+
+        detector.clear_history()
+        assert detector.record_count == 0
+        assert detector.config_history == []
+        assert detector.detect_thrashing() == (False, None)
+
+
 class TestObjective:
     """Tests for Objective dataclass."""
 
@@ -0,0 +1,164 @@
+"""
+Tests for loopctl/grade_cache.py
+
+Tests:
+- Identical artifacts are served from the cache without re-grading
+- Keys include artifact, harness hash and evaluation mode
+- Failed CLI judging and missing artifacts are never cached
+- Counters persist and surface in get_status
+"""
+
+import json
+
+import pytest
+from loopctl.core import FrozenHarness, get_status, ralph_iteration_complete
+from loopctl.grade_cache import GradeCache, hash_artifact
+
+ARTIFACT = "[assert|confident] Handles edge cases [ground:tests] [conf:0.9] [state:confirmed]"
+
+
+@pytest.fixture
+def loop_dir(tmp_path):
+    loop_dir = tmp_path / ".loop"
+    loop_dir.mkdir()
+    return loop_dir
+
+
+def make_harness(loop_dir, **kwargs):
+    kwargs.setdefault("use_cli_evaluator", False)
+    kwargs.setdefault("use_connascence", False)
+    return FrozenHarness(loop_dir, **kwargs)
+
+
+def count_grades(harness, monkeypatch):
+    """Wrap heuristic grading to count real (uncached) grades."""
+    calls = []
+    original = harness._grade_with_heuristics
+
+    def counting(content):
+        calls.append(content)
+        return original(content)
+
+    monkeypatch.setattr(harness, "_grade_with_heuristics", counting)
+    return calls
+
+
+class TestGradeCache:
+    """Tests for GradeCache storage."""
+
+    def test_round_trip_and_counters(self, loop_dir):
+        """put/get should round-trip and count hits and misses."""
+        cache = GradeCache(loop_dir)
+        assert cache.get("a", "h", "heuristic") is None
+        cache.put("a", "h", "heuristic", {"overall": 0.5})
+        assert cache.get("a", "h", "heuristic") == {"overall": 0.5}
+        assert cache.get("a", "h2", "heuristic") is None
+        assert cache.get("a", "h", "cli_evaluator") is None
+        cache.close()
+
+        stats = GradeCache(loop_dir).stats()
+        assert stats == {"hits": 1, "misses": 3, "hit_rate": 0.25, "evictions": 0, "entries": 1}
+
+    def test_lru_eviction(self, loop_dir):
+        """Least recently used entries go first beyond max_entries."""
+        cache = GradeCache(loop_dir, max_entries=2)
+        cache.put("a", "h", "m", {"overall": 0.1})
+        cache.put("b", "h", "m", {"overall": 0.2})
+        cache.get("a", "h", "m")
+        cache.put("c", "h", "m", {"overall": 0.3})
+        assert cache.get("b", "h", "m") is None
+        assert cache.get("a", "h", "m") is not None
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+
+    def test_hash_artifact(self, tmp_path):
+        """Missing artifacts hash like empty content."""
+        path = tmp_path / "out.txt"
+        assert hash_artifact(path) == hash_artifact(tmp_path / "empty")
+        path.write_text("x")
+        assert hash_artifact(path) != hash_artifact(tmp_path / "empty")
+
+
+class TestHarnessCaching:
+    """FrozenHarness.grade() on top of the cache."""
+
+    def test_identical_artifact_not_regraded(self, loop_dir, monkeypatch):
+        """A second harness on the same bytes should hit the cache."""
+        artifact = loop_dir / "output.txt"
+        artifact.write_text(ARTIFACT)
+
+        first = make_harness(loop_dir)
+        calls = count_grades(first, monkeypatch)
+        metrics = first.grade(artifact)
+        assert len(calls) == 1 and not first.last_cache_hit
+
+        second = make_harness(loop_dir)
+        calls = count_grades(second, monkeypatch)
+        assert second.grade(artifact) == metrics
+        assert calls == [] and second.last_cache_hit
+
+        artifact.write_text(ARTIFACT + " changed")
+        second.grade(artifact)
+        assert len(calls) == 1 and not second.last_cache_hit
+
+    def test_key_includes_harness_and_mode(self, loop_dir):
+        """Different harness versions and modes get separate entries."""
+        artifact = loop_dir / "output.txt"
+        artifact.write_text(ARTIFACT)
+        make_harness(loop_dir).grade(artifact)
+        make_harness(loop_dir, harness_version="2.0.0").grade(artifact)
+        with_connascence = make_harness(loop_dir, use_connascence=True)
+        with_connascence.grade(artifact)
+        assert with_connascence.cache_stats()["entries"] == 3
+        assert with_connascence.cache_stats()["hits"] == 0
+
+    def test_cli_failure_not_cached(self, loop_dir, monkeypatch):
+        """A heuristic fallback after a CLI error must not pin the score."""
+        artifact = loop_dir / "output.txt"
+        artifact.write_text(ARTIFACT)
+        harness = make_harness(loop_dir)
+        harness._cli_evaluator = object()
+
+        def failing(content):
+            raise RuntimeError("judge unavailable")
+
+        monkeypatch.setattr(harness, "_grade_with_cli", failing)
+        assert harness.grade(artifact)["evaluation_mode"] == "heuristic"
+        assert harness.cache_stats()["entries"] == 0
+
+    def test_missing_artifact_and_disabled_cache(self, loop_dir):
+        """Missing artifacts are not stored; use_cache=False skips the cache."""
+        harness = make_harness(loop_dir)
+        assert harness.grade(loop_dir / "missing.txt")["evaluation_mode"] == "none"
+        assert harness.cache_stats()["entries"] == 0
+
+        artifact = loop_dir / "output.txt"
+        artifact.write_text(ARTIFACT)
+        uncached = make_harness(loop_dir, use_cache=False)
+        uncached.grade(artifact)
+        assert uncached.cache_stats() is None
+        assert harness.cache_stats()["entries"] == 0
+
+
+class TestLoopIntegration:
+    """Cache hits through the stop-hook entry point."""
+
+    def test_status_reports_cache(self, loop_dir, monkeypatch):
+        """Repeated iterations on one artifact should show up as hits."""
+        monkeypatch.setattr(FrozenHarness, "_init_cli_evaluator", lambda self: None)
+        monkeypatch.delenv("META_LOOP_EMERGENCY_STOP", raising=False)
+        assert get_status(str(loop_dir))["grade_cache"]["entries"] == 0
+
+        artifact = loop_dir / "output.txt"
+        artifact.write_text(ARTIFACT)
+        for _ in range(3):
+            ralph_iteration_complete("state.md", str(loop_dir), output_path=str(artifact))
+
+        report = json.loads((loop_dir / "eval_report.json").read_text())
+        assert report["grade_cache_hit"] is True
+        assert report["artifact_hash"] == hash_artifact(artifact)[:16]
+
+        stats = get_status(str(loop_dir))["grade_cache"]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
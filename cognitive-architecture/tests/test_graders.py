@@ -6,11 +6,14 @@ Tests:
 - VERIXGrader, VERILINGUAGrader
 - CompositeGrader
 - RubricGrader and council evaluation
+- Concurrent council judges, timeouts, early consensus and grade_many
 """
 
 import pytest
 import sys
 import os
+import threading
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -312,6 +315,135 @@ class TestRubricGrader:
         assert result.judge_model == "council"
 
 
+def sleeping_judge(score, delay, calls=None):
+    """Judge backend that answers with a fixed 0-4 final score after delay."""
+    def judge(prompt):
+        if calls is not None:
+            calls.append(prompt)
+        time.sleep(delay)
+        return '{"criterion_scores": {}, "overall_reasoning": "ok", "final_score": %s}' % score
+    return judge
+
+
+class TestCouncilConcurrency:
+    """Tests for concurrent council grading with judge backends."""
+
+    TASK = {"id": "test", "task": "Test task"}
+
+    def test_latency_is_max_not_sum(self):
+        """Judges run concurrently; results aggregate in council order."""
+        judges = {
+            JudgeModel.CLAUDE: sleeping_judge(4, 0.3),
+            JudgeModel.GEMINI: sleeping_judge(2, 0.2),
+            JudgeModel.CODEX: sleeping_judge(0, 0.1),
+        }
+        grader = RubricGrader(use_council=True, judges=judges)
+        start = time.monotonic()
+        result = grader.grade("Test response", self.TASK)
+        assert time.monotonic() - start < 0.5
+        assert result.score == pytest.approx(0.5)
+        assert result.reasoning.startswith("[claude] ok\n\n[gemini] ok\n\n[codex] ok")
+
+    def test_timeout_and_error_excluded(self):
+        """Slow or failing judges are left out of the aggregate."""
+        def broken(prompt):
+            raise RuntimeError("quota")
+
+        judges = {
+            JudgeModel.CLAUDE: sleeping_judge(3, 0.0),
+            JudgeModel.GEMINI: sleeping_judge(0, 2.0),
+            JudgeModel.CODEX: broken,
+        }
+        grader = RubricGrader(use_council=True, judges=judges, judge_timeout=0.2)
+        start = time.monotonic()
+        result = grader.grade("Test response", self.TASK)
+        assert time.monotonic() - start < 1.0
+        assert result.score == pytest.approx(0.75)
+        assert "[gemini] timed out" in result.reasoning
+        assert "[codex] judge error: quota" in result.reasoning
+
+    def test_unparseable_judges_excluded(self):
+        """Garbage replies are not votes: no zero scores, no false consensus."""
+        def garbage(prompt):
+            return "I'd rather not answer in JSON."
+
+        judges = {
+            JudgeModel.CLAUDE: garbage,
+            JudgeModel.GEMINI: garbage,
+            JudgeModel.CODEX: sleeping_judge(3.6, 0.05),
+        }
+        result = RubricGrader(use_council=True, judges=judges, consensus_quorum=2).grade("r", self.TASK)
+        assert result.score == pytest.approx(0.9)
+        assert "consensus" not in result.reasoning
+        assert "[claude] judge error: unparseable response" in result.reasoning
+        assert "[gemini] judge error: unparseable response" in result.reasoning
+
+        judges[JudgeModel.GEMINI] = sleeping_judge(3.6, 0.0)
+        result = RubricGrader(use_council=True, judges=judges).grade("r", self.TASK)
+        assert result.score == pytest.approx(0.9)
+        assert result.confidence == pytest.approx(1.0)
+
+        # Only garbage: nothing to aggregate
+        judges = {model: garbage for model in judges}
+        result = RubricGrader(use_council=True, judges=judges).grade("r", self.TASK)
+        assert result.score == 0.0 and result.reasoning.startswith("No council results")
+
+    def test_early_consensus(self):
+        """Once a quorum agrees, the straggler is not waited for."""
+        judges = {
+            JudgeModel.CLAUDE: sleeping_judge(3, 0.0),
+            JudgeModel.GEMINI: sleeping_judge(3.1, 0.05),
+            JudgeModel.CODEX: sleeping_judge(0, 2.0),
+        }
+        grader = RubricGrader(use_council=True, judges=judges, consensus_quorum=2)
+        start = time.monotonic()
+        result = grader.grade("Test response", self.TASK)
+        assert time.monotonic() - start < 1.0
+        assert result.score == pytest.approx(0.7625)
+        assert "consensus after 2/3 judges" in result.reasoning
+
+        # Disagreement keeps waiting for every judge
+        judges[JudgeModel.GEMINI] = sleeping_judge(0.5, 0.05)
+        judges[JudgeModel.CODEX] = sleeping_judge(2, 0.1)
+        result = RubricGrader(use_council=True, judges=judges, consensus_quorum=2).grade("r", self.TASK)
+        assert result.score == pytest.approx(5.5 / 12)
+
+    def test_grade_many_shares_prefix(self):
+        """All judge prompts start with the same response-independent prefix."""
+        calls = []
+        lock = threading.Lock()
+
+        def judge(prompt):
+            with lock:
+                calls.append(prompt)
+            return '{"criterion_scores": {"Coherence": {"score": 2}}, "overall_reasoning": "ok"}'
+
+        grader = RubricGrader(judges={JudgeModel.CLAUDE: judge})
+        responses = [f"response {i}" for i in range(5)]
+        results = grader.grade_many(responses, self.TASK, expected="something")
+
+        prefix = grader._build_judge_prefix(self.TASK, "something")
+        assert len(calls) == 5
+        assert all(p.startswith(prefix) for p in calls)
+        assert sorted(p[len(prefix):].split("\n")[2] for p in calls) == responses
+        # No final_score: weighted mean of the scored criteria
+        assert [r.score for r in results] == [0.5] * 5
+
+    def test_grade_many_mock_matches_grade(self):
+        """Without backends grade_many equals grading one by one."""
+        grader = RubricGrader(use_council=True)
+        responses = ["short", "## Heading\n\n[ground:x] [conf:0.9] " + "x" * 600]
+        batched = grader.grade_many(responses, self.TASK)
+        assert [r.to_dict() for r in batched] == [grader.grade(r, self.TASK).to_dict() for r in responses]
+
+    def test_unparseable_response(self):
+        """Garbage from a judge scores zero with zero confidence."""
+        grader = RubricGrader(judges={JudgeModel.CLAUDE: lambda prompt: "no json here"})
+        result = grader.grade("Test response", self.TASK)
+        assert result.score == 0.0 and result.confidence == 0.0
+        assert result.raw_response == "no json here"
+
+
 class TestCreateRubric:
     """Tests for create_rubric() function."""
 
@@ -0,0 +1,167 @@
+"""
+Tests for optimization/impact_analyzer.py ablation
+
+Tests:
+- Shared-baseline ablation matches the original per-candidate loop
+- Batch, thread-pool and serial evaluation give identical results
+- Every trial is evaluated by default; distinct vectors once when deterministic
+- Pairwise interaction effects and MonthlyAnalyzer batch passthrough
+"""
+
+import random
+import threading
+
+import pytest
+from optimization.dspy_level1 import TelemetryAggregator, TelemetryPoint
+from optimization.impact_analyzer import ImpactAnalyzer
+from optimization.monthly_analyzer import MonthlyAnalyzer
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    rng = random.Random(3)
+    telemetry = TelemetryAggregator(storage_dir=tmp_path / "telemetry")
+    for i in range(40):
+        vector = [float(rng.random() > 0.5) for _ in range(7)] + [float(rng.randint(0, 2))] * 2
+        vector += [float(i % 2), float(rng.random() > 0.5), 0.0, 0.0, 0.0]
+        telemetry.record(TelemetryPoint(
+            config_vector=vector,
+            outcomes={"task_accuracy": rng.random()},
+            task_type="coding",
+            timestamp=float(i),
+        ))
+    return ImpactAnalyzer(telemetry=telemetry)
+
+
+def objective(vector):
+    """Deterministic outcomes with an interaction between dims 0 and 1."""
+    return {
+        "task_accuracy": 0.2 + 0.2 * vector[0] + 0.1 * vector[1] * vector[0] + 0.5 * vector[9],
+        "token_efficiency": 0.9 - 0.1 * vector[7] - 0.05 * vector[2],
+        "epistemic_consistency": 0.5 + 0.1 * vector[9],
+        "edge_robustness": 0.6 - 0.2 * vector[3] * vector[4],
+        "grounding_score": 0.3 * vector[9] + 0.2 * vector[10],
+    }
+
+
+def reference_ablation(analyzer, candidates, evaluation_fn, n_trials=10):
+    """The original per-candidate loop (re-evaluates baselines each time)."""
+    results = []
+    baseline_configs = analyzer._get_baseline_configs()
+    for idx in candidates:
+        if idx >= len(analyzer.CONFIG_DIMENSIONS):
+            continue
+        baseline_scores, ablated_scores = [], []
+        for config in baseline_configs[:n_trials]:
+            baseline_scores.append(analyzer._composite_score(evaluation_fn(config)))
+            ablated = config.copy()
+            ablated[idx] = 0.0
+            ablated_scores.append(analyzer._composite_score(evaluation_fn(ablated)))
+        baseline_avg = sum(baseline_scores) / len(baseline_scores)
+        ablated_avg = sum(ablated_scores) / len(ablated_scores)
+        results.append((idx, baseline_avg, ablated_avg, ablated_avg - baseline_avg))
+    return results
+
+
+CANDIDATES = [0, 2, 3, 7, 9, 11, 20]
+
+
+class TestSharedBaselineAblation:
+    """Single-dimension ablation."""
+
+    def test_matches_original_loop(self, analyzer):
+        """Scores and deltas equal the per-candidate loop exactly."""
+        results = analyzer.run_ablation_analysis(CANDIDATES, objective, n_trials=10)
+        expected = reference_ablation(analyzer, CANDIDATES, objective)
+        assert [(r.config_index, r.baseline_score, r.ablated_score, r.delta) for r in results] == expected
+        assert {r.recommendation for r in results} >= {"keep", "investigate"}
+        assert analyzer.get_ablation_results() == results
+
+    def test_backends_agree_and_dedupe(self, analyzer):
+        """Batch, threaded and serial evaluation agree; deterministic runs score no vector twice."""
+        seen, lock = [], threading.Lock()
+
+        def counting(vector):
+            with lock:
+                seen.append(tuple(vector))
+            return objective(vector)
+
+        serial = analyzer.run_ablation_analysis(CANDIDATES, counting, deterministic=True)
+        assert len(seen) == len(set(seen))
+        # Original loop: a baseline and an ablated call per candidate per trial
+        assert len(seen) < 2 * 6 * 10
+
+        batches = []
+
+        def batch(vectors):
+            batches.append(len(vectors))
+            return [objective(v) for v in vectors]
+
+        batched = analyzer.run_ablation_analysis(
+            CANDIDATES, batch_evaluation_fn=batch, deterministic=True,
+        )
+        threaded = analyzer.run_ablation_analysis(CANDIDATES, objective, max_workers=4)
+        assert batches == [len(set(seen))]
+        assert [r.to_dict() for r in batched] == [r.to_dict() for r in serial]
+        assert [r.to_dict() for r in threaded] == [r.to_dict() for r in serial]
+
+    def test_stochastic_trials_not_collapsed(self, analyzer):
+        """Without deterministic=True every trial is a separate evaluation."""
+        rng = random.Random(7)
+        calls = []
+
+        def noisy(vector):
+            calls.append(tuple(vector))
+            outcomes = objective(vector)
+            outcomes["task_accuracy"] += rng.gauss(0.0, 0.05)
+            return outcomes
+
+        analyzer.run_ablation_analysis(CANDIDATES, noisy, n_trials=10)
+        # Ten baselines plus ten ablations for each of the six valid candidates
+        assert len(calls) == 10 + 6 * 10
+        assert len(set(calls)) < len(calls)
+
+        batches = []
+
+        def batch(vectors):
+            batches.append(len(vectors))
+            return [noisy(v) for v in vectors]
+
+        analyzer.run_ablation_analysis(CANDIDATES, batch_evaluation_fn=batch)
+        assert batches == [70]
+
+    def test_requires_an_evaluator(self, analyzer):
+        """Without any evaluation function the call is rejected."""
+        with pytest.raises(ValueError):
+            analyzer.run_ablation_analysis([0])
+        assert ImpactAnalyzer().run_ablation_analysis([0], objective) == []
+
+
+class TestInteractionAnalysis:
+    """Pairwise ablation."""
+
+    def test_interaction_effects(self, analyzer):
+        """Only the coupled pairs show a non-zero interaction."""
+        results = analyzer.run_interaction_analysis([0, 1, 3, 4, 9], objective)
+        assert len(results) == 10
+        by_pair = {r.config_indices: r for r in results}
+        assert by_pair[(0, 1)].interaction != pytest.approx(0.0, abs=1e-9)
+        assert by_pair[(3, 4)].interaction != pytest.approx(0.0, abs=1e-9)
+        assert by_pair[(0, 9)].interaction == pytest.approx(0.0, abs=1e-12)
+        assert results[0].config_indices in {(0, 1), (3, 4)}
+
+        singles = {r.config_index: r.delta for r in analyzer.run_ablation_analysis([0, 1], objective)}
+        assert by_pair[(0, 1)].expected_delta == pytest.approx(singles[0] + singles[1])
+        assert "## Pairwise Interactions" in analyzer.generate_report()
+
+
+class TestMonthlyAblation:
+    """MonthlyAnalyzer passes batch evaluation through."""
+
+    def test_batch_passthrough(self, analyzer, tmp_path, monkeypatch):
+        monthly = MonthlyAnalyzer(impact_analyzer=analyzer, proposals_dir=tmp_path / "proposals")
+        monkeypatch.setattr(analyzer, "get_removal_candidates", lambda: ["reserved_11", "evidential_frame"])
+        calls = []
+        monthly._run_ablation(None, lambda vectors: calls.append(len(vectors)) or [objective(v) for v in vectors])
+        assert len(calls) == 1
+        assert [r.config_index for r in analyzer.get_ablation_results()] == [0, 11]
@@ -102,6 +102,26 @@ class TestOptimizeCommand:
         assert result["success"]
         assert "Three-MOO Cascade Status" in result["output"]
 
+    def test_optimize_thread_backend(self, tmp_path, monkeypatch):
+        """Should run the cascade on a thread pool and shut it down."""
+        from commands.optimize import optimize_command
+        from optimization.cascade import ThreeMOOCascade
+        from optimization.dspy_level2 import DSPyLevel2Optimizer
+
+        # Keep cascade results and compiled prompts out of the repo's storage/
+        init = ThreeMOOCascade.__init__
+
+        def init_in_tmp(self, *args, **kwargs):
+            kwargs.setdefault("l2_optimizer", DSPyLevel2Optimizer(cache_dir=tmp_path / "prompts"))
+            init(self, *args, **kwargs)
+            self._storage_dir = tmp_path
+
+        monkeypatch.setattr(ThreeMOOCascade, "__init__", init_in_tmp)
+        result = optimize_command("start", backend="thread", max_workers=2)
+        assert result["success"]
+        assert result["data"]["iterations"] == 3
+        assert len(list(tmp_path.glob("cascade-*.json"))) == 1
+
     def test_optimize_suggest(self):
         """Should return suggestions (uses mock mode)."""
         from commands.optimize import optimize_command
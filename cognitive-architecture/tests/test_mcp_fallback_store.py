@@ -0,0 +1,111 @@
+"""
+Tests for optimization/mcp_fallback_store.py
+
+Tests:
+- Store/load/list round trips through MemoryMCPClient
+- BM25 search with namespace filtering and prefix matching
+- Bulk memory_store_many and FTS index consistency on overwrite
+- One-time import of legacy per-key JSON files
+"""
+
+import json
+
+import pytest
+from optimization.mcp_client import MemoryMCPClient
+from optimization.mcp_fallback_store import FallbackMemoryStore
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(MemoryMCPClient, "_check_mcp_availability", lambda self, force=False: False)
+    client = MemoryMCPClient(namespace="ns", fallback_dir=tmp_path)
+    yield client
+    client.fallback_store.close()
+
+
+class TestClientFallback:
+    """MemoryMCPClient on top of the store."""
+
+    def test_store_load_list(self, client):
+        """Values round-trip; dict-looking strings are decoded as before."""
+        assert client.memory_store("a/one", {"x": 1}, {"WHO": "test"}).success
+        assert client.memory_store("a/two", "plain text").success
+        assert client.memory_store("b/three", '{"y": 2}').success
+
+        loaded = client.load("a/one")
+        assert loaded.data["value"] == {"x": 1}
+        assert loaded.data["metadata"]["WHO"] == "test"
+        assert "timestamp" in loaded.data["metadata"]
+        assert client.load("b/three").data["value"] == {"y": 2}
+        assert not client.load("missing").success
+
+        assert client.list_keys("a/").data["keys"] == ["ns/a/one", "ns/a/two"]
+        assert client.list_keys().data["count"] == 3
+
+    def test_search_ranking_and_namespace(self, client):
+        """Better matches rank first; other namespaces are excluded."""
+        client.memory_store("doc1", "telemetry snapshot for the cascade")
+        client.memory_store("doc2", "telemetry only")
+        client.memory_store("doc3", "unrelated content")
+        other = MemoryMCPClient(namespace="other", fallback_dir=client.fallback_dir)
+        other.memory_store("doc4", "telemetry snapshot telemetry snapshot")
+
+        result = client.vector_search("telemetry snapshot")
+        keys = [m["key"] for m in result.data["matches"]]
+        assert keys == ["ns/doc1", "ns/doc2"]
+        scores = [m["score"] for m in result.data["matches"]]
+        assert scores[0] > scores[1]
+
+        # Words match as token prefixes, like the old substring search
+        assert [m["key"] for m in client.vector_search("snap").data["matches"]] == ["ns/doc1"]
+        assert client.vector_search("!!!").data["matches"] == []
+        assert len(client.fallback_store.search("telemetry")) == 3
+        other.fallback_store.close()
+
+    def test_store_many_and_overwrite(self, client):
+        """Bulk writes land together; overwrites replace the indexed text."""
+        result = client.memory_store_many(
+            (f"k{i}", {"text": f"alpha {i}"}, None) for i in range(50)
+        )
+        assert result.success and result.data["count"] == 50
+        assert len(client.fallback_store) == 50
+
+        client.memory_store("k0", "beta")
+        matches = client.vector_search("alpha", limit=100).data["matches"]
+        assert len(matches) == 49
+        assert client.vector_search("beta").data["matches"][0]["key"] == "ns/k0"
+
+    def test_search_limit(self, client):
+        """limit caps the number of matches."""
+        client.memory_store_many((f"k{i}", "shared words", {}) for i in range(20))
+        assert client.vector_search("shared", limit=5).data["total"] == 5
+
+
+class TestLegacyImport:
+    """Directories written by the old file fallback."""
+
+    def test_imports_json_files_once(self, tmp_path):
+        """Per-key files are imported on first open and left in place."""
+        for i in range(3):
+            (tmp_path / f"ns_legacy_{i}.json").write_text(json.dumps({
+                "key": f"ns/legacy/{i}",
+                "value": {"note": f"legacy memory {i}"},
+                "metadata": {"WHO": "old"},
+                "stored_at": 100.0 + i,
+            }, indent=2))
+        (tmp_path / "broken.json").write_text("{torn")
+        (tmp_path / "other.json").write_text(json.dumps([1, 2]))
+
+        client = MemoryMCPClient(namespace="ns", fallback_dir=tmp_path)
+        assert client.list_keys("legacy/").data["count"] == 3
+        assert client.fallback_store.get("ns/legacy/1")["stored_at"] == 101.0
+        assert client.vector_search("legacy memory").data["total"] == 3
+        assert (tmp_path / "ns_legacy_0.json").exists()
+
+        # Newer writes are not clobbered by a second open
+        client.memory_store("legacy/0", "updated")
+        client.fallback_store.close()
+        again = FallbackMemoryStore(tmp_path / FallbackMemoryStore.DB_FILE)
+        assert again.migrate_legacy(tmp_path) == 0
+        assert again.get("ns/legacy/0")["value"] == "updated"
+        again.close()
@@ -0,0 +1,215 @@
+"""
+Tests for evals/parallel_runner.py
+
+Tests:
+- Parallel CLI evaluation against a fake `claude` executable on PATH
+- Results and aggregates match a serial run regardless of completion order
+- Interrupted runs resume from the checkpoint without redoing finished tasks
+- Transient failures are retried; the checkpoint is keyed by skill content
+"""
+
+import os
+import stat
+import sys
+import threading
+import time
+from dataclasses import asdict
+
+import pytest
+from evals.cli_evaluator import CLITaskEvaluator
+from evals.cli_evaluator import TaskResult as CLITaskResult
+from evals.parallel_runner import TaskCheckpoint, run_tasks
+from evals.real_evaluator import RealTaskEvaluator
+
+# Judge prompts get deterministic scores derived from the task id; skill prompts
+# sleep a little, longer for low task numbers, so completion order is scrambled.
+FAKE_CLAUDE = '''#!{python}
+import os, re, sys, time
+if "--version" in sys.argv:
+    print("fake-claude 1.0")
+    sys.exit(0)
+prompt = sys.stdin.read()
+log = os.environ.get("FAKE_CLAUDE_LOG")
+task = re.search(r"ID: (\\S+)", prompt)
+if log:
+    with open(log, "a") as f:
+        f.write(("judge " + task.group(1) if task else "skill") + "\\n")
+if task is None:
+    number = int(re.search(r"TASK-(\\d+)", prompt).group(1))
+    time.sleep(0.02 * (6 - number % 6))
+    print("skill output for TASK-%d" % number)
+    sys.exit(0)
+number = int(task.group(1).split("-")[1])
+print('{{"intent_accuracy": %.2f, "constraint_coverage": 0.5, "output_quality": %.2f, '
+      '"verix_compliance": 0.7, "l2_purity": 1.0, "passed": %s, "reasoning": "ok"}}'
+      % (number / 10, 1 - number / 20, "true" if number % 3 else "false"))
+'''
+
+
+def make_tasks(n):
+    return [
+        {
+            "id": f"TASK-{i}",
+            "difficulty": ["easy", "medium", "hard"][i % 3],
+            "category": "test",
+            "input": f"Input for TASK-{i}",
+            "success_criteria": "Be correct",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    """Put a fake `claude` executable first on PATH; returns its call log."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "claude"
+    script.write_text(FAKE_CLAUDE.format(python=sys.executable))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_CLAUDE_LOG", str(log))
+    return log
+
+
+@pytest.fixture
+def cli_evaluator(fake_claude, tmp_path, monkeypatch):
+    monkeypatch.setattr(CLITaskEvaluator, "RESULTS_DIR", tmp_path / "results")
+    monkeypatch.setattr(CLITaskEvaluator, "_load_corpus", lambda self: {"version": "t", "tasks": make_tasks(9)})
+    monkeypatch.setattr(CLITaskEvaluator, "_load_skill", lambda self: "# Test skill")
+    return CLITaskEvaluator("prompt-architect")
+
+
+def comparable(result):
+    """EvaluationResult without wall-clock fields."""
+    data = asdict(result)
+    data.pop("timestamp")
+    for task in data["task_results"]:
+        task.pop("execution_time_ms")
+    return data
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX fake executable")
+class TestCLIParallel:
+    """CLITaskEvaluator against a fake `claude` on PATH."""
+
+    def test_parallel_matches_serial(self, cli_evaluator, fake_claude):
+        """Corpus order and aggregates do not depend on worker count."""
+        serial = cli_evaluator.run_evaluation(max_workers=1)
+        parallel = cli_evaluator.run_evaluation(max_workers=4)
+
+        assert [r.task_id for r in parallel.task_results] == [f"TASK-{i}" for i in range(9)]
+        assert comparable(parallel) == comparable(serial)
+        assert parallel.passed_tasks == 6
+        assert parallel.task_results[1].skill_output == "skill output for TASK-1"
+        assert parallel.task_results[4].intent_accuracy == pytest.approx(0.4)
+        # Each run executed and judged every task once
+        assert fake_claude.read_text().count("judge") == 18
+
+    def test_resume_after_interrupt(self, cli_evaluator, fake_claude, monkeypatch):
+        """Finished tasks are read back from the checkpoint, not re-run."""
+        original = CLITaskEvaluator.evaluate_task
+
+        def interrupted(self, task):
+            if task["id"] == "TASK-5":
+                raise KeyboardInterrupt
+            return original(self, task)
+
+        monkeypatch.setattr(CLITaskEvaluator, "evaluate_task", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            cli_evaluator.run_evaluation(max_workers=1)
+        assert len(cli_evaluator._checkpoint().load(CLITaskResult)) == 5
+
+        monkeypatch.setattr(CLITaskEvaluator, "evaluate_task", original)
+        fake_claude.write_text("")
+        result = cli_evaluator.run_evaluation(max_workers=3)
+        judged = sorted(fake_claude.read_text().split("\n")[:-1])
+        assert [line for line in judged if line.startswith("judge")] == [
+            f"judge TASK-{i}" for i in range(5, 9)
+        ]
+        assert result.total_tasks == 9 and result.passed_tasks == 6
+        # A completed run removes its checkpoint
+        assert not cli_evaluator._checkpoint().path.exists()
+
+    def test_no_resume_and_skill_change(self, cli_evaluator):
+        """resume=False and an edited skill both start from scratch."""
+        checkpoint = cli_evaluator._checkpoint()
+        checkpoint.append("TASK-0", CLITaskResult("TASK-0", "easy", "test", "", "stale", "", passed=True))
+        cli_evaluator.skill_content = "# Edited skill"
+        assert cli_evaluator._checkpoint().path != checkpoint.path
+        cli_evaluator.skill_content = "# Test skill"
+
+        result = cli_evaluator.run_evaluation(task_ids=["TASK-0"], resume=False)
+        assert result.task_results[0].skill_output == "skill output for TASK-0"
+        assert result.passed_tasks == 0
+
+
+class TestRunTasks:
+    """run_tasks scheduling and checkpoint handling."""
+
+    def make_result(self, task, output="out"):
+        return CLITaskResult(task["id"], task["difficulty"], "test", task["input"], output, "", passed=True)
+
+    def test_bounded_pool(self):
+        """No more than max_workers tasks run at once."""
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def evaluate(task):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return self.make_result(task)
+
+        results = run_tasks(make_tasks(12), evaluate, max_workers=3, verbose=False)
+        assert len(results) == 12
+        assert 1 < peak[0] <= 3
+
+    def test_transient_failures_retried(self, tmp_path):
+        """Skill errors are not checkpointed, so a resumed run retries them."""
+        checkpoint = TaskCheckpoint(tmp_path / "run.jsonl")
+        tasks = make_tasks(4)
+
+        def flaky(task):
+            output = "[ERROR] Skill execution failed: timeout" if task["id"] == "TASK-2" else "out"
+            return self.make_result(task, output)
+
+        run_tasks(tasks, flaky, checkpoint=checkpoint, result_type=CLITaskResult, verbose=False)
+        assert sorted(checkpoint.load(CLITaskResult)) == ["TASK-0", "TASK-1", "TASK-3"]
+
+        calls = []
+        results = run_tasks(
+            tasks, lambda task: calls.append(task["id"]) or self.make_result(task),
+            checkpoint=checkpoint, result_type=CLITaskResult, verbose=False,
+        )
+        assert calls == ["TASK-2"]
+        assert [r.skill_output for r in results] == ["out"] * 4
+
+    def test_torn_line_ignored(self, tmp_path):
+        """A partial trailing line from a killed run is skipped."""
+        checkpoint = TaskCheckpoint(tmp_path / "run.jsonl")
+        task = make_tasks(1)[0]
+        checkpoint.append(task["id"], self.make_result(task))
+        with open(checkpoint.path, "a") as f:
+            f.write('{"task_id": "TASK-1", "res')
+        assert list(checkpoint.load(CLITaskResult)) == ["TASK-0"]
+
+
+class TestRealEvaluatorParallel:
+    """RealTaskEvaluator with concurrent API workers."""
+
+    def test_mock_client_parallel(self, tmp_path, monkeypatch):
+        """The no-API mock path runs through the pool and keeps order."""
+        monkeypatch.setattr(RealTaskEvaluator, "RESULTS_DIR", tmp_path / "results")
+        monkeypatch.setattr(RealTaskEvaluator, "_load_corpus", lambda self: {"version": "t", "tasks": make_tasks(6)})
+        monkeypatch.setattr(RealTaskEvaluator, "_load_skill", lambda self: "# Test skill")
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        evaluator = RealTaskEvaluator("prompt-architect")
+
+        result = evaluator.run_evaluation(max_workers=3)
+        assert [r.task_id for r in result.task_results] == [t["id"] for t in make_tasks(6)]
+        assert result.passed_tasks == 6
+        assert result.output_quality == pytest.approx(0.85)
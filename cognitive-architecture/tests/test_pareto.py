@@ -0,0 +1,217 @@
+"""
+Tests for optimization/pareto.py
+
+Tests:
+- Dominance and outcome_matrix conversion
+- non_dominated_mask / fast_non_dominated_sort against brute force
+- Crowding distance
+- ParetoArchive incremental insertion
+- GlobalMOOClient mock frontier and distiller wiring
+"""
+
+import random
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.pareto import (
+    ParetoArchive,
+    crowding_distance,
+    dominates,
+    fast_non_dominated_sort,
+    non_dominated_mask,
+    outcome_matrix,
+    pareto_front,
+)
+from optimization.globalmoo_client import GlobalMOOClient, OptimizationOutcome, ParetoPoint
+from optimization.telemetry_steering import TelemetrySteeringEngine
+
+OBJECTIVES = ["task_accuracy", "token_efficiency", "edge_robustness", "epistemic_consistency"]
+
+
+def brute_force_ranks(F):
+    """Reference ranking: peel off non-dominated fronts one by one."""
+    ranks = np.full(len(F), -1)
+    rank = 0
+    while (ranks < 0).any():
+        remaining = np.flatnonzero(ranks < 0)
+        front = [
+            i for i in remaining
+            if not any(dominates(F[j], F[i]) for j in remaining if j != i)
+        ]
+        ranks[front] = rank
+        rank += 1
+    return ranks
+
+
+def random_matrix(rng, n, k, levels=None):
+    """Random outcomes; small level counts produce ties and duplicates."""
+    if levels:
+        return rng.integers(0, levels, size=(n, k)).astype(float)
+    return rng.random((n, k))
+
+
+class TestDominance:
+    """Tests for dominates() and outcome_matrix()."""
+
+    def test_dominates(self):
+        """Dominance needs >= everywhere and > somewhere."""
+        assert dominates([1, 1], [0, 1])
+        assert not dominates([1, 1], [1, 1])
+        assert not dominates([1, 0], [0, 1])
+
+    def test_outcome_matrix_fills_missing(self):
+        """Missing objectives should be 0.0, columns in first-seen order."""
+        F, names = outcome_matrix([{"a": 1.0}, {"b": 2.0, "a": 0.5}])
+        assert names == ["a", "b"]
+        assert F.tolist() == [[1.0, 0.0], [0.5, 2.0]]
+
+        F, names = outcome_matrix([{"a": 1.0}], objectives=["b", "a"])
+        assert F.tolist() == [[0.0, 1.0]]
+
+
+class TestSorting:
+    """Sorting should match the brute-force definition."""
+
+    @pytest.mark.parametrize("k", [1, 2, 3, 4])
+    @pytest.mark.parametrize("levels", [None, 3])
+    def test_ranks_match_brute_force(self, k, levels):
+        """fast_non_dominated_sort should equal repeated front peeling."""
+        rng = np.random.default_rng(k * 10 + (levels or 0))
+        for n in (0, 1, 2, 17, 60):
+            F = random_matrix(rng, n, k, levels)
+            expected = brute_force_ranks(F)
+            assert fast_non_dominated_sort(F).tolist() == expected.tolist()
+            assert non_dominated_mask(F).tolist() == (expected == 0).tolist()
+
+    def test_duplicates_share_front(self):
+        """Equal points do not dominate each other."""
+        F = np.array([[1.0, 1.0], [1.0, 1.0], [0.0, 0.0]])
+        assert non_dominated_mask(F).tolist() == [True, True, False]
+        assert fast_non_dominated_sort(F).tolist() == [0, 0, 1]
+
+    def test_rounded_equal_sums(self):
+        """A dominated point whose sum rounds to its dominator's is still dominated."""
+        # 1e16 + 1.0 == 1e16 + 0.0 in float64; the dominated row comes first
+        F = np.array([[1e16, 0.0, 0.0], [1e16, 1.0, 0.0], [1e16, 0.0, 1.0], [1e16, 1.0, 1.0]])
+        assert F[:, :2].sum(axis=1)[0] == F[:, :2].sum(axis=1)[1]
+        assert non_dominated_mask(F).tolist() == [False, False, False, True]
+        assert fast_non_dominated_sort(F).tolist() == brute_force_ranks(F).tolist()
+
+        F2 = F[:, :2]
+        assert non_dominated_mask(F2).tolist() == [False, True, False, True]
+
+        rng = np.random.default_rng(7)
+        F = 1e16 + rng.integers(0, 3, size=(40, 3)).astype(float)
+        assert fast_non_dominated_sort(F).tolist() == brute_force_ranks(F).tolist()
+
+
+class TestCrowdingDistance:
+    """Tests for crowding_distance()."""
+
+    def test_boundaries_infinite(self):
+        """Extremes of each objective should be infinitely crowded apart."""
+        F = np.array([[0.0, 1.0], [0.25, 0.5], [0.5, 0.25], [1.0, 0.0]])
+        distance = crowding_distance(F)
+        assert np.isinf(distance[[0, 3]]).all()
+        assert distance[1] == pytest.approx(0.5 / 1.0 + 0.75 / 1.0)
+        assert distance[2] == pytest.approx(0.75 / 1.0 + 0.5 / 1.0)
+
+    def test_small_and_flat_fronts(self):
+        """Two or fewer points are all boundary; flat objectives add nothing."""
+        assert np.isinf(crowding_distance(np.array([[0.1, 0.2], [0.3, 0.0]]))).all()
+        F = np.array([[0.0, 0.5], [0.5, 0.5], [1.0, 0.5]])
+        assert crowding_distance(F)[1] == pytest.approx(1.0)
+
+
+class TestParetoArchive:
+    """Tests for ParetoArchive."""
+
+    def test_incremental_matches_batch(self):
+        """After every insertion the archive should equal the batch front."""
+        rng = np.random.default_rng(3)
+        F = random_matrix(rng, 200, 3, levels=6)
+        archive = ParetoArchive()
+        for i, row in enumerate(F):
+            archive.insert(dict(zip("abc", row)), i)
+            mask = non_dominated_mask(F[:i + 1])
+            assert archive.items() == np.flatnonzero(mask).tolist()
+            assert np.array_equal(archive.matrix(), F[:i + 1][mask])
+
+    def test_insert_return_value(self):
+        """insert() should report whether the point joined the front."""
+        archive = ParetoArchive(["x", "y"])
+        assert archive.insert({"x": 0.5, "y": 0.5})
+        assert not archive.insert({"x": 0.4, "y": 0.5})
+        assert archive.insert({"x": 0.6, "y": 0.6})
+        assert len(archive) == 1
+        assert archive.extend([({"x": 1.0, "y": 0.0}, "a"), ({"x": 0.0, "y": 0.0}, "b")]) == 1
+
+    def test_new_objective_extends_matrix(self):
+        """Objectives first seen later should be 0.0 for earlier members."""
+        archive = ParetoArchive()
+        archive.insert({"x": 1.0})
+        archive.insert({"x": 1.0, "y": 1.0})
+        assert archive.objectives == ["x", "y"]
+        assert archive.matrix().tolist() == [[1.0, 1.0]]
+
+    def test_clear(self):
+        """clear() should empty the archive but keep objectives."""
+        archive = ParetoArchive()
+        archive.insert({"x": 1.0})
+        archive.clear()
+        assert len(archive) == 0
+        assert archive.insert({"x": 0.0})
+
+
+class TestCallers:
+    """Pareto callers should use the shared engine."""
+
+    def test_mock_frontier_matches_full_rescan(self):
+        """The incremental mock frontier should equal a full rescan."""
+        random.seed(5)
+        client = GlobalMOOClient(use_mock=True)
+        cases = [
+            OptimizationOutcome(
+                config_vector=[random.random() for _ in range(14)],
+                outcomes={name: round(random.random(), 1) for name in OBJECTIVES},
+            )
+            for _ in range(80)
+        ]
+        client.load_cases("p", cases[:20])
+        for case in cases[20:]:
+            client.report_outcome("p", case)
+
+        frontier = client.get_pareto_frontier("p")
+        expected = pareto_front(cases)
+        assert [p.config_vector for p in frontier] == [c.config_vector for c in expected]
+        assert all(p.dominance_rank == 0 for p in frontier)
+
+        F, _ = outcome_matrix([p.outcomes for p in frontier], OBJECTIVES)
+        distances = [p.crowding_distance for p in frontier]
+        assert distances == crowding_distance(F).tolist()
+
+    def test_pareto_front_preserves_items(self):
+        """pareto_front() should return the original items in order."""
+        points = [
+            ParetoPoint(config_vector=[0.0], outcomes={"a": 0.5, "b": 0.5}),
+            ParetoPoint(config_vector=[1.0], outcomes={"a": 0.4, "b": 0.4}),
+            ParetoPoint(config_vector=[2.0], outcomes={"a": 0.9, "b": 0.1}),
+        ]
+        assert pareto_front(points) == [points[0], points[2]]
+        assert pareto_front([]) == []
+
+    def test_telemetry_frontier(self, tmp_path):
+        """Steering frontiers should hold exactly the non-dominated modes."""
+        engine = TelemetrySteeringEngine(storage_dir=tmp_path)
+        scores = {"a": (0.9, 0.2), "b": (0.5, 0.5), "c": (0.4, 0.4), "d": (0.2, 0.9)}
+        for _ in range(engine.MIN_SAMPLES_FOR_TRUST):
+            for mode, (accuracy, efficiency) in scores.items():
+                engine.record_outcome(mode, "coding", accuracy, efficiency, 0.5)
+
+        frontier = engine._pareto_frontiers["coding"]
+        assert [p.mode_name for p in frontier] == ["a", "b", "d"]
@@ -7,9 +7,14 @@ Tests:
 - Prompt components assembly
 - Factory methods
 - Task-type specific configurations
+- Compiled template cache (equivalence, keying, invalidation)
 """
 
+import random
+
 import pytest
+from core import verilingua
+from core.feature_flags import HofstadterFeatureFlags
 from core.prompt_builder import (
     PromptBuilder,
     PromptBuilderFactory,
@@ -209,6 +214,96 @@ class TestBuildPromptFunction:
         assert "Test" in user
 
 
+class UncachedPromptBuilder(PromptBuilder):
+    """PromptBuilder that recompiles the system prompt on every build."""
+
+    def _compiled_template(self, task_type):
+        return self._compile_template(task_type)
+
+
+class TestTemplateCache:
+    """Tests for the compiled system-prompt cache."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        PromptBuilder.clear_template_cache()
+        HofstadterFeatureFlags.reset_instance()
+        yield
+        PromptBuilder.clear_template_cache()
+        HofstadterFeatureFlags.reset_instance()
+
+    @pytest.mark.parametrize("auto_select_mode", [False, True])
+    def test_matches_uncached_build(self, auto_select_mode):
+        """Cached builds should equal from-scratch builds across the sweep."""
+        rng = random.Random(10)
+        task_types = list(TASK_TYPE_INSTRUCTIONS) + ["unknown", " Coding "]
+        for _ in range(60):
+            vector = [rng.random() for _ in range(VectorCodec.VECTOR_SIZE)]
+            vector[VectorCodec.IDX_VERIX_STRICTNESS] = rng.uniform(0, 2)
+            vector[VectorCodec.IDX_COMPRESSION_LEVEL] = rng.uniform(0, 2)
+            cached = PromptBuilder(
+                VectorCodec.decode(vector), auto_select_mode=auto_select_mode,
+                enable_feedback_loop=False,
+            )
+            uncached = UncachedPromptBuilder(
+                VectorCodec.decode(vector), auto_select_mode=auto_select_mode,
+                enable_feedback_loop=False,
+            )
+            for task_type in rng.sample(task_types, 3):
+                task = f"Review the quick fix {rng.random()}"
+                assert cached.build(task, task_type) == uncached.build(task, task_type)
+
+        info = PromptBuilder.template_cache_info()
+        assert info["hits"] > 0
+        assert info["size"] == info["misses"]
+
+    def test_repeat_build_hits(self):
+        """Only the first build of a config and task type should compile."""
+        builder = PromptBuilder(FullConfig(), auto_select_mode=False)
+        first = builder.build("Task one", "coding")
+        second = builder.build("Task two", "coding")
+
+        assert first[0] == second[0]
+        assert "Task two" in second[1]
+        assert PromptBuilder.template_cache_info() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_shared_across_builders(self):
+        """Builders with equal configs should share compiled templates."""
+        PromptBuilder(STRICT_CONFIG, auto_select_mode=False).build("a", "analysis")
+        PromptBuilder(STRICT_CONFIG, auto_select_mode=False).build("b", "analysis")
+        assert PromptBuilder.template_cache_info()["hits"] == 1
+
+    def test_key_separates_prompt_flags(self):
+        """Flags missing from cluster_key() should still split the cache."""
+        base = FullConfig(prompt=PromptConfig(require_ground=True))
+        other = FullConfig(prompt=PromptConfig(require_ground=False))
+        assert VectorCodec.cluster_key(base) == VectorCodec.cluster_key(other)
+
+        with_ground = PromptBuilder(base, auto_select_mode=False).build("t", "default")[0]
+        without = PromptBuilder(other, auto_select_mode=False).build("t", "default")[0]
+        assert "EVIDENCE REQUIREMENT" in with_ground
+        assert "EVIDENCE REQUIREMENT" not in without
+
+    def test_frame_weight_change_invalidates(self, monkeypatch):
+        """Changing FRAME_WEIGHTS should recompile the template."""
+        builder = PromptBuilder(FullConfig(), auto_select_mode=False)
+        before = builder.build("t", "default")[0]
+        monkeypatch.setitem(verilingua.FRAME_WEIGHTS, "aspectual", 0.99)
+        after = builder.build("t", "default")[0]
+
+        assert after != before
+        assert "ASPECTUAL (weight: 0.99)" in after
+        assert PromptBuilder.template_cache_info()["misses"] == 2
+
+    def test_feature_flag_change_invalidates(self):
+        """Toggling a feature flag should drop compiled templates."""
+        builder = PromptBuilder(FullConfig(), auto_select_mode=False)
+        builder.build("t", "default")
+        HofstadterFeatureFlags.enable_feature("frame_meta_instruction")
+        builder.build("t", "default")
+        assert PromptBuilder.template_cache_info()["misses"] == 2
+
+
 class TestPromptComponents:
     """Tests for PromptComponents dataclass."""
 
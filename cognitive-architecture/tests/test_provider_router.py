@@ -0,0 +1,275 @@
+"""
+Tests for evals/provider_router.py
+
+Tests:
+- Health verdicts are cached for the TTL
+- Fastest and weighted routing follow EWMA latency and error rate
+- Circuit breakers eject failing providers and probe them back in
+- Per-provider concurrency caps hold under parallel load
+- MultiModelClient/MultiModelEvaluator against stub provider executables
+"""
+
+import stat
+import sys
+import threading
+import time
+from collections import Counter
+
+import pytest
+from evals import multi_model_evaluator
+from evals.multi_model_evaluator import MultiModelClient, MultiModelEvaluator
+from evals.provider_router import ProviderRouter
+
+# Logs "<provider> <skill|judge> <task>" per call; judge prompts get a passing
+# score. FAIL makes every prompt call exit non-zero (--version still works).
+STUB_PROVIDER = '''#!{python}
+import os, re, sys, time
+if "--version" in sys.argv:
+    print("{name} 1.0")
+    sys.exit(0)
+prompt = sys.stdin.read()
+task = re.search(r"ID: (\\S+)", prompt)
+with open(os.environ["STUB_PROVIDER_LOG"], "a") as f:
+    if task:
+        f.write("{name} judge %s\\n" % task.group(1))
+    else:
+        f.write("{name} skill %s\\n" % re.search(r"TASK-\\d+", prompt).group(0))
+time.sleep({delay})
+if {fail}:
+    sys.stderr.write("{name} is down")
+    sys.exit(1)
+if task:
+    print('{{"intent_accuracy": 0.9, "constraint_coverage": 0.8, "output_quality": 0.9, '
+          '"verix_compliance": 0.7, "l2_purity": 1.0, "passed": true, "reasoning": "ok"}}')
+else:
+    print("output from {name}")
+'''
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def stub_providers(tmp_path, monkeypatch):
+    """Factory writing stub provider executables; returns (make, log path)."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "calls.log"
+    log.write_text("")
+    monkeypatch.setenv("STUB_PROVIDER_LOG", str(log))
+    # Only stub providers are healthy
+    monkeypatch.setattr(multi_model_evaluator, "GOOGLE_API_KEY", "")
+    monkeypatch.setattr(multi_model_evaluator, "OPENAI_API_KEY", "")
+    monkeypatch.setitem(MultiModelClient.CLI_COMMANDS, "claude", [str(bin_dir / "missing-claude")])
+
+    def make(name, delay=0.0, fail=False):
+        script = bin_dir / name
+        script.write_text(STUB_PROVIDER.format(python=sys.executable, name=name, delay=delay, fail=fail))
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        return [str(script)]
+
+    return make, log
+
+
+def calls(log):
+    return [line.split() for line in log.read_text().splitlines()]
+
+
+class TestRouting:
+    """Health caching and provider choice."""
+
+    def test_health_cached_for_ttl(self):
+        """Checks run once per provider per TTL, not per message."""
+        clock, checks = FakeClock(), Counter()
+
+        def check(name):
+            checks[name] += 1
+            return name != "down"
+
+        router = ProviderRouter(["a", "down"], check, health_ttl=60, clock=clock)
+        for _ in range(20):
+            router.release(router.acquire(), ok=True, latency_ms=5)
+        assert router.available() == ["a"]
+        assert checks == {"a": 1, "down": 1}
+
+        clock.now = 61
+        router.available()
+        assert checks == {"a": 2, "down": 2}
+        router.invalidate("a")
+        router.available()
+        assert checks["a"] == 3
+
+    def test_fastest_prefers_low_latency(self):
+        """Unmeasured providers are sampled first, then the fastest wins."""
+        router = ProviderRouter(["slow", "fast"], lambda name: True, max_concurrency=1)
+        first = [router.acquire(), router.acquire()]
+        assert first == ["slow", "fast"]
+        router.release("slow", ok=True, latency_ms=400)
+        router.release("fast", ok=True, latency_ms=50)
+        picks = []
+        for _ in range(5):
+            picks.append(router.acquire())
+            router.release(picks[-1], ok=True, latency_ms=50 if picks[-1] == "fast" else 400)
+        assert picks == ["fast"] * 5
+        # avoid is a preference, exclude is a hard filter
+        assert router.acquire(avoid=["fast"]) == "slow"
+        with pytest.raises(ValueError):
+            router.acquire(exclude=["slow", "fast"])
+
+    def test_weighted_round_robin(self):
+        """Traffic splits by inverse latency, discounted by error rate."""
+        router = ProviderRouter(["a", "b"], lambda name: True, strategy="weighted", max_concurrency=100)
+        router.release(router.acquire("a"), ok=True, latency_ms=100)
+        router.release(router.acquire("b"), ok=True, latency_ms=300)
+        picks = Counter()
+        for _ in range(40):
+            name = router.acquire()
+            picks[name] += 1
+            router.cancel(name)
+        assert picks == {"a": 30, "b": 10}
+
+        with pytest.raises(ValueError):
+            ProviderRouter(["a"], lambda name: True, strategy="random")
+
+
+class TestCircuitBreaker:
+    """Ejection and half-open probes."""
+
+    def test_eject_and_probe_back(self):
+        clock = FakeClock()
+        router = ProviderRouter(["a", "b"], lambda name: True, failure_threshold=2, cooldown=30, clock=clock)
+        router.release("a", ok=True, latency_ms=1)
+        router.release("b", ok=True, latency_ms=100)
+        for _ in range(2):
+            assert router.acquire() == "a"
+            router.release("a", ok=False)
+        assert router.snapshot()["a"]["circuit"] == "open"
+        assert router.acquire() == "b"
+        router.release("b", ok=True, latency_ms=100)
+        with pytest.raises(ValueError):
+            router.acquire("a")
+
+        # After the cooldown one probe goes through; a failed probe re-opens
+        clock.now = 31
+        assert router.acquire() == "a"
+        assert router.snapshot()["a"]["circuit"] == "half_open"
+        assert router.acquire() == "b"
+        router.release("b", ok=True, latency_ms=100)
+        router.release("a", ok=False)
+        assert router.snapshot()["a"]["circuit"] == "open"
+
+        clock.now = 62
+        assert router.acquire() == "a"
+        router.release("a", ok=True, latency_ms=1)
+        stats = router.snapshot()["a"]
+        assert stats["circuit"] == "closed" and stats["failures"] == 3
+        assert 0 < stats["error_rate"] < 1
+
+
+class TestConcurrencyCap:
+    """In-flight limits."""
+
+    def test_cap_holds_under_load(self):
+        """Callers wait for a slot instead of overloading a provider."""
+        router = ProviderRouter(["a", "b"], lambda name: True, max_concurrency={"a": 2, "b": 1})
+        active, peak, lock = Counter(), Counter(), threading.Lock()
+
+        def worker():
+            for _ in range(5):
+                name = router.acquire()
+                with lock:
+                    active[name] += 1
+                    peak[name] = max(peak[name], active[name])
+                time.sleep(0.002)
+                with lock:
+                    active[name] -= 1
+                router.release(name, ok=True, latency_ms=2)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak["a"] <= 2 and peak["b"] <= 1
+        assert router.snapshot()["a"]["calls"] + router.snapshot()["b"]["calls"] == 30
+        assert router.capacity() == 3
+
+    def test_timeout(self):
+        router = ProviderRouter(["a"], lambda name: True, max_concurrency=1)
+        router.acquire()
+        with pytest.raises(TimeoutError):
+            router.acquire(timeout=0.05)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX stub executables")
+class TestMultiModelStubs:
+    """MultiModelClient and MultiModelEvaluator with stub executables on disk."""
+
+    def test_failover_and_ejection(self, stub_providers):
+        """A failing provider is retried elsewhere, then ejected."""
+        make, log = stub_providers
+        client = MultiModelClient(
+            cli_commands={"broken": make("broken", fail=True), "good": make("good", delay=0.05)},
+            failure_threshold=2,
+        )
+        assert client.get_available_providers() == ["broken", "good"]
+
+        responses = [client.send_message("Input for TASK-1") for _ in range(4)]
+        assert {r["provider"] for r in responses} == {"good"}
+        assert responses[0]["response"] == "output from good"
+        assert [c[0] for c in calls(log)].count("broken") == 2
+        assert client.router.snapshot()["broken"]["circuit"] == "open"
+
+        # A pinned provider is not failed over, and an ejected one is refused
+        with pytest.raises(ValueError, match="No AI providers available"):
+            client.send_message("Input for TASK-1", provider="broken")
+        pinned = MultiModelClient(cli_commands={"broken": make("broken", fail=True), "good": make("good")})
+        with pytest.raises(ValueError, match="broken CLI error"):
+            pinned.send_message("Input for TASK-1", provider="broken")
+        with pytest.raises(ValueError, match="Unknown provider"):
+            client.send_message("x", provider="nope")
+
+    def test_all_failing(self, stub_providers):
+        make, _ = stub_providers
+        client = MultiModelClient(cli_commands={"x": make("x", fail=True), "y": make("y", fail=True)})
+        with pytest.raises(ValueError, match="All providers failed"):
+            client.send_message("Input for TASK-1")
+
+    def test_parallel_evaluation_spreads_tasks(self, stub_providers, tmp_path, monkeypatch):
+        """Tasks run across providers concurrently and are judged cross-model."""
+        make, log = stub_providers
+        monkeypatch.setattr(MultiModelEvaluator, "RESULTS_DIR", tmp_path / "results")
+        tasks = [
+            {"id": f"TASK-{i}", "category": "test", "input": f"Input for TASK-{i}", "success_criteria": "ok"}
+            for i in range(8)
+        ]
+        monkeypatch.setattr(MultiModelEvaluator, "_load_corpus", lambda self: {"version": "t", "tasks": tasks})
+        monkeypatch.setattr(MultiModelEvaluator, "_load_skill", lambda self: "# Test skill")
+        client = MultiModelClient(
+            cli_commands={"alpha": make("alpha", delay=0.2), "beta": make("beta", delay=0.2)},
+            strategy="weighted",
+            max_concurrency={"alpha": 4, "beta": 4},
+        )
+        evaluator = MultiModelEvaluator("prompt-architect", client=client)
+
+        start = time.perf_counter()
+        # With four workers a judge always finds a slot on the other provider
+        result = evaluator.run_evaluation(max_workers=4)
+        elapsed = time.perf_counter() - start
+
+        assert [r.task_id for r in result.task_results] == [t["id"] for t in tasks]
+        assert result.passed_tasks == 8
+        assert sorted(result.models_used) == ["alpha", "beta"]
+        # Tasks overlapped: their summed durations far exceed the wall time
+        assert sum(r.execution_time_ms for r in result.task_results) / 1000 > 2 * elapsed
+
+        executed = {task: name for name, kind, task in calls(log) if kind == "skill"}
+        judged = {task: name for name, kind, task in calls(log) if kind == "judge"}
+        assert sorted(executed) == sorted(judged) == sorted(t["id"] for t in tasks)
+        assert all(executed[t] != judged[t] for t in executed)
+        assert result.provider_stats["alpha"]["calls"] + result.provider_stats["beta"]["calls"] == 16
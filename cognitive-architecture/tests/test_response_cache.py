@@ -0,0 +1,282 @@
+"""
+Tests for core/response_cache.py
+
+Tests:
+- make_key canonical hashing
+- get/put round trip and hit/miss counters
+- TTL expiry
+- LRU eviction by entry count and by bytes
+- Trigger-maintained totals, including stores created before them
+- Persistence across instances and thread safety
+- AnthropicRuntime / CLITaskEvaluator cache integration
+"""
+
+import sqlite3
+import threading
+
+import pytest
+from core import response_cache
+from core.response_cache import ResponseCache
+from tests.stub_messages_api import StubMessagesServer
+
+
+@pytest.fixture
+def cache():
+    cache = ResponseCache(":memory:")
+    yield cache
+    cache.close()
+
+
+class TestMakeKey:
+    """Tests for ResponseCache.make_key()."""
+
+    def test_key_ignores_dict_order(self):
+        """Equal requests should hash equally regardless of key order."""
+        a = ResponseCache.make_key({"model": "m", "max_tokens": 10, "system": "s"})
+        b = ResponseCache.make_key({"system": "s", "max_tokens": 10, "model": "m"})
+        assert a == b
+        assert len(a) == 64
+
+    def test_key_covers_every_field(self):
+        """Changing any field should change the key."""
+        base = {"model": "m", "max_tokens": 10, "messages": [{"role": "user", "content": "x"}]}
+        keys = {
+            ResponseCache.make_key(base),
+            ResponseCache.make_key({**base, "model": "n"}),
+            ResponseCache.make_key({**base, "max_tokens": 11}),
+            ResponseCache.make_key({**base, "messages": [{"role": "user", "content": "y"}]}),
+        }
+        assert len(keys) == 4
+
+
+class TestGetPut:
+    """Tests for get()/put() and counters."""
+
+    def test_round_trip(self, cache):
+        """Stored values should come back unchanged."""
+        value = {"response": "héllo", "input_tokens": 3, "output_tokens": 5}
+        cache.put("k", value)
+        assert cache.get("k") == value
+        assert len(cache) == 1
+
+    def test_hit_miss_counters(self, cache):
+        """stats() should count hits, misses and the hit rate."""
+        cache.put("k", {"response": "x"})
+        cache.get("k")
+        cache.get("k")
+        cache.get("missing")
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["entries"] == 1
+        assert stats["bytes"] > 0
+
+    def test_put_replaces(self, cache):
+        """Re-putting a key should overwrite the value."""
+        cache.put("k", {"response": "old"})
+        cache.put("k", {"response": "new"})
+        assert cache.get("k") == {"response": "new"}
+        assert len(cache) == 1
+
+    def test_clear(self, cache):
+        """clear() should remove every entry."""
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestEviction:
+    """Tests for TTL expiry and LRU eviction."""
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Entries older than ttl_seconds should miss and be removed."""
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+        cache = ResponseCache(":memory:", ttl_seconds=60)
+        cache.put("k", {"response": "x"})
+
+        now[0] += 30
+        assert cache.get("k") is not None
+        now[0] += 31
+        assert cache.get("k") is None
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_ttl_expiry_on_write(self, monkeypatch):
+        """put() should purge expired entries."""
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+        cache = ResponseCache(":memory:", ttl_seconds=60)
+        cache.put("a", {})
+        now[0] += 120
+        cache.put("b", {})
+        assert len(cache) == 1
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_entry_cap(self, monkeypatch):
+        """The least recently used entry should be evicted first."""
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+        cache = ResponseCache(":memory:", max_entries=2)
+        cache.put("a", {"response": "a"})
+        now[0] += 1
+        cache.put("b", {"response": "b"})
+        now[0] += 1
+        cache.get("a")  # "b" is now least recently used
+        now[0] += 1
+        cache.put("c", {"response": "c"})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_lru_byte_cap(self, monkeypatch):
+        """Total stored bytes should stay under max_bytes."""
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+        cache = ResponseCache(":memory:", max_bytes=250)
+        for i in range(5):
+            now[0] += 1
+            cache.put(f"k{i}", {"response": "x" * 100})
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 250
+        assert stats["entries"] == 2
+        assert cache.get("k4") is not None
+        assert cache.get("k0") is None
+
+
+    def test_totals_match_table(self, monkeypatch, tmp_path):
+        """Trigger-kept totals stay exact through replace, expiry and eviction."""
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+        path = tmp_path / "responses.sqlite3"
+        cache = ResponseCache(path, max_entries=6, max_bytes=600, ttl_seconds=50)
+        other = ResponseCache(path, max_entries=6, max_bytes=600, ttl_seconds=50)
+
+        def actual():
+            return tuple(cache._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone())
+
+        for i in range(30):
+            now[0] += 3
+            (cache if i % 2 else other).put(f"k{i % 9}", {"response": "x" * (i * 7 % 120)})
+            if i % 5 == 0:
+                cache.get(f"k{(i + 4) % 9}")
+            assert tuple(cache._totals()) == actual()
+            assert actual()[0] <= 6 and actual()[1] <= 600
+        assert cache.stats()["evictions"] > 0
+        cache.clear()
+        assert len(other) == 0 and other.stats()["bytes"] == 0
+
+    def test_seeds_totals_for_existing_store(self, tmp_path):
+        """A store created before the meta table gets its totals counted once."""
+        path = tmp_path / "responses.sqlite3"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX responses_accessed ON responses(accessed)")
+        conn.executemany(
+            "INSERT INTO responses VALUES (?, ?, ?, ?, ?)",
+            [(f"k{i}", '{"response":1}', 14, float(i), float(i)) for i in range(4)],
+        )
+        conn.commit()
+        conn.close()
+
+        cache = ResponseCache(path, max_entries=3)
+        assert len(cache) == 4
+        cache.put("new", {"response": 2})
+        assert len(cache) == 3
+        assert cache.get("k0") is None and cache.get("k1") is None
+        cache.close()
+
+
+class TestPersistence:
+    """Tests for on-disk storage and concurrent access."""
+
+    def test_persists_across_instances(self, tmp_path):
+        """A reopened cache should see earlier entries."""
+        path = tmp_path / "cache" / "responses.sqlite3"
+        first = ResponseCache(path)
+        first.put("k", {"response": "kept"})
+        first.close()
+
+        second = ResponseCache(path)
+        assert second.get("k") == {"response": "kept"}
+        second.close()
+
+    def test_thread_safety(self, tmp_path):
+        """Concurrent put/get from many threads should not lose entries."""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(50):
+                    cache.put(f"{n}-{i}", {"response": i})
+                    assert cache.get(f"{n}-{i}") == {"response": i}
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) == 400
+        assert cache.stats()["hits"] == 400
+        cache.close()
+
+
+class TestEvaluatorIntegration:
+    """Cache wiring in the evaluator runtimes."""
+
+    def test_anthropic_runtime(self, cache, monkeypatch):
+        """AnthropicRuntime should serve repeats from the cache."""
+        from optimization.real_evaluator import AnthropicRuntime
+
+        with StubMessagesServer() as server:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", server.base_url)
+            runtime = AnthropicRuntime(api_key="test", cache=cache)
+            first = runtime.execute("same prompt")
+            second = runtime.execute("same prompt")
+            assert server.requests == 1
+
+            refreshing = AnthropicRuntime(api_key="test", cache=cache, bypass_cache=True)
+            refreshing.execute("same prompt")
+            assert server.requests == 2
+
+        assert first.success and second.success
+        assert second.response == first.response
+        assert second.tokens_used == first.tokens_used
+
+    def test_cli_evaluator(self, cache):
+        """CLITaskEvaluator should skip the CLI for cached prompts."""
+        from evals.cli_evaluator import CLITaskEvaluator
+
+        class FakeCLI:
+            model = "fake-model"
+            calls = 0
+
+            def send_message(self, prompt, max_tokens=2000):
+                FakeCLI.calls += 1
+                return {"response": f"out: {prompt}", "latency_ms": 1.0}
+
+        evaluator = CLITaskEvaluator.__new__(CLITaskEvaluator)
+        evaluator.skill_name = "prompt-architect"
+        evaluator.cli = FakeCLI()
+        evaluator.skill_content = "skill"
+        evaluator.cache = cache
+        evaluator.bypass_cache = False
+
+        first = evaluator._execute_skill("do the thing")
+        second = evaluator._execute_skill("do the thing")
+        assert FakeCLI.calls == 1
+        assert second == first
+        assert first.startswith("out: ")
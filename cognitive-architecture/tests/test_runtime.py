@@ -6,19 +6,31 @@ Tests:
 - MockRuntime for testing without API
 - ExecutionResult structure
 - ExecutionMetrics calculations
+- TokenBucket / RetryPolicy
+- execute_many() and AsyncClaudeRuntime against a local Messages API stub
+- ResponseCache hits, bypass and batch accounting
 - evaluate() thin waist contract
 """
 
+import asyncio
+import time
+
 import pytest
 from core.runtime import (
+    HAS_ANTHROPIC,
+    AsyncClaudeRuntime,
     ClaudeRuntime,
     MockRuntime,
     ExecutionResult,
     ExecutionMetrics,
+    RetryPolicy,
+    TokenBucket,
     create_runtime,
     evaluate,
 )
 from core.config import FullConfig, VectorCodec
+from core.response_cache import ResponseCache
+from tests.stub_messages_api import StubMessagesServer
 
 
 class TestExecutionMetrics:
@@ -147,6 +159,17 @@ class TestMockRuntime:
         runtime.execute("Task 2", "default")
         assert runtime._call_count == 2
 
+    def test_mock_execute_many(self):
+        """execute_many() should run tasks in order and aggregate metrics."""
+        runtime = MockRuntime(FullConfig())
+        results = runtime.execute_many(["Task 1", ("Task 2", "reasoning")])
+
+        assert len(results) == 2 and runtime._call_count == 2
+        assert runtime.last_batch_metrics.request_count == 2
+        assert runtime.last_batch_metrics.total_tokens == sum(
+            r.metrics.total_tokens for r in results
+        )
+
 
 class TestClaudeRuntime:
     """Tests for ClaudeRuntime (without API calls)."""
@@ -170,6 +193,242 @@ class TestClaudeRuntime:
         assert "model" in preview
 
 
+class TestTokenBucket:
+    """Tests for the TokenBucket rate limiter."""
+
+    def test_burst_then_wait(self):
+        """A full bucket should allow a burst, then queue callers."""
+        bucket = TokenBucket(rate=10.0, capacity=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_invalid_rate(self):
+        """Non-positive rates should be rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy backoff."""
+
+    def test_delay_bounded_by_backoff(self):
+        """Jittered delays should stay within the exponential cap."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=2.0)
+        for attempt in range(6):
+            cap = min(2.0, 0.5 * 2 ** attempt)
+            assert all(0.0 <= policy.delay(attempt) <= cap for _ in range(50))
+
+    def test_plain_errors_not_retried(self):
+        """Only transient API errors should be retried."""
+        assert RetryPolicy.is_retryable(ValueError("bug")) is False
+
+
+@pytest.fixture
+def stub_server():
+    with StubMessagesServer(delay=0.05) as server:
+        yield server
+
+
+def _fast_retries():
+    return RetryPolicy(max_retries=3, base_delay=0.01, max_delay=0.02)
+
+
+@pytest.mark.skipif(not HAS_ANTHROPIC, reason="anthropic not installed")
+class TestExecuteMany:
+    """Tests for concurrent execution against the Messages API stub."""
+
+    def test_results_in_input_order(self, stub_server):
+        """execute_many() should return one result per task, in order."""
+        runtime = ClaudeRuntime(FullConfig(), api_key="test", base_url=stub_server.base_url)
+        tasks = [f"task number {i}" for i in range(10)] + [("typed task", "reasoning")]
+        results = runtime.execute_many(tasks)
+
+        assert all(r.success for r in results)
+        assert [f"task number {i}" in r.response for i, r in enumerate(results[:10])] == [True] * 10
+        assert "typed task" in results[-1].response
+        assert all(r.claims for r in results)
+
+    def test_concurrency_cap(self, stub_server):
+        """No more than max_concurrency requests should be in flight."""
+        runtime = ClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url, max_concurrency=3,
+        )
+        runtime.execute_many([f"task {i}" for i in range(9)])
+        assert stub_server.peak_in_flight == 3
+
+    def test_batch_metrics_aggregated(self, stub_server):
+        """last_batch_metrics should sum per-request metrics."""
+        runtime = ClaudeRuntime(FullConfig(), api_key="test", base_url=stub_server.base_url)
+        results = runtime.execute_many([f"task {i}" for i in range(4)])
+        batch = runtime.last_batch_metrics
+
+        assert batch.request_count == 4
+        assert batch.total_tokens == sum(r.metrics.total_tokens for r in results)
+        assert batch.latency_ms == pytest.approx(sum(r.metrics.latency_ms for r in results))
+        assert 0 < batch.wall_time_ms < batch.latency_ms
+        assert batch.requests_per_second > 0
+
+    def test_retries_transient_errors(self):
+        """429 and 529 responses should be retried and counted."""
+        with StubMessagesServer(failures=[429, 529]) as server:
+            runtime = ClaudeRuntime(
+                FullConfig(), api_key="test", base_url=server.base_url,
+                retry_policy=_fast_retries(),
+            )
+            result = runtime.execute_raw("system", "hello")
+
+        assert result.success
+        assert result.metrics.retries == 2
+        assert server.requests == 3
+
+    def test_gives_up_after_max_retries(self):
+        """Persistent failures should surface as an API error."""
+        with StubMessagesServer(failures=[503] * 5) as server:
+            runtime = ClaudeRuntime(
+                FullConfig(), api_key="test", base_url=server.base_url,
+                retry_policy=_fast_retries(),
+            )
+            result = runtime.execute_raw("system", "hello")
+
+        assert not result.success
+        assert result.error.startswith("API error")
+        assert result.metrics.retries == 3
+
+    def test_rate_limit_spaces_requests(self, stub_server):
+        """requests_per_second should bound throughput."""
+        runtime = ClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url,
+            max_concurrency=8, requests_per_second=20.0,
+        )
+        start = time.time()
+        runtime.execute_many([f"task {i}" for i in range(30)])
+        # 20 burst tokens, then 10 more at 20/s
+        assert time.time() - start >= 0.45
+
+    def test_async_runtime(self, stub_server):
+        """AsyncClaudeRuntime should match the sync API with a semaphore cap."""
+        runtime = AsyncClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url, max_concurrency=5,
+        )
+
+        async def run():
+            try:
+                single = await runtime.execute("single task")
+                batch = await runtime.execute_many([f"task {i}" for i in range(15)])
+            finally:
+                await runtime.aclose()
+            return single, batch
+
+        single, batch = asyncio.run(run())
+        assert single.success and "single task" in single.response
+        assert [f"task {i}" in r.response for i, r in enumerate(batch)] == [True] * 15
+        assert stub_server.peak_in_flight == 5
+        assert runtime.last_batch_metrics.request_count == 15
+
+    def test_throughput_scales_with_concurrency(self, stub_server):
+        """Raising the cap should raise throughput on a latency-bound stub."""
+        throughput = {}
+        for cap in (1, 4):
+            runtime = ClaudeRuntime(
+                FullConfig(), api_key="test", base_url=stub_server.base_url, max_concurrency=cap,
+            )
+            runtime.execute_many([f"task {i}" for i in range(8)])
+            throughput[cap] = runtime.last_batch_metrics.requests_per_second
+        assert throughput[4] > 2.5 * throughput[1]
+
+
+class TestResponseCaching:
+    """Tests for the ResponseCache hook in ClaudeRuntime."""
+
+    def test_identical_request_served_from_cache(self, stub_server):
+        """A repeated request should not reach the API."""
+        cache = ResponseCache(":memory:")
+        runtime = ClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url, cache=cache,
+        )
+        first = runtime.execute_raw("system", "hello")
+        second = runtime.execute_raw("system", "hello")
+
+        assert stub_server.requests == 1
+        assert second.success and second.response == first.response
+        assert second.metrics.cache_hits == 1
+        assert first.metrics.cache_hits == 0
+        assert second.metrics.total_tokens == first.metrics.total_tokens
+        assert second.claims == first.claims
+
+    def test_different_request_misses(self, stub_server):
+        """Changing the prompt or model should change the cache key."""
+        cache = ResponseCache(":memory:")
+        runtime = ClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url, cache=cache,
+        )
+        runtime.execute_raw("system", "hello")
+        runtime.execute_raw("system", "hello again")
+        runtime.model = "other-model"
+        runtime.execute_raw("system", "hello")
+        assert stub_server.requests == 3
+
+    def test_bypass_refreshes_entry(self, stub_server):
+        """bypass_cache should call the API and overwrite the entry."""
+        cache = ResponseCache(":memory:")
+        ClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url, cache=cache,
+        ).execute_raw("system", "hello")
+        bypassing = ClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url,
+            cache=cache, bypass_cache=True,
+        )
+        result = bypassing.execute_raw("system", "hello")
+
+        assert stub_server.requests == 2
+        assert result.metrics.cache_hits == 0
+        assert len(cache) == 1
+
+    def test_errors_not_cached(self):
+        """Failed requests should not be stored."""
+        cache = ResponseCache(":memory:")
+        with StubMessagesServer(failures=[400]) as server:
+            runtime = ClaudeRuntime(
+                FullConfig(), api_key="test", base_url=server.base_url, cache=cache,
+            )
+            assert not runtime.execute_raw("system", "hello").success
+            assert runtime.execute_raw("system", "hello").success
+        assert len(cache) == 1
+
+    def test_batch_counts_cache_hits(self, stub_server):
+        """last_batch_metrics should report how many tasks hit the cache."""
+        cache = ResponseCache(":memory:")
+        runtime = ClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url, cache=cache,
+        )
+        runtime.execute_many(["task a", "task b"])
+        runtime.execute_many(["task a", "task b", "task c"])
+
+        assert stub_server.requests == 3
+        assert runtime.last_batch_metrics.cache_hits == 2
+        assert runtime.last_batch_metrics.to_dict()["cache_hits"] == 2
+
+    def test_async_runtime_uses_cache(self, stub_server):
+        """AsyncClaudeRuntime should share the same cache semantics."""
+        cache = ResponseCache(":memory:")
+        runtime = AsyncClaudeRuntime(
+            FullConfig(), api_key="test", base_url=stub_server.base_url, cache=cache,
+        )
+
+        async def run():
+            try:
+                await runtime.execute("task a")
+                return await runtime.execute("task a")
+            finally:
+                await runtime.aclose()
+
+        result = asyncio.run(run())
+        assert result.metrics.cache_hits == 1
+        assert stub_server.requests == 1
+
+
 class TestCreateRuntime:
     """Tests for create_runtime() factory."""
 
@@ -0,0 +1,130 @@
+"""
+Tests for eval/similarity.py
+
+Tests:
+- jaccard_candidates prefix filtering (no missed pairs)
+- SubstringIndex containment lookups
+- ConsistencyChecker / MetricCalculator equivalence with the pairwise scans
+"""
+
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eval.similarity import SubstringIndex, jaccard_candidates
+from eval.consistency import ConsistencyChecker
+from eval.metrics import MetricCalculator
+from core.verix import State, create_claim
+
+WORDS = (
+    "the cache is not fast slow true false correct incorrect wrong right "
+    "no yes never always isn't can't db hot"
+).split() + ["a\tb", "x\ny"]
+
+
+def _random_claims(rng, count):
+    claims = []
+    for _ in range(count):
+        content = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 6)))
+        if rng.random() < 0.2:
+            # Glue two words so negation markers appear mid-token
+            content = content.replace(" ", "", 1)
+        claims.append(create_claim(
+            content, confidence=rng.random(), state=rng.choice(list(State)),
+        ))
+    return claims
+
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+class TestJaccardCandidates:
+    """Tests for jaccard_candidates."""
+
+    def test_no_missed_pairs(self):
+        """Every pair at or above the threshold should be a candidate."""
+        rng = random.Random(3)
+        for _ in range(300):
+            left = {i: set(rng.sample(WORDS, rng.randint(0, 6))) for i in range(8)}
+            right = {i: set(rng.sample(WORDS, rng.randint(0, 6))) for i in range(8)}
+            for threshold in (0.3, 0.5, 0.7):
+                candidates = jaccard_candidates(left, right, threshold)
+                for a in left:
+                    for b in right:
+                        if _jaccard(left[a], right[b]) >= threshold:
+                            assert (a, b) in candidates
+
+    def test_filters_disjoint_sets(self):
+        """Sets without a shared token should not be candidates."""
+        left = {0: {"alpha", "beta"}, 1: set()}
+        right = {5: {"gamma"}, 6: {"alpha", "beta"}, 7: set()}
+        assert jaccard_candidates(left, right) == {(0, 6)}
+
+
+class TestSubstringIndex:
+    """Tests for SubstringIndex."""
+
+    def test_containing_matches_in_operator(self):
+        """Lookups should equal a scan with `in`."""
+        rng = random.Random(4)
+        texts = {i: " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 8))) for i in range(40)}
+        index = SubstringIndex(texts)
+        for _ in range(300):
+            needle = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 4)))
+            needle = needle[rng.randint(0, 2):]
+            assert index.containing(needle) == [k for k, text in texts.items() if needle in text]
+
+    def test_unknown_interior_token(self):
+        """An interior token missing from the index should short-circuit."""
+        index = SubstringIndex({0: "the cache is fast"})
+        assert index.containing("the missing fast") == []
+        assert index.containing("cache is") == [0]
+
+
+class TestPairwiseEquivalence:
+    """Indexed contradiction checks must match the all-pairs scans."""
+
+    def test_consistency_contradictions(self):
+        """ConsistencyChecker should flag the same pairs as the pairwise loop."""
+        checker = ConsistencyChecker()
+        rng = random.Random(5)
+        for _ in range(1500):
+            claims = _random_claims(rng, rng.randint(0, 20))
+            keys = [(c.content.lower(), c.state) for c in claims]
+            expected = [
+                [i, j] for i in range(len(keys)) for j in range(i + 1, len(keys))
+                if checker._keys_contradict(keys[i], keys[j])
+                and claims[i].confidence + claims[j].confidence > 1.0
+            ]
+            violations = checker._check_confidence_contradictions(claims)
+            assert [v.claim_indices for v in violations] == expected
+
+    def test_metric_confidence_consistency(self):
+        """MetricCalculator penalty should equal the pairwise loop."""
+        calculator = MetricCalculator()
+        rng = random.Random(6)
+        for _ in range(1500):
+            claims = _random_claims(rng, rng.randint(0, 20))
+            contents = [c.content.lower() for c in claims]
+            expected = 1.0
+            for i in range(len(contents)):
+                for j in range(i + 1, len(contents)):
+                    if calculator._contents_contradict(contents[i], contents[j]):
+                        if claims[i].confidence + claims[j].confidence > 1.5:
+                            expected *= 0.8
+            if len(claims) < 2:
+                expected = 1.0
+            assert calculator._check_confidence_consistency(claims) == expected
+
+    def test_retraction_detected(self):
+        """A later retraction of a confirmed claim should still be found."""
+        claims = [
+            create_claim("the cache is fast", confidence=0.9, state=State.CONFIRMED),
+            create_claim("unrelated db note", confidence=0.5),
+            create_claim("the cache is fast", confidence=0.6, state=State.RETRACTED),
+        ]
+        violations = ConsistencyChecker()._check_confidence_contradictions(claims)
+        assert [v.claim_indices for v in violations] == [[0, 2]]
@@ -6,7 +6,9 @@ import pytest
 import sys
 import os
 import tempfile
+import time
 import json
+from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -131,9 +133,116 @@ class TestTelemetryStore:
             key = store.store(record)
             assert key is not None
 
-            # Verify file was created
-            files = list(store.base_path.glob("*.json"))
-            assert len(files) == 1
+            # Verify the day segment was created and reloads
+            date = record.timestamp[:10]
+            assert store.segment_dates() == [date]
+            batch = store.load_range(date, date)
+            assert len(batch.records) == 1
+            assert batch.records[0].task_id == record.task_id
+            assert batch.records[0].task_success is True
+
+    def test_store_appends_to_day_segment(self):
+        """Records for the same day should share one segment."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = TelemetryStore(base_path=tmpdir)
+            store.store(ExecutionTelemetry(timestamp="2025-01-01T10:00:00"))
+            store.store_many([
+                ExecutionTelemetry(timestamp="2025-01-01T11:00:00"),
+                ExecutionTelemetry(timestamp="2025-01-02T09:00:00"),
+            ])
+
+            assert store.segment_dates() == ["2025-01-01", "2025-01-02"]
+            segment = store.segment_path / "2025-01-01.jsonl"
+            assert len(segment.read_text().splitlines()) == 2
+
+    def test_load_range_only_reads_window(self, monkeypatch):
+        """Range loads should open only segments inside the window."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = TelemetryStore(base_path=tmpdir)
+            for day in range(1, 8):
+                store.store(ExecutionTelemetry(timestamp=f"2025-01-0{day}T12:00:00"))
+
+            opened = []
+            original = store.iter_segment
+            monkeypatch.setattr(
+                store, "iter_segment", lambda date: (opened.append(date), original(date))[1]
+            )
+
+            batch = store.load_range("2025-01-03", "2025-01-05")
+            assert len(batch.records) == 3
+            assert opened == ["2025-01-03", "2025-01-04", "2025-01-05"]
+
+    def test_skips_torn_lines(self):
+        """A partially written trailing line should not break loading."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = TelemetryStore(base_path=tmpdir)
+            store.store(ExecutionTelemetry(timestamp="2025-01-01T10:00:00"))
+            with open(store.segment_path / "2025-01-01.jsonl", "a") as f:
+                f.write('{"task_id": "torn')
+
+            assert len(store.load_range("2025-01-01", "2025-01-01").records) == 1
+
+    def test_migrates_legacy_files(self):
+        """One-file-per-record stores should be migrated into segments on open."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            records = [
+                ExecutionTelemetry(timestamp="2025-01-01T10:00:00", task_type="debugging"),
+                ExecutionTelemetry(timestamp="2025-01-02T10:00:00", task_type="testing"),
+            ]
+            for record in records:
+                legacy = os.path.join(
+                    tmpdir, f"{record.memory_key().replace('/', '_')}.json"
+                )
+                with open(legacy, "w") as f:
+                    json.dump(record.to_dict(), f, indent=2)
+            with open(os.path.join(tmpdir, "telemetry_executions_bad.json"), "w") as f:
+                f.write("{not json")
+
+            store = TelemetryStore(base_path=tmpdir)
+
+            assert list(store.base_path.glob(TelemetryStore.LEGACY_PATTERN)) == []
+            assert (store.base_path / "telemetry_executions_bad.json.corrupt").exists()
+            batch = store.load_range("2025-01-01", "2025-01-02")
+            assert sorted(r.task_type for r in batch.records) == ["debugging", "testing"]
+
+            # Re-opening must not migrate again
+            assert TelemetryStore(base_path=tmpdir).migrate_legacy() == 0
+            assert len(store.load_range("2025-01-01", "2025-01-02").records) == 2
+
+    def test_recovers_interrupted_migration(self):
+        """Stale claims left by a crashed migration are retried without duplicates."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            appended = ExecutionTelemetry(timestamp="2025-01-01T10:00:00", task_type="debugging")
+            pending = ExecutionTelemetry(timestamp="2025-01-01T11:00:00", task_type="testing")
+            live = ExecutionTelemetry(timestamp="2025-01-01T12:00:00", task_type="research")
+            store = TelemetryStore(base_path=tmpdir)
+            # Crashed after appending one record, and before appending the other
+            store.store(appended)
+            stale = time.time() - TelemetryStore.STALE_CLAIM_SECONDS - 1
+            for record in (appended, pending, live):
+                claimed = os.path.join(
+                    tmpdir, f"{record.memory_key().replace('/', '_')}.json.migrating"
+                )
+                with open(claimed, "w") as f:
+                    json.dump(record.to_dict(), f)
+                if record is not live:
+                    os.utime(claimed, (stale, stale))
+
+            assert store.migrate_legacy() == 1
+            # A fresh claim belongs to a process that is still migrating it
+            assert [p.name for p in store.base_path.glob("*.migrating")] == [
+                f"{live.memory_key().replace('/', '_')}.json.migrating"
+            ]
+            batch = store.load_range("2025-01-01", "2025-01-01")
+            assert sorted(r.task_type for r in batch.records) == ["debugging", "testing"]
+
+    def test_claim_finished_elsewhere(self):
+        """A claim that disappears mid-migration is not an error."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            claimed = Path(tmpdir) / "telemetry_executions_x.json.migrating"
+            TelemetryStore._finish_claim(claimed, None)
+            TelemetryStore._finish_claim(claimed, "telemetry_executions_x.json.migrated")
+            assert list(Path(tmpdir).iterdir()) == []
 
 
 class TestTask:
@@ -208,8 +317,8 @@ class TestRealTaskEvaluator:
             evaluator.evaluate(config, task)
 
             # Check telemetry was stored
-            files = list(evaluator.telemetry_store.base_path.glob("*.json"))
-            assert len(files) == 1
+            batch = evaluator.telemetry_store.load_range("0000-00-00", "9999-99-99")
+            assert len(batch.records) == 1
 
     def test_to_objectives(self):
         """Should return objectives dict."""
@@ -0,0 +1,306 @@
+"""
+Tests for optimization/telemetry_columns.py
+
+Tests:
+- Builder/encoding (NaN padding, dictionary-encoded categoricals, frame bitmask)
+- Zero-copy views (select/where/since compose row selections)
+- Group-by/aggregate equivalence with the list-based TelemetryAggregator paths
+- Correlation equivalence with the per-cell np.corrcoef loop
+- TelemetryBatch statistics and TelemetryStore.load_columns
+"""
+
+import random
+import sys
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import VectorCodec
+from optimization.telemetry_columns import (
+    CategoricalColumn,
+    TelemetryColumns,
+    TelemetryColumnsBuilder,
+)
+from optimization.telemetry_schema import ExecutionTelemetry, TelemetryBatch, TelemetryStore
+from optimization.dspy_level1 import TelemetryAggregator, TelemetryPoint
+from optimization.impact_analyzer import ImpactAnalyzer
+
+
+def _random_points(n, seed=0, sparse=False):
+    rng = random.Random(seed)
+    points = []
+    for i in range(n):
+        vector = [float(rng.random() > 0.5) for _ in range(7)]
+        vector += [float(rng.randint(0, 2)), float(rng.randint(0, 2))]
+        vector += [float(rng.random() > 0.5), float(rng.random() > 0.5), 0.0, 0.0, 0.0]
+        outcomes = {
+            m: rng.random() for m in ImpactAnalyzer.OUTCOME_METRICS
+            if not (sparse and rng.random() < 0.3)
+        }
+        points.append(TelemetryPoint(
+            config_vector=vector,
+            outcomes=outcomes,
+            task_type=rng.choice(["reasoning", "coding", "research"]),
+            timestamp=float(i),
+            metadata={"mode": rng.choice(["strict", "balanced"])},
+        ))
+    return points
+
+
+def _reference_correlations(points):
+    """The original per-cell ImpactAnalyzer numpy implementation."""
+    config = np.array([p.config_vector[:14] for p in points])
+    outcomes = np.array([
+        [p.outcomes.get(m, float("nan")) for m in ImpactAnalyzer.OUTCOME_METRICS]
+        for p in points
+    ])
+    result = np.zeros((14, len(ImpactAnalyzer.OUTCOME_METRICS)))
+    for i in range(14):
+        for j in range(len(ImpactAnalyzer.OUTCOME_METRICS)):
+            mask = ~np.isnan(outcomes[:, j])
+            if mask.sum() < 10:
+                continue
+            x, y = config[mask, i], outcomes[mask, j]
+            if np.std(x) > 0 and np.std(y) > 0:
+                result[i, j] = np.corrcoef(x, y)[0, 1]
+    return result
+
+
+def _assert_nested_close(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        assert actual[key].keys() == expected[key].keys()
+        for metric, value in expected[key].items():
+            assert actual[key][metric] == pytest.approx(value, rel=1e-12, abs=1e-12)
+
+
+class TestBuilder:
+    """Tests for TelemetryColumnsBuilder encoding."""
+
+    def test_pads_short_vectors_with_nan(self):
+        builder = TelemetryColumnsBuilder()
+        builder.add([1.0, 0.0], {"a": 1.0})
+        builder.add([], {"b": 2.0})
+        columns = builder.build()
+
+        config = columns.config_matrix()
+        assert config.shape == (2, 14)
+        assert config[0, 0] == 1.0 and np.isnan(config[0, 2])
+        assert np.isnan(config[1]).all()
+        outcomes = columns.outcome_matrix(["a", "b"])
+        assert outcomes[0, 0] == 1.0 and np.isnan(outcomes[0, 1])
+        assert np.isnan(outcomes[1, 0]) and outcomes[1, 1] == 2.0
+
+    def test_categorical_encoding(self):
+        column = CategoricalColumn.encode(["x", "y", "x", None])
+        assert column.categories == ["x", "y", None]
+        assert column.codes.tolist() == [0, 1, 0, 2]
+        assert column.code_of("missing") == -1
+
+    def test_frame_bitmask_usage(self):
+        records = [
+            ExecutionTelemetry(active_frames=["evidential", "aspectual"]),
+            ExecutionTelemetry(active_frames=["evidential", "custom"]),
+        ]
+        columns = TelemetryColumns.from_records(records)
+        assert columns.frame_usage() == {"evidential": 2, "aspectual": 1, "custom": 1}
+
+
+class TestViews:
+    """Tests for zero-copy filtered views."""
+
+    def test_views_share_base_arrays(self):
+        columns = TelemetryColumns.from_points(_random_points(50))
+        view = columns.where(task_type="coding")
+        assert view._config is columns._config
+        assert view._outcomes is columns._outcomes
+        assert len(view) == sum(1 for p in _random_points(50) if p.task_type == "coding")
+
+    def test_views_compose(self):
+        points = _random_points(100)
+        columns = TelemetryColumns.from_points(points)
+        view = columns.where(task_type="research").since(40.0).where(mode="strict")
+        expected = [
+            i for i, p in enumerate(points)
+            if p.task_type == "research" and p.timestamp >= 40.0
+            and p.metadata["mode"] == "strict"
+        ]
+        assert view.row_indices().tolist() == expected
+
+    def test_where_unknown_value_is_empty(self):
+        columns = TelemetryColumns.from_points(_random_points(10))
+        assert len(columns.where(task_type="nope")) == 0
+
+
+class TestAggregationEquivalence:
+    """Columnar aggregations must match the list-based implementations."""
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_aggregate_by_cluster(self, sparse):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=tmpdir)
+            for p in _random_points(300, seed=3, sparse=sparse):
+                agg.record(p)
+
+            groups = {}
+            for p in agg.get_points():
+                key = VectorCodec.cluster_key(VectorCodec.decode(p.config_vector))
+                groups.setdefault(key, []).append(p.outcomes)
+            expected = TelemetryAggregator._average_outcome_lists(groups)
+
+            _assert_nested_close(agg.aggregate_by_cluster(), expected)
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_aggregate_by_frame(self, sparse):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=tmpdir)
+            for p in _random_points(300, seed=4, sparse=sparse):
+                agg.record(p)
+
+            frames = ["evidential", "aspectual", "morphological",
+                      "compositional", "honorific", "classifier", "spatial"]
+            groups = {f: [] for f in frames}
+            for p in agg.get_points():
+                for i, f in enumerate(frames):
+                    if p.config_vector[i] > 0.5:
+                        groups[f].append(p.outcomes)
+            expected = TelemetryAggregator._average_outcome_lists(groups)
+
+            _assert_nested_close(agg.aggregate_by_frame(), expected)
+
+    def test_cluster_requires_full_vectors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=tmpdir)
+            agg.record_outcome([1.0, 0.0], {"task_accuracy": 0.5}, "coding")
+            with pytest.raises(ValueError):
+                agg.aggregate_by_cluster()
+
+    def test_columns_cache_invalidated_on_record(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=tmpdir)
+            for p in _random_points(5):
+                agg.record(p)
+            assert len(agg.columns()) == 5
+            agg.record(_random_points(1)[0])
+            assert len(agg.columns()) == 6
+
+    def test_columns_cache_tracks_same_size_changes(self):
+        """Reloading, replacing or editing points rebuilds even at equal length."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=tmpdir)
+            first, second = _random_points(5, seed=1), _random_points(5, seed=2)
+            for p in first:
+                agg.record(p)
+            agg.save()
+            before = agg.columns()
+
+            agg._points = list(second)
+            assert agg.columns() is not before
+            expected = TelemetryColumns.from_points(second).config_matrix()
+            np.testing.assert_array_equal(agg.columns().config_matrix(), expected)
+
+            agg.load()
+            np.testing.assert_array_equal(agg.columns().config_matrix(), before.config_matrix())
+
+            cached = agg.columns()
+            agg.get_points()[0] = second[0]
+            agg.invalidate()
+            assert agg.columns() is not cached
+            assert agg.columns().config_matrix()[0].tolist() == second[0].config_vector[:14]
+
+
+class TestCorrelation:
+    """Tests for the shared correlation primitive."""
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_matches_corrcoef_loop(self, sparse):
+        points = _random_points(400, seed=5, sparse=sparse)
+        columns = TelemetryColumns.from_points(points, ImpactAnalyzer.OUTCOME_METRICS)
+        actual = columns.correlate(14, ImpactAnalyzer.OUTCOME_METRICS, min_count=10)
+        np.testing.assert_allclose(actual, _reference_correlations(points), atol=1e-12)
+
+    def test_min_count_zeroes_cells(self):
+        points = _random_points(9)
+        columns = TelemetryColumns.from_points(points, ImpactAnalyzer.OUTCOME_METRICS)
+        assert not columns.correlate(14, min_count=10).any()
+
+    def test_impact_analyzer_matches_reference(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=tmpdir)
+            points = _random_points(200, seed=6)
+            for p in points:
+                agg.record(p)
+
+            analyzer = ImpactAnalyzer(telemetry=agg)
+            matrix = analyzer.compute_correlations(min_samples=100)
+            np.testing.assert_allclose(matrix, _reference_correlations(points), atol=1e-12)
+
+
+class TestExecutionBatches:
+    """Tests for TelemetryBatch and TelemetryStore columnar paths."""
+
+    def _records(self):
+        rng = random.Random(9)
+        return [
+            ExecutionTelemetry(
+                timestamp=f"2025-01-0{1 + i % 3}T10:00:00",
+                task_type=rng.choice(["debugging", "testing"]),
+                active_frames=rng.sample(["evidential", "aspectual", "spatial"], 2),
+                aggregate_frame_score=rng.random(),
+                verix_compliance_score=rng.random(),
+                response_tokens=rng.randint(10, 500),
+                latency_ms=rng.randint(100, 900),
+                task_success=rng.choice([True, False, None]),
+            )
+            for i in range(60)
+        ]
+
+    def test_compute_statistics(self):
+        records = self._records()
+        batch = TelemetryBatch()
+        for r in records:
+            batch.add(r)
+
+        stats = batch.compute_statistics()
+        n = len(records)
+        assert stats["successful_records"] == sum(r.task_success is True for r in records)
+        assert stats["avg_frame_score"] == pytest.approx(
+            sum(r.aggregate_frame_score for r in records) / n
+        )
+        assert stats["avg_latency_ms"] == pytest.approx(sum(r.latency_ms for r in records) / n)
+        assert stats["task_type_distribution"] == {
+            t: sum(r.task_type == t for r in records) for t in {r.task_type for r in records}
+        }
+        assert batch.filter_by_task_type("testing") == [
+            r for r in records if r.task_type == "testing"
+        ]
+
+    def test_columns_cache_tracks_records(self):
+        """Replacing records, or invalidate() after an edit, rebuilds the view."""
+        records = self._records()
+        batch = TelemetryBatch(records=records[:30])
+        assert len(batch.filter_by_task_type("testing")) == sum(r.task_type == "testing" for r in records[:30])
+
+        batch.records = records[30:]
+        assert batch.filter_by_task_type("testing") == [r for r in records[30:] if r.task_type == "testing"]
+
+        batch.records[0] = records[0]
+        batch.invalidate()
+        assert batch.filter_by_task_type("testing") == [r for r in batch.records if r.task_type == "testing"]
+
+    def test_store_load_columns(self):
+        records = self._records()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = TelemetryStore(base_path=tmpdir)
+            store.store_many(records)
+
+            columns = store.load_columns("2025-01-02", "2025-01-03")
+            window = [r for r in records if r.timestamp[:10] >= "2025-01-02"]
+            assert len(columns) == len(window)
+            assert columns.value_counts("task_type") == TelemetryBatch(
+                records=window
+            )._task_type_distribution()
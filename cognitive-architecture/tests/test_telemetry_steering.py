@@ -0,0 +1,166 @@
+"""
+Tests for optimization/telemetry_steering.py
+
+Tests:
+- Incremental frontiers match a full recompute after every outcome
+- Memoized recommendations are invalidated per domain
+- Batch telemetry ingest with a persisted high-water mark
+"""
+
+import random
+
+import pytest
+from optimization.dspy_level1 import TelemetryAggregator, TelemetryPoint
+from optimization.telemetry_steering import TelemetrySteeringEngine
+
+MODES = ["minimal", "efficient", "balanced", "strict", "robust", "research"]
+VECTORS = {
+    "minimal": [1, 0, 0, 0, 0, 0, 0, 1] + [0] * 6,
+    "balanced": [1, 1, 1, 0, 0, 0, 0, 1] + [0] * 6,
+    "strict": [1, 1, 1, 0, 0, 0, 0, 2] + [0] * 6,
+}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return TelemetrySteeringEngine(
+        telemetry=TelemetryAggregator(storage_dir=tmp_path / "telemetry"),
+        storage_dir=tmp_path / "steering",
+    )
+
+
+def frontier(engine, domain):
+    return [(p.mode_name, p.accuracy, p.efficiency) for p in engine._pareto_frontiers.get(domain, [])]
+
+
+def recompute(engine, domain):
+    """Frontier from a from-scratch recompute, for comparison."""
+    engine._update_pareto_frontier(domain)
+    return frontier(engine, domain)
+
+
+def point(task_type, mode, accuracy, efficiency, timestamp):
+    return TelemetryPoint(
+        config_vector=VECTORS[mode],
+        outcomes={"task_accuracy": accuracy, "token_efficiency": efficiency},
+        task_type=task_type,
+        timestamp=timestamp,
+    )
+
+
+class TestIncrementalFrontier:
+    """Incremental frontier maintenance."""
+
+    @pytest.mark.parametrize("levels", [None, 4])
+    def test_matches_full_recompute(self, engine, levels):
+        """After every outcome the frontier equals a full recompute."""
+        rng = random.Random(levels or 0)
+
+        def score():
+            return rng.randrange(levels) / levels if levels else rng.random()
+
+        for _ in range(400):
+            domain = rng.choice(["coding", "research"])
+            engine.record_outcome(rng.choice(MODES), domain, score(), score())
+            incremental = frontier(engine, domain)
+            assert incremental == recompute(engine, domain)
+
+    def test_dominated_update_skips_recompute(self, engine, monkeypatch):
+        """Outcomes that keep a mode dominated do not rebuild the frontier."""
+        for _ in range(engine.MIN_SAMPLES_FOR_TRUST):
+            engine.record_outcome("strong", "coding", 0.9, 0.9)
+            engine.record_outcome("weak", "coding", 0.2, 0.2)
+
+        calls = []
+        original = engine._update_pareto_frontier
+        monkeypatch.setattr(engine, "_update_pareto_frontier", lambda d: calls.append(d) or original(d))
+        engine.record_outcome("weak", "coding", 0.3, 0.3)
+        engine.record_outcome("strong", "coding", 1.0, 1.0)
+        assert calls == []
+
+        # A frontier member getting worse forces a recompute
+        engine.record_outcome("strong", "coding", 0.0, 0.0)
+        assert calls == ["coding"]
+        assert [p.mode_name for p in engine._pareto_frontiers["coding"]] == ["strong"]
+
+
+class TestRecommendationCache:
+    """Memoized recommendations."""
+
+    def test_invalidated_per_domain(self, engine):
+        """Only the domain that received an outcome is recomputed."""
+        for _ in range(engine.MIN_SAMPLES_FOR_TRUST):
+            engine.record_outcome("a", "coding", 0.9, 0.5)
+            engine.record_outcome("b", "research", 0.5, 0.9)
+
+        coding = engine.get_all_recommendations("coding")
+        research = engine.get_steering_recommendation("research")
+        assert engine.get_all_recommendations("coding") == coding
+        assert engine.get_steering_recommendation("research") is research
+
+        engine.record_outcome("c", "coding", 1.0, 1.0)
+        assert [r.mode_name for r in engine.get_all_recommendations("coding")] == ["a", "c"]
+        assert engine.get_steering_recommendation("research") is research
+
+    def test_returned_list_is_a_copy(self, engine):
+        """Mutating a returned list does not corrupt the cache."""
+        engine.record_outcome("a", "coding", 0.9, 0.5)
+        engine.get_all_recommendations("coding").clear()
+        assert len(engine.get_all_recommendations("coding")) == 1
+
+
+class TestIngest:
+    """Batch ingest with a high-water mark."""
+
+    def test_reingest_skips_old_points(self, engine):
+        """Only points newer than the mark are processed."""
+        telemetry = engine.telemetry
+        for i in range(6):
+            telemetry.record(point("coding", "balanced", 0.8, 0.6, 100.0 + i))
+        assert engine.ingest_telemetry() == 6
+        assert engine.ingest_telemetry() == 0
+
+        # Ties at the mark are counted, not re-ingested
+        telemetry.record(point("coding", "strict", 0.9, 0.3, 105.0))
+        telemetry.record(point("reasoning", "minimal", 0.4, 0.9, 107.0))
+        assert engine.ingest_telemetry() == 2
+        assert engine._performance_db[("balanced", "coding")].sample_count == 6
+        assert engine._performance_db[("strict", "coding")].sample_count == 1
+        assert engine._performance_db[("minimal", "analysis")].sample_count == 1
+
+    def test_batch_matches_one_by_one(self, engine, tmp_path):
+        """A batch ingest ends in the same state as per-outcome recording."""
+        rng = random.Random(7)
+        points = [
+            point(rng.choice(["coding", "reasoning"]), rng.choice(list(VECTORS)), rng.random(), rng.random(), float(i))
+            for i in range(120)
+        ]
+        for p in points:
+            engine.telemetry.record(p)
+        engine.ingest_telemetry()
+
+        reference = TelemetrySteeringEngine(
+            telemetry=TelemetryAggregator(storage_dir=tmp_path / "other"),
+            storage_dir=tmp_path / "reference",
+        )
+        for p in points:
+            reference.record_outcome(
+                reference._infer_mode_from_vector(p.config_vector),
+                reference._task_type_to_domain(p.task_type),
+                p.outcomes["task_accuracy"],
+                p.outcomes["token_efficiency"],
+                0.5,
+            )
+        for domain in ("coding", "analysis"):
+            assert frontier(engine, domain) == frontier(reference, domain)
+            assert engine.get_all_recommendations(domain) == reference.get_all_recommendations(domain)
+
+    def test_mark_persisted(self, engine):
+        """A reloaded engine does not re-ingest saved points."""
+        engine.telemetry.record(point("coding", "balanced", 0.8, 0.6, 50.0))
+        engine.ingest_telemetry()
+        engine.save()
+
+        reloaded = TelemetrySteeringEngine(telemetry=engine.telemetry, storage_dir=engine.storage_dir)
+        assert reloaded.ingest_telemetry() == 0
+        assert reloaded._performance_db[("balanced", "coding")].sample_count == 1
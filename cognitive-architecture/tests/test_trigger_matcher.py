@@ -0,0 +1,317 @@
+"""
+Tests for skills/trigger_matcher.py
+
+Tests:
+- TriggerIndex construction (vocabulary, postings, description/category indexes)
+- Indexed match() ranking equivalence with match_linear()
+- Tie-breaking, negative triggers and fuzzy-row caching
+- SkillRouterServer / SkillRouterClient daemon protocol, hot reload, fallback
+- Socket placement in a private directory and ownership checks
+"""
+
+import json
+import random
+import shutil
+import socket
+import stat
+import sys
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "skills"))
+
+from trigger_matcher import (
+    SkillTriggerMatcher,
+    SkillRouterClient,
+    SkillRouterServer,
+    TriggerIndex,
+    RAPIDFUZZ_AVAILABLE,
+    default_socket_path,
+    format_matches,
+)
+
+REAL_INDEX = (
+    Path(__file__).parent.parent.parent / "scripts" / "skill-index" / "skill-index.json"
+)
+
+
+def _ranking(matches):
+    return [(m.name, m.confidence, sorted(m.matched_triggers)) for m in matches]
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    index = {
+        "skills": {
+            "api-debugger": {
+                "category": "delivery",
+                "path": "skills/delivery/api-debugger",
+                "description": "Debug failing API endpoints and backend errors",
+                "triggers": ["debug", "api", "endpoint", "error"],
+                "negativeTriggers": ["frontend"],
+                "files": ["SKILL.md"],
+            },
+            "frontend-builder": {
+                "category": "delivery",
+                "path": "skills/delivery/frontend-builder",
+                "description": "Build frontend components",
+                "triggers": ["frontend", "component", "react"],
+                "negativeTriggers": [],
+                "files": ["SKILL.md"],
+            },
+            "release-notes": {
+                "category": "tooling",
+                "path": "skills/tooling/release-notes",
+                "description": "Generate release notes from git history",
+                "triggers": ["release", "notes", "changelog"],
+                "negativeTriggers": ["debug"],
+                "files": ["SKILL.md"],
+            },
+            "research-synth": {
+                "category": "research",
+                "path": "skills/research/research-synth",
+                "description": "Synthesize research papers",
+                "triggers": ["research", "paper", "papers", "synthesis"],
+                "files": [],
+            },
+        }
+    }
+    path = tmp_path / "skill-index.json"
+    path.write_text(json.dumps(index), encoding="utf-8")
+    return path
+
+
+class TestTriggerIndex:
+    """Tests for TriggerIndex construction."""
+
+    def test_vocabulary_is_deduplicated(self, index_path):
+        """Triggers shared across skills should map to one vocab entry."""
+        matcher = SkillTriggerMatcher(str(index_path))
+        index = matcher.trigger_index
+        assert len(index.vocab) == len(set(index.vocab))
+        debug_id = index.vocab_ids["debug"]
+        assert index.postings[debug_id] == [(0, 0)]
+        assert index.negative_postings[debug_id] == [(2, 0)]
+
+    def test_description_and_category_indexes(self, index_path):
+        """Description tokens and categories should point at skill ordinals."""
+        index = SkillTriggerMatcher(str(index_path)).trigger_index
+        assert index.desc_postings["backend"] == [0]
+        assert index.category_members["delivery"] == [0, 1]
+
+    def test_best_per_skill_prefers_earliest_on_tie(self):
+        """Equal scores should resolve to the earliest trigger position."""
+        skills = {"s": {"triggers": ["abd", "abe"]}}
+        index = TriggerIndex(skills, lambda text: text.split())
+        row = [(index.vocab_ids["abe"], 70.0), (index.vocab_ids["abd"], 70.0)]
+        best = index.best_per_skill(row, index.postings)
+        assert best[0] == (70.0, 0, index.vocab_ids["abd"])
+
+
+@pytest.mark.skipif(not RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+class TestIndexedMatch:
+    """Tests for the indexed match() path."""
+
+    @pytest.mark.parametrize("prompt", [
+        "help me debug this API error",
+        "build a react frontend component",
+        "write release notes and a changelog",
+        "synthesize research papers",
+        "debugg the endpont",
+        "the and or",
+    ])
+    def test_matches_linear_ranking(self, index_path, prompt):
+        """Indexed ranking should equal the per-skill scan."""
+        matcher = SkillTriggerMatcher(str(index_path))
+        for threshold in (0.5, 0.6, 0.8):
+            assert _ranking(matcher.match(prompt, threshold, 10)) == _ranking(
+                matcher.match_linear(prompt, threshold, 10)
+            )
+
+    def test_negative_trigger_penalty(self, index_path):
+        """Negative triggers should lower the score exactly as before."""
+        matcher = SkillTriggerMatcher(str(index_path))
+        indexed = {m.name: m.confidence for m in matcher.match("debug release", top_k=10)}
+        linear = {m.name: m.confidence for m in matcher.match_linear("debug release", top_k=10)}
+        assert indexed == linear
+        assert "release-notes" in indexed
+
+    def test_fuzzy_rows_are_cached(self, index_path):
+        """Repeated tokens should reuse the cached fuzzy row."""
+        matcher = SkillTriggerMatcher(str(index_path))
+        matcher.match("debug api")
+        cached = dict(matcher.trigger_index._row_cache)
+        matcher.match("debug api")
+        assert dict(matcher.trigger_index._row_cache) == cached
+        assert ("debug", 0.6 * 100) in cached
+
+    def test_row_cache_is_bounded(self, index_path, monkeypatch):
+        """The fuzzy-row cache should evict least recently used tokens."""
+        monkeypatch.setattr(TriggerIndex, "ROW_CACHE_SIZE", 2)
+        matcher = SkillTriggerMatcher(str(index_path))
+        matcher.match("debug api endpoint")
+        assert len(matcher.trigger_index._row_cache) == 2
+
+    @pytest.mark.skipif(not REAL_INDEX.exists(), reason="skill-index.json not generated")
+    def test_real_index_equivalence(self):
+        """Randomized prompts over the real index should rank identically."""
+        matcher = SkillTriggerMatcher(str(REAL_INDEX))
+        words = matcher.trigger_index.vocab + list(matcher.trigger_index.desc_postings)
+        rng = random.Random(7)
+        for _ in range(40):
+            prompt = " ".join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+            assert _ranking(matcher.match(prompt, 0.6, 10)) == _ranking(
+                matcher.match_linear(prompt, 0.6, 10)
+            )
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are length-limited; keep them short
+    directory = tempfile.mkdtemp(prefix="sr-", dir="/tmp")
+    yield os.path.join(directory, "router.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_server(index_path, socket_path):
+    server = SkillRouterServer(socket_path, str(index_path))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+class TestRoutingDaemon:
+    """Tests for the warm routing daemon and its client."""
+
+    def test_client_matches_in_process(self, running_server, index_path, socket_path):
+        """Daemon results should equal in-process matching."""
+        client = SkillRouterClient(socket_path)
+        local = SkillTriggerMatcher(str(index_path))
+        prompt = "help me debug this API error"
+        assert _ranking(client.match(prompt)) == _ranking(local.match(prompt))
+        assert json.loads(client.match_json(prompt)) == json.loads(local.match_json(prompt))
+        assert client.is_alive()
+
+    def test_match_text_op(self, running_server, socket_path):
+        """match_text should return the route-skill.sh text format."""
+        client = SkillRouterClient(socket_path)
+        text = client._request({"op": "match_text", "prompt": "write release notes"})
+        assert text.startswith("MATCHED_SKILLS:")
+        assert "release-notes" in text
+
+    def test_hot_reload_on_mtime_change(self, running_server, index_path, socket_path):
+        """Rewriting skill-index.json should be picked up without restart."""
+        client = SkillRouterClient(socket_path)
+        assert all(m.name != "k8s-deployer" for m in client.match("kubernetes deploy helm"))
+
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        index["skills"]["k8s-deployer"] = {
+            "category": "operations",
+            "description": "Deploy to kubernetes",
+            "triggers": ["kubernetes", "helm"],
+        }
+        index_path.write_text(json.dumps(index), encoding="utf-8")
+        future = time.time() + 10
+        os.utime(index_path, (future, future))
+
+        assert client.match("kubernetes deploy helm")[0].name == "k8s-deployer"
+
+    def test_invalid_index_keeps_previous(self, running_server, index_path, socket_path):
+        """A half-written index should not take the daemon down."""
+        client = SkillRouterClient(socket_path)
+        before = _ranking(client.match("debug api"))
+        index_path.write_text("{not json", encoding="utf-8")
+        future = time.time() + 10
+        os.utime(index_path, (future, future))
+        assert _ranking(client.match("debug api")) == before
+
+    def test_unknown_op_raises(self, running_server, socket_path):
+        """Protocol errors should surface as RuntimeError."""
+        client = SkillRouterClient(socket_path)
+        with pytest.raises(RuntimeError, match="Unknown op"):
+            client._request({"op": "bogus"})
+
+    def test_fallback_without_daemon(self, index_path, socket_path):
+        """Client should match in-process when nothing is listening."""
+        client = SkillRouterClient(socket_path, str(index_path))
+        assert not client.is_alive()
+        local = SkillTriggerMatcher(str(index_path))
+        assert _ranking(client.match("debug api")) == _ranking(local.match("debug api"))
+
+    def test_refuses_second_daemon(self, running_server, index_path, socket_path):
+        """Starting a second daemon on a live socket should fail."""
+        with pytest.raises(OSError, match="already running"):
+            SkillRouterServer(socket_path, str(index_path))
+
+    def test_replaces_stale_socket(self, index_path, socket_path):
+        """A leftover socket file with no listener should be replaced."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+        server = SkillRouterServer(socket_path, str(index_path))
+        server.server_close()
+        assert not os.path.exists(socket_path)
+
+    def test_ignores_foreign_socket(self, running_server, index_path, socket_path, monkeypatch):
+        """A socket owned by another user is never queried."""
+        monkeypatch.setattr(os, "getuid", lambda: os.lstat(socket_path).st_uid + 1)
+        client = SkillRouterClient(socket_path, str(index_path))
+        assert not client.is_alive()
+        with pytest.raises(OSError, match="not this user's socket"):
+            SkillRouterServer(socket_path, str(index_path))
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+class TestSocketPlacement:
+    """The default socket lives where other users cannot reach or plant it."""
+
+    @pytest.fixture
+    def short_tmp(self, monkeypatch):
+        directory = tempfile.mkdtemp(prefix="sr-", dir="/tmp")
+        monkeypatch.delenv("SKILL_ROUTER_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", directory)
+        yield directory
+        shutil.rmtree(directory, ignore_errors=True)
+
+    def test_default_paths(self, short_tmp, monkeypatch):
+        private = os.path.join(short_tmp, f"skill-router-{os.getuid()}")
+        assert default_socket_path() == os.path.join(private, "router.sock")
+        monkeypatch.setenv("XDG_RUNTIME_DIR", short_tmp)
+        assert default_socket_path() == os.path.join(short_tmp, "skill-router.sock")
+        monkeypatch.setenv("SKILL_ROUTER_SOCKET", "/custom.sock")
+        assert default_socket_path() == "/custom.sock"
+
+    def test_private_directory_and_mode(self, short_tmp, index_path):
+        """The daemon creates a 0700 directory and a 0600 socket."""
+        server = SkillRouterServer(index_path=str(index_path))
+        try:
+            assert stat.S_IMODE(os.stat(os.path.dirname(server.socket_path)).st_mode) == 0o700
+            assert stat.S_IMODE(os.stat(server.socket_path).st_mode) == 0o600
+        finally:
+            server.server_close()
+
+    def test_refuses_shared_directory(self, short_tmp, index_path):
+        """A pre-created directory others can write to is rejected."""
+        directory = os.path.join(short_tmp, f"skill-router-{os.getuid()}")
+        os.mkdir(directory)
+        os.chmod(directory, 0o777)
+        with pytest.raises(OSError, match="not private"):
+            SkillRouterServer(index_path=str(index_path))
+
+
+class TestFormatMatches:
+    """Tests for the CLI text format."""
+
+    def test_no_matches(self):
+        assert format_matches("xyz", []) == "No matching skills found for: xyz"
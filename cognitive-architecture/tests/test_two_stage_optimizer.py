@@ -0,0 +1,66 @@
+"""
+Tests for optimization/two_stage_optimizer.py
+
+Tests:
+- Population objective kernels match the per-row functions
+- CognitiveProblem5D/14D evaluate through the kernels
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.two_stage_optimizer import (
+    CognitiveProblem5D,
+    CognitiveProblem14D,
+    evaluate_config_5dim,
+    evaluate_config_14dim,
+    evaluate_population_5dim,
+    evaluate_population_14dim,
+)
+
+CASES = [
+    (CognitiveProblem5D, evaluate_config_5dim, evaluate_population_5dim),
+    (CognitiveProblem14D, evaluate_config_14dim, evaluate_population_14dim),
+]
+
+
+def _population(problem, n, seed):
+    """Random rows inside the bounds plus corner and out-of-bound rows."""
+    rng = np.random.default_rng(seed)
+    xl, xu = problem.xl.astype(float), problem.xu.astype(float)
+    X = xl + rng.random((n, problem.n_var)) * (xu - xl)
+    X[: n // 4] = np.round(X[: n // 4])  # Decoded-config corners
+    X[-4:] = rng.uniform(-1.0, 3.0, (4, problem.n_var))  # Clipping branches
+    return X
+
+
+class TestPopulationKernels:
+    """Array kernels must reproduce the per-row objective functions."""
+
+    @pytest.mark.parametrize("problem_cls, row_fn, kernel", CASES)
+    def test_matches_row_function(self, problem_cls, row_fn, kernel):
+        """Each row of the kernel output should equal the row function."""
+        X = _population(problem_cls(), 5000, seed=12)
+        expected = np.array([row_fn(x) for x in X])
+        np.testing.assert_array_equal(kernel(X), expected)
+
+    @pytest.mark.parametrize("problem_cls, row_fn, kernel", CASES)
+    def test_shapes(self, problem_cls, row_fn, kernel):
+        """Single vectors and empty populations should be accepted."""
+        n_var = problem_cls().n_var
+        x = np.full(n_var, 0.5)
+        np.testing.assert_array_equal(kernel(x), row_fn(x)[None, :])
+        assert kernel(np.empty((0, n_var))).shape == (0, 4)
+
+    @pytest.mark.parametrize("problem_cls, row_fn, kernel", CASES)
+    def test_problem_evaluate(self, problem_cls, row_fn, kernel):
+        """Problem.evaluate should return the kernel output."""
+        problem = problem_cls()
+        X = _population(problem, 64, seed=13)
+        F = problem.evaluate(X, return_values_of=["F"])
+        np.testing.assert_array_equal(F, np.array([row_fn(x) for x in X]))
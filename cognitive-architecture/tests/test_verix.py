@@ -4,17 +4,23 @@ Tests for core/verix.py
 Tests:
 - VerixClaim creation and properties
 - VerixParser L1 and L0 format parsing
+- VerixTokenizer streaming and fuzz equivalence with the regex parser
+- ClaimTable compact storage and ClaimView rows
 - VerixValidator validation and compliance scoring
 - Format conversion (L0, L1, L2)
 """
 
+import random
+
 import pytest
 from core.verix import (
     Illocution,
     Affect,
     State,
+    ClaimTable,
     VerixClaim,
     VerixParser,
+    VerixTokenizer,
     VerixValidator,
     format_claim,
     create_claim,
@@ -174,6 +180,138 @@ class TestVerixParser:
             assert claims[0].state == State.PROVISIONAL
 
 
+# Fragments that exercise the L1 regex's cross-line whitespace, unclosed
+# tags, invalid markers and L0 lines.
+FUZZ_FRAGMENTS = [
+    "[assert|neutral]", "[query|uncertain]", "[ASSERT|Positive]", "[bogus|neutral]",
+    "[meta]", "[meta:verix]", "[agent:model]", "[agent:nobody]", "[id:claim-1]", "[id:",
+    "[ground:doc]", "[ground:a b]", "[ground:", "[conf:0.9]", "[conf:1.2.3]", "[conf:",
+    "[state:confirmed]", "[state:bogus]", "[state:", "[", "]", "|", ":",
+    " ", "  ", "\t", "\n", "\n\n", "\r", "word", "foo bar",
+    "MA.85:", "A+5:", "?~10:", "UX.1:",
+]
+
+
+def _fuzz_text(rng):
+    return "".join(rng.choice(FUZZ_FRAGMENTS) for _ in range(rng.randint(0, 40)))
+
+
+class TestVerixTokenizer:
+    """Tests for the single-pass VerixTokenizer."""
+
+    def test_fuzz_matches_regex_parser(self):
+        """parse() should return exactly the claims of parse_regex()."""
+        parser = VerixParser()
+        rng = random.Random(5)
+        for _ in range(3000):
+            text = _fuzz_text(rng)
+            assert parser.parse(text) == parser.parse_regex(text), repr(text)
+
+    def test_fuzz_streaming_matches_regex_parser(self):
+        """Feeding random chunks should match parse_regex() at every point."""
+        parser = VerixParser()
+        rng = random.Random(11)
+        for _ in range(1000):
+            text = _fuzz_text(rng)
+            tokenizer = VerixTokenizer()
+            pos = 0
+            while pos < len(text):
+                step = rng.randint(1, 8)
+                tokenizer.feed(text[pos:pos + step])
+                pos += step
+                if rng.random() < 0.2:
+                    assert tokenizer.claims() == parser.parse_regex(text[:pos]), repr(text[:pos])
+            assert tokenizer.claims() == parser.parse_regex(text), repr(text)
+
+    def test_trailer_on_following_line(self):
+        """Trailer tags on the next line attach to the claim, as with the regex."""
+        text = "[assert|neutral] Claim [conf:0.9]\n[state:confirmed]\nprose"
+        tokenizer = VerixTokenizer()
+        tokenizer.feed(text[:35])
+        claims = tokenizer.claims()
+        assert claims[0].state == State.PROVISIONAL
+        tokenizer.feed(text[35:])
+        claims = tokenizer.claims()
+        assert claims[0].state == State.CONFIRMED
+        assert claims == VerixParser().parse_regex(text)
+
+    def test_l1_claim_discards_l0_claims(self):
+        """A later L1 claim should replace earlier L0 claims."""
+        tokenizer = VerixTokenizer()
+        tokenizer.feed("A.85:First\n")
+        assert [c.content for c in tokenizer.claims()] == ["First"]
+        tokenizer.feed("[query|uncertain] Second\n")
+        assert [c.content for c in tokenizer.claims()] == ["Second"]
+
+    def test_settled_text_is_released(self):
+        """Committed lines should be dropped from the buffer."""
+        tokenizer = VerixTokenizer()
+        for i in range(200):
+            tokenizer.feed(f"[assert|neutral] Claim {i} [conf:0.5]\nsome prose line\n")
+        assert len(tokenizer.claims()) == 200
+        assert len(tokenizer._buffer) < 100
+
+
+class TestClaimTable:
+    """Tests for the compact ClaimTable representation."""
+
+    def test_fuzz_round_trip_matches_regex_parser(self):
+        """to_claims() should return exactly the claims of parse_regex()."""
+        parser = VerixParser()
+        rng = random.Random(17)
+        for _ in range(2000):
+            text = _fuzz_text(rng)
+            assert parser.parse_table(text).to_claims() == parser.parse_regex(text), repr(text)
+
+    def test_views_expose_claim_api(self):
+        """Views should decode fields and share VerixClaim methods."""
+        text = (
+            "[agent:model] [id:c1] [assert|positive] Cache helps "
+            "[ground:bench-1] [conf:0.9] [state:confirmed]\n"
+            "[query|uncertain] Is it stable?"
+        )
+        table = VerixParser().parse_table(text)
+        claims = VerixParser().parse(text)
+        assert len(table) == 2
+        first = table[0]
+        assert first.content == "Cache helps"
+        assert first.ground == "bench-1"
+        assert first.claim_id == "c1"
+        assert first.is_grounded() and first.is_high_confidence()
+        assert first.to_l1() == claims[0].to_l1()
+        assert table[-1].ground is None and table[-1].agent is None
+        assert table[1:] == claims[1:]
+        assert list(table) == claims
+
+    def test_l0_rows(self):
+        """L0-only text should fill the table from the L0 pattern."""
+        text = "A+85:  First claim \n?~40:Second"
+        table = VerixParser().parse_table(text)
+        assert [view.content for view in table] == ["First claim", "Second"]
+        assert table.to_claims() == VerixParser().parse_regex(text)
+
+    def test_compact_storage(self):
+        """Rows live in typed arrays and VerixClaim has no instance dict."""
+        table = VerixParser().parse_table("[assert|neutral] A [conf:0.7]\n" * 10)
+        assert table.confidence.typecode == "d"
+        assert table.illocution.tolist() == [ClaimTable.ILLOCUTIONS.index(Illocution.ASSERT)] * 10
+        assert not hasattr(table.to_claims()[0], "__dict__")
+
+    def test_validator_accepts_views(self):
+        """Validation over views should match validation over claims."""
+        text = (
+            "[assert|neutral] The cache helps [conf:0.9]\n"
+            "[assert|neutral] The cache helps [conf:0.2]\n"
+            "[id:a] [assert|neutral] X [ground:b] [conf:0.5]\n"
+            "[id:b] [assert|neutral] Y [ground:a] [conf:0.5]"
+        )
+        validator = VerixValidator(PromptConfig())
+        table = VerixParser().parse_table(text)
+        claims = VerixParser().parse(text)
+        assert validator.validate(list(table)) == validator.validate(claims)
+        assert validator.detect_ground_cycles(list(table)) == validator.detect_ground_cycles(claims)
+
+
 class TestVerixValidator:
     """Tests for VerixValidator."""
 
@@ -4,7 +4,8 @@
 # Usage: route-skill.sh "user request text"
 # Output: Top 5 matching skills with confidence scores
 #
-# Uses Python trigger_matcher.py with rapidfuzz for fuzzy matching.
+# Uses the warm trigger_matcher.py routing daemon when running, otherwise
+# Python trigger_matcher.py with rapidfuzz for fuzzy matching.
 # Falls back to Node.js if Python matcher unavailable.
 
 
@@ -35,9 +36,43 @@ if [ -z "$REQUEST" ]; then
   exit 1
 fi
 
+# Fast path: warm routing daemon (trigger_matcher.py --serve) over its Unix socket.
+# Avoids starting Python at all; needs jq plus socat or nc -U.
+# Same default path as trigger_matcher.default_socket_path(): a user-private
+# runtime dir, never a predictable name directly in the shared temp dir.
+if [ -n "$SKILL_ROUTER_SOCKET" ]; then
+  ROUTER_SOCKET="$SKILL_ROUTER_SOCKET"
+elif [ -n "$XDG_RUNTIME_DIR" ] && [ -d "$XDG_RUNTIME_DIR" ]; then
+  ROUTER_SOCKET="$XDG_RUNTIME_DIR/skill-router.sock"
+else
+  ROUTER_SOCKET="${TMPDIR:-/tmp}/skill-router-$(id -u)/router.sock"
+fi
+ROUTER_SOCKET="${ROUTER_SOCKET//\/\//\/}"
+# Only talk to a socket this user owns; another user's could inject routing text
+if [ -S "$ROUTER_SOCKET" ] && [ -O "$ROUTER_SOCKET" ] && command -v jq >/dev/null 2>&1; then
+  ROUTER_REQUEST=$(jq -nc --arg p "$REQUEST" '{op: "match_text", prompt: $p, threshold: 0.6, top_k: 5}')
+  ROUTER_RESPONSE=""
+  if command -v socat >/dev/null 2>&1; then
+    ROUTER_RESPONSE=$(printf '%s\n' "$ROUTER_REQUEST" | socat -t 2 - "UNIX-CONNECT:$ROUTER_SOCKET" 2>/dev/null)
+  elif command -v nc >/dev/null 2>&1; then
+    ROUTER_RESPONSE=$(printf '%s\n' "$ROUTER_REQUEST" | nc -U -w 2 "$ROUTER_SOCKET" 2>/dev/null)
+  fi
+  if [ -n "$ROUTER_RESPONSE" ] && [ "$(printf '%s' "$ROUTER_RESPONSE" | jq -r '.ok' 2>/dev/null)" = "true" ]; then
+    printf '%s\n' "$ROUTER_RESPONSE" | jq -r '.result'
+    exit 0
+  fi
+fi
+
+# Start the daemon in the background so the next call takes the fast path
+# (disable with SKILL_ROUTER_DAEMON=0).
+if [ -f "$PYTHON_MATCHER" ] && [ ! -S "$ROUTER_SOCKET" ] && [ "${SKILL_ROUTER_DAEMON:-1}" != "0" ]; then
+  (nohup python "$PYTHON_MATCHER" --serve --socket "$ROUTER_SOCKET" --idle-timeout 3600 \
+    >/dev/null 2>&1 &)
+fi
+
 # Try Python matcher first (has fuzzy matching with rapidfuzz)
 if [ -f "$PYTHON_MATCHER" ]; then
-  python "$PYTHON_MATCHER" "$REQUEST" 0.6 5 2>/dev/null
+  python "$PYTHON_MATCHER" --socket "$ROUTER_SOCKET" "$REQUEST" 0.6 5 2>/dev/null
   if [ $? -eq 0 ]; then
     exit 0
   fi